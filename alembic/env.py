@@ -1,6 +1,5 @@
 import asyncio
 import os
-import socket
 from logging.config import fileConfig
 
 from sqlalchemy import create_engine, pool
@@ -11,13 +10,19 @@ from alembic import context
 
 # Import models for autogenerate support
 from src.models.base import Base
+from src.utils.database_url import migration_connect_args, migration_database_url
 
 # Import all models to register them with Base.metadata
 from src.models import (  # noqa: F401
+    Broadcast,
+    ContentManifest,
     CostRecord,
     MessageTemplate,
+    OutboxMessage,
     Problem,
+    RateLimitCounter,
     Response,
+    SchedulerLease,
     SentMessage,
     Session,
     Streak,
@@ -35,45 +40,10 @@ if config.config_file_name is not None:
 
 # Use DATABASE_URL (private Railway internal) with psycopg2 for migrations.
 # We always use the private URL — it's reliable from within Railway containers
-# once we force IPv4 (*.railway.internal may resolve to both IPv6 and IPv4;
-# IPv6 routing is unreliable in Railway containers, IPv4 works fine).
+# once we force IPv4 (see src/utils/database_url.py, shared with
+# scripts/migrate.py).
 _raw_url = os.getenv("DATABASE_URL", "")
-
-
-def _build_migration_url(raw: str) -> str:
-    """Convert DATABASE_URL to a psycopg2 URL with IPv4 resolution."""
-    if not raw:
-        return raw
-    # Switch to psycopg2 (sync driver) — asyncpg has no benefit for migrations
-    if raw.startswith("postgres://"):
-        url = raw.replace("postgres://", "postgresql+psycopg2://", 1)
-    elif raw.startswith("postgresql+asyncpg://"):
-        url = raw.replace("postgresql+asyncpg://", "postgresql+psycopg2://", 1)
-    elif raw.startswith("postgresql://"):
-        url = raw.replace("postgresql://", "postgresql+psycopg2://", 1)
-    else:
-        url = raw
-    # Force IPv4 to avoid IPv6 timeout in Railway containers
-    # Extract any *.railway.internal hostname dynamically
-    from urllib.parse import urlparse
-    try:
-        parsed = urlparse(url)
-        hostname = parsed.hostname or ""
-    except Exception:
-        hostname = ""
-    if hostname.endswith(".railway.internal"):
-        try:
-            results = socket.getaddrinfo(hostname, None, family=socket.AF_INET)
-            if results:
-                ipv4 = results[0][4][0]
-                url = url.replace(hostname, ipv4)
-                print(f"[alembic] Resolved {hostname} → {ipv4}")
-        except OSError as exc:
-            print(f"[alembic] WARNING: could not resolve {hostname} to IPv4: {exc}")
-    return url
-
-
-_migration_url = _build_migration_url(_raw_url)
+_migration_url = migration_database_url(_raw_url)
 _use_sync = True  # always use psycopg2 for migrations
 
 if _migration_url:
@@ -108,9 +78,11 @@ def do_run_migrations(connection: Connection) -> None:
 
 def run_migrations_sync() -> None:
     """Run migrations synchronously via psycopg2 (used for public URL)."""
+    url = config.get_main_option("sqlalchemy.url")
     connectable = create_engine(
-        config.get_main_option("sqlalchemy.url"),  # type: ignore[arg-type]
+        url,  # type: ignore[arg-type]
         poolclass=pool.NullPool,
+        connect_args=migration_connect_args(url or ""),
     )
     with connectable.connect() as connection:
         do_run_migrations(connection)
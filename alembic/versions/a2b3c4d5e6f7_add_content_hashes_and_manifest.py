@@ -0,0 +1,129 @@
+"""Add problem content hashes and the content manifest table
+
+Lets scripts/seed_problems.py seed incrementally:
+  - problems.content_key: SHA-256 of (grade, topic, question_en), unique —
+    the ON CONFLICT target of the bulk upsert.
+  - problems.content_hash: SHA-256 of all seeded fields, so unchanged rows
+    are not rewritten.
+  - content_manifest: per-file SHA-256 of seeded YAML, so unchanged files
+    are skipped entirely.
+
+Existing rows get content_key backfilled (the first row wins if the old
+seeder ever let duplicates through); content_hash stays NULL, so the next
+seed rewrites each problem once from its YAML source.
+
+Revision ID: a2b3c4d5e6f7
+Revises: f1a2b3c4d5e6
+Create Date: 2026-03-30 00:00:00.000000
+
+"""
+
+import hashlib
+import json
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a2b3c4d5e6f7"
+down_revision: Union[str, Sequence[str], None] = "f1a2b3c4d5e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows updated per backfill statement.
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _content_key(grade: int, topic: str, question_en: str) -> str:
+    # Must match src.services.problem_content.problem_content_key().
+    raw = json.dumps([grade, topic, question_en], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    """Add content_key/content_hash to problems and create content_manifest.
+
+    Steps:
+    1. Add both columns as nullable.
+    2. Backfill content_key in batches of BACKFILL_BATCH_SIZE.
+    3. Create the unique index on content_key.
+    4. Create the content_manifest table.
+    """
+    op.add_column(
+        "problems",
+        sa.Column(
+            "content_key",
+            sa.String(length=64),
+            nullable=True,
+            comment="SHA-256 of (grade, topic, question_en); upsert key for seeding",
+        ),
+    )
+    op.add_column(
+        "problems",
+        sa.Column(
+            "content_hash",
+            sa.String(length=64),
+            nullable=True,
+            comment="SHA-256 of all seeded fields; changes when YAML content changes",
+        ),
+    )
+
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("SELECT problem_id, grade, topic, question_en FROM problems ORDER BY problem_id")
+    ).all()
+    seen: set[str] = set()
+    updates: list[dict[str, object]] = []
+    for problem_id, grade, topic, question_en in rows:
+        key = _content_key(grade, topic, question_en)
+        if key in seen:
+            continue
+        seen.add(key)
+        updates.append({"problem_id": problem_id, "content_key": key})
+
+    backfill = sa.text(
+        "UPDATE problems SET content_key = :content_key WHERE problem_id = :problem_id"
+    )
+    for start in range(0, len(updates), BACKFILL_BATCH_SIZE):
+        bind.execute(backfill, updates[start : start + BACKFILL_BATCH_SIZE])
+
+    op.create_index("idx_problems_content_key", "problems", ["content_key"], unique=True)
+
+    op.create_table(
+        "content_manifest",
+        sa.Column(
+            "source_path",
+            sa.String(length=500),
+            nullable=False,
+            comment="Content file path relative to the content root",
+        ),
+        sa.Column(
+            "file_hash",
+            sa.String(length=64),
+            nullable=False,
+            comment="SHA-256 of the file contents when last seeded",
+        ),
+        sa.Column(
+            "problem_count",
+            sa.Integer(),
+            nullable=False,
+            comment="Number of problems in the file",
+        ),
+        sa.Column(
+            "seeded_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Timestamp of the last seed of this file (UTC)",
+        ),
+        sa.PrimaryKeyConstraint("source_path", name=op.f("pk_content_manifest")),
+    )
+
+
+def downgrade() -> None:
+    """Drop content_manifest and the problems content hash columns."""
+    op.drop_table("content_manifest")
+    op.drop_index("idx_problems_content_key", table_name="problems")
+    op.drop_column("problems", "content_hash")
+    op.drop_column("problems", "content_key")
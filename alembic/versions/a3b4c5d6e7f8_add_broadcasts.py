@@ -0,0 +1,91 @@
+"""Add broadcasts table and outbox.broadcast_id
+
+Admin broadcasts are recorded in broadcasts and fanned out into the outbox
+by a scheduler job (see src/services/broadcasts.py). Each queued message
+points back at its broadcast so progress can be counted per status.
+
+Revision ID: a3b4c5d6e7f8
+Revises: f2a3b4c5d6e7
+Create Date: 2026-05-11 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3b4c5d6e7f8"
+down_revision: Union[str, Sequence[str], None] = "f2a3b4c5d6e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create broadcasts and link outbox rows to them."""
+    op.create_table(
+        "broadcasts",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("grade", sa.Integer(), nullable=True),
+        sa.Column("language", sa.String(length=5), nullable=True),
+        sa.Column(
+            "status",
+            sa.String(length=16),
+            nullable=False,
+            comment="sending or completed",
+        ),
+        sa.Column("total_recipients", sa.Integer(), nullable=False),
+        sa.Column(
+            "max_student_id",
+            sa.Integer(),
+            nullable=False,
+            comment="Students created after the broadcast are not recipients",
+        ),
+        sa.Column(
+            "last_student_id",
+            sa.Integer(),
+            nullable=False,
+            comment="Highest student_id already queued",
+        ),
+        sa.Column("queued", sa.Integer(), nullable=False),
+        sa.Column("sent", sa.Integer(), nullable=True),
+        sa.Column("failed", sa.Integer(), nullable=True),
+        sa.Column("created_by", sa.BigInteger(), nullable=False, comment="Admin Telegram ID"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("idx_broadcasts_status", "broadcasts", ["status"])
+
+    op.add_column("outbox", sa.Column("broadcast_id", sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        op.f("fk_outbox_broadcast_id_broadcasts"),
+        "outbox",
+        "broadcasts",
+        ["broadcast_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_index(
+        "idx_outbox_broadcast_status",
+        "outbox",
+        ["broadcast_id", "status"],
+        postgresql_where=sa.text("broadcast_id IS NOT NULL"),
+        sqlite_where=sa.text("broadcast_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop outbox.broadcast_id and the broadcasts table."""
+    op.drop_index("idx_outbox_broadcast_status", table_name="outbox")
+    op.drop_constraint(op.f("fk_outbox_broadcast_id_broadcasts"), "outbox", type_="foreignkey")
+    op.drop_column("outbox", "broadcast_id")
+    op.drop_index("idx_broadcasts_status", table_name="broadcasts")
+    op.drop_table("broadcasts")
@@ -0,0 +1,98 @@
+"""Add practice_history bitmap to streaks
+
+Streak calendars previously re-derived practice days from completed
+sessions on every /streak request. streaks.practice_history stores a rolling
+bitmap (bit i = practice_history_end - i days, ~2 years in 92 bytes) that
+record_practice() keeps up to date, so any calendar window or monthly
+heatmap is read from one row.
+
+Existing streaks are backfilled from completed sessions.
+
+Revision ID: b2c3d4e5f6a7
+Revises: a2b3c4d5e6f7
+Create Date: 2026-04-02 00:00:00.000000
+
+"""
+
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b2c3d4e5f6a7"
+down_revision: Union[str, Sequence[str], None] = "a2b3c4d5e6f7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match src.models.streak.PRACTICE_HISTORY_DAYS.
+PRACTICE_HISTORY_DAYS = 730
+
+
+def _as_date(value: date | datetime | str) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.fromisoformat(str(value)).date()  # SQLite returns strings
+
+
+def upgrade() -> None:
+    """Add practice_history/practice_history_end and backfill from sessions."""
+    op.add_column(
+        "streaks",
+        sa.Column(
+            "practice_history",
+            sa.LargeBinary(),
+            nullable=True,
+            comment="Rolling bitmap of practiced days; bit i = practice_history_end - i days",
+        ),
+    )
+    op.add_column(
+        "streaks",
+        sa.Column(
+            "practice_history_end",
+            sa.Date(),
+            nullable=True,
+            comment="Most recent day covered by practice_history",
+        ),
+    )
+
+    bind = op.get_bind()
+    days_by_student: dict[int, set[date]] = defaultdict(set)
+    for student_id, completed_at in bind.execute(
+        sa.text(
+            "SELECT student_id, completed_at FROM sessions "
+            "WHERE status = 'completed' AND completed_at IS NOT NULL "
+            "AND student_id IN (SELECT student_id FROM streaks)"
+        )
+    ):
+        days_by_student[student_id].add(_as_date(completed_at))
+
+    update = sa.text(
+        "UPDATE streaks SET practice_history = :history, practice_history_end = :end "
+        "WHERE student_id = :student_id"
+    )
+    for student_id, days in days_by_student.items():
+        end = max(days)
+        bits = 0
+        for day in days:
+            offset = (end - day).days
+            if offset < PRACTICE_HISTORY_DAYS:
+                bits |= 1 << offset
+        bind.execute(
+            update,
+            {
+                "history": bits.to_bytes((bits.bit_length() + 7) // 8, "little"),
+                "end": end,
+                "student_id": student_id,
+            },
+        )
+
+
+def downgrade() -> None:
+    """Drop the practice_history columns."""
+    op.drop_column("streaks", "practice_history_end")
+    op.drop_column("streaks", "practice_history")
@@ -0,0 +1,56 @@
+"""Add rate_limit_counters table
+
+slowapi counted hits in per-process memory, so the 10/day hint limit reset
+on every deploy and was multiplied by the number of workers. Workers now
+flush batched fixed-window counters to this table (see
+src/services/rate_limits.py).
+
+Revision ID: c2d3e4f5a6b7
+Revises: b2c3d4e5f6a7
+Create Date: 2026-04-06 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c2d3e4f5a6b7"
+down_revision: Union[str, Sequence[str], None] = "b2c3d4e5f6a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create rate_limit_counters table."""
+    op.create_table(
+        "rate_limit_counters",
+        sa.Column(
+            "key",
+            sa.String(length=255),
+            nullable=False,
+            comment="Rate-limit key (limit + identifier)",
+        ),
+        sa.Column(
+            "count",
+            sa.Integer(),
+            nullable=False,
+            comment="Hits in the current window across all workers",
+        ),
+        sa.Column(
+            "expires_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="End of the current window (UTC)",
+        ),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index("ix_rate_limit_counters_expires_at", "rate_limit_counters", ["expires_at"])
+
+
+def downgrade() -> None:
+    """Drop rate_limit_counters table."""
+    op.drop_index("ix_rate_limit_counters_expires_at", table_name="rate_limit_counters")
+    op.drop_table("rate_limit_counters")
@@ -0,0 +1,94 @@
+"""Add denormalized student_id to responses
+
+Student-scoped response queries (topic accuracy, recently seen problems,
+profile stats) previously resolved the student's session IDs first and then
+filtered responses with an ever-growing IN list. Storing student_id on each
+response with a (student_id, evaluated_at) index lets those queries hit a
+single index range instead.
+
+Revision ID: d1e2f3a4b5c6
+Revises: c1d2e3f4a5b6
+Create Date: 2026-03-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "d1e2f3a4b5c6"
+down_revision: Union[str, Sequence[str], None] = "c1d2e3f4a5b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows updated per backfill statement. Every batch runs in the migration's
+# transaction, so this bounds the size of each statement, not how long rows
+# stay locked: ADD COLUMN holds the table lock until the migration commits,
+# which also stops writers adding rows the backfill would miss.
+BACKFILL_BATCH_SIZE = 5000
+
+_BACKFILL = (
+    "UPDATE responses SET student_id = ("
+    "  SELECT sessions.student_id FROM sessions"
+    "  WHERE sessions.session_id = responses.session_id"
+    ") "
+    "WHERE student_id IS NULL"
+)
+
+
+def upgrade() -> None:
+    """Add responses.student_id, backfill it from sessions, then constrain it.
+
+    Steps:
+    1. Add the column as nullable so existing rows are valid.
+    2. Backfill in response_id ranges of BACKFILL_BATCH_SIZE (one UPDATE
+       for the whole table when generating SQL with --sql).
+    3. Set NOT NULL, add the FK and the composite index.
+    """
+    op.add_column(
+        "responses",
+        sa.Column(
+            "student_id",
+            sa.Integer(),
+            nullable=True,
+            comment="Student who answered (denormalized from sessions.student_id)",
+        ),
+    )
+
+    if context.is_offline_mode():
+        # No connection to read the id range from
+        op.execute(_BACKFILL)
+    else:
+        bind = op.get_bind()
+        bounds = bind.execute(
+            sa.text("SELECT MIN(response_id), MAX(response_id) FROM responses")
+        ).one()
+        low, high = bounds
+        if low is not None:
+            backfill = sa.text(_BACKFILL + " AND response_id >= :start AND response_id < :stop")
+            for start in range(low, high + 1, BACKFILL_BATCH_SIZE):
+                bind.execute(backfill, {"start": start, "stop": start + BACKFILL_BATCH_SIZE})
+
+    op.alter_column("responses", "student_id", existing_type=sa.Integer(), nullable=False)
+    op.create_foreign_key(
+        op.f("fk_responses_student_id_students"),
+        "responses",
+        "students",
+        ["student_id"],
+        ["student_id"],
+        ondelete="CASCADE",
+    )
+    op.create_index(
+        "idx_responses_student_evaluated",
+        "responses",
+        ["student_id", "evaluated_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop responses.student_id and its index."""
+    op.drop_index("idx_responses_student_evaluated", table_name="responses")
+    op.drop_constraint(op.f("fk_responses_student_id_students"), "responses", type_="foreignkey")
+    op.drop_column("responses", "student_id")
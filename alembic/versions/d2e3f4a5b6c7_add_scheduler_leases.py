@@ -0,0 +1,55 @@
+"""Add scheduler_leases table
+
+Every worker and replica ran the APScheduler jobs, so daily reminders,
+the stale-session sweep and retention ran once per process. Workers now
+elect a leader through a renewable lease row (see
+src/services/leader_election.py) and only the leader runs those jobs.
+
+Revision ID: d2e3f4a5b6c7
+Revises: c2d3e4f5a6b7
+Create Date: 2026-04-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2e3f4a5b6c7"
+down_revision: Union[str, Sequence[str], None] = "c2d3e4f5a6b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create scheduler_leases table."""
+    op.create_table(
+        "scheduler_leases",
+        sa.Column("name", sa.String(length=64), nullable=False, comment="Role name"),
+        sa.Column(
+            "holder",
+            sa.String(length=255),
+            nullable=False,
+            comment="Holder ID of the current leader",
+        ),
+        sa.Column(
+            "acquired_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="When the current holder took the lease (UTC)",
+        ),
+        sa.Column(
+            "expires_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Lease lapses at this time unless renewed (UTC)",
+        ),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Drop scheduler_leases table."""
+    op.drop_table("scheduler_leases")
@@ -0,0 +1,38 @@
+"""Add partial index on sessions.expires_at for in_progress sessions
+
+Backs the background stale-session sweeper, which replaced the table-wide
+UPDATE previously run on every /practice request. Only in_progress rows are
+indexed, so the index stays small no matter how many sessions accumulate.
+
+Revision ID: e1f2a3b4c5d6
+Revises: d1e2f3a4b5c6
+Create Date: 2026-03-24 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f2a3b4c5d6"
+down_revision: Union[str, Sequence[str], None] = "d1e2f3a4b5c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create idx_sessions_in_progress_expires (expires_at) WHERE status = 'in_progress'."""
+    op.create_index(
+        "idx_sessions_in_progress_expires",
+        "sessions",
+        ["expires_at"],
+        postgresql_where=sa.text("status = 'in_progress'"),
+        sqlite_where=sa.text("status = 'in_progress'"),
+    )
+
+
+def downgrade() -> None:
+    """Drop idx_sessions_in_progress_expires."""
+    op.drop_index("idx_sessions_in_progress_expires", table_name="sessions")
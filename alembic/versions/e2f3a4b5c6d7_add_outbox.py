@@ -0,0 +1,78 @@
+"""Add outbox table
+
+Telegram messages were sent from inside request handlers and the reminder
+job, before the transaction that produced them committed. Messages are now
+written to outbox in that transaction and sent after commit by the outbox
+dispatcher (see src/services/outbox.py).
+
+Revision ID: e2f3a4b5c6d7
+Revises: d2e3f4a5b6c7
+Create Date: 2026-04-27 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2f3a4b5c6d7"
+down_revision: Union[str, Sequence[str], None] = "d2e3f4a5b6c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create outbox table and its dispatcher index."""
+    op.create_table(
+        "outbox",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "idempotency_key",
+            sa.String(length=128),
+            nullable=False,
+            comment="Deduplicates enqueues, e.g. reply:<chat_id>:<message_id>",
+        ),
+        sa.Column("chat_id", sa.BigInteger(), nullable=False, comment="Telegram chat ID"),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column(
+            "status",
+            sa.String(length=16),
+            nullable=False,
+            comment="pending, sent or failed",
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column(
+            "next_attempt_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Earliest (re)try time; pushed ahead while a dispatcher holds the row",
+        ),
+        sa.Column("last_error", sa.String(length=255), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("idempotency_key"),
+    )
+    op.create_index(
+        "idx_outbox_pending_next_attempt",
+        "outbox",
+        ["next_attempt_at"],
+        postgresql_where=sa.text("status = 'pending'"),
+        sqlite_where=sa.text("status = 'pending'"),
+    )
+    op.create_index("idx_outbox_created", "outbox", ["created_at"])
+
+
+def downgrade() -> None:
+    """Drop outbox table."""
+    op.drop_index("idx_outbox_created", table_name="outbox")
+    op.drop_index("idx_outbox_pending_next_attempt", table_name="outbox")
+    op.drop_table("outbox")
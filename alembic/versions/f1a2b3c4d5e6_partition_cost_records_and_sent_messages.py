@@ -0,0 +1,191 @@
+"""Partition cost_records and sent_messages by month (PostgreSQL only)
+
+Both tables are append-only audit logs queried only over recent windows.
+Monthly range partitions let the nightly retention job drop whole months
+after archiving them, so index depth tracks the retention window instead of
+total history.
+
+Each table is rebuilt as a partitioned table:
+  1. Rename the existing table to <table>_legacy and drop its indexes.
+  2. Create <table> (LIKE legacy) PARTITION BY RANGE (<timestamp>), with the
+     primary key widened to (<id>, <timestamp>) as PostgreSQL requires.
+  3. Create monthly partitions covering existing data plus two months ahead,
+     and a DEFAULT partition as a safety net.
+  4. Copy rows, hand the id sequence to the new table, drop the legacy table.
+
+SQLite (used by tests) does not support partitioning; this migration is a
+no-op there.
+
+Revision ID: f1a2b3c4d5e6
+Revises: e1f2a3b4c5d6
+Create Date: 2026-03-27 00:00:00.000000
+
+"""
+
+from datetime import UTC, date, datetime
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1a2b3c4d5e6"
+down_revision: Union[str, Sequence[str], None] = "e1f2a3b4c5d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 2
+
+# table -> (id column, partition key, foreign keys, indexes)
+TABLES: dict[str, dict[str, object]] = {
+    "cost_records": {
+        "id": "cost_id",
+        "ts": "recorded_at",
+        "fks": [
+            (
+                "fk_cost_records_student_id_students",
+                "student_id",
+                "students",
+                "student_id",
+                "CASCADE",
+            ),
+            (
+                "fk_cost_records_session_id_sessions",
+                "session_id",
+                "sessions",
+                "session_id",
+                "SET NULL",
+            ),
+        ],
+        "indexes": [
+            ("idx_cost_records_student", ["student_id"]),
+            ("idx_cost_records_session", ["session_id"]),
+            ("idx_cost_records_recorded", ["recorded_at"]),
+            ("idx_cost_records_operation", ["operation"]),
+        ],
+    },
+    "sent_messages": {
+        "id": "id",
+        "ts": "sent_at",
+        "fks": [
+            (
+                "fk_sent_messages_student_id_students",
+                "student_id",
+                "students",
+                "student_id",
+                "CASCADE",
+            ),
+        ],
+        "indexes": [
+            ("ix_sent_messages_student_id", ["student_id"]),
+        ],
+    },
+}
+
+
+def _add_months(d: date, months: int) -> date:
+    index = d.year * 12 + (d.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _drop_legacy_indexes_and_pk(conn: sa.Connection, legacy: str) -> None:
+    pk = conn.execute(
+        sa.text(
+            "SELECT conname FROM pg_constraint "
+            "WHERE conrelid = CAST(:t AS regclass) AND contype = 'p'"
+        ),
+        {"t": legacy},
+    ).scalar()
+    if pk:
+        op.execute(f'ALTER TABLE "{legacy}" DROP CONSTRAINT "{pk}"')
+    for (name,) in conn.execute(
+        sa.text("SELECT indexname FROM pg_indexes WHERE tablename = :t"), {"t": legacy}
+    ):
+        op.execute(f'DROP INDEX "{name}"')
+
+
+def _create_indexes_and_fks(table: str, spec: dict[str, object]) -> None:
+    for name, column, ref_table, ref_column, on_delete in spec["fks"]:  # type: ignore[attr-defined]
+        op.execute(
+            f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" FOREIGN KEY ("{column}") '
+            f'REFERENCES "{ref_table}" ("{ref_column}") ON DELETE {on_delete}'
+        )
+    for name, columns in spec["indexes"]:  # type: ignore[attr-defined]
+        op.create_index(name, table, columns)
+
+
+def _hand_over_sequence(conn: sa.Connection, table: str, legacy: str, id_col: str) -> None:
+    seq = conn.execute(
+        sa.text("SELECT pg_get_serial_sequence(:t, :c)"), {"t": legacy, "c": id_col}
+    ).scalar()
+    if seq:
+        op.execute(f'ALTER SEQUENCE {seq} OWNED BY "{table}"."{id_col}"')
+
+
+def upgrade() -> None:
+    """Rebuild cost_records and sent_messages as monthly range-partitioned tables."""
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+
+    this_month = datetime.now(UTC).date().replace(day=1)
+
+    for table, spec in TABLES.items():
+        legacy = f"{table}_legacy"
+        id_col, ts_col = spec["id"], spec["ts"]
+
+        op.execute(f'ALTER TABLE "{table}" RENAME TO "{legacy}"')
+        _drop_legacy_indexes_and_pk(conn, legacy)
+
+        op.execute(
+            f'CREATE TABLE "{table}" (LIKE "{legacy}" INCLUDING DEFAULTS '
+            f"INCLUDING CONSTRAINTS INCLUDING COMMENTS) "
+            f'PARTITION BY RANGE ("{ts_col}")'
+        )
+        op.execute(
+            f'ALTER TABLE "{table}" ADD CONSTRAINT "pk_{table}" '
+            f'PRIMARY KEY ("{id_col}", "{ts_col}")'
+        )
+
+        oldest = conn.execute(sa.text(f'SELECT MIN("{ts_col}") FROM "{legacy}"')).scalar()
+        month = oldest.date().replace(day=1) if oldest is not None else this_month
+        last = _add_months(this_month, MONTHS_AHEAD)
+        while month <= last:
+            upper = _add_months(month, 1)
+            op.execute(
+                f'CREATE TABLE "{table}_y{month.year:04d}m{month.month:02d}" '
+                f'PARTITION OF "{table}" '
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+            )
+            month = upper
+        op.execute(f'CREATE TABLE "{table}_default" PARTITION OF "{table}" DEFAULT')
+
+        _create_indexes_and_fks(table, spec)
+        op.execute(f'INSERT INTO "{table}" SELECT * FROM "{legacy}"')
+        _hand_over_sequence(conn, table, legacy, str(id_col))
+        op.execute(f'DROP TABLE "{legacy}"')
+
+
+def downgrade() -> None:
+    """Rebuild cost_records and sent_messages as plain (unpartitioned) tables."""
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+
+    for table, spec in TABLES.items():
+        partitioned = f"{table}_partitioned"
+        id_col = spec["id"]
+
+        op.execute(f'ALTER TABLE "{table}" RENAME TO "{partitioned}"')
+        _drop_legacy_indexes_and_pk(conn, partitioned)
+
+        op.execute(
+            f'CREATE TABLE "{table}" (LIKE "{partitioned}" INCLUDING DEFAULTS '
+            f"INCLUDING CONSTRAINTS INCLUDING COMMENTS)"
+        )
+        op.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "pk_{table}" PRIMARY KEY ("{id_col}")')
+
+        _create_indexes_and_fks(table, spec)
+        op.execute(f'INSERT INTO "{table}" SELECT * FROM "{partitioned}"')
+        _hand_over_sequence(conn, table, partitioned, str(id_col))
+        op.execute(f'DROP TABLE "{partitioned}" CASCADE')
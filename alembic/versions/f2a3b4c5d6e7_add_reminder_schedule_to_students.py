@@ -0,0 +1,74 @@
+"""Add per-student reminder schedule
+
+A single cron at 12:30 UTC reminded every student in the same minute. Each
+student now has a timezone and a preferred local hour, and the reminder job
+reads small per-minute buckets ordered by next_reminder_at (see
+src/services/reminder_schedule.py).
+
+Existing students keep the 18:00 IST default; next_reminder_at starts NULL
+and is filled in by the reminder job.
+
+Revision ID: f2a3b4c5d6e7
+Revises: e2f3a4b5c6d7
+Create Date: 2026-05-04 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a3b4c5d6e7"
+down_revision: Union[str, Sequence[str], None] = "e2f3a4b5c6d7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add timezone, reminder_hour and next_reminder_at to students."""
+    op.add_column(
+        "students",
+        sa.Column(
+            "timezone",
+            sa.String(length=64),
+            nullable=False,
+            server_default="Asia/Kolkata",
+            comment="IANA timezone for the daily reminder",
+        ),
+    )
+    op.add_column(
+        "students",
+        sa.Column(
+            "reminder_hour",
+            sa.Integer(),
+            nullable=False,
+            server_default="18",
+            comment="Local hour (0-23) in which the daily reminder is sent",
+        ),
+    )
+    op.add_column(
+        "students",
+        sa.Column(
+            "next_reminder_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When the next daily reminder is due (UTC)",
+        ),
+    )
+    op.create_check_constraint(
+        "ck_students_reminder_hour_range",
+        "students",
+        "reminder_hour >= 0 AND reminder_hour <= 23",
+    )
+    op.create_index("idx_students_next_reminder_at", "students", ["next_reminder_at"])
+
+
+def downgrade() -> None:
+    """Remove the reminder schedule columns from students."""
+    op.drop_index("idx_students_next_reminder_at", table_name="students")
+    op.drop_constraint("ck_students_reminder_hour_range", "students", type_="check")
+    op.drop_column("students", "next_reminder_at")
+    op.drop_column("students", "reminder_hour")
+    op.drop_column("students", "timezone")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: per-record cost of structured logging.
+
+Usage:
+    python benchmarks/bench_logging.py [--number N] [--repeat R]
+
+Compares, per log record:
+  - sanitize: the previous sanitize_log_data() (one substring scan per
+    SENSITIVE_KEYS entry) against the current single-regex matcher.
+  - format: the previous JSONFormatter.format() against the current one.
+  - emit: time spent on the calling thread by a StreamHandler writing to
+    a null device, against a DeferredQueueHandler that only enqueues.
+
+Prints the best-of-R time per record in microseconds and the speedup.
+"""
+
+import argparse
+import json
+import logging
+import os
+import queue
+import sys
+import timeit
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+# Allow running as a top-level script from the project root.
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from src.logging.config import (  # noqa: E402
+    SENSITIVE_KEYS,
+    DeferredQueueHandler,
+    JSONFormatter,
+    sanitize_log_data,
+)
+
+
+def legacy_sanitize(data: Any) -> Any:
+    """sanitize_log_data() as it was before the precompiled matcher."""
+    if isinstance(data, dict):
+        return {
+            key: "***MASKED***" if key.lower() in SENSITIVE_KEYS else legacy_sanitize(value)
+            for key, value in data.items()
+        }
+    elif isinstance(data, list):
+        return [legacy_sanitize(item) for item in data]
+    elif isinstance(data, str):
+        lower_str = data.lower()
+        for key in SENSITIVE_KEYS:
+            if key in lower_str and ("=" in data or ":" in data):
+                return "***MASKED***"
+        return data
+    else:
+        return data
+
+
+class LegacyJSONFormatter(logging.Formatter):
+    """JSONFormatter.format() as it was before this change."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_data: dict[str, Any] = {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if hasattr(record, "extra"):
+            log_data["extra"] = record.extra
+        return json.dumps(legacy_sanitize(log_data))
+
+
+def _webhook_record() -> logging.LogRecord:
+    """A typical webhook log line: message plus a handful of context fields."""
+    record = logging.LogRecord(
+        "src.routes.webhook", logging.INFO, __file__, 1, "Received Telegram update", None, None
+    )
+    record.extra = {
+        "update_id": 123456789,
+        "student_id_hash": "9f86d081884c7d65",
+        "command": "/practice",
+        "language": "bn",
+        "elapsed_ms": 12.5,
+        "path": "/webhook",
+    }
+    return record
+
+
+def _best_us(func: Callable[[], object], number: int, repeat: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def _report(name: str, before: float, after: float) -> None:
+    print(f"{name:<10} before {before:8.2f} us   after {after:8.2f} us   {before / after:5.1f}x")
+
+
+def main() -> None:
+    """Run the benchmarks and print per-record timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20_000, help="Calls per timing run.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs; best is reported.")
+    args = parser.parse_args()
+
+    record = _webhook_record()
+    payload = {"message": record.getMessage(), "extra": record.extra}
+    assert legacy_sanitize(payload) == sanitize_log_data(payload)
+
+    _report(
+        "sanitize",
+        _best_us(lambda: legacy_sanitize(payload), args.number, args.repeat),
+        _best_us(lambda: sanitize_log_data(payload), args.number, args.repeat),
+    )
+    legacy_formatter, formatter = LegacyJSONFormatter(), JSONFormatter()
+    _report(
+        "format",
+        _best_us(lambda: legacy_formatter.format(record), args.number, args.repeat),
+        _best_us(lambda: formatter.format(record), args.number, args.repeat),
+    )
+
+    with open(os.devnull, "w") as devnull:
+        stream_handler = logging.StreamHandler(devnull)
+        stream_handler.setFormatter(legacy_formatter)
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = DeferredQueueHandler(log_queue)
+
+        def enqueue() -> None:
+            queue_handler.handle(logging.makeLogRecord(record.__dict__))
+
+        _report(
+            "emit",
+            _best_us(lambda: stream_handler.handle(record), args.number, args.repeat),
+            _best_us(enqueue, args.number, args.repeat),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks for the pure-compute code on per-message hot paths.
+
+Usage:
+    python benchmarks/microbench.py run [--save PATH] [--filter TEXT]
+    python benchmarks/microbench.py compare [--baseline PATH] [--threshold F]
+    python benchmarks/microbench.py compare --current PATH   # no re-run
+
+Cases:
+  - evaluator.*: AnswerEvaluator.evaluate() over every problem in
+    content/problems, with correct, wrong and malformed answers.
+  - selector.select_problems: a full ProblemSelector.select_problems() for
+    grade 7 with in-memory repositories and 60 responses from the last 30 days.
+  - hint_cache.*: HintCache.get() hits and misses, HintCache.set().
+  - sanitize_log_data: one webhook log payload.
+  - streak_message.*: webhook _format_streak_message() in en and bn.
+  - hash_telegram_id: one ID.
+
+Fixtures are deterministic: problems come from the real YAML files (IDs
+assigned in file order) and every random choice uses a fixed seed.
+
+Timing: each case is calibrated to run for at least --min-time seconds,
+then timed --repeat times with the garbage collector off (timeit). The
+best run is the reported figure, in nanoseconds per operation.
+
+"run --save" writes results to a JSON file (benchmarks/baseline.json by
+default). "compare" re-runs the suite (or loads --current) and exits with
+status 1 if any case is slower than the baseline by more than --threshold
+(default 0.25, i.e. 25%). Baselines are machine-specific: refresh
+benchmarks/baseline.json on the machine you compare on.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import timeit
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+# Allow running as a top-level script from the project root.
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from src.logging.config import sanitize_log_data  # noqa: E402
+from src.models.problem import Problem  # noqa: E402
+from src.models.streak import Streak  # noqa: E402
+from src.routes.webhook import _format_streak_message  # noqa: E402
+from src.services.answer_evaluator import AnswerEvaluator  # noqa: E402
+from src.services.hint_cache import HintCache  # noqa: E402
+from src.services.problem_content import (  # noqa: E402
+    find_problem_files,
+    parse_problem_files,
+    validate_and_transform_problem,
+)
+from src.services.problem_selector import ProblemSelector  # noqa: E402
+from src.utils.pii import hash_telegram_id  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+_SEED = 20240601
+
+
+@dataclass
+class Case:
+    """One benchmark: func performs ops operations per call."""
+
+    name: str
+    func: Callable[[], object]
+    ops: int = 1
+
+
+def load_problems() -> list[Problem]:
+    """Build transient Problem objects from content/problems, IDs in file order."""
+    problems: list[Problem] = []
+    for path, raw_problems in parse_problem_files(find_problem_files(), workers=1):
+        for raw in raw_problems:
+            row = validate_and_transform_problem(raw, path)
+            problems.append(Problem(problem_id=len(problems) + 1, **row))
+    return problems
+
+
+def _wrong_answer(problem: Problem) -> str:
+    if problem.answer_type == "multiple_choice":
+        return "D" if problem.answer.strip().upper() != "D" else "A"
+    return "-987654"
+
+
+class _ProblemRepo:
+    def __init__(self, problems: list[Problem]) -> None:
+        self._problems = problems
+
+    async def get_by_grade(self, db: Any, grade: int) -> list[Problem]:  # noqa: ARG002
+        return [p for p in self._problems if p.grade == grade]
+
+
+class _ResponseRepo:
+    def __init__(self, responses: list[dict[str, object]]) -> None:
+        self._responses = responses
+
+    async def get_recent_by_student(
+        self,
+        db: Any,  # noqa: ARG002
+        student_id: int,  # noqa: ARG002
+        since: datetime,
+    ) -> list[dict[str, object]]:
+        return [r for r in self._responses if r["answered_at"] >= since]  # type: ignore[operator]
+
+
+def _run_sync(coroutine: Any) -> Any:
+    """Drive a coroutine that never suspends (in-memory repos) without a loop."""
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coroutine.close()
+    raise RuntimeError("Benchmark coroutine suspended")
+
+
+def _evaluate_all(
+    evaluator: AnswerEvaluator, pairs: list[tuple[Problem, str]]
+) -> Callable[[], object]:
+    def run() -> None:
+        for problem, answer in pairs:
+            evaluator.evaluate(problem, answer, 1)
+
+    return run
+
+
+def _cache_get(cache: HintCache, keys: list[tuple[int, int]]) -> Callable[[], object]:
+    def run() -> None:
+        for problem_id, number in keys:
+            cache.get(problem_id, number, "en")
+
+    return run
+
+
+def _cache_set(cache: HintCache, keys: list[tuple[int, int]]) -> Callable[[], object]:
+    def run() -> None:
+        for problem_id, number in keys:
+            cache.set(problem_id, number, "bn", "hint")
+
+    return run
+
+
+def build_cases(problems: list[Problem]) -> list[Case]:
+    """Create every benchmark case from the problem fixtures."""
+    rng = random.Random(_SEED)
+    evaluator = AnswerEvaluator()
+    correct = [(p, p.answer) for p in problems]
+    wrong = [(p, _wrong_answer(p)) for p in problems]
+    malformed = [(p, "about twelve?") for p in problems]
+
+    grade_7 = [p for p in problems if p.grade == 7]
+    now = datetime.now(UTC)
+    responses: list[dict[str, object]] = [
+        {
+            "problem_id": problem.problem_id,
+            "topic": problem.topic,
+            "is_correct": rng.random() < 0.7,
+            "answered_at": now - timedelta(days=rng.uniform(0, 30)),
+        }
+        for problem in rng.sample(grade_7, min(60, len(grade_7)))
+    ]
+    selector = ProblemSelector(_ProblemRepo(problems), _ResponseRepo(responses))
+
+    cache = HintCache()
+    for problem in problems:
+        for number in (1, 2, 3):
+            cache.set(problem.problem_id, number, "en", f"Hint {number} for {problem.problem_id}")
+    hit_keys = [(p.problem_id, rng.randint(1, 3)) for p in problems]
+    miss_keys = [(p.problem_id, 9) for p in problems]
+
+    payload = {
+        "message": "Received Telegram update",
+        "extra": {
+            "update_id": 123456789,
+            "student_id_hash": "9f86d081884c7d65",
+            "command": "/practice",
+            "language": "bn",
+            "elapsed_ms": 12.5,
+            "path": "/webhook",
+        },
+    }
+    streak = Streak(student_id=1, current_streak=12, longest_streak=30, milestones_achieved=[3, 7])
+    today = now.date()
+    practiced: list[date] = [today - timedelta(days=d) for d in (0, 1, 2, 4, 5)]
+
+    return [
+        Case("evaluator.correct", _evaluate_all(evaluator, correct), len(correct)),
+        Case("evaluator.wrong", _evaluate_all(evaluator, wrong), len(wrong)),
+        Case("evaluator.malformed", _evaluate_all(evaluator, malformed), len(malformed)),
+        Case(
+            "selector.select_problems",
+            lambda: _run_sync(selector.select_problems(None, student_id=1, grade=7)),  # type: ignore[arg-type]
+        ),
+        Case("hint_cache.get_hit", _cache_get(cache, hit_keys), len(hit_keys)),
+        Case("hint_cache.get_miss", _cache_get(cache, miss_keys), len(miss_keys)),
+        Case("hint_cache.set", _cache_set(HintCache(), hit_keys), len(hit_keys)),
+        Case("sanitize_log_data", lambda: sanitize_log_data(payload)),
+        Case("streak_message.en", lambda: _format_streak_message(streak, practiced, "en")),
+        Case("streak_message.bn", lambda: _format_streak_message(streak, practiced, "bn")),
+        Case("hash_telegram_id", lambda: hash_telegram_id(987654321)),
+    ]
+
+
+def time_case(case: Case, repeat: int, min_time: float) -> dict[str, float]:
+    """Time one case; return best and median nanoseconds per operation."""
+    timer = timeit.Timer(case.func)
+    number, elapsed = timer.autorange()  # also warms up
+    number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    runs = [t / (number * case.ops) * 1e9 for t in timer.repeat(repeat=repeat, number=number)]
+    return {"best_ns": min(runs), "median_ns": statistics.median(runs)}
+
+
+def run_suite(name_filter: str, repeat: int, min_time: float) -> dict[str, Any]:
+    """Run every case whose name contains name_filter."""
+    problems = load_problems()
+    results: dict[str, dict[str, float]] = {}
+    for case in build_cases(problems):
+        if name_filter in case.name:
+            results[case.name] = time_case(case, repeat, min_time)
+            print(f"{case.name:<28} {results[case.name]['best_ns']:>12,.0f} ns/op", flush=True)
+    return {
+        "meta": {
+            "created": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "processor": platform.processor() or platform.machine(),
+            "problems": len(problems),
+            "repeat": repeat,
+            "min_time": min_time,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> list[str]:
+    """Print a comparison table and return the names of regressed cases."""
+    regressions: list[str] = []
+    print(f"{'case':<28} {'baseline ns':>12} {'current ns':>12} {'change':>8}")
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<28} {'-':>12} {result['best_ns']:>12,.0f}      new")
+            continue
+        change = result["best_ns"] / before["best_ns"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<28} {before['best_ns']:>12,.0f} {result['best_ns']:>12,.0f} "
+            f"{change:>+7.1%}{flag}"
+        )
+    return regressions
+
+
+def main() -> None:
+    """Parse arguments and run or compare the suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="Run the suite and print ns/op.")
+    run_parser.add_argument("--save", type=Path, default=None, help="Write results to PATH.")
+    compare_parser = commands.add_parser("compare", help="Compare against a baseline.")
+    compare_parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    compare_parser.add_argument(
+        "--current", type=Path, default=None, help="Compare saved results instead of re-running."
+    )
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.25, help="Allowed slowdown (0.25 = 25%%)."
+    )
+    for sub in (run_parser, compare_parser):
+        sub.add_argument("--filter", default="", help="Only cases whose name contains TEXT.")
+        sub.add_argument("--repeat", type=int, default=7, help="Timing runs; best is kept.")
+        sub.add_argument("--min-time", type=float, default=0.2, help="Seconds per timing run.")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run_suite(args.filter, args.repeat, args.min_time)
+        if args.save is not None:
+            args.save.write_text(json.dumps(results, indent=2) + "\n")
+            print(f"Saved {len(results['results'])} results to {args.save}")
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+    if args.current is not None:
+        current = json.loads(args.current.read_text())
+    else:
+        current = run_suite(args.filter, args.repeat, args.min_time)
+        print()
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than baseline by >{args.threshold:.0%}")
+        sys.exit(1)
+    print(f"\nNo regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Local stand-ins for the Telegram Bot API and the Anthropic Messages API.
+
+Used by benchmarks/webhook_load.py so load tests never reach the real
+services. Each stand-in is a small FastAPI app served by uvicorn on a
+pre-bound loopback socket, so its URL is known before the app under test
+reads its settings.
+
+Both take a latency (seconds, with optional uniform jitter) and an error
+rate in [0, 1]. Failed Telegram calls return 500; failed Anthropic calls
+return 529 (overloaded), which the hint generator treats as retryable.
+
+This module must not import src: the harness sets environment variables
+from the stand-in URLs before the app's settings are loaded.
+"""
+
+import asyncio
+import random
+import socket
+from dataclasses import dataclass, field
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+@dataclass
+class Faults:
+    """Latency and error injection for one stand-in.
+
+    Attributes:
+        latency: Base delay per call in seconds.
+        jitter: Extra uniformly distributed delay in [0, jitter] seconds.
+        error_rate: Fraction of calls answered with an error status.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+
+    async def apply(self, rng: random.Random) -> bool:
+        """Sleep for the configured latency; return True if the call should fail."""
+        delay = self.latency + (rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        return rng.random() < self.error_rate
+
+
+@dataclass
+class StandInStats:
+    """Call counters for one stand-in."""
+
+    calls: int = 0
+    errors: int = 0
+
+
+@dataclass
+class TelegramStandIn:
+    """Records sendMessage calls; keeps the last reply per chat.
+
+    Attributes:
+        faults: Latency and error injection.
+        last_reply: chat_id -> text of the most recent successful sendMessage.
+        stats: Call counters.
+    """
+
+    faults: Faults = field(default_factory=Faults)
+    last_reply: dict[int, str] = field(default_factory=dict)
+    stats: StandInStats = field(default_factory=StandInStats)
+    seed: int = 0
+
+    def app(self) -> FastAPI:
+        """Build the stand-in ASGI app."""
+        app = FastAPI()
+        rng = random.Random(self.seed)
+
+        @app.post("/bot{token}/sendMessage")
+        async def send_message(token: str, request: Request) -> JSONResponse:
+            self.stats.calls += 1
+            payload = await request.json()
+            if await self.faults.apply(rng):
+                self.stats.errors += 1
+                return JSONResponse(
+                    {"ok": False, "error_code": 500, "description": "Injected error"},
+                    status_code=500,
+                )
+            self.last_reply[int(payload["chat_id"])] = payload["text"]
+            return JSONResponse(
+                {"ok": True, "result": {"message_id": self.stats.calls, "text": payload["text"]}}
+            )
+
+        return app
+
+
+@dataclass
+class AnthropicStandIn:
+    """Answers POST /v1/messages with a fixed Socratic hint.
+
+    Attributes:
+        faults: Latency and error injection.
+        stats: Call counters.
+    """
+
+    faults: Faults = field(default_factory=Faults)
+    stats: StandInStats = field(default_factory=StandInStats)
+    seed: int = 0
+
+    def app(self) -> FastAPI:
+        """Build the stand-in ASGI app."""
+        app = FastAPI()
+        rng = random.Random(self.seed)
+
+        @app.post("/v1/messages")
+        async def create_message(request: Request) -> JSONResponse:
+            self.stats.calls += 1
+            payload = await request.json()
+            if await self.faults.apply(rng):
+                self.stats.errors += 1
+                return JSONResponse(
+                    {
+                        "type": "error",
+                        "error": {"type": "overloaded_error", "message": "Injected error"},
+                    },
+                    status_code=529,
+                )
+            return JSONResponse(
+                {
+                    "id": f"msg_standin_{self.stats.calls}",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": payload.get("model", "stand-in"),
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": "What is the question asking you to find? "
+                            "Write down the numbers you know first.",
+                        }
+                    ],
+                    "stop_reason": "end_turn",
+                    "stop_sequence": None,
+                    "usage": {"input_tokens": 180, "output_tokens": 24},
+                }
+            )
+
+        return app
+
+
+class StandInServer:
+    """Serves an ASGI app on a loopback port inside the current event loop.
+
+    The socket is bound in __init__, so url is usable immediately.
+    """
+
+    def __init__(self, app: FastAPI) -> None:
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(("127.0.0.1", 0))
+        port = self._socket.getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        self._server = uvicorn.Server(
+            uvicorn.Config(app, log_level="warning", lifespan="off", access_log=False)
+        )
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start serving and wait until the server accepts connections."""
+        self._task = asyncio.create_task(self._server.serve(sockets=[self._socket]))
+        while not self._server.started:
+            await asyncio.sleep(0.01)
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        self._server.should_exit = True
+        if self._task is not None:
+            await self._task
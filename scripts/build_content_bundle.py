@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Build script: validate YAML problem files and compile the content bundle.
+
+Usage:
+    python scripts/build_content_bundle.py [--output PATH] [--workers N] [--check]
+
+Options:
+    --output PATH  Bundle destination (default: content/problems.bundle.jsonl).
+    --workers N    Processes used to parse YAML files (default: one per CPU).
+    --check        Only report whether the existing bundle is up to date;
+                   exits 1 if it is missing or stale.
+
+The bundle is a single JSON Lines file (see src/services/content_bundle.py)
+that the app memory-maps at startup and scripts/seed_problems.py seeds from.
+Any invalid or duplicated problem fails the build with exit code 1 and
+leaves the existing bundle untouched.
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Allow running as a top-level script from the project root.
+# Adjust sys.path so that `src` can be imported regardless of cwd.
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from src.services.content_bundle import (  # noqa: E402
+    DEFAULT_BUNDLE_PATH,
+    ContentBundle,
+    ContentBundleError,
+    compile_bundle,
+)
+from src.services.problem_content import find_problem_files  # noqa: E402
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def check_bundle(output: Path) -> int:
+    """Report whether the bundle at output matches the current YAML files.
+
+    Args:
+        output: Bundle path.
+
+    Returns:
+        Process exit code: 0 if up to date, 1 if missing or stale.
+    """
+    try:
+        bundle = ContentBundle(output)
+    except ContentBundleError as exc:
+        logger.error("%s", exc)
+        return 1
+    stale = bundle.stale_sources(find_problem_files())
+    if stale:
+        logger.error("Content bundle is stale; changed sources: %s", ", ".join(stale))
+        return 1
+    logger.info("Content bundle is up to date (%d problems).", len(bundle))
+    return 0
+
+
+def build_bundle(output: Path, workers: int | None = None) -> int:
+    """Compile every YAML problem file into the bundle at output.
+
+    Args:
+        output: Bundle path.
+        workers: Worker processes used for parsing YAML.
+
+    Returns:
+        Process exit code: 0 on success, 1 if validation failed.
+    """
+    files = find_problem_files()
+    if not files:
+        logger.error("No YAML files found. Nothing to compile.")
+        return 1
+
+    started = time.perf_counter()
+    try:
+        header = compile_bundle(files, output, workers=workers)
+    except ContentBundleError as exc:
+        logger.error("Content validation failed: %s", exc)
+        return 1
+
+    logger.info(
+        "Wrote %s: %d problem(s) from %d file(s), %d topic(s) in %.0f ms.",
+        output,
+        header["problem_count"],
+        len(header["sources"]),
+        len(header["topics"]),
+        (time.perf_counter() - started) * 1000,
+    )
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse CLI arguments.
+
+    Returns:
+        Parsed argument namespace.
+    """
+    parser = argparse.ArgumentParser(
+        description="Validate YAML problem files and compile the content bundle.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=DEFAULT_BUNDLE_PATH,
+        metavar="PATH",
+        help="Bundle destination (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Processes used to parse YAML files (default: one per CPU).",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        default=False,
+        help="Exit 1 if the existing bundle is missing or stale; do not build.",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.check:
+        sys.exit(check_bundle(args.output))
+    sys.exit(build_bundle(args.output, workers=args.workers))
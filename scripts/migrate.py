@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Apply Alembic migrations only when the database is behind the scripts.
+
+Usage:
+    python scripts/migrate.py [--lock-timeout SECONDS] [--retries N] [--check]
+
+Options:
+    --lock-timeout SECONDS  How long to wait for another replica's migration
+                            (default: 120).
+    --retries N             Connection attempts before giving up (default: 3).
+    --check                 Only report whether migrations are pending;
+                            exits 1 if they are.
+
+Boot path: one query compares alembic_version with the head revision(s) of
+alembic/versions. When they match (every boot after the first replica of a
+deploy) the script exits without touching the migration environment.
+
+When they differ, the script takes a PostgreSQL session-level advisory lock
+so parallel replicas migrate one at a time, re-reads alembic_version (the
+replica that held the lock may already have migrated), and only then runs
+"alembic upgrade head". SQLite has no advisory locks and migrates directly.
+
+Connections are built exactly as in alembic/env.py (src/utils/database_url.py):
+psycopg2, *.railway.internal resolved to IPv4, and a connect timeout so an
+unreachable database fails fast instead of hanging the boot.
+
+Exit codes: 0 if the schema is current or was migrated, 1 on failure or,
+with --check, if migrations are pending.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.pool import NullPool
+
+from alembic import command
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_ALEMBIC_INI = _PROJECT_ROOT / "alembic.ini"
+
+# Adjust sys.path so that `src` can be imported regardless of cwd.
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from src.utils.database_url import (  # noqa: E402
+    migration_connect_args,
+    migration_database_url,
+)
+
+# pg_advisory_lock key shared by every replica ("dars" in ASCII)
+ADVISORY_LOCK_KEY = 0x64617273
+_LOCK_POLL_SECONDS = 1.0
+_RETRY_WAIT_SECONDS = 2.0
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(message)s",
+)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)  # alembic.ini sets the root logger to WARNING
+
+
+class MigrationError(Exception):
+    """Migration could not be completed; retrying will not help."""
+
+
+class MigrationLockTimeout(MigrationError):
+    """Another replica held the migration lock for longer than the timeout."""
+
+
+def script_heads(config: Config) -> set[str]:
+    """Head revision(s) of alembic/versions."""
+    return set(ScriptDirectory.from_config(config).get_heads())
+
+
+def database_heads(conn: Connection) -> set[str]:
+    """Revision(s) recorded in alembic_version; empty if the table is missing.
+
+    Args:
+        conn: Connection in AUTOCOMMIT mode, so a failed read leaves no
+            aborted transaction behind.
+    """
+    try:
+        rows = conn.execute(text("SELECT version_num FROM alembic_version"))
+    except (OperationalError, ProgrammingError):
+        return set()
+    return {row[0] for row in rows}
+
+
+@contextmanager
+def advisory_lock(conn: Connection, timeout: float) -> Iterator[None]:
+    """Hold the migration advisory lock on conn for the duration of the block.
+
+    Polls pg_try_advisory_lock so the wait is bounded and logged instead of
+    blocking silently behind another replica.
+
+    Raises:
+        MigrationLockTimeout: If the lock is not acquired within timeout seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while not conn.execute(
+        text("SELECT pg_try_advisory_lock(:key)"), {"key": ADVISORY_LOCK_KEY}
+    ).scalar():
+        if time.monotonic() >= deadline:
+            raise MigrationLockTimeout(f"Migration lock still held after {timeout:.0f}s")
+        logger.info("Waiting for another replica to finish migrating...")
+        time.sleep(_LOCK_POLL_SECONDS)
+    try:
+        yield
+    finally:
+        conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": ADVISORY_LOCK_KEY})
+
+
+def _upgrade(config: Config) -> None:
+    """Run "alembic upgrade head".
+
+    alembic/env.py calls logging.config.fileConfig(), which disables loggers
+    created before it, so ours is re-enabled afterwards.
+
+    Raises:
+        MigrationError: If any migration fails.
+    """
+    started = time.perf_counter()
+    try:
+        command.upgrade(config, "head")
+    except Exception as exc:
+        raise MigrationError(f"alembic upgrade head failed: {exc}") from exc
+    finally:
+        logger.disabled = False
+    logger.info(f"Migrated to head in {time.perf_counter() - started:.1f}s")
+
+
+def migrate_if_needed(url: str, config: Config, lock_timeout: float, check: bool = False) -> str:
+    """Compare schema versions and upgrade to head when they differ.
+
+    Args:
+        url: Synchronous database URL (see migration_database_url()).
+        config: Alembic config (alembic.ini).
+        lock_timeout: Seconds to wait for the advisory lock.
+        check: Report only; never migrate.
+
+    Returns:
+        "current" if nothing was pending, "pending" if check found pending
+        migrations, "migrated" if this process ran the upgrade.
+
+    Raises:
+        MigrationError: If the upgrade fails or the lock wait times out.
+        OperationalError: If the database cannot be reached.
+    """
+    heads = script_heads(config)
+    engine = create_engine(url, poolclass=NullPool, connect_args=migration_connect_args(url))
+    try:
+        with engine.connect() as raw_conn:
+            conn = raw_conn.execution_options(isolation_level="AUTOCOMMIT")
+            current = database_heads(conn)
+            if current == heads:
+                logger.info(f"Schema current at {', '.join(sorted(heads))}; skipping migrations")
+                return "current"
+            logger.info(
+                f"Schema at {', '.join(sorted(current)) or '<empty>'}, "
+                f"scripts at {', '.join(sorted(heads))}"
+            )
+            if check:
+                return "pending"
+
+            if conn.dialect.name != "postgresql":
+                _upgrade(config)
+                return "migrated"
+
+            with advisory_lock(conn, lock_timeout):
+                if database_heads(conn) == heads:
+                    logger.info("Another replica migrated while we waited")
+                    return "current"
+                _upgrade(config)
+                return "migrated"
+    finally:
+        engine.dispose()
+
+
+def main() -> None:
+    """Parse arguments and migrate, retrying connection failures."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lock-timeout", type=float, default=120.0)
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--check", action="store_true", help="Only report pending migrations.")
+    args = parser.parse_args()
+
+    raw_url = os.getenv("DATABASE_URL", "")
+    if not raw_url:
+        logger.error("DATABASE_URL is not set")
+        sys.exit(1)
+    url = migration_database_url(raw_url)
+    config = Config(str(_ALEMBIC_INI))
+
+    for attempt in range(1, max(1, args.retries) + 1):
+        try:
+            outcome = migrate_if_needed(url, config, args.lock_timeout, check=args.check)
+        except OperationalError as exc:
+            logger.warning(f"Database unreachable (attempt {attempt}/{args.retries}): {exc}")
+            if attempt < args.retries:
+                time.sleep(_RETRY_WAIT_SECONDS)
+            continue
+        except MigrationError as exc:
+            logger.error(str(exc))
+            sys.exit(1)
+        sys.exit(1 if outcome == "pending" else 0)
+
+    logger.error("Giving up: database unreachable")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Profile the import time of the app (or any module) with -X importtime.
+
+Usage:
+    python scripts/profile_imports.py [--module NAME] [--top N] [--runs N]
+                                      [--budget-ms MS]
+
+Options:
+    --module NAME   Module to import (default: src.main).
+    --top N         Rows shown in each table (default: 20).
+    --runs N        Fresh interpreters to time; the fastest run is reported,
+                    so the first (cold disk cache) run does not skew it
+                    (default: 3).
+    --budget-ms MS  Exit 1 if importing the module takes longer than MS.
+
+Prints the total import time, the slowest modules by cumulative time
+(the module plus everything it imported first) and by self time, and
+self time summed per top-level package, which is usually where a deferred
+import pays off.
+"""
+
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class ImportTiming:
+    """One line of -X importtime output (microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """Parse the stderr of ``python -X importtime``.
+
+    Args:
+        output: Captured stderr.
+
+    Returns:
+        One entry per imported module, in import completion order.
+    """
+    timings: list[ImportTiming] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Header row
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        timings.append(
+            ImportTiming(
+                module=module,
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+                depth=(len(name) - len(module) - 1) // 2,
+            )
+        )
+    return timings
+
+
+def profile(module: str) -> list[ImportTiming]:
+    """Import module in a fresh interpreter and return its import timings.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=_PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def _total_us(timings: list[ImportTiming], module: str) -> int:
+    return next((t.cumulative_us for t in timings if t.module == module), 0)
+
+
+def report(timings: list[ImportTiming], module: str, top: int) -> int:
+    """Print the tables; return the total import time of module in microseconds."""
+    total_us = _total_us(timings, module)
+    print(f"import {module}: {total_us / 1000:.1f} ms ({len(timings)} modules)\n")
+
+    print(f"{'cumulative ms':>13} {'self ms':>9}  module")
+    for timing in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        indent = "  " * min(timing.depth, 6)
+        print(
+            f"{timing.cumulative_us / 1000:>13.1f} {timing.self_us / 1000:>9.1f}  "
+            f"{indent}{timing.module}"
+        )
+
+    print(f"\n{'self ms':>13}  module")
+    for timing in sorted(timings, key=lambda t: t.self_us, reverse=True)[:top]:
+        print(f"{timing.self_us / 1000:>13.1f}  {timing.module}")
+
+    packages: dict[str, int] = defaultdict(int)
+    for timing in timings:
+        packages[timing.module.split(".")[0]] += timing.self_us
+    print(f"\n{'self ms':>13}  top-level package")
+    ranked = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+    for package, self_us in ranked[:top]:
+        print(f"{self_us / 1000:>13.1f}  {package}")
+    return total_us
+
+
+def main() -> None:
+    """Parse arguments, profile the import and enforce the budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="src.main", help="Module to import.")
+    parser.add_argument("--top", type=int, default=20, help="Rows per table.")
+    parser.add_argument("--runs", type=int, default=3, help="Interpreters to time.")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail above MS.")
+    args = parser.parse_args()
+
+    runs = [profile(args.module) for _ in range(max(1, args.runs))]
+    fastest = min(runs, key=lambda timings: _total_us(timings, args.module))
+    total_us = report(fastest, args.module, args.top)
+
+    if args.budget_ms is not None and total_us / 1000 > args.budget_ms:
+        print(f"\nimport {args.module} exceeds budget of {args.budget_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,27 +3,41 @@
 Seed script: load all YAML problem files into the problems table.
 
 Usage:
-    python scripts/seed_problems.py [--dry-run] [--grade N]
+    python scripts/seed_problems.py [--dry-run] [--grade N] [--force] [--workers N]
+                                    [--bundle PATH | --no-bundle]
 
 Options:
-    --dry-run   Show what would be inserted without making any DB changes.
-    --grade N   Only seed problems for the given grade (6, 7, or 8).
+    --dry-run    Show what would be inserted/updated without making any DB changes.
+    --grade N    Only seed problems for the given grade (6, 7, or 8).
+    --force      Re-seed every file, ignoring the content manifest.
+    --workers N  Processes used to parse YAML files (default: one per CPU).
+    --bundle P   Compiled content bundle (default: content/problems.bundle.jsonl).
+    --no-bundle  Ignore the bundle and always parse YAML.
 
 Idempotency:
-    Uses (grade, topic, question_en) as the uniqueness key.
-    Existing problems are skipped; new ones are inserted.
-    Running twice produces 0 inserts on the second run.
+    Each problem is keyed on content_key = SHA-256(grade, topic, question_en),
+    backed by a unique index. Each file is written with one bulk
+    INSERT ... ON CONFLICT (content_key) DO UPDATE: new problems are inserted,
+    problems whose content_hash changed are updated in place, unchanged
+    problems are left alone.
+
+    The content_manifest table records the SHA-256 of every seeded file.
+    Files whose hash is unchanged are skipped without being parsed, so a
+    re-run over an unchanged catalog costs one SELECT.
+
+Content bundle:
+    Changed files are read from the compiled bundle
+    (scripts/build_content_bundle.py) when it was built from the same file
+    contents; other files are parsed from YAML.
 """
 
 import argparse
 import asyncio
-import glob
 import logging
 import os
 import sys
 from pathlib import Path
-
-import yaml
+from typing import Any
 
 # Allow running as a top-level script from the project root.
 # Adjust sys.path so that `src` can be imported regardless of cwd.
@@ -31,7 +45,8 @@ _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
-from sqlalchemy import select  # noqa: E402
+from sqlalchemy import func, select  # noqa: E402
+from sqlalchemy.dialects import postgresql, sqlite  # noqa: E402
 from sqlalchemy.ext.asyncio import (  # noqa: E402
     AsyncSession,
     async_sessionmaker,
@@ -39,7 +54,22 @@ from sqlalchemy.ext.asyncio import (  # noqa: E402
 )
 from sqlalchemy.pool import NullPool  # noqa: E402
 
+from src.models.content_manifest import ContentManifest  # noqa: E402
 from src.models.problem import Problem  # noqa: E402
+from src.services.content_bundle import (  # noqa: E402
+    DEFAULT_BUNDLE_PATH,
+    ContentBundle,
+    ContentBundleError,
+)
+from src.services.problem_content import (  # noqa: E402
+    content_source_path,
+    file_sha256,
+    find_problem_files,
+    parse_problem_files,
+    problem_content_hash,
+    problem_content_key,
+    validate_and_transform_problem,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -47,8 +77,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Content directory relative to project root.
-CONTENT_DIR = _PROJECT_ROOT / "content" / "problems"
+# Rows per INSERT ... ON CONFLICT statement (and per content_key lookup).
+# Keeps bind-parameter counts well under SQLite's limit for large files.
+UPSERT_BATCH_SIZE = 500
+
+# Columns written by the upsert (besides content_key).
+UPSERT_COLUMNS = (
+    "grade",
+    "topic",
+    "subtopic",
+    "question_en",
+    "question_bn",
+    "answer",
+    "hints",
+    "difficulty",
+    "answer_type",
+    "acceptable_tolerance_percent",
+    "multiple_choice_options",
+    "content_hash",
+)
 
 
 def get_database_url() -> str:
@@ -76,144 +123,61 @@ def get_database_url() -> str:
     return url
 
 
-def convert_hints(raw_hints: list[dict[str, str]]) -> list[dict[str, object]]:
-    """Convert YAML hint format to DB JSON format.
-
-    YAML format:
-        hints:
-          - en: "Hint in English."
-            bn: "ইঙ্গিত বাংলায়।"
-
-    DB format:
-        [{"hint_number": 1, "text_en": "...", "text_bn": "...", "is_ai_generated": false}]
-
-    Args:
-        raw_hints: List of dicts with keys 'en' and 'bn'.
-
-    Returns:
-        List of structured hint dicts with 1-based hint_number.
-    """
-    converted: list[dict[str, object]] = []
-    for i, hint in enumerate(raw_hints, start=1):
-        converted.append(
-            {
-                "hint_number": i,
-                "text_en": hint.get("en", ""),
-                "text_bn": hint.get("bn", ""),
-                "is_ai_generated": False,
-            }
-        )
-    return converted
-
-
-def validate_and_transform_problem(raw: dict[str, object], source_file: str) -> dict[str, object]:
-    """Validate a raw YAML problem dict and transform it to DB insert format.
-
-    Args:
-        raw: Raw dict loaded from YAML.
-        source_file: Path of source YAML file (for error messages).
-
-    Returns:
-        Dict suitable for constructing a Problem ORM instance.
-
-    Raises:
-        ValueError: If required fields are missing or invalid.
-    """
-    # Required fields
-    for field in ("grade", "topic", "question_en", "question_bn", "answer", "hints"):
-        if field not in raw:
-            raise ValueError(
-                f"Problem in {source_file} is missing required field '{field}'. "
-                f"Problem: {raw.get('question_en', '<no question_en>')!r}"
-            )
-
-    raw_hints = raw["hints"]
-    if not isinstance(raw_hints, list) or len(raw_hints) == 0:
-        raise ValueError(
-            f"Problem in {source_file} has empty or invalid 'hints'. "
-            f"Must be a non-empty list of {{en, bn}} dicts."
-        )
-
-    answer_type = str(raw.get("answer_type", "numeric"))
-    if answer_type not in ("numeric", "multiple_choice", "text"):
-        logger.warning(
-            "Unknown answer_type '%s' in %s — defaulting to 'numeric'",
-            answer_type,
-            source_file,
-        )
-        answer_type = "numeric"
-
-    return {
-        "grade": int(raw["grade"]),
-        "topic": str(raw["topic"]),
-        "subtopic": str(raw["subtopic"]) if raw.get("subtopic") else None,
-        "question_en": str(raw["question_en"]),
-        "question_bn": str(raw["question_bn"]),
-        "answer": str(raw["answer"]),
-        "hints": convert_hints(raw_hints),
-        "difficulty": int(raw.get("difficulty", 1)),
-        "answer_type": answer_type,
-        "acceptable_tolerance_percent": (
-            float(raw["acceptable_tolerance_percent"])
-            if raw.get("acceptable_tolerance_percent") is not None
-            else None
-        ),
-        "multiple_choice_options": (
-            list(raw["multiple_choice_options"])
-            if raw.get("multiple_choice_options") is not None
-            else None
-        ),
-    }
-
-
-def load_yaml_files(grade_filter: int | None = None) -> list[tuple[str, list[dict[str, object]]]]:
+def load_yaml_files(
+    grade_filter: int | None = None, workers: int | None = None
+) -> list[tuple[str, list[dict[str, object]]]]:
     """Load all YAML problem files from the content directory.
 
-    Handles two YAML top-level formats:
-    - List format:  ``- grade: 6\n  topic: ...``  (most files)
-    - Dict wrapper: ``problems:\n  - grade: 6\n    ...``  (some files)
-
     Args:
         grade_filter: If set, only load files for this grade level.
+        workers: Worker processes used for parsing (see parse_problem_files).
 
     Returns:
         List of (file_path, list_of_raw_problem_dicts) tuples.
     """
-    pattern = (
-        str(CONTENT_DIR / f"grade_{grade_filter}" / "*.yaml")
-        if grade_filter is not None
-        else str(CONTENT_DIR / "grade_*" / "*.yaml")
-    )
-    files = sorted(glob.glob(pattern))
+    files = find_problem_files(grade_filter)
     if not files:
-        logger.warning("No YAML files matched pattern: %s", pattern)
         return []
-
-    result: list[tuple[str, list[dict[str, object]]]] = []
-    for file_path in files:
-        with open(file_path, encoding="utf-8") as fh:
-            data = yaml.safe_load(fh)
-        if not data:
-            logger.warning("Empty YAML file: %s", file_path)
-            continue
-        # Normalise: unwrap ``{problems: [...]}`` wrapper if present.
-        if isinstance(data, dict):
-            if "problems" in data and isinstance(data["problems"], list):
-                data = data["problems"]
-            else:
-                # Unknown dict structure — skip with a warning.
-                logger.warning(
-                    "Unexpected dict structure in %s (keys: %s) — skipping.",
-                    file_path,
-                    list(data.keys()),
-                )
-                continue
-        if not isinstance(data, list):
-            logger.warning("Unexpected YAML type %s in %s — skipping.", type(data), file_path)
-            continue
-        result.append((file_path, data))
-
-    return result
+    return parse_problem_files(files, workers=workers)
+
+
+def _dialect_insert(session: AsyncSession) -> Any:
+    """Return the dialect-specific insert() that supports ON CONFLICT."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert
+    if dialect == "sqlite":
+        return sqlite.insert
+    raise RuntimeError(f"Seeding requires PostgreSQL or SQLite, not {dialect!r}")
+
+
+async def _existing_hashes(session: AsyncSession, keys: list[str]) -> dict[str, str | None]:
+    """Return {content_key: content_hash} for the given keys already in the DB."""
+    existing: dict[str, str | None] = {}
+    for start in range(0, len(keys), UPSERT_BATCH_SIZE):
+        chunk = keys[start : start + UPSERT_BATCH_SIZE]
+        result = await session.execute(
+            select(Problem.content_key, Problem.content_hash).where(Problem.content_key.in_(chunk))
+        )
+        for key, content_hash in result.all():
+            existing[key] = content_hash
+    return existing
+
+
+async def _upsert_problems(session: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """Bulk INSERT ... ON CONFLICT (content_key) DO UPDATE for transformed rows."""
+    insert = _dialect_insert(session)
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        stmt = insert(Problem).values(rows[start : start + UPSERT_BATCH_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Problem.content_key],
+            set_={
+                **{column: stmt.excluded[column] for column in UPSERT_COLUMNS},
+                "updated_at": func.now(),
+            },
+            where=Problem.content_hash.is_distinct_from(stmt.excluded.content_hash),
+        )
+        await session.execute(stmt)
 
 
 async def seed_problems(
@@ -221,63 +185,216 @@ async def seed_problems(
     file_path: str,
     raw_problems: list[dict[str, object]],
     dry_run: bool = False,
-) -> tuple[int, int]:
+) -> tuple[int, int, int]:
     """Seed problems from one YAML file into the database.
 
-    Uses (grade, topic, question_en) as the uniqueness key. Existing problems
-    are skipped; new ones are inserted (or just counted in dry_run mode).
+    Problems are validated, keyed on content_key and written by seed_rows().
 
     Args:
         session: Async SQLAlchemy session (caller manages transaction).
         file_path: Source file path (used for logging and error messages).
         raw_problems: List of raw problem dicts from YAML.
-        dry_run: If True, no inserts are performed.
+        dry_run: If True, changes are only counted, not written.
 
     Returns:
-        Tuple of (inserted_count, skipped_count).
+        Tuple of (inserted_count, updated_count, skipped_count), where skipped
+        covers unchanged, duplicate and invalid problems.
     """
-    inserted = 0
     skipped = 0
+    by_key: dict[str, dict[str, Any]] = {}
 
     for raw in raw_problems:
         try:
-            transformed = validate_and_transform_problem(raw, file_path)
+            transformed: dict[str, Any] = validate_and_transform_problem(raw, file_path)
         except ValueError as exc:
             logger.error("Skipping invalid problem in %s: %s", file_path, exc)
             skipped += 1
             continue
 
-        # Check for existing record using the uniqueness key.
-        stmt = select(Problem).where(
-            Problem.grade == transformed["grade"],
-            Problem.topic == transformed["topic"],
-            Problem.question_en == transformed["question_en"],
+        key = problem_content_key(
+            transformed["grade"], transformed["topic"], transformed["question_en"]
         )
-        result = await session.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        if existing is not None:
+        if key in by_key:
+            logger.warning(
+                "Duplicate problem in %s (last one wins): %r",
+                file_path,
+                transformed["question_en"],
+            )
             skipped += 1
+        transformed["content_key"] = key
+        transformed["content_hash"] = problem_content_hash(transformed)
+        by_key[key] = transformed
+
+    inserted, updated, unchanged = await seed_rows(session, list(by_key.values()), dry_run)
+    return inserted, updated, skipped + unchanged
+
+
+async def seed_rows(
+    session: AsyncSession,
+    rows: list[dict[str, Any]],
+    dry_run: bool = False,
+) -> tuple[int, int, int]:
+    """Upsert already-validated problem rows keyed on content_key.
+
+    One SELECT finds which keys exist and with which content_hash; new and
+    changed rows are then written with a single bulk upsert (chunked only
+    past UPSERT_BATCH_SIZE rows).
+
+    Args:
+        session: Async SQLAlchemy session (caller manages transaction).
+        rows: Transformed problems with content_key and content_hash set and
+            unique content_keys (extra keys such as bundle metadata are ignored).
+        dry_run: If True, changes are only counted, not written.
+
+    Returns:
+        Tuple of (inserted_count, updated_count, unchanged_count).
+    """
+    existing = await _existing_hashes(session, [row["content_key"] for row in rows])
+
+    to_write: list[dict[str, Any]] = []
+    inserted = updated = unchanged = 0
+    for row in rows:
+        key = row["content_key"]
+        if key not in existing:
+            inserted += 1
+        elif existing[key] != row["content_hash"]:
+            updated += 1
+        else:
+            unchanged += 1
             continue
+        to_write.append({column: row[column] for column in ("content_key", *UPSERT_COLUMNS)})
+
+    if not dry_run and to_write:
+        await _upsert_problems(session, to_write)
+
+    return inserted, updated, unchanged
+
+
+async def _load_manifest(session: AsyncSession) -> dict[str, str]:
+    """Return {source_path: file_hash} for every previously seeded file."""
+    result = await session.execute(select(ContentManifest.source_path, ContentManifest.file_hash))
+    return {row.source_path: row.file_hash for row in result}
+
+
+async def _record_manifest(
+    session: AsyncSession, source_path: str, file_hash: str, problem_count: int
+) -> None:
+    """Upsert the manifest row for one seeded file."""
+    insert = _dialect_insert(session)
+    stmt = insert(ContentManifest).values(
+        source_path=source_path, file_hash=file_hash, problem_count=problem_count
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ContentManifest.source_path],
+        set_={
+            "file_hash": stmt.excluded.file_hash,
+            "problem_count": stmt.excluded.problem_count,
+            "seeded_at": func.now(),
+        },
+    )
+    await session.execute(stmt)
+
 
-        if not dry_run:
-            problem = Problem(**transformed)
-            session.add(problem)
+async def seed_content(
+    session: AsyncSession,
+    file_paths: list[str],
+    dry_run: bool = False,
+    force: bool = False,
+    workers: int | None = None,
+    bundle: ContentBundle | None = None,
+) -> dict[str, int]:
+    """Seed a set of YAML files, skipping those unchanged since the last seed.
 
-        inserted += 1
+    Changed files are read from the compiled content bundle when the bundle
+    was built from the same file contents; only the rest are parsed as YAML.
 
-    if not dry_run and inserted > 0:
-        await session.flush()
+    Args:
+        session: Async SQLAlchemy session (caller manages transaction).
+        file_paths: YAML files to consider.
+        dry_run: If True, changes are only counted, not written.
+        force: If True, ignore the manifest and re-seed every file.
+        workers: Worker processes used for parsing (see parse_problem_files).
+        bundle: Compiled content bundle to prefer over parsing YAML.
 
-    return inserted, skipped
+    Returns:
+        Totals with keys inserted, updated, skipped, files_seeded,
+        files_unchanged and files_from_bundle.
+    """
+    totals = dict.fromkeys(
+        (
+            "inserted",
+            "updated",
+            "skipped",
+            "files_seeded",
+            "files_unchanged",
+            "files_from_bundle",
+        ),
+        0,
+    )
+    manifest = {} if force else await _load_manifest(session)
+
+    file_hashes: dict[str, str] = {}
+    to_parse: list[str] = []
+    for path in file_paths:
+        file_hash = file_sha256(path)
+        source = content_source_path(path)
+        if manifest.get(source) == file_hash:
+            totals["files_unchanged"] += 1
+            continue
+        file_hashes[path] = file_hash
+        if bundle is not None and bundle.source_hash(source) == file_hash:
+            rows = bundle.problems_for_source(source)
+            counts = await seed_rows(session, rows, dry_run=dry_run)
+            await _finish_file(session, path, file_hash, len(rows), dry_run, totals, counts)
+            totals["files_from_bundle"] += 1
+        else:
+            to_parse.append(path)
+
+    for file_path, raw_problems in parse_problem_files(to_parse, workers=workers):
+        counts = await seed_problems(session, file_path, raw_problems, dry_run=dry_run)
+        await _finish_file(
+            session, file_path, file_hashes[file_path], len(raw_problems), dry_run, totals, counts
+        )
 
+    return totals
 
-async def run_seed(dry_run: bool = False, grade_filter: int | None = None) -> None:
+
+async def _finish_file(
+    session: AsyncSession,
+    file_path: str,
+    file_hash: str,
+    problem_count: int,
+    dry_run: bool,
+    totals: dict[str, int],
+    counts: tuple[int, int, int],
+) -> None:
+    """Log one file's counts, add them to totals and record it in the manifest."""
+    inserted, updated, skipped = counts
+    logger.info("%s: inserted=%d, updated=%d, skipped=%d", file_path, inserted, updated, skipped)
+    if not dry_run:
+        await _record_manifest(session, content_source_path(file_path), file_hash, problem_count)
+    totals["inserted"] += inserted
+    totals["updated"] += updated
+    totals["skipped"] += skipped
+    totals["files_seeded"] += 1
+
+
+async def run_seed(
+    dry_run: bool = False,
+    grade_filter: int | None = None,
+    force: bool = False,
+    workers: int | None = None,
+    bundle_path: Path | None = DEFAULT_BUNDLE_PATH,
+) -> None:
     """Main seed entry point.
 
     Args:
         dry_run: If True, no database writes are performed.
         grade_filter: If set, only seed problems for this grade.
+        force: If True, re-seed every file regardless of the manifest.
+        workers: Worker processes used for parsing YAML.
+        bundle_path: Compiled content bundle to seed from where it is current;
+            None to always parse YAML.
     """
     db_url = get_database_url()
     logger.info("Connecting to: %s (dry_run=%s)", db_url, dry_run)
@@ -297,34 +414,37 @@ async def run_seed(dry_run: bool = False, grade_filter: int | None = None) -> No
         autoflush=False,
     )
 
-    yaml_files = load_yaml_files(grade_filter)
-    if not yaml_files:
+    file_paths = find_problem_files(grade_filter)
+    if not file_paths:
         logger.warning("No YAML files found. Nothing to seed.")
         await engine.dispose()
         return
 
-    total_inserted = 0
-    total_skipped = 0
+    bundle: ContentBundle | None = None
+    if bundle_path is not None:
+        try:
+            bundle = ContentBundle(bundle_path)
+        except ContentBundleError as exc:
+            logger.info("Content bundle unavailable (%s) — parsing YAML.", exc)
 
     async with factory() as session, session.begin():
-        for file_path, raw_problems in yaml_files:
-            inserted, skipped = await seed_problems(
-                session, file_path, raw_problems, dry_run=dry_run
-            )
-            logger.info(
-                "%s: inserted=%d, skipped=%d", file_path, inserted, skipped
-            )
-            total_inserted += inserted
-            total_skipped += skipped
+        totals = await seed_content(
+            session, file_paths, dry_run=dry_run, force=force, workers=workers, bundle=bundle
+        )
 
     await engine.dispose()
 
-    action = "Would insert" if dry_run else "Inserted"
+    prefix = "Would insert" if dry_run else "Inserted"
     logger.info(
-        "Done. %s %d problem(s), skipped %d existing.",
-        action,
-        total_inserted,
-        total_skipped,
+        "Done. %s %d, updated %d, skipped %d problem(s); "
+        "%d file(s) seeded (%d from bundle), %d unchanged.",
+        prefix,
+        totals["inserted"],
+        totals["updated"],
+        totals["skipped"],
+        totals["files_seeded"],
+        totals["files_from_bundle"],
+        totals["files_unchanged"],
     )
 
 
@@ -343,7 +463,7 @@ def parse_args() -> argparse.Namespace:
         "--dry-run",
         action="store_true",
         default=False,
-        help="Show what would be inserted without making DB changes.",
+        help="Show what would be inserted/updated without making DB changes.",
     )
     parser.add_argument(
         "--grade",
@@ -353,9 +473,44 @@ def parse_args() -> argparse.Namespace:
         metavar="N",
         help="Only seed problems for grade N (6, 7, or 8).",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        default=False,
+        help="Re-seed every file, ignoring the content manifest.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Processes used to parse YAML files (default: one per CPU).",
+    )
+    parser.add_argument(
+        "--bundle",
+        type=Path,
+        default=DEFAULT_BUNDLE_PATH,
+        metavar="PATH",
+        help="Compiled content bundle to seed from (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--no-bundle",
+        dest="bundle",
+        action="store_const",
+        const=None,
+        help="Ignore the content bundle and parse YAML.",
+    )
     return parser.parse_args()
 
 
 if __name__ == "__main__":
     args = parse_args()
-    asyncio.run(run_seed(dry_run=args.dry_run, grade_filter=args.grade))
+    asyncio.run(
+        run_seed(
+            dry_run=args.dry_run,
+            grade_filter=args.grade,
+            force=args.force,
+            workers=args.workers,
+            bundle_path=args.bundle,
+        )
+    )
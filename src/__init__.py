@@ -4,4 +4,9 @@ Dars AI Tutoring Platform - Source Code Package.
 This package contains all backend code for the Dars platform.
 """
 
+import time
+
 __version__ = "0.1.0"
+
+# Taken before any submodule loads; src.main logs app import time from it.
+IMPORT_STARTED = time.perf_counter()
@@ -6,7 +6,7 @@ student is the owner of the session they are trying to access.
 PHASE3-C-1: verify_session_owner, verify_problem_in_session
 
 Security Model:
-- verify_session_owner: chains off verify_student (already-verified telegram_id).
+- verify_session_owner: chains off verify_student (already-resolved student).
   Loads the Session from DB and compares session.student_id against the
   authenticated student's student_id. Mismatches are logged at WARNING with
   SHA-256 hashed IDs — raw telegram_ids are never logged.
@@ -29,10 +29,9 @@ from fastapi import Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.auth.student import verify_student
+from src.auth.student import AuthenticatedStudent, verify_student
 from src.database import get_session
 from src.models.session import Session, SessionStatus
-from src.models.student import Student
 
 logger = logging.getLogger(__name__)
 
@@ -57,46 +56,19 @@ def _hash_student_id(student_id: int) -> str:
     return hashlib.sha256(str(student_id).encode()).hexdigest()[:16]
 
 
-async def _get_student_by_telegram_id(
-    db: AsyncSession,
-    telegram_id: int,
-) -> Student:
-    """Load Student row by telegram_id from the database.
-
-    Args:
-        db: Async database session.
-        telegram_id: Telegram user ID (from verify_student dependency).
-
-    Returns:
-        Student ORM object.
-
-    Raises:
-        HTTPException 404: If no student row exists for this telegram_id.
-    """
-    result = await db.execute(select(Student).where(Student.telegram_id == telegram_id))
-    student = result.scalar_one_or_none()
-    if student is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Student not found",
-        )
-    return student
-
-
 async def verify_session_owner(
     session_id: int,
-    telegram_id: Annotated[int, Depends(verify_student)],
+    student: Annotated[AuthenticatedStudent, Depends(verify_student)],
     db: Annotated[AsyncSession, Depends(get_session)],
 ) -> Session:
     """FastAPI dependency: verify the authenticated student owns this session.
 
-    This dependency chains off verify_student to receive the already-verified
-    telegram_id. It then:
+    This dependency chains off verify_student to receive the already-resolved
+    student (no second Student query). It then:
       1. Loads the Session by session_id.
-      2. Resolves the Student row to get the internal student_id (PK).
-      3. Compares session.student_id against the authenticated student's
+      2. Compares session.student_id against the authenticated student's
          student_id to detect IDOR attempts.
-      4. Checks session expiry and completion status.
+      3. Checks session expiry and completion status.
 
     Prevents CWE-639 (Insecure Direct Object Reference): a student cannot
     submit answers into another student's session by guessing a session_id.
@@ -106,7 +78,7 @@ async def verify_session_owner(
     Args:
         session_id: Session ID from the request body (path param via Depends
                     caller; the endpoint extracts it before invoking this dep).
-        telegram_id: Verified telegram_id from verify_student dependency.
+        student: Verified student from verify_student dependency.
         db: Async database session from get_session dependency.
 
     Returns:
@@ -128,7 +100,7 @@ async def verify_session_owner(
             extra={
                 "event": "practice.security.session_not_found",
                 "session_id": session_id,
-                "student_hash": _hash_student_id(telegram_id),
+                "student_hash": _hash_student_id(student.telegram_id),
             },
         )
         raise HTTPException(
@@ -136,9 +108,6 @@ async def verify_session_owner(
             detail="Session not found",
         )
 
-    # Resolve the authenticated student's internal student_id (PK)
-    student = await _get_student_by_telegram_id(db, telegram_id)
-
     # IDOR check: compare internal student_id, not telegram_id
     if session.student_id != student.student_id:
         # Log IDOR attempt at WARNING with hashed IDs — never raw IDs
@@ -146,7 +115,7 @@ async def verify_session_owner(
             "IDOR attempt: student tried to access another student's session",
             extra={
                 "event": "practice.security.idor_attempt",
-                "attacker_hash": _hash_student_id(telegram_id),
+                "attacker_hash": _hash_student_id(student.telegram_id),
                 "target_session_id": session_id,
                 "target_owner_hash": _hash_student_id(session.student_id),
                 "severity": "HIGH",
@@ -164,7 +133,7 @@ async def verify_session_owner(
             extra={
                 "event": "practice.security.session_expired",
                 "session_id": session_id,
-                "student_hash": _hash_student_id(telegram_id),
+                "student_hash": _hash_student_id(student.telegram_id),
             },
         )
         raise HTTPException(
@@ -179,7 +148,7 @@ async def verify_session_owner(
             extra={
                 "event": "practice.security.session_already_completed",
                 "session_id": session_id,
-                "student_hash": _hash_student_id(telegram_id),
+                "student_hash": _hash_student_id(student.telegram_id),
             },
         )
         raise HTTPException(
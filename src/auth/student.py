@@ -5,41 +5,137 @@ Security (SEC-003):
 - Queries database to verify student exists
 - Prevents IDOR (Insecure Direct Object Reference) attacks
 - Returns 404 if student not found
-- Rate limiting (30 req/min per IP) to prevent enumeration attacks
-- In-memory caching (5min TTL) to reduce database load
+- Rate limiting (10 failed attempts/min per IP) to prevent enumeration attacks
+- Bounded TTL+LRU caching to reduce database load
+
+verify_student resolves the student once and hands routes an
+AuthenticatedStudent record, so routes never repeat the Student lookup.
+Every in-memory map here is size-bounded, so enumerating IDs or rotating
+IPs cannot grow memory without limit. Profile changes (language, grade)
+must call invalidate_student() after commit, or invalidate_on_commit()
+before it, so the next request sees them; difficulty_level may lag by up
+to CACHE_TTL.
 
 Phase 1+: Will add JWT tokens with session management.
 """
 
-from datetime import UTC, datetime, timedelta
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import timedelta
 from typing import Annotated
 
 from fastapi import Depends, Header, HTTPException, Request, status
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from src.database import get_session
 from src.errors.exceptions import ERR_AUTH_MISSING
 from src.logging import get_logger
+from src.models.student import Student
+from src.utils.ttl_cache import TTLCache
 
 logger = get_logger(__name__)
 
-# In-memory cache for student verification (use Redis in production)
-# Format: {telegram_id: (exists: bool, cached_at: datetime)}
-_student_cache: dict[int, tuple[bool, datetime]] = {}
-CACHE_TTL = timedelta(minutes=5)
 
-# Rate limiting: Track failed auth attempts per IP
-# Format: {ip_address: [(timestamp, telegram_id), ...]}
-_failed_attempts: dict[str, list[tuple[datetime, int]]] = {}
+@dataclass(frozen=True, slots=True)
+class AuthenticatedStudent:
+    """Lightweight, immutable view of the authenticated student.
+
+    Attributes:
+        student_id: Internal primary key.
+        telegram_id: Telegram user ID from the X-Student-ID header.
+        grade: Default grade (6-8).
+        language: Preferred language ('en' or 'bn').
+        difficulty_level: Adaptive difficulty level (1-3).
+    """
+
+    student_id: int
+    telegram_id: int
+    grade: int
+    language: str
+    difficulty_level: int
+
+    @classmethod
+    def from_model(cls, student: Student) -> "AuthenticatedStudent":
+        """Build the record from a Student ORM row."""
+        return cls(
+            student_id=student.student_id,
+            telegram_id=student.telegram_id,
+            grade=student.grade,
+            language=student.language,
+            difficulty_level=student.difficulty_level,
+        )
+
+
+# Known students: {telegram_id: AuthenticatedStudent}
+CACHE_TTL = timedelta(minutes=5)
+CACHE_MAX_STUDENTS = 10_000
+_student_cache: TTLCache[int, AuthenticatedStudent] = TTLCache(
+    maxsize=CACHE_MAX_STUDENTS, ttl_seconds=CACHE_TTL.total_seconds()
+)
+
+# Unknown IDs are cached separately (shorter, smaller) so an enumeration
+# attempt cannot evict real students from _student_cache.
+NEGATIVE_CACHE_TTL = timedelta(minutes=1)
+NEGATIVE_CACHE_MAX = 1_000
+_missing_cache: TTLCache[int, bool] = TTLCache(
+    maxsize=NEGATIVE_CACHE_MAX, ttl_seconds=NEGATIVE_CACHE_TTL.total_seconds()
+)
+
+# Rate limiting: recent failed-attempt times (time.monotonic()) per IP
 MAX_FAILED_PER_MINUTE = 10
+MAX_TRACKED_IPS = 10_000
+_failed_attempts: TTLCache[str, deque[float]] = TTLCache(maxsize=MAX_TRACKED_IPS, ttl_seconds=60.0)
+
+# Session.info key holding telegram IDs to invalidate once the session commits.
+_INVALIDATE_ON_COMMIT = "invalidate_students"
+
+
+def invalidate_student(telegram_id: int) -> None:
+    """Drop any cached auth result for telegram_id.
+
+    Call after changing a student's profile (language, grade) or after
+    creating a student, so the next request reloads the row.
+
+    Args:
+        telegram_id: Telegram user ID.
+    """
+    _student_cache.pop(telegram_id)
+    _missing_cache.pop(telegram_id)
+
+
+def invalidate_on_commit(db: AsyncSession, telegram_id: int) -> None:
+    """Invalidate telegram_id's cached auth result when db commits.
+
+    Invalidating before commit lets a concurrent request re-cache the old
+    row for CACHE_TTL; use this from handlers whose transaction is
+    committed by the caller.
+
+    Args:
+        db: Session whose commit publishes the profile change.
+        telegram_id: Telegram user ID.
+    """
+    db.info.setdefault(_INVALIDATE_ON_COMMIT, set()).add(telegram_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    for telegram_id in session.info.pop(_INVALIDATE_ON_COMMIT, ()):
+        invalidate_student(telegram_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_after_rollback(session: Session) -> None:
+    session.info.pop(_INVALIDATE_ON_COMMIT, None)
 
 
 async def verify_student(
     request: Request,  # Required for rate limiting
     x_student_id: Annotated[str | None, Header()] = None,
     db: AsyncSession = Depends(get_session),
-) -> int:
+) -> AuthenticatedStudent:
     """Verify student authentication via X-Student-ID header.
 
     Security (SEC-003): Database verification prevents IDOR attacks
@@ -51,14 +147,16 @@ async def verify_student(
     This prevents attackers from guessing valid student IDs and accessing
     other students' data (IDOR vulnerability).
 
-    Performance: <100ms with indexed telegram_id lookup
+    Performance: one indexed telegram_id lookup per student per CACHE_TTL;
+    cached requests make no query at all.
 
     Args:
+        request: Incoming request (client IP for rate limiting).
         x_student_id: X-Student-ID header value (Telegram ID as string).
         db: Database session (injected by FastAPI Depends).
 
     Returns:
-        Student telegram ID (as integer) if student exists in database.
+        AuthenticatedStudent for the verified student.
 
     Raises:
         HTTPException:
@@ -69,8 +167,8 @@ async def verify_student(
     Example:
         >>> # In FastAPI route:
         >>> @app.get("/practice")
-        >>> async def get_practice(student_id: int = Depends(verify_student)):
-        >>>     # student_id is validated and verified in database
+        >>> async def get_practice(student: AuthenticatedStudent = Depends(verify_student)):
+        >>>     # student is validated and verified in database
         >>>     ...
     """
     if not x_student_id:
@@ -109,37 +207,30 @@ async def verify_student(
             detail="Too many authentication attempts. Please try again later.",
         )
 
-    # Check cache first (avoid DB query for known students)
-    now = datetime.now(UTC)
-    if telegram_id in _student_cache:
-        exists, cached_at = _student_cache[telegram_id]
-        if now - cached_at < CACHE_TTL:
-            if exists:
-                logger.debug(f"Student {telegram_id} authenticated from cache")
-                return telegram_id
-            else:
-                # Cached negative result (student doesn't exist)
-                _record_failed_attempt(client_ip, telegram_id)
-                logger.warning(
-                    f"Student authentication failed (cached): telegram_id {telegram_id} not found",
-                    extra={"ip": client_ip, "telegram_id": telegram_id},
-                )
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Student with ID {telegram_id} not found",
-                )
+    # Check caches first (avoid DB query for known and recently-unknown IDs)
+    cached = _student_cache.get(telegram_id)
+    if cached is not None:
+        logger.debug(f"Student {telegram_id} authenticated from cache")
+        return cached
+    if _missing_cache.get(telegram_id) is not None:
+        # Cached negative result (student doesn't exist)
+        _record_failed_attempt(client_ip, telegram_id)
+        logger.warning(
+            f"Student authentication failed (cached): telegram_id {telegram_id} not found",
+            extra={"ip": client_ip, "telegram_id": telegram_id},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Student with ID {telegram_id} not found",
+        )
 
     # SEC-003: Query database to verify student exists
     # This prevents IDOR attacks where attackers guess student IDs
-    from src.models.student import Student
-
     result = await db.execute(select(Student).where(Student.telegram_id == telegram_id))
     student = result.scalar_one_or_none()
 
-    # Cache result (both positive and negative)
-    _student_cache[telegram_id] = (student is not None, now)
-
     if not student:
+        _missing_cache.set(telegram_id, True)
         _record_failed_attempt(client_ip, telegram_id)
         logger.warning(
             f"Student authentication failed: telegram_id {telegram_id} not found in database",
@@ -150,12 +241,12 @@ async def verify_student(
             detail=f"Student with ID {telegram_id} not found",
         )
 
+    authenticated = AuthenticatedStudent.from_model(student)
+    _student_cache.set(telegram_id, authenticated)
     logger.debug(
         f"Student {student.student_id} (telegram_id={telegram_id}) authenticated successfully"
     )
-
-    # Return telegram_id (not student_id) for consistency with header
-    return telegram_id
+    return authenticated
 
 
 def _check_rate_limit_exceeded(ip: str) -> bool:
@@ -167,27 +258,25 @@ def _check_rate_limit_exceeded(ip: str) -> bool:
     Returns:
         True if rate limit exceeded, False otherwise.
     """
-    if ip not in _failed_attempts:
-        return False
-
-    # Count attempts in last minute
-    recent_attempts = _failed_attempts[ip]
-    return len(recent_attempts) >= MAX_FAILED_PER_MINUTE
+    attempts = _failed_attempts.get(ip)
+    return attempts is not None and len(attempts) >= MAX_FAILED_PER_MINUTE
 
 
 def _record_failed_attempt(ip: str, telegram_id: int) -> None:
     """Record a failed authentication attempt for monitoring.
 
+    Only the last MAX_FAILED_PER_MINUTE timestamps are kept per IP, and at
+    most MAX_TRACKED_IPS IPs are tracked.
+
     Args:
         ip: Client IP address.
         telegram_id: The telegram ID that failed auth.
     """
-    now = datetime.now(UTC)
-
-    if ip not in _failed_attempts:
-        _failed_attempts[ip] = []
-
-    _failed_attempts[ip].append((now, telegram_id))
+    attempts = _failed_attempts.get(ip)
+    if attempts is None:
+        attempts = deque(maxlen=MAX_FAILED_PER_MINUTE)
+    attempts.append(time.monotonic())
+    _failed_attempts.set(ip, attempts)
 
 
 def _cleanup_failed_attempts(ip: str) -> None:
@@ -196,14 +285,14 @@ def _cleanup_failed_attempts(ip: str) -> None:
     Args:
         ip: Client IP address.
     """
-    if ip not in _failed_attempts:
+    attempts = _failed_attempts.get(ip)
+    if attempts is None:
         return
 
-    one_minute_ago = datetime.now(UTC) - timedelta(minutes=1)
-    _failed_attempts[ip] = [
-        (timestamp, tid) for timestamp, tid in _failed_attempts[ip] if timestamp > one_minute_ago
-    ]
+    one_minute_ago = time.monotonic() - 60.0
+    while attempts and attempts[0] <= one_minute_ago:
+        attempts.popleft()
 
     # Clean up empty entries
-    if not _failed_attempts[ip]:
-        del _failed_attempts[ip]
+    if not attempts:
+        _failed_attempts.pop(ip)
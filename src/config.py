@@ -9,9 +9,19 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "postgresql://localhost/dars"
 
+    # Connection pool (ignored for SQLite, which uses NullPool)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0  # Seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # Seconds before a pooled connection is replaced; -1 disables
+    db_pool_pre_ping: bool = True  # SELECT 1 on every checkout; off saves a round trip
+    db_pool_warmup: int = 2  # Connections opened at startup, capped at db_pool_size; 0 skips
+    db_statement_cache_size: int = 100  # asyncpg statement cache per connection; 0 for PgBouncer
+
     # Telegram
     telegram_bot_token: str = ""
     telegram_secret_token: str = ""  # Webhook signature verification (SEC-002)
+    telegram_api_base_url: str = "https://api.telegram.org"  # Stand-in URL for load tests
 
     # Anthropic Claude API
     anthropic_api_key: str = ""
@@ -24,6 +34,66 @@ class Settings(BaseSettings):
 
     # Logging
     log_level: str = "INFO"
+    # Per-event overrides of the default sampling rules (src/logging/sampling.py),
+    # e.g. "reminder_sent=1/50;hint_cache_hit=100/60s"
+    log_sampling: str = ""
+
+    # Retention (see src/services/retention.py): older rows are archived to NDJSON
+    cost_records_retention_days: int = 180  # Budget checks only look at this month
+    sent_messages_retention_days: int = 30  # Non-repeat window is 7 days
+    # Root directory for gzip NDJSON archives. Must be an absolute path on
+    # persistent storage (e.g. a mounted volume): rows are deleted once
+    # archived. Unset, the retention job archives and deletes nothing.
+    archive_dir: str = ""
+
+    # Compiled content bundle (scripts/build_content_bundle.py), mapped at startup
+    content_bundle_path: str = "content/problems.bundle.jsonl"
+
+    # Message catalog (src/services/messages.py): message_templates poll interval
+    message_catalog_refresh_seconds: int = 60  # 0 disables polling
+
+    # Rate limiting (src/services/rate_limits.py): "dars-sql://" shares batched
+    # counters across workers via rate_limit_counters; any limits URI works
+    rate_limit_storage_uri: str = "dars-sql://"
+    rate_limit_flush_seconds: int = 5  # How often counters are synced to the DB
+
+    # Scheduler leader election (src/services/leader_election.py): only the
+    # lease holder runs reminders, the session sweep and retention
+    scheduler_leader_election: bool = True  # False: every process runs every job
+    scheduler_lease_seconds: int = 30  # Failover delay if the leader dies
+    scheduler_heartbeat_seconds: int = 10  # Lease renewal interval; keep well below the lease
+
+    # Health monitor (src/services/health_monitor.py): /health/ready is served
+    # from a cached DB check plus in-memory pool, scheduler and queue signals
+    health_check_interval_seconds: float = 10.0
+    health_pool_saturation: float = 0.9  # Not ready once this share of pool + overflow is in use
+    health_queue_depth_limit: int = 10_000  # Not ready once a write-behind/log queue is this deep
+
+    # Daily reminders (src/services/reminder_schedule.py): per-student slots,
+    # read in per-minute buckets
+    reminder_bucket_size: int = 200  # Due students read per query; a run reads until none are due
+    reminder_spread_minutes: int = 60  # Slots spread over this many minutes from the local hour
+
+    # Transactional outbox (src/services/outbox.py): Telegram messages are
+    # committed with the state change and sent by a background dispatcher
+    outbox_batch_size: int = 50  # Most rows claimed per dispatcher round
+    outbox_poll_seconds: float = 2.0  # Idle poll interval; commits wake the dispatcher sooner
+    outbox_rate_per_second: float = 25.0  # Send cap for all processes (Telegram: ~30/s per bot)
+    outbox_max_attempts: int = 5  # Then the row is marked failed
+    outbox_claim_seconds: int = 60  # A claimed row is retried if not settled within this
+    outbox_retention_hours: int = 168  # Sent/failed rows older than this are purged
+
+    # Admin broadcasts (src/services/broadcasts.py): fanned out into the outbox
+    broadcast_rate_per_second: float = 20.0  # Recipients queued per second, all broadcasts
+    broadcast_max_in_flight: int = 100  # Undelivered broadcast rows allowed in the outbox
+
+    # Metrics: if set, GET /metrics requires "Authorization: Bearer <token>"
+    metrics_token: str = ""
+
+    # Query instrumentation (see src/db_instrumentation.py)
+    db_slow_query_ms: float = 100.0  # Log statements slower than this
+    db_n_plus_one_threshold: int = 5  # Same query repeated this often per request
+    db_query_header: bool = False  # Emit X-DB-Queries debug header on responses
 
     model_config = SettingsConfigDict(
         env_file=".env",
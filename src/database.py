@@ -5,6 +5,7 @@ Provides async PostgreSQL connection using SQLAlchemy 2.0+ with asyncpg.
 Handles connection pooling, session management, and environment configuration.
 """
 
+import asyncio
 import logging
 import os
 import socket
@@ -12,14 +13,17 @@ import time
 from collections.abc import AsyncGenerator
 from typing import Any
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+from sqlalchemy.pool import NullPool
 
+from src.config import get_settings
+from src.db_instrumentation import InstrumentedQueuePool, install_query_instrumentation
 from src.models.base import Base
 
 _db_logger = logging.getLogger(__name__)
@@ -106,16 +110,19 @@ def get_database_url() -> str:
 def create_engine(
     database_url: str | None = None,
     echo: bool = False,
-    pool_size: int = 5,
-    max_overflow: int = 10,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
 ) -> AsyncEngine:
     """Create async SQLAlchemy engine with connection pooling.
 
+    Pool sizing, timeout, recycle, pre-ping and the asyncpg statement cache
+    come from Settings (DB_POOL_* / DB_STATEMENT_CACHE_SIZE env vars).
+
     Args:
         database_url: PostgreSQL connection string. If None, reads from env.
         echo: Whether to log SQL statements (useful for debugging).
-        pool_size: Size of connection pool (default 5).
-        max_overflow: Max overflow connections beyond pool_size (default 10).
+        pool_size: Overrides Settings.db_pool_size when given.
+        max_overflow: Overrides Settings.db_max_overflow when given.
 
     Returns:
         Configured AsyncEngine instance.
@@ -123,11 +130,14 @@ def create_engine(
     if database_url is None:
         database_url = get_database_url()
 
+    settings = get_settings()
+
     # Configure connection pool
-    # For Railway/production: Use AsyncAdaptedQueuePool (for async engines)
+    # For Railway/production: Use InstrumentedQueuePool (AsyncAdaptedQueuePool
+    # that records checkout wait time and overflow use)
     # For SQLite/testing: Use NullPool to avoid connection issues
     is_sqlite = "sqlite" in database_url
-    poolclass = NullPool if is_sqlite else AsyncAdaptedQueuePool
+    poolclass = NullPool if is_sqlite else InstrumentedQueuePool
 
     # Build engine kwargs - don't pass pool parameters for NullPool
     engine_kwargs: dict[str, Any] = {
@@ -138,9 +148,17 @@ def create_engine(
 
     if not is_sqlite:
         # Only pass pool parameters for QueuePool
-        engine_kwargs["pool_size"] = pool_size
-        engine_kwargs["max_overflow"] = max_overflow
-        engine_kwargs["pool_pre_ping"] = True
+        engine_kwargs["pool_size"] = pool_size if pool_size is not None else settings.db_pool_size
+        engine_kwargs["max_overflow"] = (
+            max_overflow if max_overflow is not None else settings.db_max_overflow
+        )
+        engine_kwargs["pool_timeout"] = settings.db_pool_timeout
+        engine_kwargs["pool_recycle"] = settings.db_pool_recycle
+        engine_kwargs["pool_pre_ping"] = settings.db_pool_pre_ping
+        if "asyncpg" in database_url:
+            engine_kwargs["connect_args"] = {
+                "prepared_statement_cache_size": settings.db_statement_cache_size,
+            }
 
     engine = create_async_engine(database_url, **engine_kwargs)
 
@@ -160,7 +178,13 @@ def get_engine() -> AsyncEngine:
     """
     global _engine
     if _engine is None:
+        settings = get_settings()
         _engine = create_engine()
+        install_query_instrumentation(
+            _engine,
+            slow_query_ms=settings.db_slow_query_ms,
+            n_plus_one_threshold=settings.db_n_plus_one_threshold,
+        )
     return _engine
 
 
@@ -266,9 +290,39 @@ async def check_connection() -> bool:
     """
     try:
         async with get_engine().begin() as conn:
-            from sqlalchemy import text
-
             await conn.execute(text("SELECT 1"))
         return True
     except Exception:
         return False
+
+
+async def warm_pool(connections: int | None = None) -> int:
+    """Open pool connections concurrently so early requests skip connect latency.
+
+    Each connection runs SELECT 1 and goes back to the pool. Does nothing
+    useful on SQLite, whose NullPool keeps no connections.
+
+    Args:
+        connections: Connections to open; defaults to Settings.db_pool_warmup.
+            Capped at Settings.db_pool_size so no overflow connection is made.
+
+    Returns:
+        Number of connections that opened successfully.
+    """
+    settings = get_settings()
+    if connections is None:
+        connections = settings.db_pool_warmup
+    connections = min(connections, settings.db_pool_size)
+
+    async def _open() -> bool:
+        try:
+            async with get_engine().connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            return True
+        except Exception:
+            return False
+
+    if connections <= 0:
+        return 0
+    opened = await asyncio.gather(*(_open() for _ in range(connections)))
+    return sum(opened)
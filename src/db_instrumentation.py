@@ -0,0 +1,427 @@
+"""
+Per-statement SQL instrumentation for the Dars platform.
+
+Hooks SQLAlchemy cursor events on an engine to:
+- Time every statement, failed ones included, and aggregate latency by
+  normalized query fingerprint
+- Count queries per HTTP request (tied to the X-Request-ID set in src/main.py)
+- Log statements slower than a threshold (slow-query log)
+- Flag N+1 patterns: the same fingerprint executed repeatedly in one request
+- Measure connection-pool checkout wait, in-use count and overflow events
+- Feed the dars_db_statement_duration_seconds histogram served at /metrics
+
+Usage:
+    from src.db_instrumentation import (
+        finish_request,
+        install_query_instrumentation,
+        track_request,
+    )
+
+    install_query_instrumentation(engine)
+
+    token = track_request(request_id)
+    try:
+        ...  # handle request
+    finally:
+        stats = finish_request(token)
+"""
+
+import logging
+import re
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool
+
+from src.metrics import DB_STATEMENT_SECONDS
+
+_db_logger = logging.getLogger(__name__)
+
+# Upper bound on distinct fingerprints kept in the process-wide table so a
+# pathological stream of unique statements cannot grow memory without limit.
+_MAX_FINGERPRINTS = 500
+_FINGERPRINT_MAX_LEN = 300
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_POSITIONAL_PARAM_RE = re.compile(r"\$\d+|%\(\w+\)s|(?<![:\w]):\w+|\?")
+_IN_LIST_RE = re.compile(r"\bIN\s*\((?:\s*\?\s*,?)+\)", re.IGNORECASE)
+_POSTCOMPILE_RE = re.compile(r"\(?\s*__\[POSTCOMPILE_\w+\]\s*\)?")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Statement types reported as histogram labels; anything else is "OTHER".
+_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"})
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize a SQL statement into a stable fingerprint.
+
+    Literals and bind parameters become ``?`` and IN lists collapse to a
+    single placeholder, so the same query shape with different values maps
+    to the same fingerprint.
+
+    Args:
+        statement: Raw SQL text as sent to the DBAPI cursor.
+
+    Returns:
+        Normalized statement, truncated to a bounded length.
+    """
+    text = _POSTCOMPILE_RE.sub(" (?)", statement)
+    text = _STRING_LITERAL_RE.sub("?", text)
+    text = _POSITIONAL_PARAM_RE.sub("?", text)
+    text = _NUMBER_RE.sub("?", text)
+    text = _IN_LIST_RE.sub("IN (?)", text)
+    text = _WHITESPACE_RE.sub(" ", text).strip()
+    return text[:_FINGERPRINT_MAX_LEN]
+
+
+@dataclass
+class FingerprintStats:
+    """Aggregated latency for one query fingerprint.
+
+    Attributes:
+        count: Number of executions observed.
+        total_ms: Sum of execution times in milliseconds.
+        max_ms: Slowest single execution in milliseconds.
+    """
+
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        """Mean execution time in milliseconds."""
+        return self.total_ms / self.count if self.count else 0.0
+
+
+@dataclass
+class RequestQueryStats:
+    """Queries issued while handling a single request.
+
+    Attributes:
+        request_id: Request ID from the X-Request-ID middleware.
+        count: Number of statements executed.
+        total_ms: Total time spent in the database in milliseconds.
+        fingerprints: Execution count per fingerprint within this request.
+    """
+
+    request_id: str
+    count: int = 0
+    total_ms: float = 0.0
+    fingerprints: dict[str, int] = field(default_factory=dict)
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Return fingerprints executed at least ``threshold`` times.
+
+        Args:
+            threshold: Minimum repeat count to report.
+
+        Returns:
+            Mapping of fingerprint -> execution count.
+        """
+        return {fp: n for fp, n in self.fingerprints.items() if n >= threshold}
+
+
+class QueryInstrumentation:
+    """Process-wide query statistics and per-request tracking.
+
+    Attributes:
+        slow_query_ms: Statements slower than this are logged as slow queries.
+        n_plus_one_threshold: Same-fingerprint repeat count within one request
+            that triggers an N+1 warning.
+    """
+
+    def __init__(self, slow_query_ms: float = 100.0, n_plus_one_threshold: int = 5) -> None:
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self._fingerprints: dict[str, FingerprintStats] = {}
+        self._current: ContextVar[RequestQueryStats | None] = ContextVar(
+            "dars_request_query_stats", default=None
+        )
+
+    # ------------------------------------------------------------------
+    # Per-request tracking
+    # ------------------------------------------------------------------
+
+    def track_request(self, request_id: str) -> Token[RequestQueryStats | None]:
+        """Start counting queries for the current request context.
+
+        Args:
+            request_id: Request ID to tag slow-query and N+1 logs with.
+
+        Returns:
+            Token to pass to finish_request().
+        """
+        return self._current.set(RequestQueryStats(request_id=request_id))
+
+    def finish_request(self, token: Token[RequestQueryStats | None]) -> RequestQueryStats | None:
+        """Stop counting for the current request and report N+1 patterns.
+
+        Args:
+            token: Token returned by track_request().
+
+        Returns:
+            The request's query statistics, or None if tracking was not active.
+        """
+        stats = self._current.get()
+        self._current.reset(token)
+        if stats is None:
+            return None
+
+        for fp, n in stats.repeated(self.n_plus_one_threshold).items():
+            _db_logger.warning(
+                "n_plus_one_query",
+                extra={
+                    "event": "db.n_plus_one",
+                    "request_id": stats.request_id,
+                    "fingerprint": fp,
+                    "count": n,
+                },
+            )
+        return stats
+
+    def current(self) -> RequestQueryStats | None:
+        """Return the statistics for the request being handled, if any."""
+        return self._current.get()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        """Record one executed statement.
+
+        Args:
+            statement: Raw SQL text.
+            elapsed_ms: Execution time in milliseconds.
+        """
+        fp = fingerprint(statement)
+
+        agg = self._fingerprints.get(fp)
+        if agg is None and len(self._fingerprints) < _MAX_FINGERPRINTS:
+            agg = self._fingerprints[fp] = FingerprintStats()
+        if agg is not None:
+            agg.count += 1
+            agg.total_ms += elapsed_ms
+            agg.max_ms = max(agg.max_ms, elapsed_ms)
+
+        req = self._current.get()
+        if req is not None:
+            req.count += 1
+            req.total_ms += elapsed_ms
+            req.fingerprints[fp] = req.fingerprints.get(fp, 0) + 1
+
+        if elapsed_ms > self.slow_query_ms:
+            _db_logger.warning(
+                "slow_query",
+                extra={
+                    "event": "db.slow_query",
+                    "request_id": req.request_id if req is not None else None,
+                    "duration_ms": round(elapsed_ms, 1),
+                    "fingerprint": fp,
+                },
+            )
+
+    def snapshot(self, limit: int = 20) -> list[dict[str, Any]]:
+        """Return the fingerprints with the highest total time.
+
+        Args:
+            limit: Maximum number of fingerprints to return.
+
+        Returns:
+            List of dicts with fingerprint, count, total_ms, avg_ms, max_ms.
+        """
+        ranked = sorted(self._fingerprints.items(), key=lambda kv: kv[1].total_ms, reverse=True)
+        return [
+            {
+                "fingerprint": fp,
+                "count": s.count,
+                "total_ms": round(s.total_ms, 1),
+                "avg_ms": round(s.avg_ms, 2),
+                "max_ms": round(s.max_ms, 1),
+            }
+            for fp, s in ranked[:limit]
+        ]
+
+    def reset(self) -> None:
+        """Clear the process-wide fingerprint table."""
+        self._fingerprints.clear()
+
+
+# Module-level singleton shared by the engine hooks and the request middleware.
+query_instrumentation = QueryInstrumentation()
+
+
+class PoolStats:
+    """Connection-pool checkout telemetry.
+
+    Attributes:
+        checkouts: Successful connection checkouts.
+        overflow_checkouts: Checkouts that had to open an overflow connection.
+        timeouts: Checkouts that gave up after pool_timeout.
+        wait_total_ms: Total time spent waiting for a connection.
+        wait_max_ms: Longest single wait for a connection.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero all counters."""
+        self.checkouts = 0
+        self.overflow_checkouts = 0
+        self.timeouts = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+
+    def record_checkout(self, wait_ms: float, overflowed: bool) -> None:
+        """Record one successful checkout.
+
+        Args:
+            wait_ms: Time spent obtaining the connection in milliseconds.
+            overflowed: Whether the checkout opened an overflow connection.
+        """
+        self.checkouts += 1
+        self.wait_total_ms += wait_ms
+        self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+        if overflowed:
+            self.overflow_checkouts += 1
+
+    def record_timeout(self) -> None:
+        """Record a checkout that timed out waiting for a connection."""
+        self.timeouts += 1
+
+    def snapshot(self, pool: Pool | None = None) -> dict[str, Any]:
+        """Return counters plus live gauges from the pool, if given.
+
+        Args:
+            pool: Pool to read size / checked-out / overflow gauges from.
+
+        Returns:
+            Dict of pool metrics.
+        """
+        data: dict[str, Any] = {
+            "checkouts": self.checkouts,
+            "overflow_checkouts": self.overflow_checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": round(self.wait_total_ms / self.checkouts, 2) if self.checkouts else 0.0,
+            "wait_max_ms": round(self.wait_max_ms, 1),
+            "size": None,
+            "checked_out": None,
+            "overflow": None,
+        }
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            data["size"] = pool.size()
+            data["checked_out"] = pool.checkedout()
+            data["overflow"] = max(pool.overflow(), 0)
+        return data
+
+
+# Module-level singleton updated by InstrumentedQueuePool.
+pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait time and overflow use."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        overflow_before = self._overflow
+        start = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except sa_exc.TimeoutError:
+            pool_stats.record_timeout()
+            _db_logger.warning(
+                "db_pool_timeout",
+                extra={
+                    "event": "db.pool_timeout",
+                    "checked_out": self.checkedout(),
+                    "pool_size": self.size(),
+                },
+            )
+            raise
+        wait_ms = (time.perf_counter() - start) * 1000
+        pool_stats.record_checkout(wait_ms, overflowed=self._overflow > max(overflow_before, 0))
+        return entry
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    conn.info.setdefault("dars_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    _record_statement(conn, statement)
+
+
+def _handle_error(context: ExceptionContext) -> None:
+    """Time a statement that failed, popping the start after_cursor_execute never saw."""
+    if context.connection is None or context.execution_context is None or not context.statement:
+        return  # Failed before the statement was sent (connect, compile)
+    _record_statement(context.connection, context.statement)
+
+
+def _record_statement(conn: Connection, statement: str) -> None:
+    starts = conn.info.get("dars_query_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    query_instrumentation.record(statement, elapsed * 1000)
+    operation = statement[:7].lstrip().split(None, 1)[0].upper() if statement else ""
+    DB_STATEMENT_SECONDS.observe(elapsed, operation if operation in _OPERATIONS else "OTHER")
+
+
+def install_query_instrumentation(
+    engine: AsyncEngine | Engine,
+    slow_query_ms: float | None = None,
+    n_plus_one_threshold: int | None = None,
+) -> None:
+    """Attach statement timing hooks to an engine.
+
+    Safe to call more than once for the same engine.
+
+    Args:
+        engine: Async or sync SQLAlchemy engine to instrument.
+        slow_query_ms: Optional override for the slow-query threshold.
+        n_plus_one_threshold: Optional override for the N+1 repeat threshold.
+    """
+    if slow_query_ms is not None:
+        query_instrumentation.slow_query_ms = slow_query_ms
+    if n_plus_one_threshold is not None:
+        query_instrumentation.n_plus_one_threshold = n_plus_one_threshold
+
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(sync_engine, "handle_error", _handle_error)
+
+
+def track_request(request_id: str) -> Token[RequestQueryStats | None]:
+    """Start per-request query counting. See QueryInstrumentation.track_request."""
+    return query_instrumentation.track_request(request_id)
+
+
+def finish_request(token: Token[RequestQueryStats | None]) -> RequestQueryStats | None:
+    """Stop per-request query counting. See QueryInstrumentation.finish_request."""
+    return query_instrumentation.finish_request(token)
@@ -4,7 +4,7 @@ This module provides:
 - JSON-formatted logging
 - Request ID tracking
 - Log levels: DEBUG, INFO, WARNING, ERROR
-- Log to stdout (captured by Railway/Render)
+- Log to stdout (captured by Railway/Render) from a background thread
 """
 
 from src.logging.config import (
@@ -12,6 +12,7 @@ from src.logging.config import (
     get_logger,
     request_id_middleware,
     setup_logging,
+    shutdown_logging,
 )
 
 __all__ = [
@@ -19,4 +20,5 @@ __all__ = [
     "get_logger",
     "request_id_middleware",
     "setup_logging",
+    "shutdown_logging",
 ]
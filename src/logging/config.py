@@ -2,6 +2,11 @@
 
 All logs are written to stdout in JSON format for easy parsing and aggregation.
 
+Performance: setup_logging() installs a QueueHandler on the root logger, so
+a log call on the event loop only resolves the message and enqueues the
+record; a QueueListener thread does the sanitizing, JSON encoding and
+stdout writes.
+
 Security (SEC-006):
 - Sensitive data (API keys, tokens, passwords, admin IDs) are masked in all logs
 - Prevents credential leakage through log files
@@ -10,15 +15,23 @@ Security (SEC-006):
 
 import json
 import logging
+import queue
+import re
 import sys
 import uuid
 from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from src.config import get_settings
+from src.logging.sampling import (
+    DEFAULT_SAMPLING_RULES,
+    get_log_sampler,
+    parse_sampling_rules,
+)
 
 # Sensitive field patterns to mask (SEC-006)
 SENSITIVE_KEYS = {
@@ -42,6 +55,27 @@ SENSITIVE_KEYS = {
     "x-telegram-bot-api-secret-token",
 }
 
+# Any SENSITIVE_KEYS entry inside a string, matched in one pass instead of
+# one substring scan per key.
+_SENSITIVE_PATTERN = re.compile(
+    "|".join(re.escape(key) for key in sorted(SENSITIVE_KEYS, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+MASKED = "***MASKED***"
+
+# Renders tracebacks on the logging thread before records are queued.
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+# LogRecord attributes that are not caller context. Anything else on a record
+# came from a stdlib logger.x(..., extra={...}) call and is output under "extra".
+_RECORD_ATTRIBUTES = frozenset(logging.makeLogRecord({}).__dict__) | {
+    "message",
+    "asctime",
+    "request_id",
+    "extra",
+}
+
 
 def sanitize_log_data(data: Any) -> Any:
     """Recursively sanitize sensitive data from log data.
@@ -65,23 +99,19 @@ def sanitize_log_data(data: Any) -> Any:
         >>> sanitize_log_data({"api_key": "secret123", "user": "john"})
         {"api_key": "***MASKED***", "user": "john"}
     """
+    if isinstance(data, str):
+        # A sensitive key next to "=" or ":" is likely a key=value or key: value pair
+        if ("=" in data or ":" in data) and _SENSITIVE_PATTERN.search(data):
+            return MASKED
+        return data
     if isinstance(data, dict):
         return {
-            key: "***MASKED***" if key.lower() in SENSITIVE_KEYS else sanitize_log_data(value)
+            key: MASKED if key.lower() in SENSITIVE_KEYS else sanitize_log_data(value)
             for key, value in data.items()
         }
-    elif isinstance(data, list):
+    if isinstance(data, list):
         return [sanitize_log_data(item) for item in data]
-    elif isinstance(data, str):
-        # Check if string contains sensitive patterns
-        lower_str = data.lower()
-        for key in SENSITIVE_KEYS:
-            if key in lower_str and ("=" in data or ":" in data):
-                # Likely a key=value or key: value pattern
-                return "***MASKED***"
-        return data
-    else:
-        return data
+    return data
 
 
 class JSONFormatter(logging.Formatter):
@@ -102,29 +132,67 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON-formatted log string with sensitive data masked.
         """
+        # Timestamp of the log call, not of formatting (which may happen later
+        # on the QueueListener thread). timestamp/level/logger never hold
+        # secrets; everything caller-supplied is sanitized (SEC-006).
         log_data: dict[str, Any] = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(),
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            "message": sanitize_log_data(record.getMessage()),
         }
 
         # Add request_id if present
         if hasattr(record, "request_id"):
-            log_data["request_id"] = record.request_id
+            log_data["request_id"] = sanitize_log_data(record.request_id)
 
-        # Add extra context if present
-        if hasattr(record, "extra"):
-            log_data["extra"] = record.extra
-
-        # Add exception info if present
+        # Add extra context if present: StructuredLogger kwargs arrive as
+        # record.extra, stdlib extra={...} keys as record attributes
+        extra = {
+            key: value for key, value in record.__dict__.items() if key not in _RECORD_ATTRIBUTES
+        }
+        context = getattr(record, "extra", None)
+        if isinstance(context, dict):
+            extra.update(context)
+        elif context is not None:
+            extra["extra"] = context
+        if extra:
+            log_data["extra"] = sanitize_log_data(extra)
+
+        # Add exception info if present (pre-rendered to exc_text by DeferredQueueHandler)
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+            log_data["exception"] = sanitize_log_data(self.formatException(record.exc_info))
+        elif record.exc_text:
+            log_data["exception"] = sanitize_log_data(record.exc_text)
 
-        # SEC-006: Sanitize all log data before outputting
-        sanitized_data = sanitize_log_data(log_data)
+        return json.dumps(log_data, default=str)
 
-        return json.dumps(sanitized_data)
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the QueueListener thread.
+
+    The stock QueueHandler.prepare() fully formats each record on the
+    calling thread. This one only resolves the message arguments (which
+    may be mutable) and renders tracebacks, which cannot safely cross
+    threads; JSONFormatter runs later on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Make the record safe to hand to another thread.
+
+        Args:
+            record: Log record to enqueue.
+
+        Returns:
+            The same record with msg resolved and exc_info rendered to exc_text.
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
 
 
 class StructuredLogger:
@@ -152,6 +220,18 @@ class StructuredLogger:
             message: Log message.
             **kwargs: Additional context to include in the log.
         """
+        if not self.logger.isEnabledFor(level):
+            return
+        if level < logging.WARNING:
+            # High-volume events may be sampled; warnings and errors never are
+            sampler = get_log_sampler()
+            if sampler.rules:
+                sample_every = sampler.allow(message)
+                if sample_every is None:
+                    return
+                if sample_every > 1:
+                    kwargs["sample_every"] = sample_every
+                _log_sampling_summary(sampler.take_summary())
         extra = {"extra": kwargs} if kwargs else {}
         self.logger.log(level, message, extra=extra)
 
@@ -201,27 +281,76 @@ class StructuredLogger:
         self._log(logging.CRITICAL, message, **kwargs)
 
 
+_log_queue: queue.SimpleQueue[logging.LogRecord] | None = None
+_queue_handler: DeferredQueueHandler | None = None
+_listener: QueueListener | None = None
+
+
+def _log_sampling_summary(suppressed: dict[str, int] | None) -> None:
+    """Log how many records each sampled event dropped since the last summary."""
+    if suppressed:
+        logging.getLogger("src.logging.sampling").info(
+            "log_sampling_summary", extra={"extra": {"suppressed": suppressed}}
+        )
+
+
 def setup_logging() -> None:
     """Configure logging for the application.
 
     Sets up JSON-formatted logging to stdout with the configured log level.
+    Records are queued by a DeferredQueueHandler on the root logger and
+    written by a background QueueListener. High-volume events are sampled
+    per DEFAULT_SAMPLING_RULES and LOG_SAMPLING (see src/logging/sampling.py).
+    Calling this again is a no-op until shutdown_logging() runs.
     """
+    global _log_queue, _queue_handler, _listener
+    if _listener is not None:
+        return
     settings = get_settings()
+    get_log_sampler().configure(
+        {**DEFAULT_SAMPLING_RULES, **parse_sampling_rules(settings.log_sampling)}
+    )
 
-    # Create console handler with JSON formatter
+    # Console handler with JSON formatter, driven by the listener thread
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(JSONFormatter())
+    _log_queue = queue.SimpleQueue()
+    _queue_handler = DeferredQueueHandler(_log_queue)
+    _listener = QueueListener(_log_queue, handler, respect_handler_level=True)
+    _listener.start()
 
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(settings.log_level)
-    root_logger.addHandler(handler)
+    root_logger.addHandler(_queue_handler)
 
     # Suppress noisy third-party loggers
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
 
+def log_queue_depth() -> int:
+    """Return the number of records waiting for the QueueListener (0 if not set up)."""
+    return _log_queue.qsize() if _log_queue is not None else 0
+
+
+def shutdown_logging() -> None:
+    """Write out queued records and remove the queue handler.
+
+    Call on application shutdown so no log lines (or suppression counts)
+    are lost.
+    """
+    global _log_queue, _queue_handler, _listener
+    if _listener is None or _queue_handler is None:
+        return
+    _log_sampling_summary(get_log_sampler().take_summary(force=True))
+    logging.getLogger().removeHandler(_queue_handler)
+    _listener.stop()  # Drains the queue before returning
+    _log_queue = None
+    _queue_handler = None
+    _listener = None
+
+
 def get_logger(name: str) -> StructuredLogger:
     """Get a structured logger instance.
 
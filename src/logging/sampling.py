@@ -0,0 +1,197 @@
+"""Per-event sampling and rate limiting for high-volume log lines.
+
+Some events are logged once per update, cache hit or student (e.g. a
+50k-student reminder run logs ~100k reminder_sent/reminder_skipped lines).
+StructuredLogger consults the process-wide LogSampler for DEBUG and INFO
+records and drops those a rule suppresses:
+
+  - sample_every=N keeps 1 in N records of the event; kept records carry
+    sample_every=N so counts can be re-weighted downstream.
+  - max_per_window=M keeps at most M records per window_seconds.
+
+WARNING and above (errors, auth failures and other security events) are
+never sampled. Suppressed counts are reported per event in a
+"log_sampling_summary" line at most once per summary interval, and on
+shutdown.
+
+Rules are keyed by the log message (the event name) and configured from
+DEFAULT_SAMPLING_RULES plus the LOG_SAMPLING setting, e.g.
+"reminder_sent=1/50;hint_cache_hit=100/60s".
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class SamplingRule:
+    """How many records of one event to keep.
+
+    Attributes:
+        sample_every: Keep 1 in this many records (1 keeps all).
+        max_per_window: Keep at most this many records per window (None: no cap).
+        window_seconds: Length of the rate-limit window.
+    """
+
+    sample_every: int = 1
+    max_per_window: int | None = None
+    window_seconds: float = 60.0
+
+
+# Applied by setup_logging(); LOG_SAMPLING entries override these.
+DEFAULT_SAMPLING_RULES: dict[str, SamplingRule] = {
+    "Received Telegram update": SamplingRule(sample_every=10),
+    "hint_cache_hit": SamplingRule(sample_every=100),
+    "reminder_sent": SamplingRule(sample_every=20, max_per_window=100),
+    "reminder_skipped": SamplingRule(sample_every=20, max_per_window=100),
+}
+
+
+def parse_sampling_rules(spec: str) -> dict[str, SamplingRule]:
+    """Parse a LOG_SAMPLING string into rules.
+
+    Entries are separated by ";" and look like "event=1/N" (keep 1 in N)
+    or "event=M/Ss" (at most M per S seconds).
+
+    Args:
+        spec: Rule specification, e.g. "reminder_sent=1/50;hint_cache_hit=100/60s".
+
+    Returns:
+        Dict of event name to SamplingRule.
+
+    Raises:
+        ValueError: If an entry is malformed.
+    """
+    rules: dict[str, SamplingRule] = {}
+    for entry in filter(None, (part.strip() for part in spec.split(";"))):
+        event, sep, value = entry.rpartition("=")
+        count, slash, period = value.partition("/")
+        if not sep or not event.strip() or not slash:
+            raise ValueError(f"Invalid log sampling rule: {entry!r}")
+        try:
+            if period.endswith("s"):
+                rule = SamplingRule(max_per_window=int(count), window_seconds=float(period[:-1]))
+            elif int(count) == 1:
+                rule = SamplingRule(sample_every=int(period))
+            else:
+                raise ValueError
+        except ValueError:
+            raise ValueError(f"Invalid log sampling rule: {entry!r}") from None
+        if rule.sample_every < 1 or rule.window_seconds <= 0:
+            raise ValueError(f"Invalid log sampling rule: {entry!r}")
+        rules[event.strip()] = rule
+    return rules
+
+
+class _EventState:
+    __slots__ = ("seen", "suppressed", "window_count", "window_start")
+
+    def __init__(self, now: float) -> None:
+        self.seen = 0
+        self.suppressed = 0
+        self.window_start = now
+        self.window_count = 0
+
+
+class LogSampler:
+    """Decides which records of sampled events to keep and counts the rest.
+
+    Attributes:
+        rules: Event name -> SamplingRule; events without a rule are always kept.
+        summary_interval: Minimum seconds between suppression summaries.
+    """
+
+    def __init__(
+        self,
+        rules: dict[str, SamplingRule] | None = None,
+        summary_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise the sampler.
+
+        Args:
+            rules: Sampling rules by event name.
+            summary_interval: Minimum seconds between suppression summaries.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.rules = dict(rules or {})
+        self.summary_interval = summary_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._events: dict[str, _EventState] = {}
+        self._last_summary = clock()
+
+    def configure(self, rules: dict[str, SamplingRule]) -> None:
+        """Replace the rules and reset all counters.
+
+        Args:
+            rules: Sampling rules by event name.
+        """
+        with self._lock:
+            self.rules = dict(rules)
+            self._events.clear()
+            self._last_summary = self._clock()
+
+    def allow(self, event: str) -> int | None:
+        """Decide whether to keep a record of event.
+
+        Args:
+            event: Event name (the log message).
+
+        Returns:
+            The rule's sample_every if the record should be logged, or None
+            if it is suppressed. Events without a rule return 1.
+        """
+        rule = self.rules.get(event)
+        if rule is None:
+            return 1
+        now = self._clock()
+        with self._lock:
+            state = self._events.get(event)
+            if state is None:
+                state = self._events[event] = _EventState(now)
+            state.seen += 1
+            if (state.seen - 1) % rule.sample_every:
+                state.suppressed += 1
+                return None
+            if rule.max_per_window is not None:
+                if now - state.window_start >= rule.window_seconds:
+                    state.window_start = now
+                    state.window_count = 0
+                if state.window_count >= rule.max_per_window:
+                    state.suppressed += 1
+                    return None
+                state.window_count += 1
+            return rule.sample_every
+
+    def take_summary(self, force: bool = False) -> dict[str, int] | None:
+        """Return and reset suppressed counts if a summary is due.
+
+        Args:
+            force: Return counts even if summary_interval has not elapsed.
+
+        Returns:
+            Event name -> records suppressed since the last summary, or None
+            if no summary is due or nothing was suppressed.
+        """
+        now = self._clock()
+        if not force and now - self._last_summary < self.summary_interval:
+            return None
+        with self._lock:
+            self._last_summary = now
+            suppressed = {
+                event: state.suppressed for event, state in self._events.items() if state.suppressed
+            }
+            for state in self._events.values():
+                state.suppressed = 0
+        return suppressed or None
+
+
+_sampler = LogSampler()
+
+
+def get_log_sampler() -> LogSampler:
+    """Return the process-wide sampler used by every StructuredLogger."""
+    return _sampler
@@ -5,31 +5,105 @@ registers all routers, and sets up middleware.
 """
 
 import asyncio
+import time
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import TypeVar
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
-from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
-from src.config import get_settings
-from src.database import check_connection, get_engine
+from src import IMPORT_STARTED
+from src.config import Settings, get_settings
+from src.database import check_connection, get_engine, warm_pool
+from src.db_instrumentation import finish_request, track_request
 from src.errors.handlers import register_exception_handlers
-from src.logging import get_logger
-from src.routes import admin, health, practice, streak, student, webhook
-from src.scheduler import start_scheduler, stop_scheduler
+from src.logging import get_logger, setup_logging, shutdown_logging
+from src.metrics import HTTP_REQUEST_SECONDS
+from src.routes import admin, health, metrics, practice, streak, student, webhook
+from src.scheduler import (
+    flush_rate_limits,
+    flush_sent_messages,
+    load_rate_limits,
+    release_leadership,
+    reload_messages,
+    start_scheduler,
+    stop_scheduler,
+)
+from src.services.content_bundle import ContentBundleError, load_content_bundle
+from src.services.health_monitor import get_health_monitor
+from src.services.outbox import get_outbox_dispatcher
+from src.services.rate_limits import create_limiter
 
 _STATIC_DIR = Path(__file__).parent.parent / "static"
 
 logger = get_logger(__name__)
 
 
+T = TypeVar("T")
+
+
+async def _timed(timings: dict[str, float], name: str, awaitable: Awaitable[T]) -> T:
+    """Await awaitable and record its duration in timings[name] (milliseconds)."""
+    started = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        timings[name] = round((time.perf_counter() - started) * 1000, 1)
+
+
+async def _start_database(settings: Settings, timings: dict[str, float]) -> bool:
+    """Check the database, then warm the pool and load DB-backed state concurrently.
+
+    Args:
+        settings: Application settings.
+        timings: Phase durations, updated in place.
+
+    Returns:
+        True if the database answered within the timeout.
+    """
+    # Check database connection (with timeout to avoid hanging startup)
+    try:
+        db_connected = await _timed(
+            timings, "db_connect_ms", asyncio.wait_for(check_connection(), timeout=5.0)
+        )
+    except TimeoutError:
+        db_connected = False
+    if not db_connected:
+        logger.warning("Database connection: FAILED (will retry on first request)")
+        return False
+    logger.info("Database connection: OK")
+
+    await asyncio.gather(
+        _timed(timings, "db_pool_warmup_ms", warm_pool(settings.db_pool_warmup)),
+        # Apply message_templates overrides (falls back to code defaults if the DB is down)
+        _timed(timings, "message_catalog_ms", reload_messages()),
+        # Restore rate-limit counters for windows still open (SEC-005)
+        _timed(timings, "rate_limits_ms", load_rate_limits()),
+    )
+    return True
+
+
+def _load_bundle(settings: Settings) -> None:
+    """Map the compiled content bundle (built into the image by the build phase).
+
+    ProblemRepository and AnswerEvaluator read problems from it; without it
+    they fall back to the problems table.
+    """
+    try:
+        bundle = load_content_bundle(settings.content_bundle_path)
+        logger.info(f"Content bundle: {len(bundle)} problems")
+    except ContentBundleError as exc:
+        logger.warning(f"Content bundle not loaded: {exc}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan context manager.
@@ -38,6 +112,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     - Startup: Initialize database connections, validate config
     - Shutdown: Close database connections gracefully
 
+    Database warm-up (connection check, pool warm-up, message catalog,
+    rate-limit counters) runs concurrently with mapping the content bundle
+    in a worker thread. The startup-complete log line carries the time
+    spent in each phase.
+
     Args:
         app: FastAPI application instance.
 
@@ -45,6 +124,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         None during application runtime.
     """
     # STARTUP
+    started = time.perf_counter()
+    timings: dict[str, float] = {}
+
+    # JSON logs to stdout, written off the event loop by a QueueListener thread
+    setup_logging()
     logger.info("Dars API starting up...")
 
     # Validate environment variables
@@ -52,34 +136,55 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"Log level: {settings.log_level}")
 
-    # Check database connection (with timeout to avoid hanging startup)
-    try:
-        db_connected = await asyncio.wait_for(check_connection(), timeout=5.0)
-    except TimeoutError:
-        db_connected = False
-    if db_connected:
-        logger.info("Database connection: OK")
-    else:
-        logger.warning("Database connection: FAILED (will retry on first request)")
-
     # Validate API keys are configured
     if not settings.telegram_bot_token:
         logger.warning("Telegram bot token not configured")
     if not settings.anthropic_api_key:
         logger.warning("Anthropic API key not configured")
 
+    await asyncio.gather(
+        _start_database(settings, timings),
+        _timed(timings, "content_bundle_ms", asyncio.to_thread(_load_bundle, settings)),
+    )
+
     # Start background scheduler (daily reminders)
+    scheduler_started = time.perf_counter()
     start_scheduler()
+    timings["scheduler_ms"] = round((time.perf_counter() - scheduler_started) * 1000, 1)
 
-    logger.info("Dars API startup complete")
+    # Cache dependency status for /health/ready (first check runs now)
+    get_health_monitor().start()
+
+    # Send queued Telegram messages (first round picks up anything left unsent)
+    get_outbox_dispatcher().start()
+
+    logger.info(
+        "Dars API startup complete",
+        event="startup.complete",
+        import_ms=_IMPORT_MS,
+        lifespan_ms=round((time.perf_counter() - started) * 1000, 1),
+        **timings,
+    )
 
     yield
 
     # SHUTDOWN
     logger.info("Dars API shutting down...")
 
-    # Stop background scheduler
+    await get_health_monitor().stop()
+
+    # Stop sending; unsent outbox rows are picked up by another process or the next start
+    await get_outbox_dispatcher().stop()
+
+    # Stop background scheduler; hand the leader lease to another process now
     stop_scheduler()
+    await release_leadership()
+
+    # Persist encouragement sends still queued in memory (REQ-013 non-repeat)
+    await flush_sent_messages()
+
+    # Persist rate-limit hits counted since the last sync (SEC-005)
+    await flush_rate_limits()
 
     # Close database connections
     engine = get_engine()
@@ -87,6 +192,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("Database connections closed")
 
     logger.info("Dars API shutdown complete")
+    shutdown_logging()
 
 
 # Create FastAPI application instance
@@ -137,7 +243,7 @@ app = FastAPI(
 
 
 # Configure rate limiter (SEC-005: Prevent DOS attacks)
-limiter = Limiter(key_func=get_remote_address)
+limiter = create_limiter(key_func=get_remote_address)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore[arg-type]
 
@@ -153,6 +259,9 @@ async def add_request_id(request: Request, call_next):  # type: ignore
     - Stored in request.state for access by handlers
     - Added to response headers for client tracking
     - Included in all log messages for tracing
+    - Used to tag per-request query counts (X-DB-Queries when enabled)
+
+    Also records request latency by route template for /metrics.
 
     Args:
         request: FastAPI request object.
@@ -164,8 +273,25 @@ async def add_request_id(request: Request, call_next):  # type: ignore
     request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
     request.state.request_id = request_id
 
-    response = await call_next(request)
+    # Count DB statements issued while handling this request (N+1 detection)
+    token = track_request(request_id)
+    started = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        query_stats = finish_request(token)
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            request.method,
+            getattr(route, "path", "unmatched"),  # Template, never the raw path
+            str(status_code),
+        )
     response.headers["X-Request-ID"] = request_id
+    if settings.db_query_header and query_stats is not None:
+        response.headers["X-DB-Queries"] = str(query_stats.count)
 
     return response
 
@@ -213,6 +339,7 @@ register_exception_handlers(app)
 
 # Register routers
 app.include_router(health.router)
+app.include_router(metrics.router)
 app.include_router(webhook.router)
 app.include_router(practice.router)
 app.include_router(streak.router)
@@ -249,3 +376,7 @@ async def root() -> dict[str, str]:
         "docs": "/docs",
         "health": "/health",
     }
+
+
+# Package import through app construction; logged in the startup breakdown
+_IMPORT_MS = round((time.perf_counter() - IMPORT_STARTED) * 1000, 1)
@@ -0,0 +1,294 @@
+"""
+Process-wide metrics in the Prometheus text exposition format.
+
+A deliberately small, dependency-free registry: counters and histograms
+are plain dicts keyed by label-value tuples, so an observation is a dict
+lookup, a bisect and two additions (~1 µs). Values that already live
+elsewhere (hint cache hits, queue depths, pool gauges) are read by
+callbacks only when /metrics is scraped, so they cost nothing per request.
+
+Label values must come from small fixed sets (route templates, command
+names, outcomes) — never IDs — to keep series counts bounded.
+
+Usage:
+    from src.metrics import TELEGRAM_SEND_SECONDS
+
+    started = time.perf_counter()
+    ...
+    TELEGRAM_SEND_SECONDS.observe(time.perf_counter() - started, "ok")
+"""
+
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+
+# Latency buckets in seconds: sub-millisecond DB statements up to slow API calls.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Callback result: {label values: sample value}; () for unlabelled metrics.
+Samples = dict[tuple[str, ...], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """Monotonically increasing value per label set.
+
+    Attributes:
+        name: Metric name.
+        documentation: HELP text.
+        labelnames: Label names; inc() takes values in the same order.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Samples = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        """Add amount (default 1) to the series for labelvalues."""
+        self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        """Return the current value of one series (0 if never incremented)."""
+        return self._values.get(labelvalues, 0.0)
+
+    def reset(self) -> None:
+        """Drop every series."""
+        self._values.clear()
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for labelvalues, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, labelvalues)} {_number(value)}")
+        return lines
+
+
+class Histogram:
+    """Bucketed distribution of observations per label set.
+
+    Bucket counts are stored per bucket and made cumulative at render time,
+    so observe() only touches one bucket.
+
+    Attributes:
+        name: Metric name.
+        documentation: HELP text.
+        labelnames: Label names; observe() takes values in the same order.
+        buckets: Upper bounds, ascending; +Inf is implicit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labelvalues -> [count per bucket..., +Inf count, sum]
+        self._series: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Record one observation (seconds, for latency histograms)."""
+        series = self._series.get(labelvalues)
+        if series is None:
+            series = self._series[labelvalues] = [0.0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, *labelvalues: str) -> int:
+        """Return the number of observations for one series."""
+        series = self._series.get(labelvalues)
+        return int(sum(series[:-1])) if series is not None else 0
+
+    def reset(self) -> None:
+        """Drop every series."""
+        self._series.clear()
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        bounds = [_number(b) for b in self.buckets] + ["+Inf"]
+        for labelvalues, series in sorted(self._series.items()):
+            cumulative = 0.0
+            for bound, bucket_count in zip(bounds, series[:-1], strict=True):
+                cumulative += bucket_count
+                le = _labels(self.labelnames, labelvalues, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{le} {_number(cumulative)}")
+            labels = _labels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}_sum{labels} {_number(series[-1])}")
+            lines.append(f"{self.name}_count{labels} {_number(cumulative)}")
+        return lines
+
+
+class CallbackMetric:
+    """Counter or gauge whose samples are read from a callback at scrape time.
+
+    Attributes:
+        name: Metric name.
+        kind: "counter" or "gauge".
+        documentation: HELP text.
+        labelnames: Label names matching the callback's key tuples.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        documentation: str,
+        callback: Callable[[], Samples],
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        self.name = name
+        self.kind = kind
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._callback = callback
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for labelvalues, value in sorted(self._callback().items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, labelvalues)} {_number(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together for /metrics."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Counter | Histogram | CallbackMetric] = {}
+
+    def _add(self, metric: Counter | Histogram | CallbackMetric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name!r} is already registered")
+        self._metrics[metric.name] = metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Create and register a Counter."""
+        metric = Counter(name, documentation, labelnames)
+        self._add(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Create and register a Histogram."""
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._add(metric)
+        return metric
+
+    def callback(
+        self,
+        name: str,
+        kind: str,
+        documentation: str,
+        callback: Callable[[], Samples],
+        labelnames: Sequence[str] = (),
+    ) -> CallbackMetric:
+        """Register a counter or gauge read from callback at scrape time.
+
+        Re-registering a name replaces the previous callback.
+        """
+        metric = CallbackMetric(name, kind, documentation, callback, labelnames)
+        self._metrics[name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text format (version 0.0.4)."""
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Zero every counter and histogram (callbacks are unaffected)."""
+        for metric in self._metrics.values():
+            if isinstance(metric, Counter | Histogram):
+                metric.reset()
+
+
+# Module-level registry rendered by GET /metrics (src/routes/metrics.py).
+registry = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "dars_http_request_duration_seconds",
+    "REST request latency by route template and status code.",
+    ("method", "route", "status"),
+)
+WEBHOOK_COMMAND_SECONDS = registry.histogram(
+    "dars_webhook_command_duration_seconds",
+    "Telegram update handling latency by command branch.",
+    ("command",),
+)
+DB_STATEMENT_SECONDS = registry.histogram(
+    "dars_db_statement_duration_seconds",
+    "SQL statement latency by statement type.",
+    ("operation",),
+)
+TELEGRAM_SEND_SECONDS = registry.histogram(
+    "dars_telegram_send_duration_seconds",
+    "Telegram Bot API sendMessage latency by outcome.",
+    ("outcome",),
+)
+CLAUDE_REQUEST_SECONDS = registry.histogram(
+    "dars_claude_request_duration_seconds",
+    "Claude API call latency by outcome.",
+    ("outcome",),
+)
+HINT_FALLBACKS = registry.counter(
+    "dars_hint_fallbacks_total",
+    "Pre-written hints served instead of AI hints, by reason.",
+    ("reason",),
+)
+AI_COST_USD = registry.counter(
+    "dars_ai_cost_usd_total",
+    "Recorded AI spend in US dollars.",
+)
+AI_TOKENS = registry.counter(
+    "dars_ai_tokens_total",
+    "Recorded AI tokens by direction.",
+    ("direction",),
+)
+REMINDERS = registry.counter(
+    "dars_reminders_total",
+    "Daily reminder outcomes.",
+    ("outcome",),
+)
+OUTBOX_MESSAGES = registry.counter(
+    "dars_outbox_messages_total",
+    "Outbox send attempts by outcome (sent, retry, failed, throttled).",
+    ("outcome",),
+)
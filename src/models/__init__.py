@@ -9,24 +9,41 @@ This module contains all SQLAlchemy models representing the core entities:
 - Streak: Daily habit tracking
 - CostRecord: API cost tracking for business model validation
 - MessageTemplate: Bilingual messages (Bengali + English) for all user-facing content
+- ContentManifest: File hashes of seeded YAML content
+- RateLimitCounter: Shared fixed-window rate-limit counters
+- SchedulerLease: Leader-election leases for background jobs
+- OutboxMessage: Outgoing Telegram messages awaiting delivery
+- Broadcast: Admin messages fanned out to many students
 """
 
+from src.models.broadcast import Broadcast, BroadcastStatus
+from src.models.content_manifest import ContentManifest
 from src.models.cost_record import CostRecord
 from src.models.message_template import MessageCategory, MessageTemplate
+from src.models.outbox_message import OutboxMessage, OutboxStatus
 from src.models.problem import Hint, Problem
+from src.models.rate_limit_counter import RateLimitCounter
 from src.models.response import Response
+from src.models.scheduler_lease import SchedulerLease
 from src.models.sent_message import SentMessage
 from src.models.session import Session
 from src.models.streak import Streak
 from src.models.student import Student
 
 __all__ = [
+    "Broadcast",
+    "BroadcastStatus",
+    "ContentManifest",
     "CostRecord",
     "Hint",
     "MessageCategory",
     "MessageTemplate",
+    "OutboxMessage",
+    "OutboxStatus",
     "Problem",
+    "RateLimitCounter",
     "Response",
+    "SchedulerLease",
     "SentMessage",
     "Session",
     "Streak",
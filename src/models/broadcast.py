@@ -0,0 +1,87 @@
+"""Broadcast model — one admin message sent to many students.
+
+A broadcast is created by the admin API and fanned out into the outbox by
+a scheduler job (see src/services/broadcasts.py). Per-recipient progress
+lives in the outbox rows it produced (outbox.broadcast_id); the broadcast
+row keeps the keyset cursor over students (last_student_id), so a restart
+resumes the fan-out where it stopped.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from src.models.base import Base
+
+
+class BroadcastStatus:
+    """Lifecycle states of a broadcast."""
+
+    SENDING = "sending"  # Fanning out, or queued messages not yet settled
+    COMPLETED = "completed"  # Every recipient's message was sent or gave up
+
+
+class Broadcast(Base):
+    """An admin message to every student matching a filter.
+
+    Attributes:
+        id: Primary key.
+        message: Text sent to each recipient.
+        grade: Only students in this grade (None = all grades).
+        language: Only students with this language (None = all languages).
+        status: "sending" or "completed".
+        total_recipients: Students matching the filter when the broadcast was created.
+        max_student_id: Highest student_id at creation; later sign-ups are not included.
+        last_student_id: Highest student_id queued so far (the fan-out's keyset cursor).
+        queued: Messages written to the outbox so far.
+        sent: Messages delivered (recorded on completion).
+        failed: Messages that gave up (recorded on completion).
+        created_by: Telegram ID of the admin who created it.
+        created_at: When the broadcast was created.
+        completed_at: When the last message was settled.
+    """
+
+    __tablename__ = "broadcasts"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
+    grade: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    language: Mapped[str | None] = mapped_column(String(5), nullable=True)
+    status: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        default=BroadcastStatus.SENDING,
+        comment="sending or completed",
+    )
+    total_recipients: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_student_id: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Students created after the broadcast are not recipients",
+    )
+    last_student_id: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Highest student_id already queued",
+    )
+    queued: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sent: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    failed: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    created_by: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        comment="Admin Telegram ID",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (Index("idx_broadcasts_status", "status"),)
+
+    def __repr__(self) -> str:
+        return f"<Broadcast id={self.id} status={self.status} queued={self.queued}>"
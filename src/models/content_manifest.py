@@ -0,0 +1,53 @@
+"""ContentManifest model — file hashes of seeded YAML content.
+
+scripts/seed_problems.py records the SHA-256 of every YAML file it has
+seeded. On the next run, files whose hash is unchanged are skipped without
+being parsed, so re-seeding an unchanged catalog costs one SELECT.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from src.models.base import Base
+
+
+class ContentManifest(Base):
+    """Hash of one content file as of its last successful seed.
+
+    Attributes:
+        source_path: File path relative to the content root (primary key).
+        file_hash: SHA-256 of the file's bytes.
+        problem_count: Number of problems in the file.
+        seeded_at: UTC timestamp of the last seed of this file.
+    """
+
+    __tablename__ = "content_manifest"
+
+    source_path: Mapped[str] = mapped_column(
+        String(500),
+        primary_key=True,
+        comment="Content file path relative to the content root",
+    )
+    file_hash: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        comment="SHA-256 of the file contents when last seeded",
+    )
+    problem_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Number of problems in the file",
+    )
+    seeded_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+        comment="Timestamp of the last seed of this file (UTC)",
+    )
+
+    def __repr__(self) -> str:
+        return f"<ContentManifest path={self.source_path!r} hash={self.file_hash[:12]}>"
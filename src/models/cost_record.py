@@ -2,6 +2,10 @@
 CostRecord model for tracking API usage and costs.
 
 Logs every Claude API call with token counts and cost calculations for business validation.
+
+On PostgreSQL the table is range-partitioned by month on recorded_at; rows
+older than COST_RECORDS_RETENTION_DAYS are archived to NDJSON by the nightly
+retention job (src/services/retention.py).
 """
 
 from datetime import datetime
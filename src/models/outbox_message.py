@@ -0,0 +1,106 @@
+"""OutboxMessage model — Telegram messages waiting to be sent.
+
+Handlers and jobs write a row here in the same transaction as the state
+change that produced the message, and the outbox dispatcher sends it after
+commit (see src/services/outbox.py). A message is sent if and only if its
+transaction committed, and a slow Telegram API no longer holds a database
+transaction open.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from src.models.base import Base
+
+# Defined outside the class body, where "text" is the message column.
+_PENDING_ONLY = text("status = 'pending'")
+_BROADCASTS_ONLY = text("broadcast_id IS NOT NULL")
+
+
+class OutboxStatus:
+    """Delivery states of an outbox row."""
+
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"  # Gave up after OUTBOX_MAX_ATTEMPTS
+
+
+class OutboxMessage(Base):
+    """One outgoing Telegram message.
+
+    Attributes:
+        id: Primary key (also the send order).
+        idempotency_key: Unique key; enqueueing the same key twice is a no-op.
+        chat_id: Telegram chat to send to.
+        text: Message text.
+        status: "pending", "sent" or "failed".
+        attempts: Send attempts so far.
+        next_attempt_at: Earliest time the dispatcher may (re)try the send.
+        last_error: Why the latest attempt failed, if it did.
+        created_at: When the message was enqueued.
+        sent_at: When Telegram accepted the message.
+        broadcast_id: Broadcast the message belongs to, if any.
+    """
+
+    __tablename__ = "outbox"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    idempotency_key: Mapped[str] = mapped_column(
+        String(128),
+        unique=True,
+        nullable=False,
+        comment="Deduplicates enqueues, e.g. reply:<chat_id>:<message_id>",
+    )
+    chat_id: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        comment="Telegram chat ID",
+    )
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        default=OutboxStatus.PENDING,
+        comment="pending, sent or failed",
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="Earliest (re)try time; pushed ahead while a dispatcher holds the row",
+    )
+    last_error: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    broadcast_id: Mapped[int | None] = mapped_column(
+        ForeignKey("broadcasts.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+
+    __table_args__ = (
+        # Partial index for the dispatcher: only undelivered rows are indexed.
+        Index(
+            "idx_outbox_pending_next_attempt",
+            "next_attempt_at",
+            postgresql_where=_PENDING_ONLY,
+            sqlite_where=_PENDING_ONLY,
+        ),
+        Index("idx_outbox_created", "created_at"),
+        # Broadcast progress and fan-out backpressure (counts by status).
+        Index(
+            "idx_outbox_broadcast_status",
+            "broadcast_id",
+            "status",
+            postgresql_where=_BROADCASTS_ONLY,
+            sqlite_where=_BROADCASTS_ONLY,
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<OutboxMessage id={self.id} key={self.idempotency_key!r} status={self.status}>"
@@ -87,6 +87,8 @@ class Problem(Base, TimestampMixin):
         answer_type: How to evaluate the answer (numeric, multiple_choice, text).
         acceptable_tolerance_percent: Tolerance for numeric answers (default 5%).
         multiple_choice_options: List of options for multiple_choice problems.
+        content_key: SHA-256 of (grade, topic, question_en); seeding upsert key.
+        content_hash: SHA-256 of all seeded fields; detects changed YAML content.
         created_at: Timestamp when problem added.
         updated_at: Timestamp when problem last modified.
     """
@@ -180,6 +182,19 @@ class Problem(Base, TimestampMixin):
         comment="List of answer options for multiple_choice problems",
     )
 
+    # Seeding identity (NULL for problems not loaded from YAML content)
+    content_key: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="SHA-256 of (grade, topic, question_en); upsert key for seeding",
+    )
+
+    content_hash: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="SHA-256 of all seeded fields; changes when YAML content changes",
+    )
+
     # Constraints
     __table_args__ = (
         CheckConstraint(
@@ -200,6 +215,7 @@ class Problem(Base, TimestampMixin):
         ),
         Index("idx_problems_grade_topic", "grade", "topic"),
         Index("idx_problems_difficulty", "difficulty"),
+        Index("idx_problems_content_key", "content_key", unique=True),
     )
 
     def get_hints(self) -> list[Hint]:
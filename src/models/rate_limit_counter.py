@@ -0,0 +1,45 @@
+"""RateLimitCounter model — shared fixed-window rate-limit counters.
+
+Each worker counts slowapi hits in memory and periodically adds its deltas
+to these rows (see src/services/rate_limits.py), so limits such as the
+10/day hint limit hold across workers and survive restarts.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class RateLimitCounter(Base):
+    """Hit count of one rate-limit key in its current window.
+
+    Attributes:
+        key: slowapi/limits key, e.g. "LIMITER/student:123/.../10/1/day".
+        count: Hits recorded by all workers in the current window.
+        expires_at: End of the current window (UTC).
+    """
+
+    __tablename__ = "rate_limit_counters"
+
+    key: Mapped[str] = mapped_column(
+        String(255),
+        primary_key=True,
+        comment="Rate-limit key (limit + identifier)",
+    )
+    count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Hits in the current window across all workers",
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+        comment="End of the current window (UTC)",
+    )
+
+    def __repr__(self) -> str:
+        return f"<RateLimitCounter key={self.key!r} count={self.count}>"
@@ -17,8 +17,11 @@ from sqlalchemy import (
     Index,
     Integer,
     String,
+    event,
+    select,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapped, Mapper, mapped_column, relationship
 
 from src.models.base import Base
 
@@ -43,6 +46,7 @@ class Response(Base):
     Attributes:
         response_id: Primary key.
         session_id: Foreign key to sessions table.
+        student_id: Foreign key to students table (denormalized from session).
         problem_id: Foreign key to problems table.
         student_answer: Student's submitted answer (string).
         is_correct: Whether answer was correct.
@@ -71,6 +75,13 @@ class Response(Base):
         comment="Session this response belongs to",
     )
 
+    student_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("students.student_id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Student who answered (denormalized from sessions.student_id)",
+    )
+
     problem_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("problems.problem_id", ondelete="CASCADE"),
@@ -156,6 +167,7 @@ class Response(Base):
         Index("idx_responses_session", "session_id"),
         Index("idx_responses_problem", "problem_id"),
         Index("idx_responses_correctness", "is_correct"),
+        Index("idx_responses_student_evaluated", "student_id", "evaluated_at"),
     )
 
     def get_hints_viewed(self) -> list["Hint"]:
@@ -175,3 +187,24 @@ class Response(Base):
             f"problem_id={self.problem_id}, correct={self.is_correct}, "
             f"hints_used={self.hints_used})>"
         )
+
+
+@event.listens_for(Response, "before_insert")
+def _fill_student_id(mapper: Mapper[Response], connection: Connection, target: Response) -> None:
+    """Populate the denormalized student_id from the owning session if unset.
+
+    Callers on hot paths pass student_id explicitly; this keeps rows created
+    without it consistent by resolving it inside the INSERT itself.
+
+    Args:
+        mapper: Response mapper (unused).
+        connection: Connection the flush is running on (unused).
+        target: Response instance about to be inserted.
+    """
+    if target.student_id is not None:
+        return
+    from src.models.session import Session
+
+    target.student_id = (
+        select(Session.student_id).where(Session.session_id == target.session_id).scalar_subquery()
+    )
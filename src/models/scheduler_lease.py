@@ -0,0 +1,51 @@
+"""SchedulerLease model — time-limited leadership leases for background jobs.
+
+One row per role (e.g. "scheduler"). The process whose holder ID is stored
+and whose expires_at is still in the future is the leader; it extends
+expires_at with periodic heartbeats, and any process may take the row over
+once it lapses (see src/services/leader_election.py).
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class SchedulerLease(Base):
+    """Current holder of one leader-elected role.
+
+    Attributes:
+        name: Role name, e.g. "scheduler".
+        holder: Holder ID of the leader ("hostname:pid:nonce").
+        acquired_at: When the current holder took the lease (UTC).
+        expires_at: When the lease lapses unless renewed (UTC).
+    """
+
+    __tablename__ = "scheduler_leases"
+
+    name: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment="Role name",
+    )
+    holder: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        comment="Holder ID of the current leader",
+    )
+    acquired_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="When the current holder took the lease (UTC)",
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Lease lapses at this time unless renewed (UTC)",
+    )
+
+    def __repr__(self) -> str:
+        return f"<SchedulerLease name={self.name!r} holder={self.holder!r}>"
@@ -3,8 +3,11 @@
 PHASE6-B-2 (REQ-013): Prevents the same encouragement message from being
 sent twice to the same student within a 7-day window.
 
-The 7-day TTL is enforced via a query filter (WHERE sent_at >= now() - 7 days),
-NOT by deleting old rows. This keeps the audit trail intact.
+The 7-day TTL is enforced via a query filter (WHERE sent_at >= now() - 7 days).
+Rows older than SENT_MESSAGES_RETENTION_DAYS are moved to NDJSON archives by
+the nightly retention job (src/services/retention.py), so the audit trail is
+kept without growing the hot table. On PostgreSQL the table is partitioned
+by month on sent_at.
 """
 
 from datetime import datetime
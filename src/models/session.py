@@ -15,6 +15,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -154,6 +155,13 @@ class Session(Base, TimestampMixin):
         Index("idx_sessions_student_created", "student_id", "created_at"),
         Index("idx_sessions_status", "status"),
         Index("idx_sessions_date", "date"),
+        # Partial index for the stale-session sweeper: only live sessions are indexed.
+        Index(
+            "idx_sessions_in_progress_expires",
+            "expires_at",
+            postgresql_where=text("status = 'in_progress'"),
+            sqlite_where=text("status = 'in_progress'"),
+        ),
     )
 
     def is_expired(self) -> bool:
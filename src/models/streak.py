@@ -1,13 +1,14 @@
 """
 Streak model for tracking daily practice habits.
 
-Tracks current streak, longest streak, and milestone achievements.
+Tracks current streak, longest streak, milestone achievements and a compact
+bitmap of practiced days used for calendar views.
 """
 
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, CheckConstraint, Date, ForeignKey, Index, Integer
+from sqlalchemy import JSON, CheckConstraint, Date, ForeignKey, Index, Integer, LargeBinary
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base, TimestampMixin
@@ -15,6 +16,9 @@ from src.models.base import Base, TimestampMixin
 if TYPE_CHECKING:
     from src.models.student import Student
 
+# Days of history kept in practice_history (two years fit in 92 bytes).
+PRACTICE_HISTORY_DAYS = 730
+
 
 class Streak(Base, TimestampMixin):
     """Streak tracking for daily practice habits.
@@ -28,6 +32,9 @@ class Streak(Base, TimestampMixin):
         longest_streak: Longest streak ever achieved.
         last_practice_date: Date of last practice session.
         milestones_achieved: Array of milestone days reached (e.g., [7, 14, 30]).
+        practice_history: Rolling bitmap of practiced days, little-endian;
+            bit i is set if the student practiced on practice_history_end - i days.
+        practice_history_end: Most recent day covered by practice_history.
         updated_at: Timestamp when streak last updated.
     """
 
@@ -72,6 +79,19 @@ class Streak(Base, TimestampMixin):
         comment="Array of milestone days reached (e.g., [7, 14, 30])",
     )
 
+    # Practice calendar: bit i <=> practiced on (practice_history_end - i days)
+    practice_history: Mapped[bytes | None] = mapped_column(
+        LargeBinary,
+        nullable=True,
+        comment="Rolling bitmap of practiced days; bit i = practice_history_end - i days",
+    )
+
+    practice_history_end: Mapped[date | None] = mapped_column(
+        Date,
+        nullable=True,
+        comment="Most recent day covered by practice_history",
+    )
+
     # Relationships
     student: Mapped["Student"] = relationship(
         "Student",
@@ -119,6 +139,53 @@ class Streak(Base, TimestampMixin):
                 return milestone
         return None
 
+    def mark_practiced(self, practice_date: date) -> None:
+        """Set the practice_history bit for a day.
+
+        Later dates shift the bitmap forward so practice_history_end is always
+        the newest practiced day; bits older than PRACTICE_HISTORY_DAYS drop off.
+        Dates older than the window are ignored.
+
+        Args:
+            practice_date: Calendar day the student practiced.
+        """
+        bits = int.from_bytes(self.practice_history or b"", "little")
+        end = self.practice_history_end
+        if end is None or practice_date > end:
+            shift = (practice_date - end).days if end is not None else 0
+            bits = (bits << shift) | 1
+            self.practice_history_end = practice_date
+        else:
+            offset = (end - practice_date).days
+            if offset >= PRACTICE_HISTORY_DAYS:
+                return
+            bits |= 1 << offset
+        bits &= (1 << PRACTICE_HISTORY_DAYS) - 1
+        self.practice_history = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+
+    def practiced_days(self, start: date, end: date) -> list[date]:
+        """Return the practiced days in [start, end] from practice_history.
+
+        Args:
+            start: First day of the window (inclusive).
+            end: Last day of the window (inclusive).
+
+        Returns:
+            Sorted list of practiced dates within the window.
+        """
+        history_end = self.practice_history_end
+        if history_end is None or not self.practice_history or end < start:
+            return []
+        bits = int.from_bytes(self.practice_history, "little")
+        days: list[date] = []
+        day = start
+        while day <= end:
+            offset = (history_end - day).days
+            if 0 <= offset < PRACTICE_HISTORY_DAYS and (bits >> offset) & 1:
+                days.append(day)
+            day += timedelta(days=1)
+        return days
+
     def __repr__(self) -> str:
         """String representation of Streak."""
         return (
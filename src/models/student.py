@@ -4,9 +4,10 @@ Student model representing learners in the Dars platform.
 Each student has a unique Telegram ID, grade level (6-8), and language preference.
 """
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BigInteger, CheckConstraint, Index, Integer, String
+from sqlalchemy import BigInteger, CheckConstraint, DateTime, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base, TimestampMixin
@@ -26,6 +27,10 @@ class Student(Base, TimestampMixin):
         name: Student's display name (max 100 chars).
         grade: Student's grade level (6, 7, or 8).
         language: Preferred language for content ('bn' for Bengali, 'en' for English).
+        timezone: IANA timezone for the daily reminder, e.g. "Asia/Kolkata".
+        reminder_hour: Local hour (0-23) in which the daily reminder is sent.
+        next_reminder_at: When the next daily reminder is due (UTC); NULL until
+            the reminder job first schedules the student.
         created_at: Timestamp when student registered.
         updated_at: Timestamp when profile last updated.
     """
@@ -77,6 +82,29 @@ class Student(Base, TimestampMixin):
         comment="Current adaptive difficulty level (1=easy, 2=medium, 3=hard; REQ-004)",
     )
 
+    # Daily reminder schedule (REQ-011; see src/services/reminder_schedule.py)
+    timezone: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        server_default="Asia/Kolkata",
+        default="Asia/Kolkata",
+        comment="IANA timezone for the daily reminder",
+    )
+
+    reminder_hour: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="18",
+        default=18,
+        comment="Local hour (0-23) in which the daily reminder is sent",
+    )
+
+    next_reminder_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the next daily reminder is due (UTC)",
+    )
+
     # Relationships
     sessions: Mapped[list["Session"]] = relationship(
         "Session",
@@ -114,8 +142,14 @@ class Student(Base, TimestampMixin):
             "difficulty_level IN (1, 2, 3)",
             name="ck_students_difficulty_level_valid",
         ),
+        CheckConstraint(
+            "reminder_hour >= 0 AND reminder_hour <= 23",
+            name="ck_students_reminder_hour_range",
+        ),
         Index("idx_students_telegram_id", "telegram_id"),
         Index("idx_students_grade", "grade"),
+        # The reminder job reads small per-minute buckets in due order.
+        Index("idx_students_next_reminder_at", "next_reminder_at"),
     )
 
     def __repr__(self) -> str:
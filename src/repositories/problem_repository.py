@@ -4,16 +4,136 @@ ProblemRepository — data access layer for the problems table.
 Provides all queries needed by the ProblemSelector service and other
 downstream consumers. All methods accept an AsyncSession provided by the
 caller so that transaction management stays at the service/route layer.
+
+Problem lookups (by id, by ids, by grade) are served from the content
+bundle (src/services/content_bundle.py) when one is loaded: one query maps
+problem_id to content_key and is cached for _CATALOG_TTL_SECONDS, and the
+rows themselves are decoded from the memory-mapped bundle. Only problems
+whose content_hash matches the bundled record are served that way, and a
+grade is listed from the bundle only if every one of its problems is; the
+rest are read from the database. Problems served from the bundle are
+transient (not attached to the session).
 """
 
+import time
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
 from sqlalchemy import distinct, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.problem import Problem
 from src.models.response import Response
-from src.models.session import Session
+from src.services.content_bundle import ContentBundle, get_content_bundle
+
+# How long the problem_id -> bundle record map is reused before it is
+# rebuilt (picks up problems seeded while the process runs).
+_CATALOG_TTL_SECONDS = 300.0
+
+# Problem columns stored in every bundle record.
+_BUNDLED_COLUMNS = (
+    "grade",
+    "topic",
+    "subtopic",
+    "question_en",
+    "question_bn",
+    "answer",
+    "hints",
+    "difficulty",
+    "answer_type",
+    "acceptable_tolerance_percent",
+    "multiple_choice_options",
+    "content_key",
+    "content_hash",
+)
+
+
+@dataclass
+class _BundleCatalog:
+    """Seeded problems that can be served from a content bundle.
+
+    Attributes:
+        bundle: The bundle the map was built for.
+        bind: Database engine the map was built from.
+        built_at: time.monotonic() when the map was built.
+        ids: content_key -> problem_id, for rows matching the bundle.
+        keys: problem_id -> content_key, for the same rows.
+        minutes: problem_id -> estimated_time_minutes (not in the bundle).
+        grades: Grades whose every problem matches the bundle.
+    """
+
+    bundle: ContentBundle
+    bind: Any
+    built_at: float
+    ids: dict[str, int] = field(default_factory=dict)
+    keys: dict[int, str] = field(default_factory=dict)
+    minutes: dict[int, int] = field(default_factory=dict)
+    grades: set[int] = field(default_factory=set)
+
+    def problem(self, problem_id: int) -> Problem | None:
+        """Build a transient Problem from the bundle, or None if not bundled."""
+        content_key = self.keys.get(problem_id)
+        if content_key is None:
+            return None
+        record = self.bundle.problem_by_key(content_key)
+        return None if record is None else self.from_record(record)
+
+    def from_record(self, record: dict[str, Any]) -> Problem:
+        """Build a transient Problem from a bundle record of a seeded problem."""
+        problem_id = self.ids[record["content_key"]]
+        return Problem(
+            problem_id=problem_id,
+            estimated_time_minutes=self.minutes[problem_id],
+            **{column: record[column] for column in _BUNDLED_COLUMNS},
+        )
+
+
+_catalog: _BundleCatalog | None = None
+
+
+async def _bundle_catalog(db: AsyncSession) -> _BundleCatalog | None:
+    """Return the catalog for the loaded bundle, rebuilding it when stale.
+
+    Returns:
+        None when no content bundle is loaded.
+    """
+    global _catalog
+    bundle = get_content_bundle()
+    if bundle is None:
+        return None
+    bind = db.get_bind()
+    if (
+        _catalog is not None
+        and _catalog.bundle is bundle
+        and _catalog.bind is bind
+        and time.monotonic() - _catalog.built_at < _CATALOG_TTL_SECONDS
+    ):
+        return _catalog
+
+    catalog = _BundleCatalog(bundle=bundle, bind=bind, built_at=time.monotonic())
+    unmatched: set[int] = set()
+    result = await db.execute(
+        select(
+            Problem.problem_id,
+            Problem.grade,
+            Problem.content_key,
+            Problem.content_hash,
+            Problem.estimated_time_minutes,
+        )
+    )
+    for problem_id, grade, content_key, content_hash, minutes in result.all():
+        catalog.grades.add(grade)
+        # Not loaded from YAML, not in the bundle, or changed since the build
+        if content_key is None or bundle.answer_normalized(content_key, content_hash) is None:
+            unmatched.add(grade)
+            continue
+        catalog.ids[content_key] = problem_id
+        catalog.keys[problem_id] = content_key
+        catalog.minutes[problem_id] = minutes
+    catalog.grades -= unmatched
+    _catalog = catalog
+    return catalog
 
 
 class ProblemRepository:
@@ -47,6 +167,28 @@ class ProblemRepository:
         Returns:
             List of matching Problem objects, ordered by problem_id.
         """
+        catalog = await _bundle_catalog(db)
+        if catalog is not None and grade in catalog.grades:
+            if topic is not None:
+                records = catalog.bundle.problems_for_topic(grade, topic)
+            else:
+                prefix = f"{grade}/"
+                records = [
+                    catalog.bundle.problem(index)
+                    for key, indexes in catalog.bundle.topics.items()
+                    if key.startswith(prefix)
+                    for index in indexes
+                ]
+            excluded = set(exclude_ids or ())
+            problems = [
+                catalog.from_record(record)
+                for record in records
+                if record["content_key"] in catalog.ids
+                and (difficulty is None or record["difficulty"] == difficulty)
+                and catalog.ids[record["content_key"]] not in excluded
+            ]
+            return sorted(problems, key=lambda p: p.problem_id)
+
         stmt = select(Problem).where(Problem.grade == grade)
 
         if difficulty is not None:
@@ -68,8 +210,8 @@ class ProblemRepository:
     ) -> list[int]:
         """Get IDs of problems this student has seen in the last N days.
 
-        Looks at all sessions belonging to the student within the window
-        and returns the union of problem_ids from those sessions.
+        Uses the (student_id, evaluated_at) index on responses so the cost
+        does not grow with the number of sessions the student has accumulated.
 
         Args:
             db: Active async database session.
@@ -81,20 +223,9 @@ class ProblemRepository:
         """
         cutoff = datetime.now(UTC) - timedelta(days=days)
 
-        # Sub-query: get all sessions for this student in the window.
-        session_stmt = select(Session.session_id).where(
-            Session.student_id == student_id,
-            Session.created_at >= cutoff,
-        )
-        session_result = await db.execute(session_stmt)
-        session_ids = [row[0] for row in session_result.fetchall()]
-
-        if not session_ids:
-            return []
-
-        # Get distinct problem_ids answered in those sessions via responses.
         resp_stmt = select(distinct(Response.problem_id)).where(
-            Response.session_id.in_(session_ids)
+            Response.student_id == student_id,
+            Response.evaluated_at >= cutoff,
         )
         resp_result = await db.execute(resp_stmt)
         return [row[0] for row in resp_result.fetchall()]
@@ -113,6 +244,11 @@ class ProblemRepository:
         Returns:
             Problem object if found, None otherwise.
         """
+        catalog = await _bundle_catalog(db)
+        problem = catalog.problem(problem_id) if catalog is not None else None
+        if problem is not None:
+            return problem
+
         stmt = select(Problem).where(Problem.problem_id == problem_id)
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
@@ -172,9 +308,18 @@ class ProblemRepository:
         """
         if not problem_ids:
             return []
-        stmt = select(Problem).where(Problem.problem_id.in_(problem_ids))
-        result = await db.execute(stmt)
-        problems_by_id = {p.problem_id: p for p in result.scalars().all()}
+        problems_by_id: dict[int, Problem] = {}
+        catalog = await _bundle_catalog(db)
+        if catalog is not None:
+            for pid in problem_ids:
+                problem = catalog.problem(pid)
+                if problem is not None:
+                    problems_by_id[pid] = problem
+        missing = [pid for pid in problem_ids if pid not in problems_by_id]
+        if missing:
+            stmt = select(Problem).where(Problem.problem_id.in_(missing))
+            result = await db.execute(stmt)
+            problems_by_id.update((p.problem_id, p) for p in result.scalars().all())
         return [problems_by_id[pid] for pid in problem_ids if pid in problems_by_id]
 
     async def get_problem_count_by_grade(
@@ -14,7 +14,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.problem import Problem
 from src.models.response import ConfidenceLevel, Response
-from src.models.session import Session
 
 
 def _confidence_from_hints(hints_used: int) -> str:
@@ -41,7 +40,7 @@ class ResponseRepository:
         response = await repo.create_response(
             db, session_id=1, problem_id=5, student_answer="20",
             is_correct=True, hints_used=0, time_spent_seconds=45,
-            confidence_level="high",
+            confidence_level="high", student_id=3,
         )
     """
 
@@ -55,6 +54,7 @@ class ResponseRepository:
         hints_used: int,
         time_spent_seconds: int,
         confidence_level: str | None = None,
+        student_id: int | None = None,
     ) -> Response:
         """Record a student's answer submission.
 
@@ -73,6 +73,8 @@ class ResponseRepository:
             hints_used: Number of hints the student requested (0-3).
             time_spent_seconds: Time spent on this problem in seconds.
             confidence_level: Optional override; derived from hints_used if None.
+            student_id: Owning student; resolved from the session inside the
+                INSERT when not provided.
 
         Returns:
             Newly created and flushed Response object.
@@ -82,6 +84,7 @@ class ResponseRepository:
 
         response = Response(
             session_id=session_id,
+            student_id=student_id,
             problem_id=problem_id,
             student_answer=student_answer,
             is_correct=is_correct,
@@ -141,51 +144,23 @@ class ResponseRepository:
         """
         cutoff = datetime.now(UTC) - timedelta(days=days)
 
-        # Get sessions for this student within the window.
-        session_stmt = select(Session.session_id).where(
-            Session.student_id == student_id,
-            Session.created_at >= cutoff,
-        )
-        session_result = await db.execute(session_stmt)
-        session_ids = [row[0] for row in session_result.fetchall()]
-
-        if not session_ids:
-            return 0.5  # Neutral baseline — no history.
-
-        # Get problem IDs for the topic.
-        problem_stmt = select(Problem.problem_id).where(Problem.topic == topic)
-        problem_result = await db.execute(problem_stmt)
-        topic_problem_ids = [row[0] for row in problem_result.fetchall()]
-
-        if not topic_problem_ids:
-            return 0.5  # Topic not in DB — neutral.
-
-        # Count total and correct responses for this student on the topic.
-        total_stmt = (
-            select(func.count())
-            .select_from(Response)
-            .where(
-                Response.session_id.in_(session_ids),
-                Response.problem_id.in_(topic_problem_ids),
+        stmt = (
+            select(
+                func.count(Response.response_id),
+                func.count(Response.response_id).filter(Response.is_correct.is_(True)),
             )
-        )
-        total_result = await db.execute(total_stmt)
-        total = total_result.scalar_one()
-
-        if total == 0:
-            return 0.5
-
-        correct_stmt = (
-            select(func.count())
-            .select_from(Response)
+            .join(Problem, Response.problem_id == Problem.problem_id)
             .where(
-                Response.session_id.in_(session_ids),
-                Response.problem_id.in_(topic_problem_ids),
-                Response.is_correct.is_(True),
+                Response.student_id == student_id,
+                Response.evaluated_at >= cutoff,
+                Problem.topic == topic,
             )
         )
-        correct_result = await db.execute(correct_stmt)
-        correct = correct_result.scalar_one()
+        result = await db.execute(stmt)
+        total, correct = result.one()
+
+        if not total:
+            return 0.5  # Neutral baseline — no history for this topic.
 
         return correct / total
 
@@ -210,26 +185,20 @@ class ResponseRepository:
         """
         cutoff = datetime.now(UTC) - timedelta(days=days)
 
-        # Get recent sessions for this student.
-        session_stmt = select(Session.session_id).where(
-            Session.student_id == student_id,
-            Session.created_at >= cutoff,
-        )
-        session_result = await db.execute(session_stmt)
-        session_ids = [row[0] for row in session_result.fetchall()]
-
-        if not session_ids:
-            return {}
-
         # Join responses -> problems to group by topic.
         stmt = (
             select(
                 Problem.topic,
                 func.count(Response.response_id).label("total"),
-                func.sum(func.cast(Response.is_correct, type_=func.count().type)).label("correct"),
+                func.count(Response.response_id)
+                .filter(Response.is_correct.is_(True))
+                .label("correct"),
             )
             .join(Problem, Response.problem_id == Problem.problem_id)
-            .where(Response.session_id.in_(session_ids))
+            .where(
+                Response.student_id == student_id,
+                Response.evaluated_at >= cutoff,
+            )
             .group_by(Problem.topic)
         )
         result = await db.execute(stmt)
@@ -291,16 +260,6 @@ class ResponseRepository:
         Returns:
             List of response dicts. Empty list for new students.
         """
-        # Sub-query: session IDs for this student
-        session_stmt = select(Session.session_id).where(
-            Session.student_id == student_id,
-        )
-        session_result = await db.execute(session_stmt)
-        session_ids = [row[0] for row in session_result.fetchall()]
-
-        if not session_ids:
-            return []
-
         stmt = (
             select(
                 Response.problem_id,
@@ -310,7 +269,7 @@ class ResponseRepository:
             )
             .join(Problem, Response.problem_id == Problem.problem_id)
             .where(
-                Response.session_id.in_(session_ids),
+                Response.student_id == student_id,
                 Response.evaluated_at >= since,
                 Response.student_answer != "",
             )
@@ -71,6 +71,10 @@ class SessionRepository:
         how to proceed (e.g. resume an in-progress session, or short-circuit
         for a completed one).
 
+        Expiry is applied lazily: an IN_PROGRESS session past expires_at is
+        treated as absent, so this stays a read-only query. The background
+        sweeper (src/scheduler.py) flips such rows to ABANDONED later.
+
         Args:
             db: Active async database session.
             student_id: Student to look up.
@@ -95,7 +99,14 @@ class SessionRepository:
             .limit(1)
         )
         result = await db.execute(stmt)
-        return result.scalar_one_or_none()
+        session = result.scalar_one_or_none()
+        if (
+            session is not None
+            and session.status == SessionStatus.IN_PROGRESS
+            and session.is_expired()
+        ):
+            return None
+        return session
 
     async def get_session_by_id(
         self,
@@ -161,25 +172,36 @@ class SessionRepository:
     async def expire_stale_sessions(
         self,
         db: AsyncSession,
+        limit: int | None = None,
     ) -> int:
-        """Mark all in_progress sessions past their expiry as abandoned.
+        """Mark in_progress sessions past their expiry as abandoned.
 
-        Intended to be called at the start of each new /practice request so
-        stale sessions from previous days/hours are cleaned up.
+        Called periodically by the stale-session sweeper in src/scheduler.py;
+        request handlers rely on Session.is_expired() instead. The candidate
+        scan uses the partial index idx_sessions_in_progress_expires.
 
         Args:
             db: Active async database session.
+            limit: Maximum number of sessions to update in this call. None
+                updates every stale session at once.
 
         Returns:
             Number of sessions that were marked abandoned.
         """
         now = datetime.now(UTC)
-        stmt = (
-            update(Session)
+        stale = (
+            select(Session.session_id)
             .where(
                 Session.status == SessionStatus.IN_PROGRESS,
                 Session.expires_at < now,
             )
+            .order_by(Session.expires_at)
+        )
+        if limit is not None:
+            stale = stale.limit(limit)
+        stmt = (
+            update(Session)
+            .where(Session.session_id.in_(stale.scalar_subquery()))
             .values(status=SessionStatus.ABANDONED)
             .execution_options(synchronize_session="fetch")
         )
@@ -9,13 +9,13 @@ management (commit/rollback) is the caller's responsibility. Methods
 use flush() not commit() so callers control transaction boundaries.
 """
 
+import calendar
 from datetime import UTC, date, datetime, timedelta
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.session import Session, SessionStatus
-from src.models.streak import Streak
+from src.models.streak import PRACTICE_HISTORY_DAYS, Streak
 
 # Milestone thresholds (days).  REQ-012.
 STREAK_MILESTONES: list[int] = [7, 14, 30]
@@ -42,6 +42,31 @@ def _to_date(value: date | datetime | None) -> date | None:
     return value
 
 
+def practice_window(streak: Streak | None, days: int, end_date: date | None = None) -> list[date]:
+    """Return the practiced days in the N days ending on end_date.
+
+    Reads only the streak's practice_history bitmap, so the cost does not
+    depend on how many sessions the student has.
+
+    Args:
+        streak: Streak row (None means no practice yet).
+        days: Window length in days (1 to PRACTICE_HISTORY_DAYS).
+        end_date: Last day of the window, inclusive (defaults to today, UTC).
+
+    Returns:
+        Sorted list of practiced dates in the window.
+
+    Raises:
+        ValueError: If days is outside 1..PRACTICE_HISTORY_DAYS.
+    """
+    if not 1 <= days <= PRACTICE_HISTORY_DAYS:
+        raise ValueError(f"days must be between 1 and {PRACTICE_HISTORY_DAYS}, got {days}")
+    if streak is None:
+        return []
+    end = end_date or datetime.now(UTC).date()
+    return streak.practiced_days(end - timedelta(days=days - 1), end)
+
+
 class StreakRepository:
     """Data access methods for the streaks table.
 
@@ -151,8 +176,9 @@ class StreakRepository:
         if streak.current_streak > streak.longest_streak:
             streak.longest_streak = streak.current_streak
 
-        # --- Update last practice date ---
+        # --- Update last practice date and the practice calendar ---
         streak.last_practice_date = practice_date  # type: ignore[assignment]
+        streak.mark_practiced(practice_date)
 
         # --- Detect new milestones ---
         # Build a new list to replace the JSON column (in-place mutation is not
@@ -177,49 +203,68 @@ class StreakRepository:
     ) -> list[date]:
         """Return the calendar dates (UTC) in the last 7 days when the student practiced.
 
-        Queries completed sessions to determine practice days.  Used by the
-        /streak endpoint to render a 7-day calendar view (REQ-010).
+        Used by the /streak endpoint to render a 7-day calendar view (REQ-010).
 
         Args:
             db: Active async database session.
             student_id: Student primary key.
 
         Returns:
-            Sorted list of date objects (UTC) when student had a completed
-            session in the last 7 calendar days (today inclusive).
-            May be empty; at most 7 elements.
+            Sorted list of date objects (UTC) when student practiced in the
+            last 7 calendar days (today inclusive). May be empty; at most 7
+            elements.
         """
-        today_utc = datetime.now(UTC).date()
-        seven_days_ago = today_utc - timedelta(days=6)  # 7-day window inclusive
-
-        window_start = datetime(
-            seven_days_ago.year,
-            seven_days_ago.month,
-            seven_days_ago.day,
-            tzinfo=UTC,
-        )
+        return await self.get_practice_days(db, student_id, days=7)
 
-        stmt = (
-            select(Session.completed_at)
-            .where(
-                Session.student_id == student_id,
-                Session.status == SessionStatus.COMPLETED,
-                Session.completed_at >= window_start,
-            )
-            .order_by(Session.completed_at)
-        )
-        result = await db.execute(stmt)
-        rows = result.scalars().all()
-
-        # Deduplicate by calendar date (UTC)
-        seen: set[date] = set()
-        practice_dates: list[date] = []
-        for completed_at in rows:
-            if completed_at is None:
-                continue
-            d = completed_at.date() if isinstance(completed_at, datetime) else completed_at
-            if d not in seen:
-                seen.add(d)
-                practice_dates.append(d)
-
-        return sorted(practice_dates)
+    async def get_practice_days(
+        self,
+        db: AsyncSession,
+        student_id: int,
+        days: int,
+        end_date: date | None = None,
+    ) -> list[date]:
+        """Return the days the student practiced in an N-day window.
+
+        Reads the streak's practice_history bitmap (one primary-key lookup);
+        sessions are not queried.
+
+        Args:
+            db: Active async database session.
+            student_id: Student primary key.
+            days: Window length in days (1 to PRACTICE_HISTORY_DAYS).
+            end_date: Last day of the window, inclusive (defaults to today, UTC).
+
+        Returns:
+            Sorted list of practiced dates in the window.
+
+        Raises:
+            ValueError: If days is outside 1..PRACTICE_HISTORY_DAYS.
+        """
+        streak = await self.get_for_student(db, student_id)
+        return practice_window(streak, days, end_date)
+
+    async def get_month_heatmap(
+        self,
+        db: AsyncSession,
+        student_id: int,
+        year: int,
+        month: int,
+    ) -> list[bool]:
+        """Return one practiced/not-practiced flag per day of a calendar month.
+
+        Args:
+            db: Active async database session.
+            student_id: Student primary key.
+            year: Calendar year.
+            month: Calendar month (1-12).
+
+        Returns:
+            List of booleans; index 0 is the 1st of the month.
+        """
+        days_in_month = calendar.monthrange(year, month)[1]
+        first = date(year, month, 1)
+        last = date(year, month, days_in_month)
+
+        streak = await self.get_for_student(db, student_id)
+        practiced = set(streak.practiced_days(first, last)) if streak else set()
+        return [first + timedelta(days=i) in practiced for i in range(days_in_month)]
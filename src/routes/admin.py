@@ -7,6 +7,7 @@ Security (SEC-004):
 - Prevents unauthorized access to sensitive data
 """
 
+import time
 from datetime import UTC, datetime, timedelta
 
 from fastapi import APIRouter, Depends, Query
@@ -14,14 +15,39 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.admin import verify_admin
-from src.database import get_session
+from src.config import get_settings
+from src.database import get_engine, get_session
+from src.db_instrumentation import pool_stats, query_instrumentation
+from src.errors.exceptions import ResourceNotFoundError
 from src.logging import get_logger
+from src.models.broadcast import Broadcast, BroadcastStatus
 from src.models.cost_record import CostRecord
+from src.models.outbox_message import OutboxStatus
 from src.models.session import Session
 from src.models.streak import Streak
 from src.models.student import Student
-from src.schemas.admin import AdminStats, CostSummary, StudentListResponse, StudentSummary
+from src.schemas.admin import (
+    AdminStats,
+    BroadcastCreateRequest,
+    BroadcastResponse,
+    ContentBundleResponse,
+    CostSummary,
+    MessageCatalogResponse,
+    PoolStatsResponse,
+    QueryFingerprintStats,
+    QueryStatsResponse,
+    StudentListResponse,
+    StudentSummary,
+)
+from src.services.broadcasts import create_broadcast, delivery_counts
+from src.services.content_bundle import (
+    ContentBundle,
+    ContentBundleError,
+    get_content_bundle,
+    load_content_bundle,
+)
 from src.services.cost_tracker import BUDGET_PER_STUDENT_USD
+from src.services.messages import MessageCatalog, get_message_catalog, refresh_message_catalog
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -255,3 +281,256 @@ async def get_admin_cost(
         budget_alert=budget_alert,
         timestamp=datetime.now(UTC),
     )
+
+
+@router.get("/admin/db/queries", response_model=QueryStatsResponse, tags=["Admin"])
+async def get_admin_query_stats(
+    limit: int = Query(20, ge=1, le=100, description="Number of fingerprints to return"),
+    admin_id: int = Depends(verify_admin),
+) -> QueryStatsResponse:
+    """Get the SQL fingerprints with the highest total execution time.
+
+    Backed by the in-process statement instrumentation in
+    src/db_instrumentation.py; figures reset when the process restarts.
+
+    Args:
+        limit: Maximum number of fingerprints to return.
+        admin_id: Authenticated admin telegram ID (injected by verify_admin).
+
+    Returns:
+        QueryStatsResponse with per-fingerprint latency aggregates.
+    """
+    logger.info("Admin requested query stats", admin_id=admin_id)
+
+    return QueryStatsResponse(
+        slow_query_ms=query_instrumentation.slow_query_ms,
+        n_plus_one_threshold=query_instrumentation.n_plus_one_threshold,
+        queries=[QueryFingerprintStats(**row) for row in query_instrumentation.snapshot(limit)],
+    )
+
+
+@router.get("/admin/db/pool", response_model=PoolStatsResponse, tags=["Admin"])
+async def get_admin_pool_stats(
+    admin_id: int = Depends(verify_admin),
+) -> PoolStatsResponse:
+    """Get connection-pool gauges and checkout-wait telemetry.
+
+    Use this to size DB_POOL_SIZE / DB_MAX_OVERFLOW from observed load:
+    sustained overflow_checkouts or a rising wait_max_ms mean the pool is
+    too small for the number of concurrent requests.
+
+    Args:
+        admin_id: Authenticated admin telegram ID (injected by verify_admin).
+
+    Returns:
+        PoolStatsResponse with live gauges and cumulative counters.
+    """
+    logger.info("Admin requested pool stats", admin_id=admin_id)
+
+    pool = get_engine().pool
+    return PoolStatsResponse(
+        pool_class=type(pool).__name__,
+        max_overflow=get_settings().db_max_overflow,
+        **pool_stats.snapshot(pool),
+    )
+
+
+def _content_bundle_response(
+    bundle: ContentBundle | None, load_ms: float | None = None
+) -> ContentBundleResponse:
+    """Summarise a content bundle for the admin API."""
+    path = get_settings().content_bundle_path
+    if bundle is None:
+        return ContentBundleResponse(loaded=False, path=path)
+    return ContentBundleResponse(
+        loaded=True,
+        path=path,
+        built_at=bundle.built_at,
+        problem_count=len(bundle),
+        source_count=len(bundle.sources),
+        topics={topic: len(indexes) for topic, indexes in bundle.topics.items()},
+        load_ms=load_ms,
+    )
+
+
+@router.get("/admin/content", response_model=ContentBundleResponse, tags=["Admin"])
+async def get_admin_content(
+    admin_id: int = Depends(verify_admin),
+) -> ContentBundleResponse:
+    """Get the compiled content bundle currently mapped by this process.
+
+    Args:
+        admin_id: Authenticated admin telegram ID (injected by verify_admin).
+
+    Returns:
+        ContentBundleResponse with per-topic problem counts.
+    """
+    logger.info("Admin requested content bundle info", admin_id=admin_id)
+    return _content_bundle_response(get_content_bundle())
+
+
+@router.post("/admin/content/reload", response_model=ContentBundleResponse, tags=["Admin"])
+async def reload_admin_content(
+    admin_id: int = Depends(verify_admin),
+) -> ContentBundleResponse:
+    """Re-map the compiled content bundle from CONTENT_BUNDLE_PATH.
+
+    Run scripts/build_content_bundle.py first; mapping the new file only
+    parses its header, so the reload takes milliseconds.
+
+    Args:
+        admin_id: Authenticated admin telegram ID (injected by verify_admin).
+
+    Returns:
+        ContentBundleResponse for the newly loaded bundle.
+
+    Raises:
+        ResourceNotFoundError: If the bundle is missing or unreadable.
+    """
+    started = time.perf_counter()
+    try:
+        bundle = load_content_bundle(get_settings().content_bundle_path)
+    except ContentBundleError as exc:
+        raise ResourceNotFoundError(str(exc), error_code="ERR_CONTENT_BUNDLE") from exc
+    load_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    logger.info("Admin reloaded content bundle", admin_id=admin_id, problems=len(bundle))
+    return _content_bundle_response(bundle, load_ms=load_ms)
+
+
+def _message_catalog_response(catalog: MessageCatalog) -> MessageCatalogResponse:
+    """Summarise a message catalog for the admin API."""
+    return MessageCatalogResponse(
+        version=catalog.version,
+        fingerprint=catalog.fingerprint,
+        loaded_at=catalog.loaded_at,
+        message_count=len(catalog.templates),
+        overrides=list(catalog.overrides),
+        rejected=list(catalog.rejected),
+    )
+
+
+@router.get("/admin/messages", response_model=MessageCatalogResponse, tags=["Admin"])
+async def get_admin_messages(
+    admin_id: int = Depends(verify_admin),
+) -> MessageCatalogResponse:
+    """Get the message catalog version currently used by this process.
+
+    Args:
+        admin_id: Authenticated admin telegram ID (injected by verify_admin).
+
+    Returns:
+        MessageCatalogResponse with the active overrides.
+    """
+    logger.info("Admin requested message catalog info", admin_id=admin_id)
+    return _message_catalog_response(get_message_catalog())
+
+
+@router.post("/admin/messages/reload", response_model=MessageCatalogResponse, tags=["Admin"])
+async def reload_admin_messages(
+    admin_id: int = Depends(verify_admin),
+    db: AsyncSession = Depends(get_session),
+) -> MessageCatalogResponse:
+    """Reload message_templates into this process's message catalog now.
+
+    Other workers pick the change up on their next scheduled refresh
+    (MESSAGE_CATALOG_REFRESH_SECONDS).
+
+    Args:
+        admin_id: Authenticated admin telegram ID (injected by verify_admin).
+        db: Database session (injected).
+
+    Returns:
+        MessageCatalogResponse for the catalog now in effect.
+    """
+    catalog = await refresh_message_catalog(db, force=True)
+    logger.info("Admin reloaded message catalog", admin_id=admin_id, version=catalog.version)
+    return _message_catalog_response(catalog)
+
+
+async def _broadcast_response(db: AsyncSession, broadcast: Broadcast) -> BroadcastResponse:
+    """Report a broadcast's progress; live outbox counts until it completes."""
+    if broadcast.status == BroadcastStatus.COMPLETED:
+        pending, sent, failed = 0, broadcast.sent or 0, broadcast.failed or 0
+    else:
+        counts = await delivery_counts(db, broadcast.id)
+        pending = counts.get(OutboxStatus.PENDING, 0)
+        sent = counts.get(OutboxStatus.SENT, 0)
+        failed = counts.get(OutboxStatus.FAILED, 0)
+    return BroadcastResponse(
+        broadcast_id=broadcast.id,
+        status=broadcast.status,
+        grade=broadcast.grade,
+        language=broadcast.language,
+        total_recipients=broadcast.total_recipients,
+        queued=broadcast.queued,
+        pending=pending,
+        sent=sent,
+        failed=failed,
+        created_at=broadcast.created_at,
+        completed_at=broadcast.completed_at,
+    )
+
+
+@router.post("/admin/broadcasts", response_model=BroadcastResponse, status_code=202, tags=["Admin"])
+async def post_admin_broadcast(
+    request: BroadcastCreateRequest,
+    admin_id: int = Depends(verify_admin),
+    db: AsyncSession = Depends(get_session),
+) -> BroadcastResponse:
+    """Create a broadcast to every student matching the filter.
+
+    Only the broadcast row is written here. A scheduler job queues the
+    recipients into the outbox in the background at BROADCAST_RATE_PER_SECOND
+    (see src/services/broadcasts.py); poll GET /admin/broadcasts/{id} for
+    progress.
+
+    Args:
+        request: Message text and optional grade/language filter.
+        admin_id: Authenticated admin telegram ID (injected by verify_admin).
+        db: Async database session.
+
+    Returns:
+        BroadcastResponse for the new broadcast.
+    """
+    broadcast = await create_broadcast(
+        db, request.message, admin_id, grade=request.grade, language=request.language
+    )
+    await db.commit()
+    await db.refresh(broadcast)
+    logger.info(
+        "Admin created broadcast",
+        admin_id=admin_id,
+        broadcast_id=broadcast.id,
+        grade=request.grade,
+        language=request.language,
+        recipients=broadcast.total_recipients,
+    )
+    return await _broadcast_response(db, broadcast)
+
+
+@router.get("/admin/broadcasts/{broadcast_id}", response_model=BroadcastResponse, tags=["Admin"])
+async def get_admin_broadcast(
+    broadcast_id: int,
+    admin_id: int = Depends(verify_admin),
+    db: AsyncSession = Depends(get_session),
+) -> BroadcastResponse:
+    """Get a broadcast's delivery progress.
+
+    Args:
+        broadcast_id: Broadcast primary key.
+        admin_id: Authenticated admin telegram ID (injected by verify_admin).
+        db: Async database session.
+
+    Returns:
+        BroadcastResponse with queued/pending/sent/failed counts.
+
+    Raises:
+        ResourceNotFoundError: If no broadcast has this ID.
+    """
+    broadcast = await db.get(Broadcast, broadcast_id)
+    if broadcast is None:
+        raise ResourceNotFoundError(
+            f"Broadcast {broadcast_id} not found", error_code="ERR_BROADCAST_NOT_FOUND"
+        )
+    return await _broadcast_response(db, broadcast)
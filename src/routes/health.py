@@ -1,6 +1,13 @@
-"""Health check endpoint for monitoring system status.
+"""Health check endpoints for monitoring system status.
 
-This endpoint checks:
+- GET /health/live: the process is up and serving (no dependency checks).
+- GET /health/ready: cached dependency status from the background health
+  monitor (src/services/health_monitor.py): database, pool saturation,
+  scheduler and queue depth. Never touches the database.
+- GET /health: the original combined check below. It uses the monitor's
+  cached database status once available, and checks live otherwise.
+
+/health checks:
 - Database connectivity (PostgreSQL)
 - Claude API availability (optional check)
 - Overall system health
@@ -15,6 +22,7 @@ Response format follows API_ARCHITECTURE.md:
 """
 
 import asyncio
+import time
 from datetime import UTC, datetime
 from typing import Any
 
@@ -23,6 +31,7 @@ from fastapi.responses import JSONResponse
 
 from src.config import get_settings
 from src.logging import get_logger
+from src.services.health_monitor import get_health_monitor
 
 router = APIRouter(tags=["system"])
 logger = get_logger(__name__)
@@ -118,10 +127,14 @@ async def health_check() -> JSONResponse:
           "timestamp": "2026-01-28T10:00:00Z"
         }
     """
-    # Run health checks in parallel
-    db_status, claude_status = await asyncio.gather(
-        check_database(), check_claude_api(), return_exceptions=False
-    )
+    # Prefer the monitor's cached DB status; check live before its first run
+    monitor = get_health_monitor()
+    if monitor.has_result:
+        db_status, claude_status = monitor.db_status, await check_claude_api()
+    else:
+        db_status, claude_status = await asyncio.gather(
+            check_database(), check_claude_api(), return_exceptions=False
+        )
 
     # Determine overall status
     overall_status = "ok" if db_status == "ok" and claude_status == "ok" else "error"
@@ -142,3 +155,49 @@ async def health_check() -> JSONResponse:
     logger.info(f"Health check completed: {overall_status}", **response_data)
 
     return JSONResponse(status_code=status_code, content=response_data)
+
+
+@router.get("/health/live")
+async def liveness() -> dict[str, Any]:
+    """Liveness probe: answers as long as the event loop is serving requests.
+
+    Checks no dependencies, so a database outage never gets the process
+    restarted; use /health/ready to take it out of rotation instead.
+
+    Returns:
+        dict with status "ok", uptime in seconds and timestamp.
+    """
+    return {
+        "status": "ok",
+        "uptime_seconds": round(time.monotonic() - get_health_monitor().started_at, 1),
+        "timestamp": datetime.now(UTC).isoformat(),
+    }
+
+
+@router.get("/health/ready")
+async def readiness() -> JSONResponse:
+    """Readiness probe served from the health monitor's cache.
+
+    Response Codes:
+        200: Ready for traffic (every check passed)
+        503: Not ready: the database check failed or is stale (or has not
+            run yet), the pool is near saturation, the scheduler is
+            stopped, or a queue is backed up
+
+    Example Response:
+        {
+          "status": "ok",
+          "checks": {
+            "db": {"ok": true, "status": "ok", "age_seconds": 4.2, "latency_ms": 1.8, ...},
+            "pool": {"ok": true, "saturation": 0.2, "checked_out": 3, "capacity": 15, ...},
+            "scheduler": {"ok": true, "running": true, "leader": false},
+            "queues": {"ok": true, "depths": {"sent_messages": 0, ...}, "limit": 10000}
+          },
+          "timestamp": "2026-01-28T10:00:00Z"
+        }
+    """
+    report = get_health_monitor().readiness()
+    status_code = (
+        status.HTTP_200_OK if report["status"] == "ok" else status.HTTP_503_SERVICE_UNAVAILABLE
+    )
+    return JSONResponse(status_code=status_code, content=report)
@@ -0,0 +1,116 @@
+"""Prometheus scrape endpoint.
+
+GET /metrics renders src/metrics.registry in the Prometheus text format:
+latency histograms recorded on the hot paths, plus counters and gauges read
+from existing in-process state (hint cache, write-behind queues, DB pool,
+scheduler leadership) at scrape time.
+
+Security: if METRICS_TOKEN is set, scrapers must send
+"Authorization: Bearer <token>"; otherwise keep the endpoint on a private
+network.
+"""
+
+import secrets
+
+from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+from src import database
+from src.config import get_settings
+from src.db_instrumentation import pool_stats
+from src.logging import get_logger
+from src.logging.config import log_queue_depth
+from src.metrics import Samples, registry
+from src.scheduler import get_leader_lease
+from src.services.hint_state import hint_cache
+from src.services.rate_limits import get_rate_limit_store
+from src.services.recent_variants import get_recent_variants
+
+router = APIRouter(tags=["system"])
+logger = get_logger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _hint_cache_requests() -> Samples:
+    stats = hint_cache.stats
+    return {("hit",): stats["hits"], ("miss",): stats["misses"]}
+
+
+def _queue_depths() -> Samples:
+    return {
+        ("sent_messages",): get_recent_variants().pending,
+        ("rate_limit_counters",): get_rate_limit_store().pending,
+        ("log_records",): log_queue_depth(),
+    }
+
+
+def _db_pool() -> Samples:
+    engine = database._engine  # Never create an engine just to be scraped
+    snapshot = pool_stats.snapshot(engine.pool if engine is not None else None)
+    return {
+        (name,): snapshot[name]
+        for name in ("size", "checked_out", "overflow")
+        if snapshot[name] is not None
+    }
+
+
+registry.callback(
+    "dars_hint_cache_requests_total",
+    "counter",
+    "Hint cache lookups by result.",
+    _hint_cache_requests,
+    ("result",),
+)
+registry.callback(
+    "dars_hint_cache_entries",
+    "gauge",
+    "Hints held in the in-memory cache.",
+    lambda: {(): hint_cache.stats["entries"]},
+)
+registry.callback(
+    "dars_queue_depth",
+    "gauge",
+    "Items waiting in in-process write-behind queues.",
+    _queue_depths,
+    ("queue",),
+)
+registry.callback(
+    "dars_db_pool_connections",
+    "gauge",
+    "Connection-pool gauges.",
+    _db_pool,
+    ("state",),
+)
+registry.callback(
+    "dars_db_pool_timeouts_total",
+    "counter",
+    "Connection checkouts that timed out.",
+    lambda: {(): pool_stats.timeouts},
+)
+registry.callback(
+    "dars_scheduler_leader",
+    "gauge",
+    "1 if this process holds the scheduler lease and runs leader-only jobs.",
+    lambda: {(): int(get_leader_lease().is_leader)},
+)
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(authorization: str | None = Header(default=None)) -> PlainTextResponse:
+    """Serve all metrics in the Prometheus text exposition format.
+
+    Args:
+        authorization: "Bearer <METRICS_TOKEN>" when a token is configured.
+
+    Returns:
+        PlainTextResponse with the exposition text.
+
+    Raises:
+        HTTPException: 401 if METRICS_TOKEN is set and the header does not match.
+    """
+    expected = get_settings().metrics_token
+    if expected and not secrets.compare_digest(authorization or "", f"Bearer {expected}"):
+        logger.warning("Metrics scrape rejected: invalid token")
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
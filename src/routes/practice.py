@@ -16,14 +16,11 @@ PHASE3-B-3
 from datetime import date
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from slowapi import Limiter
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.auth.student import verify_student
+from src.auth.student import AuthenticatedStudent, verify_student
 from src.database import get_session
 from src.logging import get_logger
-from src.models.student import Student
 from src.repositories import ProblemRepository, ResponseRepository, SessionRepository
 from src.repositories.streak_repository import StreakRepository
 from src.schemas.practice import (
@@ -39,6 +36,7 @@ from src.services.cost_tracker import CostTracker
 from src.services.encouragement import EncouragementService
 from src.services.hint_state import hint_generator as _hint_generator
 from src.services.problem_selector import ProblemSelector
+from src.services.rate_limits import create_limiter
 from src.utils.pii import hash_telegram_id, redact_answer
 
 router = APIRouter()
@@ -57,27 +55,7 @@ def get_student_rate_limit_key(request: Request) -> str:
 
 
 # Rate limiter instance (SEC-005) - uses student ID, not IP
-limiter = Limiter(key_func=get_student_rate_limit_key)
-
-
-async def _get_student_by_telegram_id(db: AsyncSession, telegram_id: int) -> Student:
-    """Fetch Student row by telegram_id.
-
-    Args:
-        db: Async database session.
-        telegram_id: The telegram ID returned by verify_student.
-
-    Returns:
-        Student instance.
-
-    Raises:
-        HTTPException: 404 if not found (should not happen after verify_student).
-    """
-    result = await db.execute(select(Student).where(Student.telegram_id == telegram_id))
-    student = result.scalar_one_or_none()
-    if not student:
-        raise HTTPException(status_code=404, detail="Student not found")
-    return student
+limiter = create_limiter(key_func=get_student_rate_limit_key)
 
 
 def _cached_answer_response(
@@ -142,7 +120,7 @@ def _problem_to_schema(problem: "Problem") -> ProblemWithoutAnswer:  # type: ign
 
 @router.get("/practice", response_model=PracticeResponse, tags=["Student Practice"])
 async def get_practice_problems(
-    student_id: int = Depends(verify_student),  # SEC-003: Database verification
+    student: AuthenticatedStudent = Depends(verify_student),  # SEC-003: Database verification
     db: AsyncSession = Depends(get_session),
 ) -> PracticeResponse:
     """Get daily practice problems.
@@ -156,7 +134,7 @@ async def get_practice_problems(
     - Student existence verified in database (prevents IDOR)
 
     Args:
-        student_id: Verified student telegram ID (from dependency).
+        student: Verified student (from dependency).
         db: Database session (from dependency).
 
     Returns:
@@ -165,16 +143,11 @@ async def get_practice_problems(
     Raises:
         HTTPException: If student not found or problem selection fails.
     """
-    student = await _get_student_by_telegram_id(db, student_id)
-
     problem_repo = ProblemRepository()
     session_repo = SessionRepository()
     response_repo = ResponseRepository()
 
-    # Expire any stale sessions first
-    await session_repo.expire_stale_sessions(db)
-
-    hashed_tid = hash_telegram_id(student_id)
+    hashed_tid = hash_telegram_id(student.telegram_id)
 
     # Check for existing session today
     existing = await session_repo.get_active_session_for_today(db, student.student_id)
@@ -266,7 +239,7 @@ async def get_practice_problems(
 async def submit_answer(
     problem_id: int,
     request: AnswerRequest,
-    student_id: int = Depends(verify_student),  # SEC-003: Database verification
+    student: AuthenticatedStudent = Depends(verify_student),  # SEC-003: Database verification
     db: AsyncSession = Depends(get_session),
 ) -> AnswerResponse:
     """Submit answer to a problem.
@@ -277,7 +250,7 @@ async def submit_answer(
     Args:
         problem_id: ID of the problem being answered.
         request: Answer submission containing student_answer and session_id.
-        student_id: Verified student telegram ID (from dependency).
+        student: Verified student (from dependency).
         db: Database session (from dependency).
 
     Returns:
@@ -289,8 +262,6 @@ async def submit_answer(
             - 403 if session belongs to a different student
             - 410 if session has expired
     """
-    student = await _get_student_by_telegram_id(db, student_id)
-
     problem_repo = ProblemRepository()
     session_repo = SessionRepository()
     response_repo = ResponseRepository()
@@ -304,7 +275,7 @@ async def submit_answer(
     if session.student_id != student.student_id:
         logger.warning(
             "IDOR attempt: student tried to answer another student's session",
-            hashed_telegram_id=hash_telegram_id(student_id),
+            hashed_telegram_id=hash_telegram_id(student.telegram_id),
         )
         raise HTTPException(status_code=403, detail="Forbidden: session belongs to another student")
 
@@ -343,7 +314,7 @@ async def submit_answer(
     # Log answer (redacted for PII)
     logger.info(
         "Evaluating answer",
-        hashed_telegram_id=hash_telegram_id(student_id),
+        hashed_telegram_id=hash_telegram_id(student.telegram_id),
         problem_id=problem_id,
         redacted_answer=redact_answer(request.student_answer),
         is_correct=result.is_correct,
@@ -359,6 +330,7 @@ async def submit_answer(
         hints_used=hints_used,
         time_spent_seconds=request.time_spent_seconds or 0,
         confidence_level=result.confidence_level,
+        student_id=student.student_id,
     )
 
     # Update session correct count
@@ -410,7 +382,7 @@ async def request_hint(
     req: Request,  # Required by slowapi rate limiter
     problem_id: int,
     request: HintRequest,
-    student_id: int = Depends(verify_student),  # SEC-003: Database verification
+    student: AuthenticatedStudent = Depends(verify_student),  # SEC-003: Database verification
     db: AsyncSession = Depends(get_session),
 ) -> HintResponse:
     """Deliver the next Socratic hint via Claude Haiku (cached + fallback).
@@ -428,7 +400,7 @@ async def request_hint(
         req: FastAPI request object (required by rate limiter).
         problem_id: ID of the problem.
         request: Hint request containing session_id and hint_number (1-3).
-        student_id: Verified student telegram ID (from dependency).
+        student: Verified student (from dependency).
         db: Database session (from dependency).
 
     Returns:
@@ -442,8 +414,6 @@ async def request_hint(
             - 410 if session expired
             - 429 if rate limit exceeded
     """
-    student = await _get_student_by_telegram_id(db, student_id)
-
     problem_repo = ProblemRepository()
     session_repo = SessionRepository()
     response_repo = ResponseRepository()
@@ -456,7 +426,7 @@ async def request_hint(
     if session.student_id != student.student_id:
         logger.warning(
             "IDOR attempt on hint endpoint",
-            hashed_telegram_id=hash_telegram_id(student_id),
+            hashed_telegram_id=hash_telegram_id(student.telegram_id),
         )
         raise HTTPException(status_code=403, detail="Forbidden: session belongs to another student")
 
@@ -509,6 +479,7 @@ async def request_hint(
             hints_used=0,
             time_spent_seconds=0,
             confidence_level="high",
+            student_id=student.student_id,
         )
 
     # Only increment hint count if this is a new hint level
@@ -539,7 +510,7 @@ async def request_hint(
 
     logger.info(
         "Hint served",
-        hashed_telegram_id=hash_telegram_id(student_id),
+        hashed_telegram_id=hash_telegram_id(student.telegram_id),
         problem_id=problem_id,
         hint_number=request.hint_number,
     )
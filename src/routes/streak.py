@@ -4,44 +4,23 @@ Implements REQ-009 (streak tracking) and REQ-010 (streak display).
 Returns real streak data from the database for the authenticated student.
 """
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.auth.student import verify_student
+from src.auth.student import AuthenticatedStudent, verify_student
 from src.database import get_session
-from src.models.student import Student
-from src.repositories.streak_repository import StreakRepository
-from src.schemas.streak import StreakData
+from src.models.streak import PRACTICE_HISTORY_DAYS
+from src.repositories.streak_repository import StreakRepository, practice_window
+from src.schemas.streak import StreakCalendar, StreakData, StreakHeatmap
 
 router = APIRouter()
 
 
-async def _get_student_by_telegram_id(db: AsyncSession, telegram_id: int) -> Student:
-    """Fetch Student row by telegram_id.
-
-    Args:
-        db: Async database session.
-        telegram_id: The telegram ID returned by verify_student.
-
-    Returns:
-        Student instance.
-
-    Raises:
-        HTTPException: 404 if not found.
-    """
-    result = await db.execute(select(Student).where(Student.telegram_id == telegram_id))
-    student = result.scalar_one_or_none()
-    if not student:
-        raise HTTPException(status_code=404, detail="Student not found")
-    return student
-
-
 @router.get("/streak", response_model=StreakData, tags=["Student Engagement"])
 async def get_streak(
-    student_id: int = Depends(verify_student),
+    student: AuthenticatedStudent = Depends(verify_student),
     db: AsyncSession = Depends(get_session),
 ) -> StreakData:
     """Get student's streak information.
@@ -50,17 +29,12 @@ async def get_streak(
     dates of practice sessions in the last 7 calendar days.
 
     Args:
-        student_id: Verified student telegram ID (from dependency).
+        student: Verified student (from dependency).
         db: Database session (from dependency).
 
     Returns:
         StreakData with real streak information from the database.
-
-    Raises:
-        HTTPException: 404 if student not found.
     """
-    student = await _get_student_by_telegram_id(db, student_id)
-
     streak_repo = StreakRepository()
     streak = await streak_repo.get_or_create(db, student.student_id)
 
@@ -87,3 +61,65 @@ async def get_streak(
         milestones_achieved=list(streak.milestones_achieved or []),
         updated_at=datetime.now(UTC),
     )
+
+
+@router.get("/streak/calendar", response_model=StreakCalendar, tags=["Student Engagement"])
+async def get_streak_calendar(
+    days: int = Query(7, ge=1, le=PRACTICE_HISTORY_DAYS, description="Window length in days"),
+    student: AuthenticatedStudent = Depends(verify_student),
+    db: AsyncSession = Depends(get_session),
+) -> StreakCalendar:
+    """Get the days the student practiced in the last N days (today inclusive).
+
+    Served from the streak's practice bitmap, so the cost is the same for
+    any window length or amount of history.
+
+    Args:
+        days: Window length in days.
+        student: Verified student (from dependency).
+        db: Database session (from dependency).
+
+    Returns:
+        StreakCalendar with the practiced dates in the window.
+    """
+    streak = await StreakRepository().get_for_student(db, student.student_id)
+
+    end = datetime.now(UTC).date()
+    return StreakCalendar(
+        student_id=student.student_id,
+        start_date=end - timedelta(days=days - 1),
+        end_date=end,
+        practiced_dates=practice_window(streak, days, end),
+    )
+
+
+@router.get("/streak/heatmap", response_model=StreakHeatmap, tags=["Student Engagement"])
+async def get_streak_heatmap(
+    year: int | None = Query(None, ge=2000, le=9999, description="Year (default: current)"),
+    month: int | None = Query(None, ge=1, le=12, description="Month (default: current)"),
+    student: AuthenticatedStudent = Depends(verify_student),
+    db: AsyncSession = Depends(get_session),
+) -> StreakHeatmap:
+    """Get a monthly practice heatmap (one flag per day).
+
+    Args:
+        year: Calendar year (defaults to the current UTC year).
+        month: Calendar month (defaults to the current UTC month).
+        student: Verified student (from dependency).
+        db: Database session (from dependency).
+
+    Returns:
+        StreakHeatmap for the requested month.
+    """
+    today = datetime.now(UTC).date()
+    year = year or today.year
+    month = month or today.month
+    days = await StreakRepository().get_month_heatmap(db, student.student_id, year, month)
+
+    return StreakHeatmap(
+        student_id=student.student_id,
+        year=year,
+        month=month,
+        days=days,
+        practiced_count=sum(days),
+    )
@@ -1,16 +1,20 @@
 """Student profile endpoints."""
 
+from datetime import UTC, datetime
+
 from fastapi import APIRouter, Depends, Header, HTTPException
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.auth.student import invalidate_student
+from src.config import get_settings
 from src.database import get_session
 from src.logging import get_logger
 from src.models.response import Response
-from src.models.session import Session
 from src.models.student import Student
 from src.repositories.streak_repository import StreakRepository
 from src.schemas.student import ProfileUpdateRequest, StudentProfile
+from src.services.reminder_schedule import reschedule
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -28,18 +32,18 @@ async def _build_profile(student: Student, db: AsyncSession) -> StudentProfile:
     Returns:
         Populated StudentProfile schema.
     """
-    session_subq = select(Session.session_id).where(Session.student_id == student.student_id)
-
     total = (
         await db.scalar(
-            select(func.count(Response.response_id)).where(Response.session_id.in_(session_subq))
+            select(func.count(Response.response_id)).where(
+                Response.student_id == student.student_id
+            )
         )
         or 0
     )
     correct = (
         await db.scalar(
             select(func.count(Response.response_id)).where(
-                Response.session_id.in_(session_subq),
+                Response.student_id == student.student_id,
                 Response.is_correct == True,  # noqa: E712
             )
         )
@@ -56,6 +60,9 @@ async def _build_profile(student: Student, db: AsyncSession) -> StudentProfile:
         name=student.name,
         grade=student.grade,
         language=student.language,
+        timezone=student.timezone,
+        reminder_hour=student.reminder_hour,
+        next_reminder_at=student.next_reminder_at,
         current_streak=streak.current_streak if streak else 0,
         longest_streak=streak.longest_streak if streak else 0,
         avg_accuracy=avg_accuracy,
@@ -101,10 +108,13 @@ async def update_student_profile(
     x_student_id: str = Header(..., description="Student telegram ID"),
     db: AsyncSession = Depends(get_session),
 ) -> StudentProfile:
-    """Update student language and/or grade preference.
+    """Update student language, grade and/or reminder time.
+
+    Changing the timezone or reminder hour moves the next reminder to the
+    first matching slot from now.
 
     Args:
-        request: Fields to update (language and/or grade).
+        request: Fields to update (language, grade, timezone, reminder_hour).
         x_student_id: Student telegram ID from header.
         db: Async database session.
 
@@ -127,9 +137,16 @@ async def update_student_profile(
         student.language = request.language
     if request.grade is not None:
         student.grade = request.grade
+    if request.timezone is not None or request.reminder_hour is not None:
+        if request.timezone is not None:
+            student.timezone = request.timezone
+        if request.reminder_hour is not None:
+            student.reminder_hour = request.reminder_hour
+        reschedule(student, datetime.now(UTC), get_settings().reminder_spread_minutes)
 
     await db.flush()
     await db.commit()
+    invalidate_student(telegram_id)
     await db.refresh(student)
 
     logger.info(
@@ -137,5 +154,7 @@ async def update_student_profile(
         student_id=student.student_id,
         language=student.language,
         grade=student.grade,
+        timezone=student.timezone,
+        reminder_hour=student.reminder_hour,
     )
     return await _build_profile(student, db)
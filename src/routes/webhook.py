@@ -8,6 +8,7 @@ Security (SEC-002):
 PHASE3-B-4: Adds /practice, /hint, and free-text answer routing.
 """
 
+import time
 from datetime import UTC, date, datetime, timedelta
 from typing import Any
 
@@ -15,22 +16,25 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.auth.student import invalidate_on_commit
 from src.auth.telegram import verify_telegram_webhook
 from src.database import get_session
 from src.logging import get_logger
+from src.metrics import WEBHOOK_COMMAND_SECONDS
 from src.models.response import Response
 from src.models.session import Session, SessionStatus
 from src.models.streak import Streak
 from src.models.student import Student
 from src.repositories import ProblemRepository, ResponseRepository, SessionRepository
-from src.repositories.streak_repository import StreakRepository
+from src.repositories.streak_repository import StreakRepository, practice_window
 from src.schemas.telegram import TelegramMessage, TelegramUpdate, WebhookResponse
-from src.services import StudentService, TelegramClient
+from src.services import StudentService
 from src.services.answer_evaluator import AnswerEvaluator, EvaluationResult
 from src.services.cost_tracker import CostTracker
 from src.services.encouragement import EncouragementService
 from src.services.hint_state import hint_generator as _hint_generator
 from src.services.messages import MessageKey, get_message
+from src.services.outbox import enqueue_message
 from src.utils.pii import hash_telegram_id, redact_answer
 
 router = APIRouter()
@@ -136,7 +140,6 @@ async def handle_practice_command(telegram_id: int, db: AsyncSession) -> str:
         return get_message(MessageKey.REGISTER_FIRST, "en")
 
     session_repo = SessionRepository()
-    await session_repo.expire_stale_sessions(db)
 
     existing = await session_repo.get_active_session_for_today(db, student.student_id)
     if existing is not None and existing.status == SessionStatus.IN_PROGRESS:
@@ -204,9 +207,7 @@ async def handle_practice_grade_choice(telegram_id: int, text: str, db: AsyncSes
     _pending_topic_choice[telegram_id] = topics
 
     numbered = "\n".join(f"{i + 1}. {t}" for i, t in enumerate(topics))
-    if language == "bn":
-        return f"একটি বিষয় বেছে নাও:\n\n{numbered}\n\nনম্বর দিয়ে উত্তর দাও।"
-    return f"Choose a topic to practice:\n\n{numbered}\n\nReply with the number."
+    return get_message(MessageKey.TOPIC_PROMPT, language, topics=numbered)
 
 
 async def handle_topic_choice(telegram_id: int, text: str, db: AsyncSession) -> str:
@@ -628,6 +629,7 @@ async def handle_hint_command(telegram_id: int, db: AsyncSession) -> str:
             hints_used=0,
             time_spent_seconds=0,
             confidence_level="high",
+            student_id=student_id,
         )
 
     if next_hint_number > hints_already_used:
@@ -651,9 +653,13 @@ async def handle_hint_command(telegram_id: int, db: AsyncSession) -> str:
     await cost_tracker.check_budget_alert(db, student_id)
 
     remaining = 3 - next_hint_number
-    if student_language == "bn":
-        return f"Hint {next_hint_number}: {hint_text}\n(আরও {remaining}টি hint বাকি আছে)"
-    return f"Hint {next_hint_number}: {hint_text}\n({remaining} hints remaining)"
+    return get_message(
+        MessageKey.HINT_WITH_REMAINING,
+        student_language,
+        number=next_hint_number,
+        hint=hint_text,
+        remaining=remaining,
+    )
 
 
 def _format_streak_message(
@@ -750,9 +756,8 @@ async def handle_streak_command(telegram_id: int, db: AsyncSession) -> str:
 
     streak_repo = StreakRepository()
     streak = await streak_repo.get_for_student(db, student.student_id)
-    # Skip get_last_7_days on zero-streak path — _format_streak_message doesn't use it
-    current = streak.current_streak if streak else 0
-    last_7_days = await streak_repo.get_last_7_days(db, student.student_id) if current > 0 else []
+    # 7-day calendar comes from the streak's practice bitmap — no sessions query
+    last_7_days = practice_window(streak, days=7)
 
     logger.info(
         "Handled /streak",
@@ -845,6 +850,7 @@ async def handle_onboarding_reply(telegram_id: int, text: str, db: AsyncSession)
         db, telegram_id, name, grade=grade, language=language
     )
     _pending_onboarding.pop(telegram_id, None)
+    invalidate_on_commit(db, telegram_id)  # clear a cached "not found" from before signup
 
     return get_message(MessageKey.ONBOARDING_COMPLETE, student.language, name=student.name)
 
@@ -911,6 +917,7 @@ async def handle_language_choice(telegram_id: int, text: str, db: AsyncSession)
 
     student.language = new_language
     await db.flush()
+    invalidate_on_commit(db, telegram_id)
 
     _pending_language_choice.pop(telegram_id, None)
     logger.info(
@@ -983,6 +990,7 @@ async def handle_grade_choice(telegram_id: int, text: str, db: AsyncSession) ->
     new_grade = int(cleaned)
     student.grade = new_grade
     await db.flush()
+    invalidate_on_commit(db, telegram_id)
 
     _pending_grade_choice.pop(telegram_id, None)
     logger.info(
@@ -1040,6 +1048,7 @@ async def _persist_answer_response(
             hints_used=0,
             time_spent_seconds=0,
             confidence_level=eval_result.confidence_level,
+            student_id=session.student_id,
         )
     else:
         # Update stub response created by earlier hint delivery
@@ -1151,6 +1160,10 @@ async def telegram_webhook(
 async def _handle_message(message: TelegramMessage, db: AsyncSession) -> None:  # noqa: C901
     """Route a Telegram message to the correct handler.
 
+    Replies are queued in the request transaction and sent by the outbox
+    dispatcher after commit (see src/services/outbox.py). Handling latency
+    is recorded per command branch for /metrics.
+
     Args:
         message: Telegram message object.
         db: Database session.
@@ -1160,7 +1173,9 @@ async def _handle_message(message: TelegramMessage, db: AsyncSession) -> None:
     telegram_id = message.from_.id
     first_name = message.from_.first_name
 
-    telegram = TelegramClient()
+    # One reply per update; the key stops a redelivered update replying twice.
+    reply_key = f"reply:{chat_id}:{message.message_id}"
+    started = time.perf_counter()
 
     # Fetch student language for localisation (default 'en' if not registered)
     result = await db.execute(select(Student).where(Student.telegram_id == telegram_id))
@@ -1168,6 +1183,7 @@ async def _handle_message(message: TelegramMessage, db: AsyncSession) -> None:
     student_language = existing_student.language if existing_student else "en"
 
     if text.startswith("/start"):
+        command = "start"
         # Cancel any pending flows
         _pending_language_choice.pop(telegram_id, None)
         _pending_onboarding.pop(telegram_id, None)
@@ -1182,10 +1198,10 @@ async def _handle_message(message: TelegramMessage, db: AsyncSession) -> None:
             welcome_msg = get_message(
                 MessageKey.WELCOME, existing_student.language, name=existing_student.name
             )
-            await telegram.send_message(chat_id, welcome_msg)
+            await enqueue_message(db, chat_id, welcome_msg, key=reply_key)
         else:
             reply = await handle_start_new_student(telegram_id, first_name)
-            await telegram.send_message(chat_id, reply)
+            await enqueue_message(db, chat_id, reply, key=reply_key)
 
         logger.info(
             "Handled /start",
@@ -1194,19 +1210,22 @@ async def _handle_message(message: TelegramMessage, db: AsyncSession) -> None:
         )
 
     elif text.startswith("/exit"):
+        command = "exit"
         reply = await handle_exit_command(telegram_id, db)
-        await telegram.send_message(chat_id, reply)
+        await enqueue_message(db, chat_id, reply, key=reply_key)
         logger.info("Handled /exit", hashed_telegram_id=hash_telegram_id(telegram_id))
 
     elif _pending_onboarding.get(telegram_id):
+        command = "onboarding"
         reply = await handle_onboarding_reply(telegram_id, text, db)
-        await telegram.send_message(chat_id, reply)
+        await enqueue_message(db, chat_id, reply, key=reply_key)
         logger.info(
             "Handled onboarding reply",
             hashed_telegram_id=hash_telegram_id(telegram_id),
         )
 
     elif text.startswith("/practice"):
+        command = "practice"
         _pending_language_choice.pop(telegram_id, None)
         _pending_wrong_answer.pop(telegram_id, None)
         _pending_continue.pop(telegram_id, None)
@@ -1215,104 +1234,118 @@ async def _handle_message(message: TelegramMessage, db: AsyncSession) -> None:
         _session_grade_override.pop(telegram_id, None)
         _pending_grade_choice.pop(telegram_id, None)
         reply = await handle_practice_command(telegram_id, db)
-        await telegram.send_message(chat_id, reply)
+        await enqueue_message(db, chat_id, reply, key=reply_key)
         logger.info(
             "Handled /practice",
             hashed_telegram_id=hash_telegram_id(telegram_id),
         )
 
     elif text.startswith("/hint"):
+        command = "hint"
         # /hint works from both normal session and wrong-answer-pending states
         _pending_language_choice.pop(telegram_id, None)
         _pending_wrong_answer.pop(telegram_id, None)
         reply = await handle_hint_command(telegram_id, db)
-        await telegram.send_message(chat_id, reply)
+        await enqueue_message(db, chat_id, reply, key=reply_key)
         logger.info(
             "Handled /hint",
             hashed_telegram_id=hash_telegram_id(telegram_id),
         )
 
     elif text.startswith("/streak"):
+        command = "streak"
         _pending_language_choice.pop(telegram_id, None)
         reply = await handle_streak_command(telegram_id, db)
-        await telegram.send_message(chat_id, reply)
+        await enqueue_message(db, chat_id, reply, key=reply_key)
 
     elif text.startswith("/grade"):
+        command = "grade"
         _pending_language_choice.pop(telegram_id, None)
         _pending_practice_grade.pop(telegram_id, None)
         _session_grade_override.pop(telegram_id, None)
         reply = await handle_grade_command(telegram_id, db)
-        await telegram.send_message(chat_id, reply)
+        await enqueue_message(db, chat_id, reply, key=reply_key)
         logger.info("Handled /grade", hashed_telegram_id=hash_telegram_id(telegram_id))
 
     elif _pending_grade_choice.get(telegram_id):
+        command = "grade_choice"
         reply = await handle_grade_choice(telegram_id, text, db)
-        await telegram.send_message(chat_id, reply)
+        await enqueue_message(db, chat_id, reply, key=reply_key)
         logger.info(
             "Handled grade choice",
             hashed_telegram_id=hash_telegram_id(telegram_id),
         )
 
     elif _pending_practice_grade.get(telegram_id):
+        command = "practice_grade_choice"
         reply = await handle_practice_grade_choice(telegram_id, text, db)
-        await telegram.send_message(chat_id, reply)
+        await enqueue_message(db, chat_id, reply, key=reply_key)
         logger.info(
             "Handled practice grade choice",
             hashed_telegram_id=hash_telegram_id(telegram_id),
         )
 
     elif _pending_topic_choice.get(telegram_id) is not None:
+        command = "topic_choice"
         reply = await handle_topic_choice(telegram_id, text, db)
-        await telegram.send_message(chat_id, reply)
+        await enqueue_message(db, chat_id, reply, key=reply_key)
         logger.info(
             "Handled topic choice",
             hashed_telegram_id=hash_telegram_id(telegram_id),
         )
 
     elif _pending_wrong_answer.get(telegram_id):
+        command = "wrong_answer_choice"
         reply = await handle_wrong_answer_choice(telegram_id, text, db)
-        await telegram.send_message(chat_id, reply)
+        await enqueue_message(db, chat_id, reply, key=reply_key)
         logger.info(
             "Handled wrong answer choice",
             hashed_telegram_id=hash_telegram_id(telegram_id),
         )
 
     elif _pending_continue.get(telegram_id) is not None:
+        command = "continue_choice"
         reply = await handle_continue_choice(telegram_id, text, db)
-        await telegram.send_message(chat_id, reply)
+        await enqueue_message(db, chat_id, reply, key=reply_key)
         logger.info(
             "Handled continue choice",
             hashed_telegram_id=hash_telegram_id(telegram_id),
         )
 
     elif _pending_language_choice.get(telegram_id):
+        command = "language_choice"
         reply = await handle_language_choice(telegram_id, text, db)
-        await telegram.send_message(chat_id, reply)
+        await enqueue_message(db, chat_id, reply, key=reply_key)
         logger.info(
             "Handled language choice",
             hashed_telegram_id=hash_telegram_id(telegram_id),
         )
 
     elif text.startswith("/language"):
+        command = "language"
         reply = await handle_language_command(telegram_id, db)
-        await telegram.send_message(chat_id, reply)
+        await enqueue_message(db, chat_id, reply, key=reply_key)
         logger.info(
             "Handled /language",
             hashed_telegram_id=hash_telegram_id(telegram_id),
         )
 
     elif telegram_id in _active_sessions:
+        command = "answer"
         reply = await handle_answer_message(telegram_id, text, db)
-        await telegram.send_message(chat_id, reply)
+        await enqueue_message(db, chat_id, reply, key=reply_key)
         logger.info(
             "Handled answer",
             hashed_telegram_id=hash_telegram_id(telegram_id),
         )
 
     else:
+        command = "unknown"
         reply = await handle_unknown_message(telegram_id, text, student_language)
-        await telegram.send_message(chat_id, reply)
+        await enqueue_message(db, chat_id, reply, key=reply_key)
         logger.info(
             "Unknown message",
             hashed_telegram_id=hash_telegram_id(telegram_id),
         )
+
+    WEBHOOK_COMMAND_SECONDS.observe(time.perf_counter() - started, command)
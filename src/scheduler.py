@@ -1,174 +1,710 @@
-"""Background scheduler for Dars — daily reminder job.
+"""Background scheduler for Dars — daily reminders and session sweeping.
 
 PHASE6-A-1 / PHASE6-A-2
 
 Uses APScheduler 3.x AsyncIOScheduler. Registered as a FastAPI lifespan
 task in src/main.py.
 
-The scheduler fires send_daily_reminders() every day at 12:30 UTC (18:00 IST),
-which sends Telegram reminders to students who have not yet practiced today.
+send_daily_reminders() runs every minute and reminds the students whose
+daily reminder slot is due (each student has a timezone and preferred hour,
+18:00 IST by default; see src/services/reminder_schedule.py), so reminders
+are spread over the evening instead of all firing at 12:30 UTC.
+
+sweep_stale_sessions() runs every few minutes and marks expired in_progress
+sessions as abandoned in bounded batches, so /practice requests never have
+to write just to clean up.
+
+flush_sent_messages() persists encouragement sends queued by the in-memory
+RecentVariantTracker every few seconds (see src/services/recent_variants.py).
+
+flush_rate_limits() syncs slowapi hit counters with rate_limit_counters so
+limits hold across workers and restarts (see src/services/rate_limits.py).
+
+reload_messages() polls message_templates so wording edited in the DB
+reaches every worker without a restart (see src/services/messages.py).
+
+purge_outbox_rows() deletes delivered and failed outbox rows past
+OUTBOX_RETENTION_HOURS every hour (see src/services/outbox.py).
+
+fan_out_broadcasts() queues the next recipients of admin broadcasts every
+few seconds (see src/services/broadcasts.py).
+
+run_retention() runs nightly at 03:00 UTC and archives cost_records and
+sent_messages rows past their retention window (see src/services/retention.py).
+
+With several workers or replicas, every process runs the scheduler, but the
+reminder, sweep, outbox purge, broadcast and retention jobs act on shared
+state and only run in the elected leader: renew_leadership() heartbeats a
+lease row (see src/services/leader_election.py) and the other processes
+skip those jobs.
+The flush and reload jobs serve per-process state and run everywhere.
 """
 
 from __future__ import annotations
 
+import functools
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
 from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from sqlalchemy import select
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
+from src.config import get_settings
 from src.database import get_session_factory
 from src.logging import get_logger
+from src.metrics import REMINDERS
 from src.models.sent_message import SentMessage
 from src.models.streak import Streak
 from src.models.student import Student
-from src.repositories.streak_repository import StreakRepository
-from src.services.telegram_client import TelegramClient
+from src.repositories.session_repository import SessionRepository
+from src.services.broadcasts import advance_broadcasts
+from src.services.leader_election import LeaderLease
+from src.services.messages import MessageKey, get_message, refresh_message_catalog
+from src.services.outbox import enqueue_message, purge_outbox
+from src.services.rate_limits import get_rate_limit_store
+from src.services.recent_variants import get_recent_variants
+from src.services.reminder_schedule import get_zone, reschedule, schedule_new_students
+from src.services.retention import RetentionService, get_retention_policies
 from src.utils.pii import hash_telegram_id
 
 logger = get_logger(__name__)
 
 scheduler = AsyncIOScheduler(timezone="UTC")
 
+# Stale-session sweeper: rows per UPDATE, and a cap on batches per run so one
+# run cannot monopolise the connection after a long outage.
+_SWEEP_INTERVAL_MINUTES = 5
+_SWEEP_BATCH_SIZE = 500
+_SWEEP_MAX_BATCHES = 20
+
+# Write-behind interval for recently sent encouragement variants.
+_SENT_MESSAGE_FLUSH_SECONDS = 15
+
+_OUTBOX_PURGE_INTERVAL_MINUTES = 60
+
+_BROADCAST_INTERVAL_SECONDS = 5
+
+# Reminder buckets: how often due slots are read, and how late a slot may be
+# served (after an outage) before it is skipped for the day.
+_REMINDER_INTERVAL_SECONDS = 60
+_REMINDER_MAX_LATENESS = timedelta(hours=3)
+
+# A run reads buckets until no due student is left, but stops after this
+# long so the leader check runs again; the next run picks up the rest.
+_REMINDER_MAX_RUN_SECONDS = 50
+
+# Students with no practice in this many days get no reminders.
+_REMINDER_ACTIVE_DAYS = 30
+
+_LEADER_LEASE_NAME = "scheduler"
+_leader_lease: LeaderLease | None = None
+
+
+def get_leader_lease() -> LeaderLease:
+    """Return this process's scheduler lease (created on first use)."""
+    global _leader_lease
+    if _leader_lease is None:
+        _leader_lease = LeaderLease(
+            _LEADER_LEASE_NAME, lease_seconds=get_settings().scheduler_lease_seconds
+        )
+    return _leader_lease
+
+
+def leader_only(job: Callable[[], Awaitable[Any]]) -> Callable[[], Awaitable[None]]:
+    """Wrap a job so it only runs in the elected leader.
+
+    The lease is checked when the job fires, so a process that lost the
+    lease since its last heartbeat does not run it. With
+    SCHEDULER_LEADER_ELECTION=false every process runs the job.
+    """
+
+    @functools.wraps(job)
+    async def run() -> None:
+        if get_settings().scheduler_leader_election and not get_leader_lease().is_leader:
+            logger.debug("leader_only: skipped on follower", job=job.__name__)
+            return
+        await job()
+
+    return run
+
+
+async def renew_leadership() -> bool:
+    """Take or renew the scheduler lease; log leadership changes.
+
+    A failed renewal (database unreachable) keeps any lease this process
+    already holds until it expires.
+
+    Returns:
+        True if this process is the leader.
+    """
+    lease = get_leader_lease()
+    was_leader = lease.is_leader
+    try:
+        async with get_session_factory()() as db:
+            await lease.renew(db)
+    except Exception as exc:
+        logger.error("renew_leadership: failed", error=type(exc).__name__)
+    leader = lease.is_leader
+    if leader and not was_leader:
+        logger.info("Scheduler leadership acquired", holder=lease.holder)
+    elif was_leader and not leader:
+        logger.warning("Scheduler leadership lost", holder=lease.holder)
+    return leader
+
+
+async def release_leadership() -> None:
+    """Give up the scheduler lease on shutdown so another process takes over now."""
+    lease = get_leader_lease()
+    if not lease.is_leader:
+        return
+    try:
+        async with get_session_factory()() as db:
+            await lease.release(db)
+        logger.info("Scheduler leadership released", holder=lease.holder)
+    except Exception as exc:
+        logger.error("release_leadership: failed", error=type(exc).__name__)
+
+
+def _local_today(student: Student, now: datetime) -> date:
+    """Return the calendar date in the student's own timezone."""
+    return now.astimezone(get_zone(student.timezone)).date()
+
+
+def _as_date(value: date | datetime | None) -> date | None:
+    return value.date() if isinstance(value, datetime) else value
+
+
+async def _reschedule_dormant(
+    db: AsyncSession, now: datetime, spread: int, cutoff: date, limit: int
+) -> int:
+    """Move due students with no practice since cutoff to their next slot.
+
+    They get no reminder, so this reads only profile columns: no streak
+    lookup or SentMessage check per student, and one commit per batch.
+
+    Returns:
+        Number of students rescheduled.
+    """
+    result = await db.execute(
+        select(Student)
+        .outerjoin(Streak, Streak.student_id == Student.student_id)
+        .where(
+            Student.next_reminder_at <= now,
+            or_(Streak.last_practice_date.is_(None), Streak.last_practice_date < cutoff),
+        )
+        .limit(limit)
+        .options(lazyload("*"))
+    )
+    students = result.scalars().all()
+    for student in students:
+        reschedule(student, now, spread)
+    if students:
+        await db.commit()
+        REMINDERS.inc("skipped", amount=len(students))
+    return len(students)
+
+
+async def _prepare_slots(
+    db: AsyncSession, now: datetime, spread: int, cutoff: date, limit: int, deadline: float
+) -> int:
+    """Schedule new students and move dormant ones on, limit rows per batch.
+
+    Returns:
+        Number of dormant students rescheduled.
+    """
+    while time.monotonic() < deadline:
+        scheduled = await schedule_new_students(db, now, spread, limit=limit)
+        if scheduled:
+            await db.commit()
+        if scheduled < limit:
+            break
+
+    dormant = 0
+    while time.monotonic() < deadline:
+        batch = await _reschedule_dormant(db, now, spread, cutoff, limit=limit)
+        dormant += batch
+        if batch < limit:
+            break
+    return dormant
+
+
+async def _due_students(
+    db: AsyncSession, now: datetime, cutoff: date, limit: int, exclude: set[int]
+) -> list[tuple[Student, Streak]]:
+    """Return the next due students who practiced since cutoff, with their streaks."""
+    result = await db.execute(
+        select(Student, Streak)
+        .join(Streak, Streak.student_id == Student.student_id)
+        .where(
+            Student.next_reminder_at <= now,
+            Streak.last_practice_date >= cutoff,
+            Student.student_id.not_in(exclude),
+        )
+        .order_by(Student.next_reminder_at)
+        .limit(limit)
+        .options(lazyload("*"))  # Only profile and streak columns are needed
+    )
+    return [(student, streak) for student, streak in result.all()]
+
+
+async def _reminded_today(
+    db: AsyncSession, rows: list[tuple[Student, Streak]], now: datetime
+) -> set[int]:
+    """Return the students in rows who already have today's reminder recorded."""
+    keys = {f"reminder_{_local_today(student, now).isoformat()}" for student, _ in rows}
+    result = await db.execute(
+        select(SentMessage.student_id, SentMessage.message_key).where(
+            SentMessage.student_id.in_([student.student_id for student, _ in rows]),
+            SentMessage.message_key.in_(keys),
+        )
+    )
+    recorded = set(result.all())
+    return {
+        student.student_id
+        for student, _ in rows
+        if (student.student_id, f"reminder_{_local_today(student, now).isoformat()}") in recorded
+    }
+
+
+def _reminder_skip_reason(
+    student: Student, streak: Streak | None, now: datetime, already_reminded: bool
+) -> str | None:
+    """Return why a due student gets no reminder today, or None to send one."""
+    today = _local_today(student, now)
+    last_date = _as_date(streak.last_practice_date) if streak is not None else None
+    if last_date is None or last_date < today - timedelta(days=_REMINDER_ACTIVE_DAYS):
+        return "inactive"
+    # Practice dates are UTC; west of UTC one can be a day ahead of the local date
+    if last_date >= today:
+        return "practiced_today"
+
+    due_at = student.next_reminder_at
+    assert due_at is not None  # Selected by next_reminder_at <= now
+    # SQLite returns naive datetimes; next_reminder_at is always stored as UTC.
+    if now - (due_at if due_at.tzinfo else due_at.replace(tzinfo=UTC)) > _REMINDER_MAX_LATENESS:
+        return "missed_window"
+
+    # Fix 4: guard against double-fire on app restart within the same local day
+    if already_reminded:
+        return "already_reminded_today"
+    return None
+
+
+async def _remind_student(
+    db: AsyncSession,
+    student: Student,
+    streak: Streak,
+    now: datetime,
+    spread: int,
+    already_reminded: bool,
+) -> str:
+    """Queue one due student's reminder, or skip it; reschedule either way.
+
+    Returns:
+        "sent", "skipped" or "failed" (failed students keep their slot).
+    """
+    hashed_tid = hash_telegram_id(student.telegram_id)  # Fix 2: never log raw telegram_id
+    today = _local_today(student, now)
+    skip_reason = _reminder_skip_reason(student, streak, now, already_reminded)
+
+    if skip_reason is not None:
+        reschedule(student, now, spread)  # Committed with the next reminder or the bucket
+        REMINDERS.inc("skipped")
+        logger.info("reminder_skipped", hashed_telegram_id=hashed_tid, reason=skip_reason)
+        return "skipped"
+
+    current_streak = streak.current_streak
+
+    # Build bilingual reminder message
+    if current_streak == 0:
+        msg = get_message(MessageKey.REMINDER_FIRST_STREAK, student.language)
+    else:
+        msg = get_message(
+            MessageKey.REMINDER_STREAK_AT_RISK, student.language, streak=current_streak
+        )
+
+    # Queue the reminder, record it and move to tomorrow's slot in one
+    # transaction (savepoint per student): it is sent by the outbox
+    # dispatcher only once committed, and a restart can never send it
+    # without the SentMessage row (Fix 4).
+    try:
+        async with db.begin_nested():
+            await enqueue_message(
+                db,
+                student.telegram_id,
+                msg,
+                key=f"reminder:{student.student_id}:{today.isoformat()}",
+            )
+            db.add(
+                SentMessage(
+                    student_id=student.student_id,
+                    message_key=f"reminder_{today.isoformat()}",
+                )
+            )
+        reschedule(student, now, spread)
+        await db.commit()
+    except Exception as exc:
+        REMINDERS.inc("failed")
+        logger.error(
+            "reminder_enqueue_failed",
+            hashed_telegram_id=hashed_tid,
+            error=type(exc).__name__,
+        )
+        return "failed"
+
+    REMINDERS.inc("sent")
+    logger.info("reminder_sent", hashed_telegram_id=hashed_tid, current_streak=current_streak)
+    return "sent"
+
 
 async def send_daily_reminders() -> None:
-    """Send Telegram reminders to students who have not practiced today.
+    """Send Telegram reminders to students whose reminder slot is due.
+
+    Runs every minute. Each student has a daily slot in their own timezone
+    (see src/services/reminder_schedule.py). A run reads due students in
+    buckets of REMINDER_BUCKET_SIZE, earliest slot first, until none are
+    left (or _REMINDER_MAX_RUN_SECONDS have passed; the next run carries
+    on), and moves each handled student on to the next day's slot.
 
     REQ-011 rules:
-    - Run once per day at 12:30 UTC (18:00 IST) via APScheduler cron job
-    - Send only if student has NOT completed practice today (UTC date)
+    - One reminder per student per day at their slot (default 18:00 IST)
+    - Only students who practiced at least once in the last 30 days; the
+      others are filtered out in SQL and only rescheduled
+    - Send only if student has NOT completed practice today (the student's
+      local date)
     - streak=0 → motivational message (not "at risk")
     - streak>=1 → "Your N-day streak is at risk" message
     - Uses student.language for bilingual messages
-    - Send failures logged as ERROR; processing continues for remaining students
+    - Reminders are queued in the outbox with their SentMessage row and sent
+      after commit by the outbox dispatcher (src/services/outbox.py)
+    - Queueing failures logged as ERROR; the student is retried next run and
+      processing continues for remaining students
+    - Slots missed by more than _REMINDER_MAX_LATENESS (e.g. during an
+      outage) are skipped rather than sent late at night
     """
-    logger.info("send_daily_reminders: job started")
-
+    settings = get_settings()
+    spread = settings.reminder_spread_minutes
+    bucket_size = settings.reminder_bucket_size
     factory = get_session_factory()
-    today = datetime.now(UTC).date()  # Fix 1: explicit UTC — avoids wrong date on non-UTC servers
-    cutoff = today - timedelta(days=30)
+    now = datetime.now(UTC)
+    # Loosest bound over all timezones; _reminder_skip_reason() checks the local date
+    cutoff = now.date() - timedelta(days=_REMINDER_ACTIVE_DAYS + 1)
+    deadline = time.monotonic() + _REMINDER_MAX_RUN_SECONDS
 
-    sent_count = 0
-    skipped_count = 0
-    error_count = 0
+    counts: Counter[str] = Counter()  # Students per outcome
+    failed_ids: set[int] = set()  # Not rescheduled; retried by the next run
 
     async with factory() as db:
-        # Query students who have practiced at least once in the last 30 days
-        result = await db.execute(
-            select(Student)
-            .join(Streak, Streak.student_id == Student.student_id)
-            .where(Streak.last_practice_date >= cutoff)
-        )
-        students = result.scalars().all()
-
-        streak_repo = StreakRepository()
-        telegram = TelegramClient()
-
-        # TODO(Phase7): replace per-student queries with a single JOIN + eager-load
-        # to avoid 3 DB round-trips per student when scaling beyond the 50-student pilot.
-        for student in students:
-            hashed_tid = hash_telegram_id(student.telegram_id)  # Fix 2: never log raw telegram_id
-            streak_obj = await streak_repo.get_for_student(db, student.student_id)
-
-            # Skip if already practiced today
-            if streak_obj is not None:
-                raw = streak_obj.last_practice_date
-                last_date: date | None = raw.date() if isinstance(raw, datetime) else raw
-                if last_date == today:
-                    skipped_count += 1
-                    logger.info(
-                        "reminder_skipped",
-                        hashed_telegram_id=hashed_tid,
-                        reason="practiced_today",
-                    )
-                    continue
-
-            # Fix 4: guard against double-fire on app restart within the same UTC day
-            reminder_key = f"reminder_{today.isoformat()}"
-            already_reminded = (
-                await db.execute(
-                    select(SentMessage).where(
-                        SentMessage.student_id == student.student_id,
-                        SentMessage.message_key == reminder_key,
-                    )
-                )
-            ).scalar_one_or_none()
-            if already_reminded is not None:
-                skipped_count += 1
-                logger.info(
-                    "reminder_skipped",
-                    hashed_telegram_id=hashed_tid,
-                    reason="already_reminded_today",
-                )
-                continue
-
-            current_streak = streak_obj.current_streak if streak_obj is not None else 0
-
-            # Build bilingual reminder message
-            if student.language == "bn":
-                if current_streak == 0:
-                    msg = "\U0001f4da আজকের অনুশীলন সম্পন্ন করো এবং তোমার প্রথম ধারা শুরু করো!"
-                else:
-                    msg = (
-                        f"\u09a4\u09cb\u09ae\u09be\u09b0 {current_streak} \u09a6\u09bf\u09a8\u09c7\u09b0 "
-                        f"\u09a7\u09be\u09b0\u09be \u099d\u09c1\u0981\u0995\u09bf\u09a4\u09c7 \u0986\u099b\u09c7! "
-                        f"\u0986\u099c\u0995\u09c7\u09b0 \u0985\u09a8\u09c1\u09b6\u09c0\u09b2\u09a8 \u09b8\u09ae\u09cd\u09aa\u09a8\u09cd\u09a8 \u0995\u09b0\u09cb\u0964 \U0001f525"
-                    )
-            else:
-                if current_streak == 0:
-                    msg = "\U0001f4da Ready to start your first streak? Complete today's practice!"
-                else:
-                    msg = (
-                        f"Your {current_streak}-day streak is at risk! "
-                        f"Complete today's practice to keep it alive. \U0001f525"
-                    )
-
-            # Fix 8: narrow try/except to just the network call — programming errors surface
-            try:
-                await telegram.send_message(student.telegram_id, msg)
-            except Exception as exc:
-                error_count += 1
-                logger.error(
-                    "reminder_send_failed",
-                    hashed_telegram_id=hashed_tid,
-                    error=type(exc).__name__,
+        counts["skipped"] += await _prepare_slots(db, now, spread, cutoff, bucket_size, deadline)
+
+        while time.monotonic() < deadline:
+            rows = await _due_students(db, now, cutoff, limit=bucket_size, exclude=failed_ids)
+            if not rows:
+                break
+            reminded = await _reminded_today(db, rows, now)
+
+            for student, streak_obj in rows:
+                outcome = await _remind_student(
+                    db, student, streak_obj, now, spread, student.student_id in reminded
                 )
-                continue
-
-            # Record this reminder so restarts don't double-fire (Fix 4)
-            db.add(SentMessage(student_id=student.student_id, message_key=reminder_key))
-            await db.commit()  # commit per-student for durability across restarts
-            sent_count += 1
-            logger.info(
-                "reminder_sent",
-                hashed_telegram_id=hashed_tid,
-                current_streak=current_streak,
-            )
+                counts[outcome] += 1
+                if outcome == "failed":
+                    failed_ids.add(student.student_id)
+            await db.commit()  # Reschedules of skipped students
+        else:
+            logger.warning("send_daily_reminders: time budget spent, continuing next run")
 
-    logger.info(
-        "send_daily_reminders: job complete",
-        sent=sent_count,
-        skipped=skipped_count,
-        errors=error_count,
-    )
+    if counts:
+        logger.info(
+            "send_daily_reminders: run complete",
+            sent=counts["sent"],
+            skipped=counts["skipped"],
+            errors=counts["failed"],
+        )
+
+
+async def sweep_stale_sessions() -> int:
+    """Mark expired in_progress sessions as abandoned, in bounded batches.
+
+    Each batch is committed on its own so row locks are held briefly. Stops
+    when a batch comes back short or after _SWEEP_MAX_BATCHES batches; any
+    remainder is picked up by the next run.
+
+    Returns:
+        Total number of sessions marked abandoned in this run.
+    """
+    factory = get_session_factory()
+    session_repo = SessionRepository()
+    total = 0
+
+    for _ in range(_SWEEP_MAX_BATCHES):
+        async with factory() as db:
+            swept = await session_repo.expire_stale_sessions(db, limit=_SWEEP_BATCH_SIZE)
+            await db.commit()
+        total += swept
+        if swept < _SWEEP_BATCH_SIZE:
+            break
+
+    if total:
+        logger.info("sweep_stale_sessions: sessions abandoned", count=total)
+    return total
+
+
+async def flush_sent_messages() -> int:
+    """Persist queued encouragement sends to sent_messages in one batch.
+
+    Returns:
+        Number of rows written (0 if nothing was queued or the write failed).
+    """
+    tracker = get_recent_variants()
+    if not tracker.pending:
+        return 0
+    try:
+        async with get_session_factory()() as db:
+            written = await tracker.flush(db)
+            await db.commit()
+    except Exception as exc:
+        logger.error("flush_sent_messages: failed", error=type(exc).__name__)
+        return 0
+    return written
+
+
+async def load_rate_limits() -> int:
+    """Restore rate-limit counters for windows still open (run at startup).
+
+    Returns:
+        Number of counters loaded (0 if the read failed).
+    """
+    try:
+        async with get_session_factory()() as db:
+            return await get_rate_limit_store().load(db)
+    except Exception as exc:
+        logger.error("load_rate_limits: failed", error=type(exc).__name__)
+        return 0
+
+
+async def flush_rate_limits() -> int:
+    """Sync in-memory rate-limit counters with rate_limit_counters.
+
+    Returns:
+        Number of keys whose hits were written (0 if idle or the sync failed).
+    """
+    store = get_rate_limit_store()
+    if not store.active:
+        return 0
+    try:
+        async with get_session_factory()() as db:
+            written = await store.flush(db)
+    except Exception as exc:
+        logger.error("flush_rate_limits: failed", error=type(exc).__name__)
+        return 0
+    return written
+
+
+async def reload_messages() -> None:
+    """Refresh the message catalog from message_templates if it changed."""
+    factory = get_session_factory()
+    try:
+        async with factory() as db:
+            await refresh_message_catalog(db)
+    except Exception as exc:
+        logger.error("reload_messages: failed", error=type(exc).__name__)
+
+
+async def purge_outbox_rows() -> int:
+    """Delete delivered and failed outbox rows older than OUTBOX_RETENTION_HOURS.
+
+    Returns:
+        Number of rows deleted (0 if the delete failed).
+    """
+    older_than = timedelta(hours=get_settings().outbox_retention_hours)
+    try:
+        async with get_session_factory()() as db:
+            deleted = await purge_outbox(db, older_than)
+            await db.commit()
+    except Exception as exc:
+        logger.error("purge_outbox_rows: failed", error=type(exc).__name__)
+        return 0
+    if deleted:
+        logger.info("purge_outbox_rows: rows deleted", count=deleted)
+    return deleted
+
+
+async def fan_out_broadcasts() -> int:
+    """Queue the next recipients of sending broadcasts and complete finished ones.
+
+    Queues at most BROADCAST_RATE_PER_SECOND x _BROADCAST_INTERVAL_SECONDS
+    recipients per run.
+
+    Returns:
+        Number of recipients queued (0 if the run failed).
+    """
+    settings = get_settings()
+    budget = int(settings.broadcast_rate_per_second * _BROADCAST_INTERVAL_SECONDS)
+    try:
+        async with get_session_factory()() as db:
+            queued = await advance_broadcasts(db, budget, settings.broadcast_max_in_flight)
+            await db.commit()
+    except Exception as exc:
+        logger.error("fan_out_broadcasts: failed", error=type(exc).__name__)
+        return 0
+    return queued
+
+
+async def run_retention() -> None:
+    """Archive expired audit rows and maintain monthly partitions.
+
+    For each retention policy: pre-create upcoming partitions (PostgreSQL),
+    archive rows past the retention window to gzip NDJSON, then drop
+    partitions that are now empty. A failure on one table is logged and
+    does not stop the others.
+
+    Rows are deleted once archived, so unless ARCHIVE_DIR is an absolute
+    path (expected to be persistent storage) nothing is archived or
+    deleted; only partitions are maintained.
+    """
+    settings = get_settings()
+    archive_dir: Path | None = Path(settings.archive_dir) if settings.archive_dir else None
+    if archive_dir is None or not archive_dir.is_absolute():
+        logger.error(
+            "run_retention: ARCHIVE_DIR is not an absolute path; expired rows are kept",
+            archive_dir=settings.archive_dir,
+        )
+        archive_dir = None
+    service = RetentionService(archive_dir)
+    factory = get_session_factory()
+
+    for policy in get_retention_policies(settings):
+        try:
+            async with factory() as db:
+                await service.ensure_partitions(db, policy)
+                await db.commit()
+                archived = await service.archive_expired(db, policy)
+                dropped = await service.drop_expired_partitions(db, policy)
+                await db.commit()
+        except Exception as exc:
+            logger.error("run_retention: failed", table=policy.table, error=type(exc).__name__)
+            continue
+        logger.info(
+            "run_retention: table done",
+            table=policy.table,
+            archived=archived,
+            partitions_dropped=len(dropped),
+        )
 
 
 def start_scheduler() -> None:
     """Register all background jobs and start the scheduler.
 
-    Adds the daily reminder cron job (12:30 UTC = 18:00 IST) and starts
-    the APScheduler event loop integration.
+    Adds the per-minute reminder bucket job, the stale-session sweeper,
+    sent-message flush and rate-limit sync interval jobs, the message
+    catalog reload job (unless MESSAGE_CATALOG_REFRESH_SECONDS is 0), the
+    hourly outbox purge, the broadcast fan-out and the nightly retention job,
+    then starts the APScheduler event loop integration.
+
+    Reminders, the sweeper, the outbox purge, broadcasts and retention only
+    run in the elected leader; the leadership heartbeat is registered to run
+    immediately and then every SCHEDULER_HEARTBEAT_SECONDS (unless
+    SCHEDULER_LEADER_ELECTION is false).
     """
+    settings = get_settings()
+    if settings.scheduler_leader_election:
+        scheduler.add_job(
+            renew_leadership,
+            trigger="interval",
+            seconds=settings.scheduler_heartbeat_seconds,
+            next_run_time=datetime.now(UTC),
+            id="leader_heartbeat",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
     scheduler.add_job(
-        send_daily_reminders,
-        trigger="cron",
-        hour=12,
-        minute=30,  # 12:30 UTC = 18:00 IST
+        leader_only(send_daily_reminders),
+        trigger="interval",
+        seconds=_REMINDER_INTERVAL_SECONDS,
         id="daily_reminders",
         replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        leader_only(sweep_stale_sessions),
+        trigger="interval",
+        minutes=_SWEEP_INTERVAL_MINUTES,
+        id="stale_session_sweeper",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        flush_sent_messages,
+        trigger="interval",
+        seconds=_SENT_MESSAGE_FLUSH_SECONDS,
+        id="sent_message_flush",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        flush_rate_limits,
+        trigger="interval",
+        seconds=settings.rate_limit_flush_seconds,
+        id="rate_limit_flush",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    refresh_seconds = settings.message_catalog_refresh_seconds
+    if refresh_seconds > 0:
+        scheduler.add_job(
+            reload_messages,
+            trigger="interval",
+            seconds=refresh_seconds,
+            id="message_catalog_reload",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
+    scheduler.add_job(
+        leader_only(purge_outbox_rows),
+        trigger="interval",
+        minutes=_OUTBOX_PURGE_INTERVAL_MINUTES,
+        id="outbox_purge",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        leader_only(fan_out_broadcasts),
+        trigger="interval",
+        seconds=_BROADCAST_INTERVAL_SECONDS,
+        id="broadcast_fan_out",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        leader_only(run_retention),
+        trigger="cron",
+        hour=3,
+        minute=0,
+        id="retention",
+        replace_existing=True,
+        max_instances=1,
     )
     if not scheduler.running:
         scheduler.start()
-    logger.info("Scheduler started — daily_reminders job registered at 12:30 UTC")
+    logger.info(
+        f"Scheduler started — daily_reminders every {_REMINDER_INTERVAL_SECONDS}s, "
+        f"stale_session_sweeper every {_SWEEP_INTERVAL_MINUTES} min"
+    )
 
 
 def stop_scheduler() -> None:
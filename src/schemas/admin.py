@@ -61,3 +61,102 @@ class CostSummary(BaseModel):
     )
     budget_alert: bool = Field(..., description="True if any student is projected > $0.10/month")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Report timestamp")
+
+
+class QueryFingerprintStats(BaseModel):
+    """Aggregated latency for one normalized SQL statement."""
+
+    fingerprint: str = Field(..., description="Normalized SQL with literals replaced by '?'")
+    count: int = Field(..., description="Executions since process start or last reset")
+    total_ms: float = Field(..., description="Total execution time in milliseconds")
+    avg_ms: float = Field(..., description="Mean execution time in milliseconds")
+    max_ms: float = Field(..., description="Slowest single execution in milliseconds")
+
+
+class QueryStatsResponse(BaseModel):
+    """Top SQL fingerprints by total time spent."""
+
+    slow_query_ms: float = Field(..., description="Slow-query log threshold in milliseconds")
+    n_plus_one_threshold: int = Field(
+        ..., description="Same-query repeats per request that trigger an N+1 warning"
+    )
+    queries: list[QueryFingerprintStats] = Field(..., description="Fingerprints by total time")
+    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Report timestamp")
+
+
+class PoolStatsResponse(BaseModel):
+    """Database connection-pool configuration and checkout telemetry."""
+
+    pool_class: str = Field(..., description="SQLAlchemy pool implementation in use")
+    size: int | None = Field(None, description="Configured pool size (None for NullPool)")
+    checked_out: int | None = Field(None, description="Connections currently in use")
+    overflow: int | None = Field(None, description="Overflow connections currently open")
+    max_overflow: int = Field(..., description="Configured max overflow connections")
+    checkouts: int = Field(..., description="Successful checkouts since process start")
+    overflow_checkouts: int = Field(..., description="Checkouts that opened an overflow slot")
+    timeouts: int = Field(..., description="Checkouts that timed out waiting for a connection")
+    wait_avg_ms: float = Field(..., description="Mean checkout wait in milliseconds")
+    wait_max_ms: float = Field(..., description="Longest checkout wait in milliseconds")
+    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Report timestamp")
+
+
+class ContentBundleResponse(BaseModel):
+    """State of the in-memory compiled content bundle."""
+
+    loaded: bool = Field(..., description="Whether a content bundle is loaded")
+    path: str = Field(..., description="Configured bundle path")
+    built_at: str | None = Field(default=None, description="When the loaded bundle was compiled")
+    problem_count: int = Field(default=0, description="Problems in the loaded bundle")
+    source_count: int = Field(default=0, description="YAML source files compiled into the bundle")
+    topics: dict[str, int] = Field(
+        default_factory=dict, description="Problem count per '<grade>/<topic>'"
+    )
+    load_ms: float | None = Field(
+        default=None, description="Time taken to map the bundle (reload only)"
+    )
+    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Report timestamp")
+
+
+class MessageCatalogResponse(BaseModel):
+    """State of the in-memory message catalog."""
+
+    version: int = Field(..., description="Catalog version; 0 means code defaults only")
+    fingerprint: str = Field(..., description="SHA-256 of the message_templates rows loaded")
+    loaded_at: datetime = Field(..., description="When this catalog version was built")
+    message_count: int = Field(..., description="Message keys in the catalog")
+    overrides: list[str] = Field(
+        default_factory=list, description="Keys whose text comes from message_templates"
+    )
+    rejected: list[str] = Field(
+        default_factory=list, description="message_templates rows ignored as invalid"
+    )
+    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Report timestamp")
+
+
+class BroadcastCreateRequest(BaseModel):
+    """Request to message every student matching a filter."""
+
+    message: str = Field(
+        ..., description="Text sent to each recipient", min_length=1, max_length=4096
+    )
+    grade: int | None = Field(None, description="Only students in this grade", ge=6, le=8)
+    language: str | None = Field(
+        None, description="Only students with this language", pattern="^(en|bn)$"
+    )
+
+
+class BroadcastResponse(BaseModel):
+    """A broadcast and its delivery progress."""
+
+    broadcast_id: int = Field(..., description="Broadcast primary key")
+    status: str = Field(..., description="sending or completed", examples=["sending"])
+    grade: int | None = Field(None, description="Grade filter (None = all grades)")
+    language: str | None = Field(None, description="Language filter (None = all languages)")
+    total_recipients: int = Field(..., description="Students matching the filter at creation")
+    queued: int = Field(..., description="Messages written to the outbox so far")
+    pending: int = Field(..., description="Queued messages not yet sent or given up")
+    sent: int = Field(..., description="Messages delivered")
+    failed: int = Field(..., description="Messages that gave up after retries")
+    created_at: datetime = Field(..., description="When the broadcast was created")
+    completed_at: datetime | None = Field(None, description="When the last message settled")
+    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Report timestamp")
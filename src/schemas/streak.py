@@ -1,6 +1,6 @@
 """Streak tracking schemas."""
 
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel, Field
 
@@ -16,3 +16,24 @@ class StreakData(BaseModel):
         default_factory=list, description="Milestones achieved (e.g., [7, 14, 30])"
     )
     updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update time")
+
+
+class StreakCalendar(BaseModel):
+    """Days a student practiced within an N-day window."""
+
+    student_id: int = Field(..., description="Student ID")
+    start_date: date = Field(..., description="First day of the window (inclusive)")
+    end_date: date = Field(..., description="Last day of the window (inclusive)")
+    practiced_dates: list[date] = Field(
+        default_factory=list, description="Days with a completed practice session"
+    )
+
+
+class StreakHeatmap(BaseModel):
+    """Per-day practice flags for one calendar month."""
+
+    student_id: int = Field(..., description="Student ID")
+    year: int = Field(..., description="Calendar year")
+    month: int = Field(..., description="Calendar month (1-12)", ge=1, le=12)
+    days: list[bool] = Field(..., description="Practiced flag per day; index 0 is the 1st")
+    practiced_count: int = Field(..., description="Number of practiced days in the month", ge=0)
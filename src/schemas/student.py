@@ -2,7 +2,9 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from src.services.reminder_schedule import is_valid_timezone
 
 
 class StudentProfile(BaseModel):
@@ -13,6 +15,9 @@ class StudentProfile(BaseModel):
     name: str = Field(..., description="Student name", max_length=100)
     grade: int = Field(..., description="Grade level (6, 7, or 8)", ge=6, le=8)
     language: str = Field(..., description="Preferred language", examples=["bn", "en"])
+    timezone: str = Field(..., description="IANA timezone for reminders", examples=["Asia/Kolkata"])
+    reminder_hour: int = Field(..., description="Local hour of the daily reminder", ge=0, le=23)
+    next_reminder_at: datetime | None = Field(None, description="Next daily reminder (UTC)")
     current_streak: int = Field(..., description="Current practice streak in days", ge=0)
     longest_streak: int = Field(..., description="Longest streak achieved", ge=0)
     avg_accuracy: float = Field(..., description="Average accuracy percentage", ge=0.0, le=100.0)
@@ -26,3 +31,16 @@ class ProfileUpdateRequest(BaseModel):
 
     language: str | None = Field(None, description="Preferred language", examples=["bn", "en"])
     grade: int | None = Field(None, description="Grade level", ge=6, le=8)
+    timezone: str | None = Field(
+        None, description="IANA timezone for reminders", examples=["Asia/Kolkata"]
+    )
+    reminder_hour: int | None = Field(
+        None, description="Local hour (0-23) of the daily reminder", ge=0, le=23
+    )
+
+    @field_validator("timezone")
+    @classmethod
+    def _known_timezone(cls, value: str | None) -> str | None:
+        if value is not None and not is_valid_timezone(value):
+            raise ValueError(f"Unknown timezone: {value}")
+        return value
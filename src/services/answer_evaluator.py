@@ -2,7 +2,8 @@
 
 Evaluates student answers against correct answers with appropriate tolerance
 rules for numeric, multiple-choice, and future text types. Purely computational
-— no I/O, completes in <10ms.
+— no I/O, completes in <10ms. Correct answers of problems in the content
+bundle use its precomputed normalized form.
 
 PHASE3-B-2
 """
@@ -52,6 +53,69 @@ _BENGALI_TO_ASCII = str.maketrans(
 )
 
 
+def normalize_answer(raw: str) -> str:
+    """Normalise an answer string for comparison.
+
+    Applies the following in order:
+    1. Strip whitespace.
+    2. Remove currency symbols (₹, $, €, £).
+    3. Remove currency words (rupees, taka, etc.).
+    4. Remove thousands-separator commas (3,500 → 3500).
+    5. Remove trailing units (cm, kg, %, etc.).
+    6. Strip Arabic/Devanagari comma variants.
+    7. Strip again after all substitutions.
+
+    Args:
+        raw: Raw answer string (from DB or student input).
+
+    Returns:
+        Normalised string (may be empty if answer was blank/whitespace).
+    """
+    if not raw:
+        return ""
+
+    text = raw.strip()
+
+    # Convert Bengali digits to ASCII (e.g., "৩" → "3")
+    text = text.translate(_BENGALI_TO_ASCII)
+
+    # Remove currency symbols
+    text = _CURRENCY_SYMBOLS.sub("", text)
+
+    # Remove currency words
+    text = _CURRENCY_WORDS.sub("", text)
+
+    # Remove thousands-separator commas (must loop for cases like "1,000,000")
+    while _THOUSANDS_COMMA.search(text):
+        text = _THOUSANDS_COMMA.sub(r"\1\2", text)
+
+    # Remove Arabic/variant commas
+    text = _ARABIC_COMMA.sub("", text)
+
+    # Remove percent symbol
+    text = _PERCENT_SYMBOL.sub("", text)
+
+    # Remove trailing units (e.g., "300 cm" → "300")
+    text = _TRAILING_UNITS.sub("", text)
+
+    # Normalise power notation (x**2 → x^2) so both forms compare equal
+    text = _DOUBLE_STAR.sub("^", text)
+
+    return text.strip()
+
+
+def _bundled_answer(problem: Problem) -> str | None:
+    """Return the problem's normalized answer from the content bundle, if it has one."""
+    # content_bundle imports normalize_answer from this module
+    from src.services.content_bundle import get_content_bundle
+
+    bundle = get_content_bundle()
+    content_key = getattr(problem, "content_key", None)
+    if bundle is None or not content_key:
+        return None
+    return bundle.answer_normalized(content_key, getattr(problem, "content_hash", None))
+
+
 @dataclass
 class EvaluationResult:
     """Result of evaluating a student's answer.
@@ -133,7 +197,7 @@ class AnswerEvaluator:
             if tolerance is None:
                 tolerance = DEFAULT_NUMERIC_TOLERANCE_PERCENT
             is_correct, format_valid = self._evaluate_numeric(
-                problem.answer, normalized, float(tolerance)
+                problem.answer, normalized, float(tolerance), _bundled_answer(problem)
             )
 
         if not format_valid:
@@ -170,6 +234,7 @@ class AnswerEvaluator:
         correct_raw: str,
         student_normalized: str,
         tolerance_percent: float,
+        correct_normalized: str | None = None,
     ) -> tuple[bool, bool]:
         """Evaluate a numeric answer with percentage tolerance.
 
@@ -177,12 +242,15 @@ class AnswerEvaluator:
             correct_raw: The raw correct answer from the database.
             student_normalized: The student's answer after normalisation.
             tolerance_percent: Acceptable tolerance as a percentage (e.g., 5.0).
+            correct_normalized: correct_raw already normalised (from the
+                content bundle); computed from correct_raw if None.
 
         Returns:
             Tuple (is_correct, format_valid). format_valid is False if
             the student's answer cannot be parsed as a float.
         """
-        correct_normalized = self._normalize_answer(correct_raw)
+        if correct_normalized is None:
+            correct_normalized = self._normalize_answer(correct_raw)
 
         try:
             correct_value = float(correct_normalized)
@@ -253,16 +321,7 @@ class AnswerEvaluator:
         return None
 
     def _normalize_answer(self, raw: str) -> str:
-        """Normalise an answer string for comparison.
-
-        Applies the following in order:
-        1. Strip whitespace.
-        2. Remove currency symbols (₹, $, €, £).
-        3. Remove currency words (rupees, taka, etc.).
-        4. Remove thousands-separator commas (3,500 → 3500).
-        5. Remove trailing units (cm, kg, %, etc.).
-        6. Strip Arabic/Devanagari comma variants.
-        7. Strip again after all substitutions.
+        """Normalise an answer string for comparison (see normalize_answer).
 
         Args:
             raw: Raw answer string (from DB or student input).
@@ -270,37 +329,7 @@ class AnswerEvaluator:
         Returns:
             Normalised string (may be empty if answer was blank/whitespace).
         """
-        if not raw:
-            return ""
-
-        text = raw.strip()
-
-        # Convert Bengali digits to ASCII (e.g., "৩" → "3")
-        text = text.translate(_BENGALI_TO_ASCII)
-
-        # Remove currency symbols
-        text = _CURRENCY_SYMBOLS.sub("", text)
-
-        # Remove currency words
-        text = _CURRENCY_WORDS.sub("", text)
-
-        # Remove thousands-separator commas (must loop for cases like "1,000,000")
-        while _THOUSANDS_COMMA.search(text):
-            text = _THOUSANDS_COMMA.sub(r"\1\2", text)
-
-        # Remove Arabic/variant commas
-        text = _ARABIC_COMMA.sub("", text)
-
-        # Remove percent symbol
-        text = _PERCENT_SYMBOL.sub("", text)
-
-        # Remove trailing units (e.g., "300 cm" → "300")
-        text = _TRAILING_UNITS.sub("", text)
-
-        # Normalise power notation (x**2 → x^2) so both forms compare equal
-        text = _DOUBLE_STAR.sub("^", text)
-
-        return text.strip()
+        return normalize_answer(raw)
 
     def _derive_confidence(self, hints_used: int) -> str:
         """Map hints_used to a confidence level string.
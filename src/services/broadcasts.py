@@ -0,0 +1,214 @@
+"""Admin broadcasts: one message to every student in a grade or language.
+
+The admin API only records the broadcast (create_broadcast()); web workers
+never touch the recipient list. A leader-only scheduler job calls
+advance_broadcasts() every few seconds, which:
+
+  - reads the next recipients with a keyset-paged query over students
+    (student_id > last_student_id ORDER BY student_id), so each page is an
+    index range scan however far the fan-out has got;
+  - queues one outbox row per recipient (key broadcast:<id>:<student_id>)
+    and moves last_student_id on in the same transaction. After a crash the
+    fan-out resumes from the committed cursor, and the idempotency key
+    stops a recipient being queued twice;
+  - queues at most BROADCAST_RATE_PER_SECOND x interval recipients per run,
+    and never more than BROADCAST_MAX_IN_FLIGHT undelivered broadcast rows,
+    so conversation replies are never stuck behind a 100k-message backlog
+    in the outbox. Sends stay under the outbox's bot-wide rate cap.
+
+Per-recipient delivery state is the status of each outbox row. Once the
+fan-out is done and no row is pending, the broadcast is marked completed
+and its sent/failed totals are stored, since the outbox purge deletes
+settled rows after OUTBOX_RETENTION_HOURS.
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import ColumnElement, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.logging import get_logger
+from src.models.broadcast import Broadcast, BroadcastStatus
+from src.models.outbox_message import OutboxMessage, OutboxStatus
+from src.models.student import Student
+from src.services.outbox import enqueue_messages
+
+logger = get_logger(__name__)
+
+# Recipients read (and rows inserted) per statement.
+_PAGE_SIZE = 500
+
+
+def _recipient_filter(grade: int | None, language: str | None) -> list[ColumnElement[bool]]:
+    conditions: list[ColumnElement[bool]] = []
+    if grade is not None:
+        conditions.append(Student.grade == grade)
+    if language is not None:
+        conditions.append(Student.language == language)
+    return conditions
+
+
+async def create_broadcast(
+    db: AsyncSession,
+    message: str,
+    created_by: int,
+    grade: int | None = None,
+    language: str | None = None,
+) -> Broadcast:
+    """Record a broadcast; the scheduler fans it out.
+
+    Recipients are the students matching the filter that exist now; students
+    who sign up later are not included.
+
+    Args:
+        db: Async database session (flushed, not committed here).
+        message: Text to send.
+        created_by: Admin Telegram ID.
+        grade: Only students in this grade (None = all).
+        language: Only students with this language (None = all).
+
+    Returns:
+        The new broadcast (already completed if nobody matches).
+    """
+    total, max_student_id = (
+        await db.execute(
+            select(func.count(Student.student_id), func.max(Student.student_id)).where(
+                *_recipient_filter(grade, language)
+            )
+        )
+    ).one()
+    broadcast = Broadcast(
+        message=message,
+        grade=grade,
+        language=language,
+        status=BroadcastStatus.SENDING,
+        total_recipients=total,
+        max_student_id=max_student_id or 0,
+        last_student_id=0,
+        queued=0,
+        created_by=created_by,
+    )
+    if not total:
+        _complete(broadcast, {})
+    db.add(broadcast)
+    await db.flush()
+    return broadcast
+
+
+async def delivery_counts(db: AsyncSession, broadcast_id: int) -> dict[str, int]:
+    """Count a broadcast's outbox rows by status.
+
+    Args:
+        db: Async database session.
+        broadcast_id: Broadcast to count.
+
+    Returns:
+        Rows per outbox status; statuses with no rows are absent.
+    """
+    result = await db.execute(
+        select(OutboxMessage.status, func.count())
+        .where(OutboxMessage.broadcast_id == broadcast_id)
+        .group_by(OutboxMessage.status)
+    )
+    return dict(result.all())
+
+
+async def fan_out(db: AsyncSession, broadcast: Broadcast, limit: int) -> int:
+    """Queue the next recipients of a broadcast and advance its cursor.
+
+    Args:
+        db: Async database session (not committed here).
+        broadcast: Broadcast still fanning out.
+        limit: Most recipients to queue.
+
+    Returns:
+        Number of recipients queued.
+    """
+    queued = 0
+    while queued < limit and broadcast.last_student_id < broadcast.max_student_id:
+        page_size = min(limit - queued, _PAGE_SIZE)
+        rows = (
+            await db.execute(
+                select(Student.student_id, Student.telegram_id)
+                .where(
+                    Student.student_id > broadcast.last_student_id,
+                    Student.student_id <= broadcast.max_student_id,
+                    *_recipient_filter(broadcast.grade, broadcast.language),
+                )
+                .order_by(Student.student_id)
+                .limit(page_size)
+            )
+        ).all()
+        await enqueue_messages(
+            db,
+            [
+                (telegram_id, broadcast.message, f"broadcast:{broadcast.id}:{student_id}")
+                for student_id, telegram_id in rows
+            ],
+            broadcast_id=broadcast.id,
+        )
+        queued += len(rows)
+        broadcast.queued += len(rows)
+        # A short page means no matching student is left below max_student_id
+        broadcast.last_student_id = (
+            rows[-1].student_id if len(rows) == page_size else broadcast.max_student_id
+        )
+    return queued
+
+
+async def advance_broadcasts(db: AsyncSession, budget: int, max_in_flight: int) -> int:
+    """Fan out sending broadcasts (oldest first) and complete finished ones.
+
+    Args:
+        db: Async database session (not committed here).
+        budget: Most recipients to queue in this call.
+        max_in_flight: Cap on broadcast rows pending in the outbox.
+
+    Returns:
+        Number of recipients queued.
+    """
+    broadcasts = (
+        (
+            await db.execute(
+                select(Broadcast)
+                .where(Broadcast.status == BroadcastStatus.SENDING)
+                .order_by(Broadcast.id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if not broadcasts:
+        return 0
+
+    in_flight = await db.scalar(
+        select(func.count()).where(
+            OutboxMessage.broadcast_id.is_not(None),
+            OutboxMessage.status == OutboxStatus.PENDING,
+        )
+    )
+    budget = min(budget, max_in_flight - (in_flight or 0))
+
+    queued = 0
+    for broadcast in broadcasts:
+        if broadcast.last_student_id < broadcast.max_student_id:
+            if budget - queued > 0:
+                queued += await fan_out(db, broadcast, budget - queued)
+            continue
+        counts = await delivery_counts(db, broadcast.id)
+        if not counts.get(OutboxStatus.PENDING):
+            _complete(broadcast, counts)
+            logger.info(
+                "broadcast_completed",
+                broadcast_id=broadcast.id,
+                sent=broadcast.sent,
+                failed=broadcast.failed,
+            )
+    return queued
+
+
+def _complete(broadcast: Broadcast, counts: dict[str, int]) -> None:
+    broadcast.status = BroadcastStatus.COMPLETED
+    broadcast.sent = counts.get(OutboxStatus.SENT, 0)
+    broadcast.failed = counts.get(OutboxStatus.FAILED, 0)
+    broadcast.completed_at = datetime.now(UTC)
@@ -0,0 +1,348 @@
+"""Compiled content bundle: the YAML problem catalog as one memory-mapped file.
+
+scripts/build_content_bundle.py validates every file under
+content/problems/grade_*/*.yaml and compiles it into a single JSON Lines
+artifact (content/problems.bundle.jsonl by default):
+
+  line 0   header: format/version, per-source file hashes and record ranges,
+           the (grade, topic) and content_key indexes and the byte offset
+           of every record
+  line 1+  one compact JSON record per problem, in source-file order, with
+           the problems row plus content_key, content_hash, the normalized
+           canonical answer and the source path
+
+ContentBundle memory-maps the file and parses only the header, so opening
+the full catalog takes milliseconds; individual records are decoded on
+access. The bundle is built in the deploy's build phase and ships with the
+image. The app loads it at startup (reloadable via POST /admin/content/reload):
+ProblemRepository serves problem lookups from it and AnswerEvaluator uses
+its normalized answers, for every problem whose content_hash matches the
+seeded row. scripts/seed_problems.py seeds from it instead of parsing YAML
+whenever a source's hash still matches.
+"""
+
+import json
+import logging
+import mmap
+import os
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from src.services.answer_evaluator import normalize_answer
+from src.services.problem_content import (
+    PROBLEMS_DIR,
+    content_source_path,
+    file_sha256,
+    parse_problem_files,
+    problem_content_hash,
+    problem_content_key,
+    validate_and_transform_problem,
+)
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT = "dars-content-bundle"
+BUNDLE_VERSION = 2
+
+# Default artifact location, next to the YAML sources.
+DEFAULT_BUNDLE_PATH = PROBLEMS_DIR.parent / "problems.bundle.jsonl"
+
+
+class ContentBundleError(ValueError):
+    """Raised when content fails validation or a bundle file is unreadable."""
+
+
+def topic_index_key(grade: int, topic: str) -> str:
+    """Return the topic index key for a (grade, topic) pair, e.g. "7/percentages"."""
+    return f"{grade}/{topic}"
+
+
+def compile_bundle(
+    file_paths: list[str],
+    output_path: Path | str = DEFAULT_BUNDLE_PATH,
+    workers: int | None = None,
+) -> dict[str, Any]:
+    """Validate YAML problem files and write them as a content bundle.
+
+    Every problem is validated; any invalid problem or duplicate
+    (grade, topic, question_en) aborts the build without touching the
+    existing bundle. The file is written to a temporary path and renamed
+    into place, so processes that have the old bundle mapped are unaffected.
+
+    Args:
+        file_paths: YAML files to compile.
+        output_path: Destination of the bundle.
+        workers: Worker processes used for parsing (see parse_problem_files).
+
+    Returns:
+        The bundle header that was written.
+
+    Raises:
+        ContentBundleError: If any problem is invalid or duplicated.
+    """
+    hashes = {path: file_sha256(path) for path in file_paths}
+    errors: list[str] = []
+    records: list[bytes] = []
+    sources: dict[str, dict[str, Any]] = {}
+    topics: dict[str, list[int]] = {}
+    keys: dict[str, int] = {}
+    seen: dict[str, str] = {}
+
+    for file_path, raw_problems in parse_problem_files(file_paths, workers=workers):
+        source = content_source_path(file_path)
+        start = len(records)
+        for raw in raw_problems:
+            try:
+                row: dict[str, Any] = validate_and_transform_problem(raw, source)
+            except ValueError as exc:
+                errors.append(str(exc))
+                continue
+
+            key = problem_content_key(row["grade"], row["topic"], row["question_en"])
+            if key in seen:
+                errors.append(
+                    f"Duplicate problem in {source} (first seen in {seen[key]}): "
+                    f"{row['question_en']!r}"
+                )
+                continue
+            seen[key] = source
+
+            row["content_key"] = key
+            row["content_hash"] = problem_content_hash(row)
+            row["answer_normalized"] = normalize_answer(row["answer"])
+            row["source"] = source
+
+            topics.setdefault(topic_index_key(row["grade"], row["topic"]), []).append(len(records))
+            keys[key] = len(records)
+            records.append(
+                json.dumps(row, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            )
+        sources[source] = {
+            "sha256": hashes[file_path],
+            "start": start,
+            "count": len(records) - start,
+        }
+
+    if errors:
+        raise ContentBundleError(
+            f"{len(errors)} content error(s):\n" + "\n".join(f"  - {e}" for e in errors)
+        )
+
+    offsets = [0]
+    for record in records:
+        offsets.append(offsets[-1] + len(record) + 1)
+
+    header: dict[str, Any] = {
+        "format": BUNDLE_FORMAT,
+        "version": BUNDLE_VERSION,
+        "built_at": datetime.now(UTC).isoformat(),
+        "problem_count": len(records),
+        "sources": sources,
+        "topics": topics,
+        "keys": keys,
+        "offsets": offsets,
+    }
+
+    output = Path(output_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(f".{output.name}.tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        fh.write(b"\n")
+        for record in records:
+            fh.write(record)
+            fh.write(b"\n")
+    os.replace(tmp, output)
+
+    logger.info(
+        "content_bundle_built",
+        extra={
+            "event": "content_bundle.built",
+            "path": str(output),
+            "problems": len(records),
+            "sources": len(sources),
+        },
+    )
+    return header
+
+
+class ContentBundle:
+    """Read-only, memory-mapped view of a compiled content bundle.
+
+    Attributes:
+        path: Bundle file path.
+        built_at: ISO timestamp of the build.
+        sources: {source path: {"sha256", "start", "count"}} per YAML file.
+        topics: {"<grade>/<topic>": [record index, ...]}.
+        keys: {content_key: record index}.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Map a bundle file and parse its header.
+
+        Args:
+            path: Bundle file path.
+
+        Raises:
+            ContentBundleError: If the file is missing, empty or not a bundle.
+        """
+        self.path = Path(path)
+        try:
+            with open(self.path, "rb") as fh:
+                self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as exc:
+            raise ContentBundleError(f"Cannot open content bundle {self.path}: {exc}") from exc
+
+        header_end = self._mm.find(b"\n")
+        try:
+            header = json.loads(self._mm[:header_end]) if header_end > 0 else None
+        except json.JSONDecodeError:
+            header = None
+        if not isinstance(header, dict) or header.get("format") != BUNDLE_FORMAT:
+            raise ContentBundleError(f"{self.path} is not a content bundle")
+        if header.get("version") != BUNDLE_VERSION:
+            raise ContentBundleError(
+                f"{self.path} has bundle version {header.get('version')}, "
+                f"expected {BUNDLE_VERSION}; rebuild it"
+            )
+
+        self._data_start = header_end + 1
+        self._offsets: list[int] = header["offsets"]
+        self.built_at: str = header["built_at"]
+        self.sources: dict[str, dict[str, Any]] = header["sources"]
+        self.topics: dict[str, list[int]] = header["topics"]
+        self.keys: dict[str, int] = header["keys"]
+        self._answers: dict[str, tuple[str, str]] = {}  # content_key -> (hash, answer)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for index in range(len(self)):
+            yield self.problem(index)
+
+    def problem(self, index: int) -> dict[str, Any]:
+        """Decode one problem record.
+
+        Args:
+            index: Record index (0-based, in source-file order).
+
+        Returns:
+            The record dict (problems row plus content_key, content_hash,
+            answer_normalized and source).
+        """
+        start = self._data_start + self._offsets[index]
+        end = self._data_start + self._offsets[index + 1] - 1
+        record: dict[str, Any] = json.loads(self._mm[start:end])
+        return record
+
+    def problems_for_topic(self, grade: int, topic: str) -> list[dict[str, Any]]:
+        """Return every problem for a (grade, topic) pair via the topic index."""
+        return [self.problem(i) for i in self.topics.get(topic_index_key(grade, topic), [])]
+
+    def problem_by_key(self, content_key: str) -> dict[str, Any] | None:
+        """Return the record with a content_key, or None if it is not in the bundle."""
+        index = self.keys.get(content_key)
+        return None if index is None else self.problem(index)
+
+    def answer_normalized(self, content_key: str, content_hash: str | None) -> str | None:
+        """Return the precomputed normalized answer of an unchanged problem.
+
+        Args:
+            content_key: The problem's content_key.
+            content_hash: The problem's content_hash, as seeded.
+
+        Returns:
+            The bundled answer_normalized, or None if the problem is not in
+            the bundle or its content differs from the bundled record.
+        """
+        cached = self._answers.get(content_key)
+        if cached is None:
+            record = self.problem_by_key(content_key)
+            if record is None:
+                return None
+            cached = (record["content_hash"], record["answer_normalized"])
+            self._answers[content_key] = cached
+        bundled_hash, answer = cached
+        return answer if bundled_hash == content_hash else None
+
+    def problems_for_source(self, source: str) -> list[dict[str, Any]]:
+        """Return every problem compiled from one YAML source file.
+
+        Args:
+            source: Source path relative to PROBLEMS_DIR, e.g. "grade_7/percentages.yaml".
+
+        Returns:
+            The source's records, or an empty list if it is not in the bundle.
+        """
+        entry = self.sources.get(source)
+        if entry is None:
+            return []
+        return [self.problem(i) for i in range(entry["start"], entry["start"] + entry["count"])]
+
+    def source_hash(self, source: str) -> str | None:
+        """Return the SHA-256 the source file had when the bundle was built."""
+        entry = self.sources.get(source)
+        return None if entry is None else str(entry["sha256"])
+
+    def stale_sources(self, file_paths: list[str]) -> list[str]:
+        """Return sources that changed, appeared or disappeared since the build.
+
+        Only file bytes are hashed; nothing is parsed.
+
+        Args:
+            file_paths: Current YAML files.
+
+        Returns:
+            Sorted source paths whose hash differs from the bundle's.
+        """
+        current = {content_source_path(path): file_sha256(path) for path in file_paths}
+        changed = {s for s, h in current.items() if self.source_hash(s) != h}
+        changed.update(set(self.sources) - set(current))
+        return sorted(changed)
+
+    def close(self) -> None:
+        """Unmap the bundle file."""
+        self._mm.close()
+
+
+_bundle: ContentBundle | None = None
+
+
+def get_content_bundle() -> ContentBundle | None:
+    """Return the bundle loaded by load_content_bundle(), if any."""
+    return _bundle
+
+
+def load_content_bundle(path: Path | str = DEFAULT_BUNDLE_PATH) -> ContentBundle:
+    """Map a bundle and make it the process-wide bundle.
+
+    The previous bundle is not closed explicitly; its mapping is released
+    once nothing references it, so callers holding it keep working.
+
+    Args:
+        path: Bundle file path.
+
+    Returns:
+        The newly loaded bundle.
+
+    Raises:
+        ContentBundleError: If the bundle cannot be opened.
+    """
+    global _bundle
+    started = time.perf_counter()
+    bundle = ContentBundle(path)
+    _bundle = bundle
+    logger.info(
+        "content_bundle_loaded",
+        extra={
+            "event": "content_bundle.loaded",
+            "path": str(bundle.path),
+            "problems": len(bundle),
+            "load_ms": round((time.perf_counter() - started) * 1000, 3),
+        },
+    )
+    return bundle
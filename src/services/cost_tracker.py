@@ -27,6 +27,7 @@ from datetime import UTC, datetime
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.metrics import AI_COST_USD, AI_TOKENS
 from src.models.cost_record import ApiProvider, CostRecord, OperationType
 
 logger = logging.getLogger(__name__)
@@ -102,6 +103,10 @@ class CostTracker:
 
         # Flush so cost_id is populated and record survives disconnect
         await db.flush()
+        if cost_usd:
+            AI_COST_USD.inc(amount=cost_usd)
+            AI_TOKENS.inc("input", amount=input_tokens or 0)
+            AI_TOKENS.inc("output", amount=output_tokens or 0)
 
         # PHASE7-C-1: Budget alert — warn if student has exceeded monthly ceiling
         mtd_cost = await self.get_student_cost_this_month(db, student_id)
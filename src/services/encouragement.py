@@ -9,17 +9,16 @@ hints_used, or grade) modulo the pool length.
 
 REQ-009 (streak tracking), REQ-010 (streak display), REQ-012 (milestones).
 REQ-013 (non-repeat): async variants get_unique_correct_message() and
-get_unique_incorrect_message() track sent variants via the SentMessage DB table.
+get_unique_incorrect_message() track sent variants in an in-memory
+RecentVariantTracker, hydrated from and written behind to the SentMessage
+table (see src/services/recent_variants.py).
 """
 
 from __future__ import annotations
 
-from datetime import UTC, datetime, timedelta
-
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.sent_message import SentMessage
+from src.services.recent_variants import RecentVariantTracker, get_recent_variants
 
 # ---------------------------------------------------------------------------
 # Correct-answer message templates
@@ -148,6 +147,15 @@ class EncouragementService:
         msg = svc.get_correct_message(streak=7, language="bn")
     """
 
+    def __init__(self, tracker: RecentVariantTracker | None = None) -> None:
+        """Initialise the service.
+
+        Args:
+            tracker: Recent-variant tracker for the non-repeat methods.
+                     Defaults to the process-wide tracker.
+        """
+        self._tracker = tracker if tracker is not None else get_recent_variants()
+
     def get_correct_message(self, streak: int, language: str) -> str:
         """Return a celebratory message after a correct answer.
 
@@ -176,20 +184,19 @@ class EncouragementService:
         default_idx: int,
         streak: int | None = None,
     ) -> str:
-        """Select an unseen message variant and record it in SentMessage.
+        """Select a variant not sent recently and record it in the tracker.
 
-        Queries SentMessage rows for this student within the last 7 days to find
-        which variants have been sent. Cycles to the first unseen variant; if all
-        have been seen, falls back to the deterministic default_idx and records
-        it anyway (repeat is acceptable after exhaustion).
+        Recently sent keys come from the student's in-memory ring buffer; the
+        DB is only read the first time this process sees the student. Cycles
+        to the first unseen variant; if all have been seen, falls back to the
+        deterministic default_idx and records it anyway (repeat is acceptable
+        after exhaustion).
 
-        The row is flushed but not committed — the caller's transaction commit
-        persists it. Trade-off: if the caller's transaction rolls back after this
-        returns, the SentMessage row is lost and the variant may repeat on the
-        next call. Callers should commit promptly after sending the message.
+        The send is persisted to SentMessage by the tracker's next batched
+        flush, not in the caller's transaction.
 
         Args:
-            db: Async database session (within an open transaction).
+            db: Async database session (used to hydrate the tracker).
             student_id: Student primary key for tracking.
             pool: Ordered list of message template strings.
             prefix: Key prefix used to identify this message type (e.g. 'correct_streak_low').
@@ -199,15 +206,7 @@ class EncouragementService:
         Returns:
             Selected message string, formatted if applicable.
         """
-        cutoff = datetime.now(UTC) - timedelta(days=7)
-        result = await db.execute(
-            select(SentMessage.message_key).where(
-                SentMessage.student_id == student_id,
-                SentMessage.sent_at >= cutoff,
-                SentMessage.message_key.like(f"{prefix}_%"),
-            )
-        )
-        recently_sent: set[str] = {row[0] for row in result.fetchall()}
+        recently_sent = await self._tracker.recent_keys(db, student_id, prefix)
 
         chosen_idx = default_idx
         for i in range(len(pool)):
@@ -219,8 +218,7 @@ class EncouragementService:
         if streak is not None and "{streak}" in text:
             text = text.format(streak=streak)
 
-        db.add(SentMessage(student_id=student_id, message_key=f"{prefix}_{chosen_idx}"))
-        await db.flush()
+        self._tracker.record(student_id, f"{prefix}_{chosen_idx}")
         return text
 
     async def get_unique_correct_message(
@@ -236,7 +234,7 @@ class EncouragementService:
         for the student's current streak level.
 
         Args:
-            db: Async database session (within an open transaction).
+            db: Async database session (used to hydrate the tracker).
             student_id: Student primary key for tracking.
             streak: Student's current streak for streak-aware variant selection.
             language: Preferred language code ('en' or 'bn').
@@ -265,7 +263,7 @@ class EncouragementService:
         Delegates to _get_unique_message with the incorrect-answer template pool.
 
         Args:
-            db: Async database session (within an open transaction).
+            db: Async database session (used to hydrate the tracker).
             student_id: Student primary key for tracking.
             hints_used: Number of hints already used (0-3).
             language: Preferred language code ('en' or 'bn').
@@ -0,0 +1,210 @@
+"""Background health monitor behind /health/live and /health/ready.
+
+Probes used to run SELECT 1 in a fresh transaction on every request, so
+platform probes and uptime monitors each took a pooled connection. This
+module moves the dependency checks off the request path:
+
+  - A background task checks the database every HEALTH_CHECK_INTERVAL_SECONDS
+    and caches the result with its time and latency.
+  - readiness() combines that cached status with in-memory signals read at
+    call time: connection-pool saturation, scheduler state and the depth of
+    the write-behind and log queues. Probes never touch the database.
+  - The instance reports not-ready when the database check fails or goes
+    stale, the pool is nearly exhausted, the scheduler has stopped, or a
+    queue backs up, so traffic drains before requests start timing out.
+
+Usage (src/main.py lifespan):
+    monitor = get_health_monitor()
+    monitor.start()
+    ...
+    await monitor.stop()
+"""
+
+import asyncio
+import contextlib
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+from src import database
+from src.config import get_settings
+from src.db_instrumentation import pool_stats
+from src.logging import get_logger
+from src.logging.config import log_queue_depth
+from src.scheduler import get_leader_lease, scheduler
+from src.services.rate_limits import get_rate_limit_store
+from src.services.recent_variants import get_recent_variants
+
+logger = get_logger(__name__)
+
+# Per-check timeout; the probe itself never waits on it.
+DB_CHECK_TIMEOUT = 3.0
+
+# A cached DB result older than this many intervals counts as failed: the
+# monitor loop itself is stuck.
+_STALE_AFTER_INTERVALS = 3
+
+
+class HealthMonitor:
+    """Caches dependency status for the health endpoints.
+
+    Attributes:
+        interval: Seconds between database checks.
+        started_at: time.monotonic() when the monitor was created.
+    """
+
+    def __init__(self, interval: float) -> None:
+        """Create a monitor with no cached result yet.
+
+        Args:
+            interval: Seconds between database checks.
+        """
+        self.interval = interval
+        self.started_at = time.monotonic()
+        self._db_status = "unknown"
+        self._db_latency_ms: float | None = None
+        self._db_checked_at: float | None = None  # time.monotonic()
+        self._db_checked_wall: datetime | None = None
+        self._ready: bool | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """True while the background task is alive."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def has_result(self) -> bool:
+        """True once the database has been checked at least once."""
+        return self._db_checked_at is not None
+
+    @property
+    def db_status(self) -> str:
+        """Last database status: "ok", "timeout", "error" or "unknown"."""
+        return self._db_status
+
+    def start(self) -> None:
+        """Start the background check loop (first check runs immediately)."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="health-monitor")
+
+    async def stop(self) -> None:
+        """Cancel the background check loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def refresh(self) -> str:
+        """Check the database once and cache the result.
+
+        Returns:
+            Database status: "ok", "timeout" or "error".
+        """
+        started = time.perf_counter()
+        try:
+            ok = await asyncio.wait_for(database.check_connection(), timeout=DB_CHECK_TIMEOUT)
+            db_status = "ok" if ok else "error"
+        except TimeoutError:
+            db_status = "timeout"
+        except Exception as exc:
+            logger.error("health_monitor: check failed", error=type(exc).__name__)
+            db_status = "error"
+        self._db_status = db_status
+        self._db_latency_ms = round((time.perf_counter() - started) * 1000, 1)
+        self._db_checked_at = time.monotonic()
+        self._db_checked_wall = datetime.now(UTC)
+
+        readiness = self.readiness()
+        ready = readiness["status"] == "ok"
+        if ready != self._ready:
+            if ready:
+                logger.info("Readiness: ready")
+            else:
+                logger.warning("Readiness: not ready", checks=readiness["checks"])
+            self._ready = ready
+        return db_status
+
+    async def _run(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.interval)
+
+    def readiness(self) -> dict[str, Any]:
+        """Combine the cached database status with live in-memory signals.
+
+        Returns:
+            Dict with overall "status" ("ok" or "error") and per-signal
+            "checks", each carrying its own "ok" flag.
+        """
+        settings = get_settings()
+        checks: dict[str, dict[str, Any]] = {
+            "db": self._db_check(),
+            "pool": self._pool_check(settings.db_max_overflow, settings.health_pool_saturation),
+            "scheduler": self._scheduler_check(),
+            "queues": self._queue_check(settings.health_queue_depth_limit),
+        }
+        return {
+            "status": "ok" if all(check["ok"] for check in checks.values()) else "error",
+            "checks": checks,
+            "timestamp": datetime.now(UTC).isoformat(),
+        }
+
+    def _db_check(self) -> dict[str, Any]:
+        if self._db_checked_at is None:
+            return {"ok": False, "status": "unknown", "age_seconds": None}
+        age = time.monotonic() - self._db_checked_at
+        stale = age > self.interval * _STALE_AFTER_INTERVALS
+        return {
+            "ok": self._db_status == "ok" and not stale,
+            "status": "stale" if stale else self._db_status,
+            "age_seconds": round(age, 1),
+            "latency_ms": self._db_latency_ms,
+            "checked_at": self._db_checked_wall.isoformat() if self._db_checked_wall else None,
+        }
+
+    @staticmethod
+    def _pool_check(max_overflow: int, threshold: float) -> dict[str, Any]:
+        engine = database._engine  # Never create an engine just to be probed
+        snapshot = pool_stats.snapshot(engine.pool if engine is not None else None)
+        if snapshot["size"] is None:  # SQLite NullPool or no engine yet
+            return {"ok": True, "saturation": None, "timeouts": snapshot["timeouts"]}
+        capacity = snapshot["size"] + max_overflow
+        saturation = snapshot["checked_out"] / capacity if capacity else 0.0
+        return {
+            "ok": saturation < threshold,
+            "saturation": round(saturation, 3),
+            "checked_out": snapshot["checked_out"],
+            "capacity": capacity,
+            "timeouts": snapshot["timeouts"],
+        }
+
+    @staticmethod
+    def _scheduler_check() -> dict[str, Any]:
+        return {
+            "ok": bool(scheduler.running),
+            "running": bool(scheduler.running),
+            "leader": get_leader_lease().is_leader,
+        }
+
+    @staticmethod
+    def _queue_check(limit: int) -> dict[str, Any]:
+        depths = {
+            "sent_messages": get_recent_variants().pending,
+            "rate_limit_counters": get_rate_limit_store().pending,
+            "log_records": log_queue_depth(),
+        }
+        return {"ok": max(depths.values()) < limit, "depths": depths, "limit": limit}
+
+
+_monitor: HealthMonitor | None = None
+
+
+def get_health_monitor() -> HealthMonitor:
+    """Return the process-wide monitor (created on first use)."""
+    global _monitor
+    if _monitor is None:
+        _monitor = HealthMonitor(interval=get_settings().health_check_interval_seconds)
+    return _monitor
@@ -19,15 +19,15 @@ Callers own the transaction boundary and cost-recording call.
 """
 
 import asyncio
+import time
 from datetime import UTC, date, datetime
 
-import anthropic
-from anthropic.types import TextBlock
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import get_settings
 from src.logging import get_logger
+from src.metrics import CLAUDE_REQUEST_SECONDS, HINT_FALLBACKS
 from src.models.cost_record import CostRecord, OperationType
 from src.models.problem import Problem
 from src.services.hint_cache import HintCache
@@ -127,6 +127,7 @@ class HintGenerator:
         settings = get_settings()
         if not settings.anthropic_api_key:
             logger.debug("hint_generator_no_api_key")
+            HINT_FALLBACKS.inc("no_api_key")
             return fallback_text, False, None, None
 
         # 3. Daily rate limit
@@ -135,19 +136,27 @@ class HintGenerator:
                 "hint_rate_limit_reached",
                 extra={"student_id": student_id, "limit": _MAX_AI_HINTS_PER_DAY},
             )
+            HINT_FALLBACKS.inc("rate_limited")
             return fallback_text, False, None, None
 
         # 4. Claude API with retry
+        # The SDK takes over a second to import; load it on the first API call
+        # instead of at app startup.
+        import anthropic
+        from anthropic.types import TextBlock
+
         prompt = self._build_prompt(problem, student_answer, hint_number, language)
         client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
 
         for attempt in range(_MAX_RETRIES):
+            started = time.perf_counter()
             try:
                 response = await client.messages.create(
                     model=_MODEL,
                     max_tokens=_MAX_TOKENS,
                     messages=[{"role": "user", "content": prompt}],
                 )
+                CLAUDE_REQUEST_SECONDS.observe(time.perf_counter() - started, "ok")
                 block = response.content[0]
                 hint_text = block.text.strip() if isinstance(block, TextBlock) else ""
                 in_tok: int = response.usage.input_tokens
@@ -174,6 +183,7 @@ class HintGenerator:
                 anthropic.InternalServerError,
                 anthropic.RateLimitError,
             ) as exc:
+                CLAUDE_REQUEST_SECONDS.observe(time.perf_counter() - started, "retryable_error")
                 if attempt < _MAX_RETRIES - 1:
                     wait = 2**attempt  # 1s, 2s
                     logger.warning(
@@ -192,6 +202,7 @@ class HintGenerator:
                     )
 
             except (anthropic.AuthenticationError, anthropic.BadRequestError) as exc:
+                CLAUDE_REQUEST_SECONDS.observe(time.perf_counter() - started, "fatal_error")
                 logger.error(
                     "hint_api_auth_or_billing_error",
                     extra={"error_type": type(exc).__name__, "error": str(exc)},
@@ -199,6 +210,7 @@ class HintGenerator:
                 break  # No point retrying auth/billing failures
 
         # 5. All retries exhausted — serve pre-written fallback
+        HINT_FALLBACKS.inc("api_error")
         return fallback_text, False, None, None
 
     # ------------------------------------------------------------------
@@ -0,0 +1,130 @@
+"""Leader election for background jobs through a renewable lease row.
+
+Every uvicorn worker and replica starts the scheduler, but jobs that act on
+shared state (daily reminders, the stale-session sweep, retention) must run
+in one process only. Processes compete for a row in scheduler_leases:
+
+  - renew() takes the row if it is missing, expired or already ours, and
+    pushes expires_at one lease duration ahead. It is a single upsert, so
+    two processes can never both win.
+  - The leader renews on every heartbeat. If it dies, the lease lapses
+    after lease_seconds and the next heartbeat elsewhere takes over.
+  - is_leader also checks the lease locally: a leader whose heartbeats
+    stall (database outage, blocked loop) stops acting as leader when its
+    lease runs out, before any other process can take it.
+  - release() expires the row on shutdown so a deploy fails over at once.
+
+Trade-off: expiry is computed from each process's clock, so the lease
+assumes clocks agree to well within lease_seconds.
+
+Usage:
+    lease = LeaderLease("scheduler", lease_seconds=30)
+    async with factory() as db:
+        await lease.renew(db)
+    if lease.is_leader:
+        ...
+"""
+
+import os
+import socket
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from sqlalchemy import case, or_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.scheduler_lease import SchedulerLease
+
+
+def _to_datetime(epoch: float) -> datetime:
+    return datetime.fromtimestamp(epoch, tz=UTC)
+
+
+def default_holder_id() -> str:
+    """Identify this process: hostname, PID and a nonce against PID reuse."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderLease:
+    """This process's claim on one leader-elected role.
+
+    Attributes:
+        name: Role name (scheduler_leases primary key).
+        holder: This process's holder ID.
+        lease_seconds: How long a renewal keeps the lease.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        lease_seconds: float,
+        holder: str | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.name = name
+        self.holder = holder if holder is not None else default_holder_id()
+        self.lease_seconds = lease_seconds
+        self._clock = clock
+        self._expires_at = 0.0
+
+    @property
+    def is_leader(self) -> bool:
+        """True while this process holds an unexpired lease."""
+        return self._clock() < self._expires_at
+
+    async def renew(self, db: AsyncSession) -> bool:
+        """Take or extend the lease, and commit.
+
+        The local expiry is only moved forward after the commit succeeds,
+        and is measured from before the statement ran, so this process
+        never believes in a lease longer than the database does.
+
+        Args:
+            db: Async database session (committed here).
+
+        Returns:
+            True if this process is the leader.
+        """
+        now = self._clock()
+        expires_at = now + self.lease_seconds
+        dialect = db.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(SchedulerLease).values(
+            name=self.name,
+            holder=self.holder,
+            acquired_at=_to_datetime(now),
+            expires_at=_to_datetime(expires_at),
+        )
+        ours = SchedulerLease.holder == stmt.excluded.holder
+        upsert = stmt.on_conflict_do_update(
+            index_elements=[SchedulerLease.name],
+            set_={
+                "holder": stmt.excluded.holder,
+                "acquired_at": case(
+                    (ours, SchedulerLease.acquired_at), else_=stmt.excluded.acquired_at
+                ),
+                "expires_at": stmt.excluded.expires_at,
+            },
+            where=or_(ours, SchedulerLease.expires_at <= _to_datetime(now)),
+        ).returning(SchedulerLease.holder)
+        won = (await db.execute(upsert)).scalar_one_or_none() == self.holder
+        await db.commit()
+        self._expires_at = expires_at if won else 0.0
+        return won
+
+    async def release(self, db: AsyncSession) -> None:
+        """Give up the lease (if held) so another process can take it now.
+
+        Args:
+            db: Async database session (committed here).
+        """
+        self._expires_at = 0.0
+        await db.execute(
+            update(SchedulerLease)
+            .where(SchedulerLease.name == self.name, SchedulerLease.holder == self.holder)
+            .values(expires_at=_to_datetime(self._clock()))
+        )
+        await db.commit()
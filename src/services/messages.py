@@ -4,15 +4,29 @@ PHASE7-A-2 (REQ-021): All student-facing strings not already handled by
 EncouragementService or HintGenerator live here. Strings are keyed by
 the MessageKey enum and retrieved via get_message().
 
-Strings are stored in code (not the DB) for Phase 0. Migration to
-MessageTemplate rows is deferred to Phase 1+ (GAP-3 in PHASE7_TASKS.md).
+MESSAGES holds the code defaults. Rows in message_templates override them
+(or add new keys) without a deploy: refresh_message_catalog() reads the
+table, pre-parses every template and atomically swaps in a new versioned
+MessageCatalog. It runs at startup, on a scheduler interval and from
+POST /admin/messages/reload; get_message() itself never touches the DB and
+stays a dict lookup.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from enum import StrEnum
+from string import Formatter
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.logging import get_logger
+from src.models.message_template import MessageTemplate
 
 _FALLBACK = "en"
 _logger = get_logger(__name__)
@@ -59,6 +73,13 @@ class MessageKey(StrEnum):
     GRADE_INVALID = "grade_invalid"
     # Practice-flow grade selection (temporary, per-session)
     PRACTICE_GRADE_PROMPT = "practice_grade_prompt"
+    # Topic list shown after /practice
+    TOPIC_PROMPT = "topic_prompt"
+    # Hint footer
+    HINT_WITH_REMAINING = "hint_with_remaining"
+    # Daily reminders (src/scheduler.py)
+    REMINDER_FIRST_STREAK = "reminder_first_streak"
+    REMINDER_STREAK_AT_RISK = "reminder_streak_at_risk"
 
 
 # Bilingual message templates.  All {placeholders} are documented inline.
@@ -104,7 +125,7 @@ MESSAGES: dict[str, dict[str, str]] = {
     MessageKey.SESSION_COMPLETE_SCORE: {
         "en": "Practice complete! You got {correct}/{total} correct. \U0001f3c6 See you tomorrow!",
         "bn": (
-            "অনুশীলন শেষ! তুমি {total}টির মধ্যে {correct}টি সঠিক করেছ। " "\U0001f3c6 কাল আবার এসো!"
+            "অনুশীলন শেষ! তুমি {total}টির মধ্যে {correct}টি সঠিক করেছ। \U0001f3c6 কাল আবার এসো!"
         ),
     },
     MessageKey.NO_ACTIVE_SESSION: {
@@ -159,12 +180,10 @@ MESSAGES: dict[str, dict[str, str]] = {
     # Shown when student is not registered — bilingual since language unknown
     MessageKey.REGISTER_FIRST: {
         "en": (
-            "Please type /start to register.\n"
-            "আপনাকে খুঁজে পাওয়া যাচ্ছে না। /start লিখে নিবন্ধন করুন।"
+            "Please type /start to register.\nআপনাকে খুঁজে পাওয়া যাচ্ছে না। /start লিখে নিবন্ধন করুন।"
         ),
         "bn": (
-            "Please type /start to register.\n"
-            "আপনাকে খুঁজে পাওয়া যাচ্ছে না। /start লিখে নিবন্ধন করুন।"
+            "Please type /start to register.\nআপনাকে খুঁজে পাওয়া যাচ্ছে না। /start লিখে নিবন্ধন করুন।"
         ),
     },
     MessageKey.NO_PROBLEMS_FOUND: {
@@ -267,17 +286,210 @@ MESSAGES: dict[str, dict[str, str]] = {
             "সব command দেখতে /help লেখো।"
         ),
     },
+    # {topics} — numbered topic list, one per line
+    MessageKey.TOPIC_PROMPT: {
+        "en": "Choose a topic to practice:\n\n{topics}\n\nReply with the number.",
+        "bn": "একটি বিষয় বেছে নাও:\n\n{topics}\n\nনম্বর দিয়ে উত্তর দাও।",
+    },
+    # {number} — hint number, {hint} — hint text, {remaining} — hints left
+    MessageKey.HINT_WITH_REMAINING: {
+        "en": "Hint {number}: {hint}\n({remaining} hints remaining)",
+        "bn": "Hint {number}: {hint}\n(আরও {remaining}টি hint বাকি আছে)",
+    },
+    MessageKey.REMINDER_FIRST_STREAK: {
+        "en": "\U0001f4da Ready to start your first streak? Complete today's practice!",
+        "bn": "\U0001f4da আজকের অনুশীলন সম্পন্ন করো এবং তোমার প্রথম ধারা শুরু করো!",
+    },
+    # {streak} — current streak in days
+    MessageKey.REMINDER_STREAK_AT_RISK: {
+        "en": (
+            "Your {streak}-day streak is at risk! "
+            "Complete today's practice to keep it alive. \U0001f525"
+        ),
+        "bn": "তোমার {streak} দিনের ধারা ঝুঁকিতে আছে! আজকের অনুশীলন সম্পন্ন করো। \U0001f525",
+    },
 }
 
 
-def get_message(key: MessageKey, language: str, **kwargs: str | int) -> str:
+@dataclass(frozen=True, slots=True)
+class CompiledTemplate:
+    """A message template parsed once when the catalog is built.
+
+    Attributes:
+        text: Raw template with {placeholder} fields.
+        fields: Placeholder names referenced by the template.
+    """
+
+    text: str
+    fields: frozenset[str]
+
+    @classmethod
+    def parse(cls, text: str) -> CompiledTemplate:
+        """Parse a str.format template.
+
+        Args:
+            text: Template text.
+
+        Returns:
+            CompiledTemplate with its placeholder names extracted.
+
+        Raises:
+            ValueError: If the template has unbalanced braces.
+        """
+        fields = frozenset(
+            name.split(".", 1)[0].split("[", 1)[0]
+            for _, name, _, _ in Formatter().parse(text)
+            if name is not None
+        )
+        return cls(text=text, fields=fields)
+
+    def render(self, kwargs: dict[str, Any]) -> str | None:
+        """Format the template, or return None if a placeholder is missing."""
+        if not self.fields:
+            return self.text
+        if not self.fields.issubset(kwargs):
+            return None
+        try:
+            return self.text.format(**kwargs)
+        except (KeyError, IndexError, ValueError):
+            return None
+
+
+def _compile(messages: dict[str, dict[str, str]]) -> dict[str, dict[str, CompiledTemplate]]:
+    return {
+        str(key): {lang: CompiledTemplate.parse(text) for lang, text in variants.items()}
+        for key, variants in messages.items()
+    }
+
+
+_DEFAULTS = _compile(MESSAGES)
+
+
+@dataclass(frozen=True)
+class MessageCatalog:
+    """Immutable snapshot of every message template in use.
+
+    Attributes:
+        version: Incremented each time a reload changes the catalog (0 = code defaults).
+        fingerprint: SHA-256 of the message_templates rows it was built from.
+        templates: {message key: {language: CompiledTemplate}}.
+        overrides: Keys whose text came from message_templates.
+        rejected: Keys whose rows were ignored (bad braces or unknown placeholders).
+        loaded_at: When this snapshot was built.
+    """
+
+    version: int
+    fingerprint: str
+    templates: dict[str, dict[str, CompiledTemplate]]
+    overrides: tuple[str, ...] = ()
+    rejected: tuple[str, ...] = ()
+    loaded_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+_catalog = MessageCatalog(version=0, fingerprint="", templates=_DEFAULTS)
+
+
+def get_message_catalog() -> MessageCatalog:
+    """Return the catalog snapshot get_message() currently reads from."""
+    return _catalog
+
+
+def _build_catalog(
+    rows: list[tuple[str, str, str]], version: int, fingerprint: str
+) -> MessageCatalog:
+    templates = dict(_DEFAULTS)
+    overrides: list[str] = []
+    rejected: list[str] = []
+    for key, message_en, message_bn in rows:
+        try:
+            compiled = {
+                lang: CompiledTemplate.parse(text)
+                for lang, text in (("en", message_en), ("bn", message_bn))
+                if text
+            }
+        except ValueError:
+            rejected.append(key)
+            continue
+
+        default = _DEFAULTS.get(key, {})
+        if default:
+            # An override may only use placeholders the calling code supplies.
+            allowed = frozenset().union(*(t.fields for t in default.values()))
+            if any(not t.fields <= allowed for t in compiled.values()):
+                rejected.append(key)
+                continue
+        if not compiled:
+            continue
+        templates[key] = {**default, **compiled}
+        overrides.append(key)
+
+    return MessageCatalog(
+        version=version,
+        fingerprint=fingerprint,
+        templates=templates,
+        overrides=tuple(overrides),
+        rejected=tuple(rejected),
+    )
+
+
+async def refresh_message_catalog(db: AsyncSession, force: bool = False) -> MessageCatalog:
+    """Reload message_templates into a new catalog if the table changed.
+
+    The table is small, so every row is read and fingerprinted; the catalog
+    is only rebuilt (and its version bumped) when the fingerprint differs
+    from the current one. Rows with unbalanced braces, or that use
+    placeholders the code default does not, are logged and skipped so an
+    editing mistake cannot break a message.
+
+    Args:
+        db: Async database session.
+        force: Rebuild even if the rows are unchanged.
+
+    Returns:
+        The catalog in effect after the refresh.
+    """
+    global _catalog
+    result = await db.execute(
+        select(
+            MessageTemplate.message_key, MessageTemplate.message_en, MessageTemplate.message_bn
+        ).order_by(MessageTemplate.message_key)
+    )
+    rows = [(key, en, bn) for key, en, bn in result.all()]
+    fingerprint = hashlib.sha256(
+        json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+
+    current = _catalog
+    if fingerprint == current.fingerprint and not force:
+        return current
+
+    catalog = _build_catalog(rows, current.version + 1, fingerprint)
+    _catalog = catalog
+    if catalog.rejected:
+        _logger.warning("message_catalog: rows rejected", keys=list(catalog.rejected))
+    _logger.info(
+        "message_catalog: reloaded",
+        version=catalog.version,
+        overrides=len(catalog.overrides),
+    )
+    return catalog
+
+
+def reset_message_catalog() -> None:
+    """Drop every override and go back to the code defaults (version 0)."""
+    global _catalog
+    _catalog = MessageCatalog(version=0, fingerprint="", templates=_DEFAULTS)
+
+
+def get_message(key: MessageKey | str, language: str, **kwargs: str | int) -> str:
     """Return the message for key in the requested language.
 
-    Falls back to English if the language is unsupported or the key has
-    no entry for that language.
+    Reads the current MessageCatalog, so wording edited in message_templates
+    applies after the next refresh. Falls back to English if the language
+    is unsupported or the key has no entry for that language.
 
     Args:
-        key: MessageKey enum value identifying the message template.
+        key: MessageKey (or message_templates key) identifying the template.
         language: Preferred language code ('en' or 'bn').
         **kwargs: Named substitution values for format placeholders.
 
@@ -285,17 +497,21 @@ def get_message(key: MessageKey, language: str, **kwargs: str | int) -> str:
         Formatted message string in the requested language.
     """
     lang = language if language in ("en", "bn") else _FALLBACK
-    variants = MESSAGES.get(key, {})
-    template = variants.get(lang) or variants.get(_FALLBACK) or str(key)
+    variants = _catalog.templates.get(key)
+    if variants is None:
+        return str(key)
+    template = variants.get(lang) or variants.get(_FALLBACK)
+    if template is None:
+        return str(key)
     if not kwargs:
-        return template
-    try:
-        return template.format(**kwargs)
-    except (KeyError, IndexError):
+        return template.text
+    message = template.render(kwargs)
+    if message is None:
         _logger.error(
             "get_message format error — missing placeholder kwarg",
             message_key=str(key),
             language=lang,
             provided_kwargs=list(kwargs.keys()),
         )
-        return template  # safe fallback: return unformatted template
+        return template.text  # safe fallback: return unformatted template
+    return message
@@ -0,0 +1,521 @@
+"""Transactional outbox for outgoing Telegram messages.
+
+Handlers used to call the Telegram API in the middle of request processing,
+and the reminder job sent first and committed its SentMessage row after,
+so a crash in between lost or duplicated messages, and every send held the
+transaction open. Messages now go through the outbox table:
+
+  - enqueue_message() inserts a row in the caller's transaction. The message
+    exists if and only if the business change committed. Each row carries
+    an idempotency key; enqueueing the same key again is a no-op, so a
+    redelivered webhook update or a re-run job cannot queue a duplicate.
+  - OutboxDispatcher, a background task in every process, claims due rows
+    in batches (FOR UPDATE SKIP LOCKED on PostgreSQL, so processes never
+    claim the same row), commits the claim, sends outside any transaction
+    at a capped rate, then marks each row sent or schedules a retry with
+    exponential backoff. Rows that fail OUTBOX_MAX_ATTEMPTS times are
+    marked failed.
+  - OUTBOX_RATE_PER_SECOND is one budget for the whole bot. Each process
+    reserves sends from a per-second row in rate_limit_counters before
+    using them, so all workers and replicas together stay under it.
+  - An HTTP 429 from Telegram is not a failed attempt: the batch stops, and
+    the throttled and unsent rows are handed back, due after the
+    retry_after Telegram asked for.
+  - Committing a session that enqueued a message wakes the local
+    dispatcher, so replies go out right after commit instead of at the
+    next poll.
+
+Delivery is at-least-once: if a process dies after Telegram accepted a
+message but before the row was marked sent, the claim lapses after
+OUTBOX_CLAIM_SECONDS and the message is sent again.
+
+The send budget uses wall-clock seconds, so it assumes process clocks agree
+to well within a second; skew lets a window's budget leak into the next.
+
+A live process never outlasts its own claim: a round claims at most half of
+what the rate cap can send in OUTBOX_CLAIM_SECONDS, stops sending once the
+claim is close to lapsing and hands the unsent rows back. Outcomes are
+written only if the row's attempts still match the claim, so a row that was
+re-claimed by another process is left to that process.
+
+Usage:
+    await enqueue_message(db, chat_id, reply, key=f"reply:{chat_id}:{message_id}")
+    # ...the caller commits; the dispatcher sends.
+"""
+
+import asyncio
+import contextlib
+import math
+import time
+import uuid
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any, Protocol
+
+from sqlalchemy import delete, event, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.config import get_settings
+from src.database import get_session_factory
+from src.logging import get_logger
+from src.metrics import OUTBOX_MESSAGES
+from src.models.outbox_message import OutboxMessage, OutboxStatus
+from src.models.rate_limit_counter import RateLimitCounter
+from src.services.telegram_client import TelegramRetryAfter
+
+logger = get_logger(__name__)
+
+# Retry backoff: _RETRY_BASE_SECONDS * 2**(attempts - 1), capped.
+_RETRY_BASE_SECONDS = 5
+_RETRY_MAX_SECONDS = 600
+
+# Sending stops this long before a claim lapses (at most half the claim):
+# longer than one send can take (TelegramClient times out after 5 s).
+_CLAIM_MARGIN_SECONDS = 10.0
+
+# rate_limit_counters key of the shared send budget for one epoch second.
+_SEND_BUDGET_KEY = "outbox:sends:{window}"
+
+# Session.info flag set by enqueue_message(); see _wake_after_commit().
+_ENQUEUED = "outbox_enqueued"
+
+
+class MessageSender(Protocol):
+    """Anything with TelegramClient's send_message().
+
+    send_message() raises TelegramRetryAfter when the bot is rate-limited.
+    """
+
+    async def send_message(self, chat_id: int, text: str) -> bool: ...
+
+
+async def enqueue_message(
+    db: AsyncSession, chat_id: int, text: str, key: str | None = None
+) -> None:
+    """Queue a Telegram message in the caller's transaction.
+
+    Nothing is sent until the caller commits.
+
+    Args:
+        db: Async database session (not committed here).
+        chat_id: Telegram chat to send to.
+        text: Message text.
+        key: Idempotency key; a second enqueue with the same key is ignored.
+            Defaults to a random key.
+    """
+    await enqueue_messages(db, [(chat_id, text, key)])
+
+
+async def enqueue_messages(
+    db: AsyncSession,
+    messages: Sequence[tuple[int, str, str | None]],
+    broadcast_id: int | None = None,
+) -> None:
+    """Queue several Telegram messages with one INSERT.
+
+    Args:
+        db: Async database session (not committed here).
+        messages: (chat_id, text, idempotency key or None) per message.
+        broadcast_id: Broadcast the messages belong to, if any.
+    """
+    if not messages:
+        return
+    dialect = db.get_bind().dialect.name
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    now = datetime.now(UTC)
+    await db.execute(
+        insert(OutboxMessage)
+        .values(
+            [
+                {
+                    "idempotency_key": key if key is not None else uuid.uuid4().hex,
+                    "chat_id": chat_id,
+                    "text": text,
+                    "status": OutboxStatus.PENDING,
+                    "attempts": 0,
+                    "next_attempt_at": now,
+                    "broadcast_id": broadcast_id,
+                }
+                for chat_id, text, key in messages
+            ]
+        )
+        .on_conflict_do_nothing(index_elements=[OutboxMessage.idempotency_key])
+    )
+    db.info[_ENQUEUED] = True
+
+
+async def purge_outbox(db: AsyncSession, older_than: timedelta) -> int:
+    """Delete sent and failed rows created more than older_than ago.
+
+    Args:
+        db: Async database session (not committed here).
+        older_than: Age after which settled rows are no longer needed.
+
+    Send budget windows that have ended are deleted too.
+
+    Returns:
+        Number of outbox rows deleted.
+    """
+    now = datetime.now(UTC)
+    result = await db.execute(
+        delete(OutboxMessage).where(
+            OutboxMessage.status.in_((OutboxStatus.SENT, OutboxStatus.FAILED)),
+            OutboxMessage.created_at < now - older_than,
+        )
+    )
+    await db.execute(
+        delete(RateLimitCounter).where(
+            RateLimitCounter.key.startswith(_SEND_BUDGET_KEY.format(window="")),
+            RateLimitCounter.expires_at <= now,
+        )
+    )
+    return int(result.rowcount or 0)  # type: ignore[attr-defined]
+
+
+def _retry_delay(attempts: int) -> float:
+    return float(min(_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0), _RETRY_MAX_SECONDS))
+
+
+class OutboxDispatcher:
+    """Sends pending outbox rows in the background.
+
+    Attributes:
+        batch_size: Rows claimed per round.
+        poll_seconds: Idle wait between rounds when nothing wakes the loop.
+        rate_per_second: Send cap shared by every process (0 disables it).
+        max_attempts: Failed sends after which a row is marked failed.
+        claim_seconds: How long a claimed row is reserved for this process.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        poll_seconds: float,
+        rate_per_second: float,
+        max_attempts: int,
+        claim_seconds: float,
+        sender: MessageSender | None = None,
+    ) -> None:
+        """Create an idle dispatcher.
+
+        Args:
+            batch_size: Rows claimed per round.
+            poll_seconds: Idle wait between rounds.
+            rate_per_second: Send cap shared by every process (0 disables it).
+            max_attempts: Failed sends after which a row is marked failed.
+            claim_seconds: How long a claimed row is reserved.
+            sender: Client used to send; a TelegramClient by default.
+        """
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.rate_per_second = rate_per_second
+        self.max_attempts = max_attempts
+        self.claim_seconds = claim_seconds
+        self._sender = sender
+        self._next_send_at = 0.0
+        self._budget_window = 0  # Epoch second the reserved sends belong to
+        self._budget = 0  # Sends reserved and not yet used in that second
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """True while the background task is alive."""
+        return self._task is not None and not self._task.done()
+
+    def notify(self) -> None:
+        """Wake the loop now (called after a commit that enqueued messages)."""
+        self._wake.set()
+
+    def start(self) -> None:
+        """Start the background loop (first round runs immediately)."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="outbox-dispatcher")
+
+    async def stop(self) -> None:
+        """Cancel the background loop; unsent rows stay pending."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def drain(self) -> int:
+        """Run rounds until the outbox has no due rows left.
+
+        Returns:
+            Number of rows sent.
+        """
+        sent = 0
+        while True:
+            async with get_session_factory()() as db:
+                claimed, delivered = await self.dispatch(db)
+            sent += delivered
+            if claimed < self._claim_limit():
+                return sent
+
+    async def dispatch(self, db: AsyncSession) -> tuple[int, int]:
+        """Claim one batch of due rows, send them and record the outcomes.
+
+        The claim and the outcomes are committed separately; no transaction
+        is open while messages are being sent.
+
+        Rows still unsent when the claim is about to lapse, or when Telegram
+        answers 429, are handed back instead of being sent. A 429 makes them
+        due again after Telegram's retry_after and costs no attempt.
+
+        Args:
+            db: Async database session (committed here).
+
+        Returns:
+            (rows claimed, rows sent).
+        """
+        margin = min(_CLAIM_MARGIN_SECONDS, self.claim_seconds / 2)
+        deadline = time.monotonic() + self.claim_seconds - margin
+        rows = await self._claim(db)
+        if not rows:
+            return 0, 0
+
+        sender = self._sender
+        if sender is None:
+            from src.services.telegram_client import TelegramClient
+
+            sender = self._sender = TelegramClient()
+
+        sent: list[tuple[int, int]] = []  # (id, attempts)
+        failed: list[tuple[int, int, str]] = []  # (id, attempts, error)
+        unsent: list[tuple[int, int]] = []  # (id, attempts)
+        retry_after = 0.0
+        for index, (row_id, chat_id, text, attempts) in enumerate(rows):
+            if retry_after or not await self._acquire(db, len(rows) - index, deadline):
+                # Throttled, or the claim is about to lapse: hand the rest back
+                unsent.append((row_id, attempts))
+                continue
+            try:
+                ok = await sender.send_message(chat_id, text)
+                error = "send_failed"
+            except TelegramRetryAfter as exc:
+                retry_after = max(exc.retry_after, 1.0)  # Non-zero: stops the batch
+                self._next_send_at = time.monotonic() + retry_after
+                unsent.append((row_id, attempts))
+                continue
+            except Exception as exc:
+                ok = False
+                error = type(exc).__name__
+            if ok:
+                sent.append((row_id, attempts))
+            else:
+                failed.append((row_id, attempts, error))
+
+        if retry_after:
+            OUTBOX_MESSAGES.inc("throttled", amount=len(unsent))
+            logger.warning("outbox_throttled", retry_after=retry_after, unsent=len(unsent))
+        elif unsent:
+            logger.warning("outbox_claim_expiring", unsent=len(unsent))
+        await self._settle(db, sent, failed, unsent, retry_after)
+        return len(rows), len(sent)
+
+    def _claim_limit(self) -> int:
+        """Rows per claim: never more than half the claim window can send."""
+        if self.rate_per_second <= 0:
+            return self.batch_size
+        return max(1, min(self.batch_size, int(self.rate_per_second * self.claim_seconds / 2)))
+
+    async def _claim(self, db: AsyncSession) -> list[Any]:
+        now = datetime.now(UTC)
+        due = (
+            select(OutboxMessage.id)
+            .where(
+                OutboxMessage.status == OutboxStatus.PENDING,
+                OutboxMessage.next_attempt_at <= now,
+            )
+            .order_by(OutboxMessage.id)
+            .limit(self._claim_limit())
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(due))
+            .values(
+                attempts=OutboxMessage.attempts + 1,
+                next_attempt_at=now + timedelta(seconds=self.claim_seconds),
+            )
+            .returning(
+                OutboxMessage.id, OutboxMessage.chat_id, OutboxMessage.text, OutboxMessage.attempts
+            )
+            .execution_options(synchronize_session=False)
+        )
+        rows = sorted(result.all())
+        await db.commit()
+        return rows
+
+    async def _settle(
+        self,
+        db: AsyncSession,
+        sent: list[tuple[int, int]],
+        failed: list[tuple[int, int, str]],
+        unsent: list[tuple[int, int]],
+        retry_after: float = 0.0,
+    ) -> None:
+        """Record outcomes for rows this process still holds.
+
+        Every update matches (id, attempts) as claimed: if the claim lapsed
+        and another process re-claimed the row, attempts has moved on and
+        the row is left alone. Unsent rows become due after retry_after
+        seconds.
+        """
+        now = datetime.now(UTC)
+        if sent:
+            await db.execute(
+                update(OutboxMessage)
+                .where(tuple_(OutboxMessage.id, OutboxMessage.attempts).in_(sent))
+                .values(status=OutboxStatus.SENT, sent_at=now, last_error=None)
+                .execution_options(synchronize_session=False)
+            )
+            OUTBOX_MESSAGES.inc("sent", amount=len(sent))
+        if unsent:
+            # Never attempted: give the attempt back and make the rows due again
+            await db.execute(
+                update(OutboxMessage)
+                .where(tuple_(OutboxMessage.id, OutboxMessage.attempts).in_(unsent))
+                .values(
+                    attempts=OutboxMessage.attempts - 1,
+                    next_attempt_at=now + timedelta(seconds=retry_after),
+                )
+                .execution_options(synchronize_session=False)
+            )
+        for row_id, attempts, error in failed:
+            gave_up = attempts >= self.max_attempts
+            values: dict[str, Any] = {"last_error": error}
+            if gave_up:
+                values["status"] = OutboxStatus.FAILED
+            else:
+                values["next_attempt_at"] = now + timedelta(seconds=_retry_delay(attempts))
+            await db.execute(
+                update(OutboxMessage)
+                .where(OutboxMessage.id == row_id, OutboxMessage.attempts == attempts)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            OUTBOX_MESSAGES.inc("failed" if gave_up else "retry")
+            log = logger.error if gave_up else logger.warning
+            log("outbox_send_failed", outbox_id=row_id, attempts=attempts, gave_up=gave_up)
+        await db.commit()
+
+    async def _acquire(self, db: AsyncSession, remaining: int, deadline: float) -> bool:
+        """Wait for the next send slot, from the local pace and the shared budget.
+
+        Args:
+            db: Async database session (each reservation is committed).
+            remaining: Rows of this batch still to send.
+            deadline: time.monotonic() after which no more rows may be sent.
+
+        Returns:
+            True if one send may go ahead now; False once the deadline passes.
+        """
+        while True:
+            await self._throttle(deadline)
+            if time.monotonic() >= deadline:
+                return False
+            if self.rate_per_second <= 0:
+                return True
+            window = int(time.time())
+            if window != self._budget_window:
+                # Unused sends of an earlier second are not carried over
+                self._budget_window, self._budget = window, 0
+            if not self._budget:
+                self._budget = await self._reserve(db, window, remaining)
+            if self._budget:
+                self._budget -= 1
+                return True
+            # This second's budget is spent by other processes
+            await asyncio.sleep(max(0.0, window + 1 - time.time()))
+
+    async def _reserve(self, db: AsyncSession, window: int, remaining: int) -> int:
+        """Reserve sends from the shared budget of one epoch second.
+
+        Asks for no more than this process can send before the second ends,
+        and adds the request to the window's row with one upsert, so
+        concurrent processes never get more than the budget between them.
+
+        Args:
+            db: Async database session (committed here).
+            window: Epoch second to reserve in.
+            remaining: Rows of this batch still to send.
+
+        Returns:
+            Sends granted (0 if the second's budget is spent).
+        """
+        limit = max(1, round(self.rate_per_second))
+        left_in_window = max(0.0, window + 1 - time.time())
+        wanted = max(1, min(remaining, limit, math.ceil(self.rate_per_second * left_in_window)))
+        dialect = db.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(RateLimitCounter).values(
+            key=_SEND_BUDGET_KEY.format(window=window),
+            count=wanted,
+            expires_at=datetime.fromtimestamp(window + 1, tz=UTC),
+        )
+        total = (
+            await db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[RateLimitCounter.key],
+                    set_={"count": RateLimitCounter.count + stmt.excluded.count},
+                ).returning(RateLimitCounter.count)
+            )
+        ).scalar_one()
+        await db.commit()
+        return max(0, min(wanted, limit - (total - wanted)))
+
+    async def _throttle(self, deadline: float = math.inf) -> None:
+        """Pace this process's sends at rate_per_second, waking by deadline."""
+        now = time.monotonic()
+        if self._next_send_at > now:
+            await asyncio.sleep(min(self._next_send_at, deadline) - now)
+            if time.monotonic() >= deadline:
+                return
+        if self.rate_per_second > 0:
+            now = time.monotonic()
+            self._next_send_at = max(now, self._next_send_at) + 1 / self.rate_per_second
+
+    async def _run(self) -> None:
+        while True:
+            self._wake.clear()
+            try:
+                await self.drain()
+            except Exception as exc:
+                logger.error("outbox_dispatch_failed", error=type(exc).__name__)
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_seconds)
+
+
+_dispatcher: OutboxDispatcher | None = None
+
+
+def get_outbox_dispatcher() -> OutboxDispatcher:
+    """Return the process-wide dispatcher (created on first use)."""
+    global _dispatcher
+    if _dispatcher is None:
+        settings = get_settings()
+        _dispatcher = OutboxDispatcher(
+            batch_size=settings.outbox_batch_size,
+            poll_seconds=settings.outbox_poll_seconds,
+            rate_per_second=settings.outbox_rate_per_second,
+            max_attempts=settings.outbox_max_attempts,
+            claim_seconds=settings.outbox_claim_seconds,
+        )
+    return _dispatcher
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_after_commit(session: Session) -> None:
+    if session.info.pop(_ENQUEUED, False) and _dispatcher is not None:
+        _dispatcher.notify()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_after_rollback(session: Session) -> None:
+    session.info.pop(_ENQUEUED, None)
@@ -0,0 +1,285 @@
+"""Validation, hashing and parsing helpers for YAML problem content.
+
+Shared by scripts/seed_problems.py and the content bundle compiler
+(src/services/content_bundle.py):
+
+  - validate_and_transform_problem(): raw YAML problem -> problems row.
+  - find_problem_files(): the YAML files under PROBLEMS_DIR.
+  - file_sha256(): hash of a YAML file's bytes, recorded in the content
+    manifest so unchanged files are skipped without being parsed.
+  - parse_problem_files(): YAML -> lists of raw problem dicts, parsed in a
+    process pool across files.
+  - problem_content_key(): stable identity of a problem (grade, topic,
+    question_en); the ON CONFLICT target when upserting.
+  - problem_content_hash(): hash of every seeded field, so an upsert only
+    rewrites rows whose content actually changed.
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# YAML problem files live in PROBLEMS_DIR/grade_*/<topic>.yaml.
+PROBLEMS_DIR = Path(__file__).resolve().parent.parent.parent / "content" / "problems"
+
+# libyaml's C loader is ~10x faster than the pure-Python one when available.
+_YamlLoader: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Fields covered by problem_content_hash(); any change to one of these is
+# applied to the existing row in place.
+HASHED_FIELDS = (
+    "grade",
+    "topic",
+    "subtopic",
+    "question_en",
+    "question_bn",
+    "answer",
+    "hints",
+    "difficulty",
+    "answer_type",
+    "acceptable_tolerance_percent",
+    "multiple_choice_options",
+)
+
+
+def file_sha256(path: Path | str) -> str:
+    """Return the hex SHA-256 of a file's contents.
+
+    Args:
+        path: File to hash.
+
+    Returns:
+        64-character hex digest.
+    """
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def parse_problem_file(path: str) -> list[dict[str, Any]] | None:
+    """Parse one YAML problem file.
+
+    Handles two YAML top-level formats:
+    - List format:  ``- grade: 6\\n  topic: ...``  (most files)
+    - Dict wrapper: ``problems:\\n  - grade: 6\\n    ...``  (some files)
+
+    Args:
+        path: Path of the YAML file.
+
+    Returns:
+        List of raw problem dicts, or None if the file is empty or has an
+        unexpected structure (a warning is logged).
+    """
+    with open(path, encoding="utf-8") as fh:
+        # Safe loaders only: CSafeLoader or SafeLoader.
+        data = yaml.load(fh, Loader=_YamlLoader)
+    if not data:
+        logger.warning("Empty YAML file: %s", path)
+        return None
+    # Normalise: unwrap ``{problems: [...]}`` wrapper if present.
+    if isinstance(data, dict):
+        if "problems" in data and isinstance(data["problems"], list):
+            return list(data["problems"])
+        logger.warning(
+            "Unexpected dict structure in %s (keys: %s) — skipping.", path, list(data.keys())
+        )
+        return None
+    if not isinstance(data, list):
+        logger.warning("Unexpected YAML type %s in %s — skipping.", type(data), path)
+        return None
+    return data
+
+
+def convert_hints(raw_hints: list[dict[str, str]]) -> list[dict[str, object]]:
+    """Convert YAML hint format to DB JSON format.
+
+    YAML format:
+        hints:
+          - en: "Hint in English."
+            bn: "ইঙ্গিত বাংলায়।"
+
+    DB format:
+        [{"hint_number": 1, "text_en": "...", "text_bn": "...", "is_ai_generated": false}]
+
+    Args:
+        raw_hints: List of dicts with keys 'en' and 'bn'.
+
+    Returns:
+        List of structured hint dicts with 1-based hint_number.
+    """
+    converted: list[dict[str, object]] = []
+    for i, hint in enumerate(raw_hints, start=1):
+        converted.append(
+            {
+                "hint_number": i,
+                "text_en": hint.get("en", ""),
+                "text_bn": hint.get("bn", ""),
+                "is_ai_generated": False,
+            }
+        )
+    return converted
+
+
+def validate_and_transform_problem(raw: dict[str, Any], source_file: str) -> dict[str, Any]:
+    """Validate a raw YAML problem dict and transform it to DB insert format.
+
+    Args:
+        raw: Raw dict loaded from YAML.
+        source_file: Path of source YAML file (for error messages).
+
+    Returns:
+        Dict suitable for constructing a Problem ORM instance.
+
+    Raises:
+        ValueError: If required fields are missing or invalid.
+    """
+    # Required fields
+    for field in ("grade", "topic", "question_en", "question_bn", "answer", "hints"):
+        if field not in raw:
+            raise ValueError(
+                f"Problem in {source_file} is missing required field '{field}'. "
+                f"Problem: {raw.get('question_en', '<no question_en>')!r}"
+            )
+
+    raw_hints = raw["hints"]
+    if not isinstance(raw_hints, list) or len(raw_hints) == 0:
+        raise ValueError(
+            f"Problem in {source_file} has empty or invalid 'hints'. "
+            f"Must be a non-empty list of {{en, bn}} dicts."
+        )
+
+    answer_type = str(raw.get("answer_type", "numeric"))
+    if answer_type not in ("numeric", "multiple_choice", "text"):
+        logger.warning(
+            "Unknown answer_type '%s' in %s — defaulting to 'numeric'",
+            answer_type,
+            source_file,
+        )
+        answer_type = "numeric"
+
+    return {
+        "grade": int(raw["grade"]),
+        "topic": str(raw["topic"]),
+        "subtopic": str(raw["subtopic"]) if raw.get("subtopic") else None,
+        "question_en": str(raw["question_en"]),
+        "question_bn": str(raw["question_bn"]),
+        "answer": str(raw["answer"]),
+        "hints": convert_hints(raw_hints),
+        "difficulty": int(raw.get("difficulty", 1)),
+        "answer_type": answer_type,
+        "acceptable_tolerance_percent": (
+            float(raw["acceptable_tolerance_percent"])
+            if raw.get("acceptable_tolerance_percent") is not None
+            else None
+        ),
+        "multiple_choice_options": (
+            list(raw["multiple_choice_options"])
+            if raw.get("multiple_choice_options") is not None
+            else None
+        ),
+    }
+
+
+def find_problem_files(grade_filter: int | None = None) -> list[str]:
+    """Return the sorted YAML problem file paths under PROBLEMS_DIR.
+
+    Args:
+        grade_filter: If set, only return files for this grade level.
+
+    Returns:
+        Sorted list of file paths (empty if none match).
+    """
+    pattern = (
+        str(PROBLEMS_DIR / f"grade_{grade_filter}" / "*.yaml")
+        if grade_filter is not None
+        else str(PROBLEMS_DIR / "grade_*" / "*.yaml")
+    )
+    files = sorted(glob.glob(pattern))
+    if not files:
+        logger.warning("No YAML files matched pattern: %s", pattern)
+    return files
+
+
+def parse_problem_files(
+    file_paths: list[str], workers: int | None = None
+) -> list[tuple[str, list[dict[str, Any]]]]:
+    """Parse YAML problem files, in parallel across processes.
+
+    Args:
+        file_paths: Files to parse.
+        workers: Worker processes (default: one per CPU, capped at the number
+            of files). 1 parses serially in this process.
+
+    Returns:
+        List of (file_path, list_of_raw_problem_dicts) tuples in input order,
+        omitting empty or malformed files.
+    """
+    if workers is None:
+        workers = min(len(file_paths), os.cpu_count() or 1)
+
+    if workers <= 1 or len(file_paths) <= 1:
+        parsed = [parse_problem_file(path) for path in file_paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(parse_problem_file, file_paths))
+
+    return [
+        (path, problems)
+        for path, problems in zip(file_paths, parsed, strict=True)
+        if problems is not None
+    ]
+
+
+def content_source_path(file_path: Path | str) -> str:
+    """Return a content file's path relative to PROBLEMS_DIR, in POSIX form.
+
+    This is the key used by the content manifest and the content bundle.
+
+    Args:
+        file_path: Path of a YAML file (absolute or relative to the cwd).
+
+    Returns:
+        e.g. "grade_7/percentages.yaml"; the absolute path for files
+        outside PROBLEMS_DIR.
+    """
+    path = Path(file_path).resolve()
+    try:
+        return path.relative_to(PROBLEMS_DIR).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def problem_content_key(grade: int, topic: str, question_en: str) -> str:
+    """Return the stable identity hash of a problem.
+
+    Args:
+        grade: Grade level.
+        topic: Topic name.
+        question_en: English question text.
+
+    Returns:
+        64-character hex digest of (grade, topic, question_en).
+    """
+    raw = json.dumps([grade, topic, question_en], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def problem_content_hash(problem: dict[str, Any]) -> str:
+    """Return a hash of every seeded field of a transformed problem.
+
+    Args:
+        problem: Problem dict as produced by the seed script's transform step.
+
+    Returns:
+        64-character hex digest; equal digests mean identical content.
+    """
+    payload = {field: problem.get(field) for field in HASHED_FIELDS}
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
@@ -0,0 +1,359 @@
+"""Shared, restart-safe rate-limit storage for slowapi (SEC-005).
+
+slowapi's default memory:// storage is per process: the 10/day hint limit
+reset on every deploy and each worker enforced it separately. This module
+provides a limits storage backend, registered as "dars-sql://", that keeps
+fixed-window counters in memory and syncs them through the
+rate_limit_counters table:
+
+  - Hits only touch memory, so rate limiting adds no DB round trip.
+  - flush(), run by the scheduler every few seconds and on shutdown, adds
+    each key's unsynced hits to its row with an atomic upsert and reads
+    back the combined count, so every worker sees the other workers' hits.
+  - load(), run at startup, restores counters for windows still open.
+
+Trade-off: between flushes each worker only sees its own new hits, so a
+limit can be exceeded by at most (workers - 1) x hits-per-flush-interval.
+
+The backend is chosen with RATE_LIMIT_STORAGE_URI; any limits URI
+(memory://, redis://...) also works.
+
+Usage:
+    from src.services.rate_limits import create_limiter
+
+    limiter = create_limiter(key_func=get_remote_address)
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from limits.storage import Storage
+from slowapi import Limiter
+from sqlalchemy import case, delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import get_settings
+from src.models.rate_limit_counter import RateLimitCounter
+
+# Keys written or read per statement during flush().
+_FLUSH_BATCH_SIZE = 500
+
+
+class _Counter:
+    """Counter for one key: hits synced from the DB plus local unsynced hits.
+
+    in_flight holds hits a running flush() is writing; they count towards
+    the limit until the shared count that includes them is adopted.
+    """
+
+    __slots__ = ("expires_at", "in_flight", "pending", "synced")
+
+    def __init__(self, expires_at: float, synced: int = 0) -> None:
+        self.synced = synced
+        self.pending = 0
+        self.in_flight = 0
+        self.expires_at = expires_at
+
+    @property
+    def total(self) -> int:
+        return self.synced + self.in_flight + self.pending
+
+
+def _to_epoch(value: datetime) -> float:
+    # SQLite returns naive datetimes; expires_at is always stored as UTC.
+    return (value if value.tzinfo else value.replace(tzinfo=UTC)).timestamp()
+
+
+def _to_datetime(epoch: float) -> datetime:
+    return datetime.fromtimestamp(epoch, tz=UTC)
+
+
+class BatchedCounterStore:
+    """Fixed-window counters held in memory and synced to rate_limit_counters.
+
+    Thread-safe: slowapi may count hits from sync routes running in the
+    threadpool while flush() runs on the event loop.
+
+    Attributes:
+        _counters: key -> _Counter for windows that have not expired.
+        _cleared: Keys reset locally whose rows must be deleted on flush().
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        """Initialise an empty store.
+
+        Args:
+            clock: Wall-clock time source in epoch seconds (injectable for tests).
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._counters: dict[str, _Counter] = {}
+        self._cleared: set[str] = set()
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        """Count amount hits on key, starting a new window if needed.
+
+        Args:
+            key: Rate-limit key.
+            expiry: Window length in seconds.
+            amount: Number of hits.
+
+        Returns:
+            Hits in the current window, including other workers' synced hits.
+        """
+        now = self._clock()
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is None or counter.expires_at <= now:
+                counter = self._counters[key] = _Counter(now + expiry)
+            counter.pending += amount
+            return counter.total
+
+    def get(self, key: str) -> int:
+        """Return hits in key's current window (0 if none)."""
+        counter = self._counters.get(key)
+        if counter is None or counter.expires_at <= self._clock():
+            return 0
+        return counter.total
+
+    def get_expiry(self, key: str) -> float:
+        """Return the epoch time key's current window ends."""
+        counter = self._counters.get(key)
+        return counter.expires_at if counter is not None else self._clock()
+
+    def clear(self, key: str) -> None:
+        """Reset key here and, on the next flush(), in the shared table."""
+        with self._lock:
+            self._counters.pop(key, None)
+            self._cleared.add(key)
+
+    def reset(self) -> int:
+        """Forget every local counter without touching the shared table.
+
+        Returns:
+            Number of counters dropped.
+        """
+        with self._lock:
+            dropped = len(self._counters)
+            self._counters.clear()
+            self._cleared.clear()
+            return dropped
+
+    @property
+    def pending(self) -> int:
+        """Number of keys with hits not yet written by flush()."""
+        return sum(1 for counter in self._counters.values() if counter.pending)
+
+    @property
+    def active(self) -> bool:
+        """True if flush() has anything to write, clear or refresh."""
+        return bool(self._counters or self._cleared)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of store statistics.
+
+        Returns:
+            Dict with keys "keys" and "pending".
+        """
+        return {"keys": len(self._counters), "pending": self.pending}
+
+    async def load(self, db: AsyncSession) -> int:
+        """Restore counters for windows that are still open.
+
+        Args:
+            db: Async database session.
+
+        Returns:
+            Number of counters loaded.
+        """
+        now = self._clock()
+        result = await db.execute(
+            select(RateLimitCounter.key, RateLimitCounter.count, RateLimitCounter.expires_at).where(
+                RateLimitCounter.expires_at > _to_datetime(now)
+            )
+        )
+        rows = result.all()
+        with self._lock:
+            for key, count, expires_at in rows:
+                self._apply(key, count, _to_epoch(expires_at), now)
+        return len(rows)
+
+    async def flush(self, db: AsyncSession) -> int:
+        """Write unsynced hits, refresh every live counter and commit.
+
+        Hits being written stay counted as in flight until the commit
+        succeeds and the shared counts are adopted. If a statement or the
+        commit fails, they go back to pending so the next flush retries them.
+
+        Args:
+            db: Async database session (committed here).
+
+        Returns:
+            Number of keys whose hits were written.
+        """
+        now = self._clock()
+        with self._lock:
+            for key in [k for k, c in self._counters.items() if c.expires_at <= now]:
+                del self._counters[key]
+            batch = {
+                key: (counter.pending, counter.expires_at)
+                for key, counter in self._counters.items()
+                if counter.pending
+            }
+            for key, (amount, _) in batch.items():
+                self._counters[key].in_flight += amount
+                self._counters[key].pending = 0
+            idle = [key for key in self._counters if key not in batch]
+            cleared, self._cleared = self._cleared, set()
+
+        try:
+            if cleared:
+                await db.execute(delete(RateLimitCounter).where(RateLimitCounter.key.in_(cleared)))
+            synced = await self._upsert(db, batch, now)
+            synced.update(await self._refresh(db, idle))
+            await db.execute(
+                delete(RateLimitCounter).where(RateLimitCounter.expires_at <= _to_datetime(now))
+            )
+            await db.commit()
+        except Exception:
+            with self._lock:
+                for key, (amount, expires_at) in batch.items():
+                    counter = self._counters.get(key)
+                    if counter is None:
+                        counter = self._counters[key] = _Counter(expires_at)
+                    counter.in_flight = max(0, counter.in_flight - amount)
+                    counter.pending += amount
+                self._cleared |= cleared
+            raise
+
+        with self._lock:
+            for key, (count, expires_at) in synced.items():
+                self._apply(key, count, expires_at, now, batch.get(key, (0, 0.0))[0])
+        return len(batch)
+
+    def _apply(self, key: str, count: int, expires_at: float, now: float, flushed: int = 0) -> None:
+        """Adopt the shared count and window for key (caller holds the lock).
+
+        Args:
+            key: Rate-limit key.
+            count: Shared count, including the flushed hits.
+            expires_at: Shared window end in epoch seconds.
+            now: Time the flush or load started.
+            flushed: In-flight hits of this worker that count already includes.
+        """
+        counter = self._counters.get(key)
+        if counter is not None:
+            counter.in_flight = max(0, counter.in_flight - flushed)
+        if expires_at <= now:
+            return
+        if counter is None:
+            self._counters[key] = _Counter(expires_at, synced=count)
+            return
+        counter.synced = count
+        counter.expires_at = expires_at
+
+    async def _upsert(
+        self, db: AsyncSession, batch: dict[str, tuple[int, float]], now: float
+    ) -> dict[str, tuple[int, float]]:
+        """Add batch deltas to their rows, restarting rows whose window ended."""
+        dialect = db.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        expired = RateLimitCounter.expires_at <= _to_datetime(now)
+        synced: dict[str, tuple[int, float]] = {}
+        items = list(batch.items())
+        for start in range(0, len(items), _FLUSH_BATCH_SIZE):
+            stmt = insert(RateLimitCounter).values(
+                [
+                    {"key": key, "count": amount, "expires_at": _to_datetime(expires_at)}
+                    for key, (amount, expires_at) in items[start : start + _FLUSH_BATCH_SIZE]
+                ]
+            )
+            upsert = stmt.on_conflict_do_update(
+                index_elements=[RateLimitCounter.key],
+                set_={
+                    "count": case(
+                        (expired, stmt.excluded.count),
+                        else_=RateLimitCounter.count + stmt.excluded.count,
+                    ),
+                    "expires_at": case(
+                        (expired, stmt.excluded.expires_at),
+                        else_=RateLimitCounter.expires_at,
+                    ),
+                },
+            ).returning(RateLimitCounter.key, RateLimitCounter.count, RateLimitCounter.expires_at)
+            for key, count, expires_at in (await db.execute(upsert)).all():
+                synced[key] = (count, _to_epoch(expires_at))
+        return synced
+
+    async def _refresh(self, db: AsyncSession, keys: list[str]) -> dict[str, tuple[int, float]]:
+        """Read the shared counts of keys this worker has no new hits for."""
+        synced: dict[str, tuple[int, float]] = {}
+        for start in range(0, len(keys), _FLUSH_BATCH_SIZE):
+            result = await db.execute(
+                select(
+                    RateLimitCounter.key, RateLimitCounter.count, RateLimitCounter.expires_at
+                ).where(RateLimitCounter.key.in_(keys[start : start + _FLUSH_BATCH_SIZE]))
+            )
+            for key, count, expires_at in result.all():
+                synced[key] = (count, _to_epoch(expires_at))
+        return synced
+
+
+_store = BatchedCounterStore()
+
+
+def get_rate_limit_store() -> BatchedCounterStore:
+    """Return the process-wide store shared by every "dars-sql://" limiter."""
+    return _store
+
+
+class BatchedSQLStorage(Storage):
+    """limits storage backend delegating to the process-wide BatchedCounterStore.
+
+    Supports the fixed-window strategy, which both slowapi limiters use.
+    """
+
+    STORAGE_SCHEME = ["dars-sql"]  # noqa: RUF012 - limits declares it as a plain attribute
+
+    def __init__(self, uri: str | None = None, wrap_exceptions: bool = False, **options: Any):
+        self._store = get_rate_limit_store()
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return ValueError
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        return self._store.incr(key, expiry, amount)
+
+    def get(self, key: str) -> int:
+        return self._store.get(key)
+
+    def get_expiry(self, key: str) -> float:
+        return self._store.get_expiry(key)
+
+    def check(self) -> bool:
+        return True
+
+    def reset(self) -> int | None:
+        return self._store.reset()
+
+    def clear(self, key: str) -> None:
+        self._store.clear(key)
+
+
+def create_limiter(key_func: Callable[..., str]) -> Limiter:
+    """Build a slowapi Limiter on the configured storage backend.
+
+    Args:
+        key_func: Function mapping a request to its rate-limit identifier.
+
+    Returns:
+        Limiter using RATE_LIMIT_STORAGE_URI (default "dars-sql://").
+    """
+    return Limiter(key_func=key_func, storage_uri=get_settings().rate_limit_storage_uri)
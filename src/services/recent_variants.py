@@ -0,0 +1,191 @@
+"""In-memory tracker of recently sent message variants (REQ-013).
+
+PHASE6-B-2 stored every encouragement variant in sent_messages and queried
+it with a LIKE on each selection — two round trips to pick a string. This
+module keeps a small ring buffer of (message_key, sent_at) per student
+instead:
+
+  - Hydrated lazily: the first selection for a student in this process
+    loads that student's sent_messages rows from the last 7 days once.
+  - Pure memory after that: selection filters the buffer, no queries.
+  - Write-behind: sends are queued and persisted to sent_messages in one
+    batch by flush(), which the scheduler runs every few seconds and the
+    app runs on shutdown, so the 7-day history survives restarts.
+
+Trade-off: sends recorded after the last flush are lost if the process
+crashes, so those variants may repeat once. With several workers, each
+keeps its own buffer and sees the others' sends only once they are flushed.
+"""
+
+import logging
+from collections import OrderedDict, deque
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.sent_message import SentMessage
+
+logger = logging.getLogger(__name__)
+
+# Non-repeat window for encouragement variants (REQ-013).
+RECENT_WINDOW = timedelta(days=7)
+
+# Entries kept per student. Pools hold 3 variants under 3 prefixes, so this
+# covers several full cycles; older sends only matter once a pool is exhausted.
+_BUFFER_SIZE = 32
+
+# Students kept in memory; the least recently used are dropped (and
+# re-hydrated from the DB if they come back).
+_MAX_STUDENTS = 10_000
+
+
+class RecentVariantTracker:
+    """Per-student ring buffers of sent message keys with write-behind persistence.
+
+    Attributes:
+        _buffers: student_id -> deque of (message_key, sent_at), LRU-ordered.
+        _pending: Sends not yet written to sent_messages.
+    """
+
+    def __init__(self, max_students: int = _MAX_STUDENTS) -> None:
+        """Initialise an empty tracker.
+
+        Args:
+            max_students: Maximum number of students held in memory.
+        """
+        self._max_students = max_students
+        self._buffers: OrderedDict[int, deque[tuple[str, datetime]]] = OrderedDict()
+        self._pending: list[tuple[int, str, datetime]] = []
+        self._hydrations = 0
+
+    async def recent_keys(self, db: AsyncSession, student_id: int, prefix: str) -> set[str]:
+        """Return message keys starting with prefix sent within RECENT_WINDOW.
+
+        Queries sent_messages only the first time a student is seen by this
+        tracker (or after LRU eviction).
+
+        Args:
+            db: Async database session, used for hydration only.
+            student_id: Student primary key.
+            prefix: Message type prefix, e.g. "correct_streak_low".
+
+        Returns:
+            Set of recently sent keys like {"correct_streak_low_0"}.
+        """
+        buffer = self._buffers.get(student_id)
+        if buffer is None:
+            buffer = await self._hydrate(db, student_id)
+        else:
+            self._buffers.move_to_end(student_id)
+
+        cutoff = datetime.now(UTC) - RECENT_WINDOW
+        match = f"{prefix}_"
+        return {key for key, sent_at in buffer if sent_at >= cutoff and key.startswith(match)}
+
+    def record(self, student_id: int, message_key: str) -> None:
+        """Remember a send and queue it for the next flush().
+
+        Args:
+            student_id: Student primary key.
+            message_key: Variant key, e.g. "incorrect_2".
+        """
+        sent_at = datetime.now(UTC)
+        buffer = self._buffers.get(student_id)
+        if buffer is not None:
+            buffer.append((message_key, sent_at))
+        self._pending.append((student_id, message_key, sent_at))
+
+    async def flush(self, db: AsyncSession) -> int:
+        """Write queued sends to sent_messages in one batch.
+
+        Rows are flushed but not committed; the caller commits. If the
+        insert fails the rows are re-queued, except on an integrity error
+        (e.g. a student deleted meanwhile), where the batch is dropped so
+        one bad row cannot block every later flush.
+
+        Args:
+            db: Async database session.
+
+        Returns:
+            Number of rows written.
+        """
+        batch, self._pending = self._pending, []
+        if not batch:
+            return 0
+        db.add_all(
+            SentMessage(student_id=student_id, message_key=key, sent_at=sent_at)
+            for student_id, key, sent_at in batch
+        )
+        try:
+            await db.flush()
+        except IntegrityError:
+            logger.warning(
+                "sent_messages_flush_dropped",
+                extra={"event": "recent_variants.flush_dropped", "rows": len(batch)},
+            )
+            raise
+        except Exception:
+            self._pending[:0] = batch
+            raise
+        return len(batch)
+
+    @property
+    def pending(self) -> int:
+        """Number of sends waiting for flush()."""
+        return len(self._pending)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of tracker statistics.
+
+        Returns:
+            Dict with keys "students", "pending" and "hydrations".
+        """
+        return {
+            "students": len(self._buffers),
+            "pending": len(self._pending),
+            "hydrations": self._hydrations,
+        }
+
+    def clear(self) -> None:
+        """Forget every buffer and drop unflushed sends."""
+        self._buffers.clear()
+        self._pending.clear()
+        self._hydrations = 0
+
+    async def _hydrate(self, db: AsyncSession, student_id: int) -> deque[tuple[str, datetime]]:
+        cutoff = datetime.now(UTC) - RECENT_WINDOW
+        result = await db.execute(
+            select(SentMessage.message_key, SentMessage.sent_at)
+            .where(SentMessage.student_id == student_id, SentMessage.sent_at >= cutoff)
+            .order_by(SentMessage.sent_at)
+        )
+        rows = result.all()
+        self._hydrations += 1
+
+        # Another coroutine may have hydrated this student while we awaited.
+        existing = self._buffers.get(student_id)
+        if existing is not None:
+            return existing
+
+        buffer: deque[tuple[str, datetime]] = deque(maxlen=_BUFFER_SIZE)
+        for key, sent_at in rows:
+            # SQLite returns naive datetimes; sent_at is always stored as UTC.
+            buffer.append((key, sent_at if sent_at.tzinfo else sent_at.replace(tzinfo=UTC)))
+        # Sends queued before an eviction are not in the DB yet.
+        buffer.extend((key, at) for sid, key, at in self._pending if sid == student_id)
+
+        self._buffers[student_id] = buffer
+        if len(self._buffers) > self._max_students:
+            self._buffers.popitem(last=False)
+        return buffer
+
+
+_tracker = RecentVariantTracker()
+
+
+def get_recent_variants() -> RecentVariantTracker:
+    """Return the process-wide tracker shared by EncouragementService instances."""
+    return _tracker
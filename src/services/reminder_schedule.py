@@ -0,0 +1,120 @@
+"""Per-student daily reminder times (REQ-011).
+
+Reminders used to go out from one cron at 12:30 UTC (18:00 IST), so every
+student was pinged in the same minute and many opened /practice together,
+a synchronised spike on the database, Claude and Telegram. Each student
+now has a timezone and a preferred local hour (18 by default), and:
+
+  - Within that hour a student's slot is offset by student_id modulo
+    REMINDER_SPREAD_MINUTES, so students with the same preference are
+    spread evenly over the hour instead of sharing one minute.
+  - next_reminder_at holds the next slot in UTC. The reminder job runs
+    every minute and reads only the rows now due, through an index on
+    next_reminder_at, REMINDER_BUCKET_SIZE rows per query until none are due.
+  - After a student is handled (reminded or skipped), next_reminder_at
+    moves to the following day's slot.
+
+Unknown timezone names fall back to Asia/Kolkata.
+"""
+
+import functools
+from datetime import UTC, datetime, time, timedelta, timezone, tzinfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.student import Student
+
+DEFAULT_TIMEZONE = "Asia/Kolkata"
+
+# Used only if the system has no tz database at all.
+_IST = timezone(timedelta(hours=5, minutes=30), "IST")
+
+
+def is_valid_timezone(name: str) -> bool:
+    """Return True if name is an IANA timezone known to this system."""
+    try:
+        ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=512)
+def get_zone(name: str) -> tzinfo:
+    """Return the tzinfo for an IANA name, falling back to DEFAULT_TIMEZONE."""
+    if is_valid_timezone(name):
+        return ZoneInfo(name)
+    if name != DEFAULT_TIMEZONE:
+        return get_zone(DEFAULT_TIMEZONE)
+    return _IST
+
+
+def next_reminder_at(
+    student_id: int,
+    tz_name: str,
+    hour: int,
+    after: datetime,
+    spread_minutes: int,
+) -> datetime:
+    """Return the first reminder slot strictly after a given time.
+
+    Args:
+        student_id: Student primary key (picks the minute within the hour).
+        tz_name: IANA timezone of the student.
+        hour: Preferred local hour (0-23).
+        after: Timezone-aware reference time.
+        spread_minutes: Width of the window slots are spread over (0 = on the hour).
+
+    Returns:
+        The next slot, as an aware UTC datetime.
+    """
+    zone = get_zone(tz_name)
+    offset = timedelta(minutes=student_id % spread_minutes if spread_minutes > 0 else 0)
+    local_day = after.astimezone(zone).date()
+    for days in range(3):  # Today's slot may have passed; DST can shift one more
+        slot = datetime.combine(local_day + timedelta(days=days), time(hour), tzinfo=zone)
+        slot_utc = (slot + offset).astimezone(UTC)
+        if slot_utc > after:
+            return slot_utc
+    raise AssertionError("unreachable: a slot exists within three local days")
+
+
+def reschedule(student: Student, after: datetime, spread_minutes: int) -> None:
+    """Move student.next_reminder_at to the first slot after a given time.
+
+    Args:
+        student: Student to update (not flushed here).
+        after: Timezone-aware reference time.
+        spread_minutes: See next_reminder_at().
+    """
+    student.next_reminder_at = next_reminder_at(
+        student.student_id, student.timezone, student.reminder_hour, after, spread_minutes
+    )
+
+
+async def schedule_new_students(
+    db: AsyncSession, now: datetime, spread_minutes: int, limit: int
+) -> int:
+    """Give students without a next_reminder_at their first slot.
+
+    New and migrated students start unscheduled; they are never reminded
+    for a slot that passed before they were scheduled.
+
+    Args:
+        db: Async database session (not committed here).
+        now: Current time (aware).
+        spread_minutes: See next_reminder_at().
+        limit: Maximum students scheduled per call.
+
+    Returns:
+        Number of students scheduled.
+    """
+    result = await db.execute(
+        select(Student).where(Student.next_reminder_at.is_(None)).limit(limit)
+    )
+    students = result.scalars().all()
+    for student in students:
+        reschedule(student, now, spread_minutes)
+    return len(students)
@@ -0,0 +1,312 @@
+"""Retention and archival for append-only audit tables.
+
+cost_records and sent_messages gain a row per hint / reminder / encouragement
+but every live query only looks at recent windows (today, this month, the
+last 7 days). This service keeps those hot tables bounded:
+
+  - archive_expired(): moves rows older than the table's retention window to
+    gzip-compressed NDJSON files, in primary-key batches, then deletes them.
+  - ensure_partitions(): PostgreSQL only — creates upcoming monthly range
+    partitions so inserts never land in the DEFAULT partition.
+  - drop_expired_partitions(): PostgreSQL only — drops monthly partitions
+    that lie wholly before the retention cutoff (emptied by archive_expired),
+    so index depth tracks the retention window rather than table history.
+
+SQLite (tests) keeps each table unpartitioned; the archive/delete path is
+identical on both dialects.
+
+Archive files are written before the matching DELETE commits, so delivery is
+at-least-once: a crash between the two can duplicate rows across archives but
+never loses them. Without an archive directory nothing is archived or
+deleted; the directory must be on persistent storage (ARCHIVE_DIR), since
+the rows are gone from the database once archived.
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import re
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import delete, inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import Settings
+from src.models.base import Base
+from src.models.cost_record import CostRecord
+from src.models.sent_message import SentMessage
+
+logger = logging.getLogger(__name__)
+
+# Rows archived and deleted per transaction.
+ARCHIVE_BATCH_SIZE = 1000
+
+# Monthly partitions created ahead of the current month.
+PARTITION_MONTHS_AHEAD = 2
+
+_PARTITION_NAME_RE = re.compile(r"^(?P<table>\w+)_y(?P<year>\d{4})m(?P<month>\d{2})$")
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """How long rows of one table stay in the hot database.
+
+    Attributes:
+        model: ORM model of the table.
+        timestamp_column: Column the retention window (and partitioning) is keyed on.
+        retention_days: Rows older than this many days are archived.
+    """
+
+    model: type[Base]
+    timestamp_column: str
+    retention_days: int
+
+    @property
+    def table(self) -> str:
+        """Table name of the model."""
+        return str(self.model.__tablename__)
+
+
+def get_retention_policies(settings: Settings) -> list[RetentionPolicy]:
+    """Build the retention policies from application settings.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        One policy per archived table.
+    """
+    return [
+        RetentionPolicy(CostRecord, "recorded_at", settings.cost_records_retention_days),
+        RetentionPolicy(SentMessage, "sent_at", settings.sent_messages_retention_days),
+    ]
+
+
+def partition_name(table: str, month: date) -> str:
+    """Return the monthly partition name for a table, e.g. cost_records_y2026m03."""
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def _month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def _add_months(d: date, months: int) -> date:
+    index = d.year * 12 + (d.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    return value
+
+
+def _write_ndjson_gz(path: Path, rows: list[dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, "wt", encoding="utf-8") as fh:
+        for row in rows:
+            fh.write(json.dumps(row, ensure_ascii=False, default=str))
+            fh.write("\n")
+
+
+class RetentionService:
+    """Archive and purge expired rows; manage monthly partitions on PostgreSQL.
+
+    Attributes:
+        archive_dir: Root directory for NDJSON archives (one subdirectory per
+            table); None disables archiving, so no rows are deleted.
+        batch_size: Rows archived and deleted per transaction.
+    """
+
+    def __init__(
+        self, archive_dir: Path | str | None, batch_size: int = ARCHIVE_BATCH_SIZE
+    ) -> None:
+        self.archive_dir = Path(archive_dir) if archive_dir is not None else None
+        self.batch_size = batch_size
+
+    async def archive_expired(
+        self,
+        db: AsyncSession,
+        policy: RetentionPolicy,
+        now: datetime | None = None,
+    ) -> int:
+        """Move rows older than the policy's window to gzip NDJSON and delete them.
+
+        Each batch is written to its own file and committed separately.
+        Does nothing when the service has no archive_dir.
+
+        Args:
+            db: Async database session (committed once per batch).
+            policy: Retention policy for the table.
+            now: Reference time (defaults to current UTC time).
+
+        Returns:
+            Number of rows archived.
+        """
+        if self.archive_dir is None:
+            return 0
+
+        now = now or datetime.now(UTC)
+        cutoff = now - timedelta(days=policy.retention_days)
+        mapper = inspect(policy.model)
+        pk_col = mapper.primary_key[0]
+        pk_key = mapper.get_property_by_column(pk_col).key
+        ts_col = getattr(policy.model, policy.timestamp_column)
+        columns = [c.key for c in mapper.column_attrs]
+
+        total = 0
+        while True:
+            result = await db.execute(
+                select(*[getattr(policy.model, c) for c in columns])
+                .where(ts_col < cutoff)
+                .order_by(pk_col)
+                .limit(self.batch_size)
+            )
+            rows = [
+                {c: _to_json_value(v) for c, v in zip(columns, row, strict=True)}
+                for row in result.all()
+            ]
+            if not rows:
+                break
+
+            first_pk = rows[0][pk_key]
+            path = (
+                self.archive_dir
+                / policy.table
+                / f"{policy.table}-{now:%Y%m%dT%H%M%S}-{first_pk}.ndjson.gz"
+            )
+            await asyncio.to_thread(_write_ndjson_gz, path, rows)
+
+            await db.execute(delete(policy.model).where(pk_col.in_([r[pk_key] for r in rows])))
+            await db.commit()
+            total += len(rows)
+
+            if len(rows) < self.batch_size:
+                break
+
+        if total:
+            logger.info(
+                "retention_archived",
+                extra={
+                    "event": "retention.archived",
+                    "table": policy.table,
+                    "rows": total,
+                    "cutoff": cutoff.isoformat(),
+                },
+            )
+        return total
+
+    async def ensure_partitions(
+        self,
+        db: AsyncSession,
+        policy: RetentionPolicy,
+        today: date | None = None,
+        months_ahead: int = PARTITION_MONTHS_AHEAD,
+    ) -> list[str]:
+        """Create monthly partitions from the current month through months_ahead.
+
+        No-op on dialects other than PostgreSQL.
+
+        Args:
+            db: Async database session (caller commits).
+            policy: Retention policy for the partitioned table.
+            today: Reference date (defaults to current UTC date).
+            months_ahead: Number of future months to pre-create.
+
+        Returns:
+            Names of partitions that were created.
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return []
+
+        start = _month_start(today or datetime.now(UTC).date())
+        created: list[str] = []
+        for offset in range(months_ahead + 1):
+            lower = _add_months(start, offset)
+            upper = _add_months(lower, 1)
+            name = partition_name(policy.table, lower)
+            exists = await db.scalar(text("SELECT to_regclass(:name)"), {"name": name})
+            if exists is not None:
+                continue
+            await db.execute(
+                text(
+                    f'CREATE TABLE "{name}" PARTITION OF "{policy.table}" '
+                    f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+                )
+            )
+            created.append(name)
+
+        if created:
+            logger.info(
+                "retention_partitions_created",
+                extra={
+                    "event": "retention.partitions_created",
+                    "table": policy.table,
+                    "partitions": created,
+                },
+            )
+        return created
+
+    async def drop_expired_partitions(
+        self,
+        db: AsyncSession,
+        policy: RetentionPolicy,
+        now: datetime | None = None,
+    ) -> list[str]:
+        """Drop monthly partitions that end on or before the retention cutoff.
+
+        Only empty partitions are dropped, so rows are never lost if
+        archive_expired() has not caught up yet. No-op on dialects other
+        than PostgreSQL.
+
+        Args:
+            db: Async database session (caller commits).
+            policy: Retention policy for the partitioned table.
+            now: Reference time (defaults to current UTC time).
+
+        Returns:
+            Names of partitions that were dropped.
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return []
+
+        cutoff = ((now or datetime.now(UTC)) - timedelta(days=policy.retention_days)).date()
+        result = await db.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = :table"
+            ),
+            {"table": policy.table},
+        )
+
+        dropped: list[str] = []
+        for (name,) in result.all():
+            match = _PARTITION_NAME_RE.match(name)
+            if match is None or match["table"] != policy.table:
+                continue  # DEFAULT partition or foreign naming
+            upper = _add_months(date(int(match["year"]), int(match["month"]), 1), 1)
+            if upper > cutoff:
+                continue
+            has_rows = await db.scalar(text(f'SELECT EXISTS (SELECT 1 FROM "{name}")'))
+            if has_rows:
+                continue
+            await db.execute(text(f'DROP TABLE "{name}"'))
+            dropped.append(name)
+
+        if dropped:
+            logger.info(
+                "retention_partitions_dropped",
+                extra={
+                    "event": "retention.partitions_dropped",
+                    "table": policy.table,
+                    "partitions": dropped,
+                },
+            )
+        return dropped
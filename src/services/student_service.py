@@ -50,7 +50,7 @@ class StudentService:
             language=language,
         )
         db.add(student)
-        await db.commit()
+        await db.flush()
         await db.refresh(student)
 
         logger.info(
@@ -1,12 +1,42 @@
 """Minimal Telegram Bot API wrapper."""
 
+import time
+
 import httpx
 
 from src.config import get_settings
 from src.logging import get_logger
+from src.metrics import TELEGRAM_SEND_SECONDS
 
 logger = get_logger(__name__)
 
+# Wait used when a 429 response carries no retry_after.
+_DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
+
+class TelegramRetryAfter(Exception):
+    """Telegram answered 429: the bot is over its send limit.
+
+    Attributes:
+        retry_after: Seconds to wait before sending again.
+    """
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"retry after {retry_after:g}s")
+        self.retry_after = retry_after
+
+
+def _retry_after(response: httpx.Response) -> float:
+    """Read the wait Telegram asks for from a 429 response."""
+    try:
+        value = response.json()["parameters"]["retry_after"]
+    except (ValueError, KeyError, TypeError):
+        value = response.headers.get("Retry-After", _DEFAULT_RETRY_AFTER_SECONDS)
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return _DEFAULT_RETRY_AFTER_SECONDS
+
 
 class TelegramClient:
     """Send messages via Telegram Bot API."""
@@ -15,7 +45,7 @@ class TelegramClient:
         """Initialize Telegram client with bot token from settings."""
         settings = get_settings()
         self.bot_token = settings.telegram_bot_token
-        self.base_url = f"https://api.telegram.org/bot{self.bot_token}"
+        self.base_url = f"{settings.telegram_api_base_url}/bot{self.bot_token}"
 
     async def send_message(self, chat_id: int, text: str) -> bool:
         """Send text message to user.
@@ -26,8 +56,12 @@ class TelegramClient:
 
         Returns:
             True if message sent successfully, False otherwise
+
+        Raises:
+            TelegramRetryAfter: Telegram rate-limited the bot (HTTP 429).
         """
         url = f"{self.base_url}/sendMessage"
+        started = time.perf_counter()
 
         try:
             async with httpx.AsyncClient() as client:
@@ -36,10 +70,17 @@ class TelegramClient:
                     json={"chat_id": chat_id, "text": text},
                     timeout=5.0,
                 )
+                if response.status_code == 429:
+                    TELEGRAM_SEND_SECONDS.observe(time.perf_counter() - started, "throttled")
+                    raise TelegramRetryAfter(_retry_after(response))
                 response.raise_for_status()
+                TELEGRAM_SEND_SECONDS.observe(time.perf_counter() - started, "ok")
                 logger.info(f"Message sent to chat {chat_id}")
                 return True
 
+        except TelegramRetryAfter:
+            raise
         except Exception as e:
+            TELEGRAM_SEND_SECONDS.observe(time.perf_counter() - started, "error")
             logger.error(f"Failed to send message to {chat_id}: {e}")
             return False
@@ -0,0 +1,72 @@
+"""Database URL and connection settings for migrations.
+
+Shared by alembic/env.py and scripts/migrate.py so the version check and
+the upgrade itself connect the same way:
+
+- Migrations use the synchronous psycopg2 driver (asyncpg has no benefit
+  there), or plain sqlite for local files.
+- *.railway.internal hostnames are resolved to IPv4: they may resolve to
+  both IPv6 and IPv4, and IPv6 routing is unreliable in Railway containers.
+- PostgreSQL connections time out after MIGRATION_CONNECT_TIMEOUT_SECONDS
+  instead of hanging the boot.
+"""
+
+import socket
+from typing import Any
+from urllib.parse import urlparse
+
+MIGRATION_CONNECT_TIMEOUT_SECONDS = 10
+
+_SYNC_PREFIXES = {
+    "postgres://": "postgresql+psycopg2://",
+    "postgresql+asyncpg://": "postgresql+psycopg2://",
+    "postgresql://": "postgresql+psycopg2://",
+    "sqlite+aiosqlite://": "sqlite://",
+}
+
+
+def migration_database_url(raw: str) -> str:
+    """Convert DATABASE_URL to a synchronous URL, resolving Railway hosts to IPv4.
+
+    Args:
+        raw: DATABASE_URL as configured for the app.
+
+    Returns:
+        URL usable with sqlalchemy.create_engine (empty if raw is empty).
+    """
+    url = raw
+    for prefix, replacement in _SYNC_PREFIXES.items():
+        if raw.startswith(prefix):
+            url = replacement + raw[len(prefix) :]
+            break
+
+    try:
+        hostname = urlparse(url).hostname or ""
+    except ValueError:
+        hostname = ""
+    if hostname.endswith(".railway.internal"):
+        try:
+            results = socket.getaddrinfo(hostname, None, family=socket.AF_INET)
+        except OSError as exc:
+            # print, not logging: alembic's fileConfig() disables existing loggers
+            print(f"[migrations] WARNING: could not resolve {hostname} to IPv4: {exc}")
+        else:
+            if results:
+                ipv4 = str(results[0][4][0])
+                url = url.replace(hostname, ipv4, 1)
+                print(f"[migrations] Resolved {hostname} → {ipv4}")
+    return url
+
+
+def migration_connect_args(url: str) -> dict[str, Any]:
+    """DBAPI connect() arguments for a migration URL.
+
+    Args:
+        url: URL returned by migration_database_url().
+
+    Returns:
+        A connect timeout for PostgreSQL; nothing for other databases.
+    """
+    if url.startswith("postgresql"):
+        return {"connect_timeout": MIGRATION_CONNECT_TIMEOUT_SECONDS}
+    return {}
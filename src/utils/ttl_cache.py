@@ -0,0 +1,127 @@
+"""Size-bounded in-process cache with per-entry TTL and LRU eviction.
+
+Used where a plain dict would grow with attacker-controlled keys (telegram
+IDs, client IPs): the cache never holds more than maxsize entries, entries
+older than ttl_seconds are treated as missing, and the least recently used
+entry is evicted first.
+
+Usage:
+    from src.utils.ttl_cache import TTLCache
+
+    cache: TTLCache[int, str] = TTLCache(maxsize=1000, ttl_seconds=300)
+    cache.set(42, "value")
+    cache.get(42)  # "value" until it expires or is evicted
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """LRU mapping whose entries expire ttl_seconds after they were set.
+
+    Not thread-safe; intended for use from a single event loop.
+
+    Attributes:
+        maxsize: Maximum number of entries kept.
+        ttl_seconds: Lifetime of an entry, measured from its last set().
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries (must be >= 1).
+            ttl_seconds: Entry lifetime in seconds.
+            clock: Monotonic time source (injectable for tests).
+
+        Raises:
+            ValueError: If maxsize < 1.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._store: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value, or None if missing or expired.
+
+        A hit marks the entry as most recently used.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value, or None.
+        """
+        entry = self._store.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        value, stored_at = entry
+        if self._clock() - stored_at >= self.ttl_seconds:
+            del self._store[key]
+            self._misses += 1
+            return None
+        self._store.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store value under key, resetting its TTL and evicting the LRU entry if full.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+        """
+        self._store[key] = (value, self._clock())
+        self._store.move_to_end(key)
+        while len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+            self._evictions += 1
+
+    def pop(self, key: K) -> None:
+        """Remove key if present."""
+        self._store.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry and reset statistics."""
+        self._store.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._store
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of cache statistics.
+
+        Returns:
+            Dict with keys "hits", "misses", "evictions" and "entries".
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "entries": len(self._store),
+        }
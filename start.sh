@@ -1,7 +1,13 @@
 #!/bin/sh
-# Diagnose private networking
-echo "=== Network diagnostics ==="
-python3 -c "
+# Fast boot path: scripts/migrate.py compares alembic_version with the script
+# head in one query and only runs migrations (under a Postgres advisory lock,
+# so replicas migrate one at a time) when they differ. The content bundle is
+# compiled in the build phase (railway.toml buildCommand) and ships with the image.
+
+# Diagnose private networking (only run when the database is unreachable)
+network_diagnostics() {
+  echo "=== Network diagnostics ==="
+  python3 -c "
 import os, socket
 from urllib.parse import urlparse
 
@@ -37,21 +43,13 @@ for family in [socket.AF_INET, socket.AF_INET6]:
         print(f'{label}: {e}')
     finally:
         s.close()
-"
-echo "==========================="
+  "
+  echo "==========================="
+}
 
-for i in 1 2 3; do
-  echo "Alembic migration attempt $i..."
-  output=$(timeout 20 /opt/venv/bin/alembic upgrade head 2>&1)
-  exit_code=$?
-  echo "$output"
-  echo "Alembic exit code: $exit_code"
-  if [ $exit_code -eq 0 ]; then
-    echo "Alembic migration succeeded"
-    break
-  fi
-  echo "Attempt $i failed, waiting 5s..."
-  sleep 5
-done
+if ! /opt/venv/bin/python scripts/migrate.py; then
+  echo "Migration check failed"
+  network_diagnostics
+fi
 
 exec /opt/venv/bin/uvicorn src.main:app --host 0.0.0.0 --port "${PORT:-8000}"
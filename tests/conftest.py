@@ -3,16 +3,20 @@ Pytest fixtures and configuration for Dars tests.
 
 This file provides shared fixtures for all tests:
 - Database fixtures (async)
+- SQL statement counting for query budgets
 - API client fixtures
 - Mock Telegram updates
 - Mock Claude API responses
 """
 
 import asyncio
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, Callable, Generator
+from typing import Any
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.pool import StaticPool
 
 from src.models.base import Base
@@ -61,6 +65,53 @@ async def db_session(test_db_engine) -> AsyncGenerator[AsyncSession, None]:  # t
         await session.close()
 
 
+class QueryCounter:
+    """Records SQL statements executed on an engine inside a with block.
+
+    Usage:
+        with count_queries() as queries:
+            await handler(db_session)
+        queries.assert_within(4, "answer")
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+        self.statements: list[str] = []
+
+    def _record(self, *args: Any) -> None:
+        # before_cursor_execute(conn, cursor, statement, parameters, context, executemany)
+        self.statements.append(args[2])
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self._engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        event.remove(self._engine, "before_cursor_execute", self._record)
+
+    @property
+    def count(self) -> int:
+        """Number of statements recorded."""
+        return len(self.statements)
+
+    def assert_within(self, budget: int, label: str) -> None:
+        """Fail with the recorded statements if more than budget were executed."""
+        if self.count > budget:
+            listing = "\n".join(
+                f"  {i + 1}. {s.splitlines()[0]}" for i, s in enumerate(self.statements)
+            )
+            pytest.fail(
+                f"{label}: {self.count} queries exceeds budget of {budget}:\n{listing}",
+                pytrace=False,
+            )
+
+
+@pytest.fixture
+def count_queries(test_db_engine: AsyncEngine) -> Callable[[], QueryCounter]:
+    """Return a factory of QueryCounters bound to the db_session engine."""
+    return lambda: QueryCounter(test_db_engine.sync_engine)
+
+
 @pytest.fixture
 async def test_db_session(test_db_engine) -> AsyncGenerator[AsyncSession, None]:  # type: ignore
     """Alias for db_session fixture for backward compatibility."""
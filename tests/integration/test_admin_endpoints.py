@@ -7,6 +7,7 @@ PHASE7-C-2
 """
 
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -16,9 +17,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.database import get_session
 from src.main import app
 from src.models.cost_record import ApiProvider, CostRecord, OperationType
+from src.models.message_template import MessageCategory, MessageTemplate
 from src.models.session import Session, SessionStatus
 from src.models.student import Student
+from src.services.broadcasts import advance_broadcasts
+from src.services.content_bundle import compile_bundle
 from src.services.cost_tracker import BUDGET_PER_STUDENT_USD
+from src.services.messages import reset_message_catalog
+from src.services.problem_content import find_problem_files
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -249,3 +255,121 @@ class TestAdminCost:
 
         assert response.status_code == 200
         assert response.json()["budget_alert"] is False
+
+
+@pytest.mark.integration
+class TestAdminContent:
+    async def test_reload_maps_bundle(
+        self, db_session: AsyncSession, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """POST /admin/content/reload maps the configured bundle and reports its topics."""
+        files = find_problem_files(6)
+        bundle_path = tmp_path / "bundle.jsonl"
+        compile_bundle(files, bundle_path, workers=1)
+        monkeypatch.setenv("CONTENT_BUNDLE_PATH", str(bundle_path))
+
+        client = _make_client(db_session)
+        try:
+            reloaded = client.post("/admin/content/reload", headers=_ADMIN_HEADERS)
+            info = client.get("/admin/content", headers=_ADMIN_HEADERS)
+        finally:
+            app.dependency_overrides.pop(get_session, None)
+
+        assert reloaded.status_code == 200
+        data = reloaded.json()
+        assert data["loaded"] is True
+        assert data["source_count"] == len(files)
+        assert all(topic.startswith("6/") for topic in data["topics"])
+        assert info.json()["problem_count"] == data["problem_count"]
+
+    async def test_reload_missing_bundle_returns_404(
+        self, db_session: AsyncSession, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A missing bundle file is reported as 404, not a server error."""
+        monkeypatch.setenv("CONTENT_BUNDLE_PATH", str(tmp_path / "missing.jsonl"))
+
+        client = _make_client(db_session)
+        try:
+            response = client.post("/admin/content/reload", headers=_ADMIN_HEADERS)
+        finally:
+            app.dependency_overrides.pop(get_session, None)
+
+        assert response.status_code == 404
+
+
+class TestAdminMessages:
+    async def test_reload_applies_overrides(self, db_session: AsyncSession) -> None:
+        """POST /admin/messages/reload picks up edited message_templates rows."""
+        db_session.add(
+            MessageTemplate(
+                message_key="help",
+                category=MessageCategory.UI,
+                message_en="Custom help",
+                message_bn="কাস্টম সাহায্য",
+                variables=[],
+            )
+        )
+        await db_session.flush()
+
+        client = _make_client(db_session)
+        try:
+            reloaded = client.post("/admin/messages/reload", headers=_ADMIN_HEADERS)
+            info = client.get("/admin/messages", headers=_ADMIN_HEADERS)
+        finally:
+            app.dependency_overrides.pop(get_session, None)
+            reset_message_catalog()
+
+        assert reloaded.status_code == 200
+        data = reloaded.json()
+        assert data["version"] >= 1
+        assert data["overrides"] == ["help"]
+        assert info.json()["fingerprint"] == data["fingerprint"]
+
+
+@pytest.mark.integration
+class TestAdminBroadcasts:
+    async def test_create_and_track_broadcast(self, db_session: AsyncSession) -> None:
+        """POST records the broadcast; GET reports progress as it is fanned out."""
+        for i in range(3):
+            await _create_student(db_session, telegram_id=8000 + i, grade=7)
+        await _create_student(db_session, telegram_id=8100, grade=8)
+        await db_session.commit()
+
+        client = _make_client(db_session)
+        try:
+            created = client.post(
+                "/admin/broadcasts",
+                headers=_ADMIN_HEADERS,
+                json={"message": "Exam tips tonight", "grade": 7},
+            )
+            broadcast_id = created.json()["broadcast_id"]
+            await advance_broadcasts(db_session, budget=10, max_in_flight=10)
+            await db_session.commit()
+            progress = client.get(f"/admin/broadcasts/{broadcast_id}", headers=_ADMIN_HEADERS)
+        finally:
+            app.dependency_overrides.pop(get_session, None)
+
+        assert created.status_code == 202
+        assert created.json()["total_recipients"] == 3
+        assert created.json()["queued"] == 0
+        assert progress.status_code == 200
+        data = progress.json()
+        assert (data["status"], data["queued"], data["pending"]) == ("sending", 3, 3)
+
+    async def test_unknown_broadcast_returns_404(self, db_session: AsyncSession) -> None:
+        client = _make_client(db_session)
+        try:
+            response = client.get("/admin/broadcasts/12345", headers=_ADMIN_HEADERS)
+        finally:
+            app.dependency_overrides.pop(get_session, None)
+
+        assert response.status_code == 404
+
+    async def test_broadcast_requires_auth(self, db_session: AsyncSession) -> None:
+        client = _make_client(db_session)
+        try:
+            response = client.post("/admin/broadcasts", json={"message": "Hi"})
+        finally:
+            app.dependency_overrides.pop(get_session, None)
+
+        assert response.status_code == 401
@@ -11,7 +11,8 @@ from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-from src.auth.student import verify_student
+from src.auth import student as student_auth
+from src.auth.student import invalidate_on_commit, invalidate_student, verify_student
 from src.models.base import Base
 from src.models.student import Student
 
@@ -46,6 +47,21 @@ async def async_db_session() -> AsyncSession:  # type: ignore
     await engine.dispose()
 
 
+@pytest.fixture(autouse=True)
+def _clear_auth_caches() -> None:
+    """Each test gets empty auth caches and a fresh failed-attempt budget."""
+    student_auth._student_cache.clear()
+    student_auth._missing_cache.clear()
+    student_auth._failed_attempts.clear()
+
+
+def _mock_request(host: str = "127.0.0.1") -> Mock:
+    request = Mock()
+    request.client = Mock()
+    request.client.host = host
+    return request
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 class TestStudentDatabaseVerification:
@@ -79,7 +95,7 @@ class TestStudentDatabaseVerification:
         result = await verify_student(
             request=mock_request, x_student_id="123456789", db=async_db_session
         )
-        assert result == 123456789
+        assert result.telegram_id == 123456789
 
     async def test_verify_student_not_in_database_returns_404(
         self, async_db_session: AsyncSession
@@ -133,13 +149,13 @@ class TestStudentDatabaseVerification:
         result1 = await verify_student(
             request=mock_request, x_student_id="111111111", db=async_db_session
         )
-        assert result1 == 111111111
+        assert result1.telegram_id == 111111111
 
         # Verify second student
         result2 = await verify_student(
             request=mock_request, x_student_id="222222222", db=async_db_session
         )
-        assert result2 == 222222222
+        assert result2.telegram_id == 222222222
 
         # Verify third (non-existent) fails
         with pytest.raises(HTTPException) as exc_info:
@@ -213,7 +229,7 @@ class TestStudentDatabaseVerification:
         results = await asyncio.gather(*tasks)
 
         # All should succeed with same result
-        assert all(r == 777777777 for r in results)
+        assert all(r.telegram_id == 777777777 for r in results)
         assert len(results) == 10
 
     async def test_verify_student_prevents_idor_attack(
@@ -255,4 +271,100 @@ class TestStudentDatabaseVerification:
 
         # Only valid ID should work
         result = await verify_student(request=mock_request, x_student_id="100", db=async_db_session)
-        assert result == 100
+        assert result.telegram_id == 100
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestStudentAuthCache:
+    """verify_student caches resolved students in bounded TTL+LRU caches."""
+
+    async def test_returns_student_record(self, async_db_session: AsyncSession) -> None:
+        """The dependency hands routes the resolved student, not just the ID."""
+        student = Student(telegram_id=4242, name="Ria", grade=8, language="bn")
+        async_db_session.add(student)
+        await async_db_session.commit()
+
+        result = await verify_student(
+            request=_mock_request(), x_student_id="4242", db=async_db_session
+        )
+
+        assert result.student_id == student.student_id
+        assert (result.grade, result.language) == (8, "bn")
+
+    async def test_cached_student_skips_database(self, async_db_session: AsyncSession) -> None:
+        """A second request for the same student issues no query."""
+        async_db_session.add(Student(telegram_id=4343, name="Ria", grade=7, language="en"))
+        await async_db_session.commit()
+        await verify_student(request=_mock_request(), x_student_id="4343", db=async_db_session)
+
+        no_db = Mock()
+        no_db.execute = Mock(side_effect=AssertionError("unexpected query"))
+        result = await verify_student(request=_mock_request(), x_student_id="4343", db=no_db)
+
+        assert result.telegram_id == 4343
+
+    async def test_invalidate_reloads_profile(self, async_db_session: AsyncSession) -> None:
+        """invalidate_student() makes the next request see profile changes."""
+        student = Student(telegram_id=4444, name="Ria", grade=7, language="en")
+        async_db_session.add(student)
+        await async_db_session.commit()
+        await verify_student(request=_mock_request(), x_student_id="4444", db=async_db_session)
+
+        student.language = "bn"
+        await async_db_session.commit()
+        invalidate_student(4444)
+        result = await verify_student(
+            request=_mock_request(), x_student_id="4444", db=async_db_session
+        )
+
+        assert result.language == "bn"
+
+    async def test_invalidate_on_commit_waits_for_commit(
+        self, async_db_session: AsyncSession
+    ) -> None:
+        """A change is only invalidated once committed, so the old row is not re-cached."""
+        student = Student(telegram_id=4545, name="Ria", grade=7, language="en")
+        async_db_session.add(student)
+        await async_db_session.commit()
+        await verify_student(request=_mock_request(), x_student_id="4545", db=async_db_session)
+
+        student.language = "bn"
+        await async_db_session.flush()
+        invalidate_on_commit(async_db_session, 4545)
+        assert 4545 in student_auth._student_cache  # Still cached until commit
+
+        await async_db_session.commit()
+        assert 4545 not in student_auth._student_cache
+
+    async def test_invalidate_on_commit_forgotten_on_rollback(
+        self, async_db_session: AsyncSession
+    ) -> None:
+        async_db_session.add(Student(telegram_id=4646, name="Ria", grade=7, language="en"))
+        await async_db_session.flush()
+        invalidate_on_commit(async_db_session, 4646)
+        await async_db_session.rollback()
+
+        assert "invalidate_students" not in async_db_session.info
+
+    async def test_enumeration_memory_is_bounded(
+        self, async_db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Unknown IDs from many IPs never grow the caches past their caps."""
+        monkeypatch.setattr(student_auth, "_missing_cache", student_auth.TTLCache(5, 60.0))
+        monkeypatch.setattr(student_auth, "_failed_attempts", student_auth.TTLCache(5, 60.0))
+        async_db_session.add(Student(telegram_id=4545, name="Ria", grade=7, language="en"))
+        await async_db_session.commit()
+        await verify_student(request=_mock_request(), x_student_id="4545", db=async_db_session)
+
+        for n in range(50):
+            with pytest.raises(HTTPException):
+                await verify_student(
+                    request=_mock_request(f"10.0.0.{n}"),
+                    x_student_id=str(900000 + n),
+                    db=async_db_session,
+                )
+
+        assert len(student_auth._missing_cache) == 5
+        assert len(student_auth._failed_attempts) == 5
+        assert 4545 in student_auth._student_cache
@@ -132,7 +132,7 @@ class TestHintGeneratorFlow:
 
         with (
             patch("src.services.hint_generator.get_settings") as mock_settings,
-            patch("src.services.hint_generator.anthropic.AsyncAnthropic") as mock_anthropic,
+            patch("anthropic.AsyncAnthropic") as mock_anthropic,
         ):
             mock_settings.return_value.anthropic_api_key = "sk-test"
             mock_anthropic.return_value.messages.create = AsyncMock(return_value=mock_resp)
@@ -162,7 +162,7 @@ class TestHintGeneratorFlow:
 
         with (
             patch("src.services.hint_generator.get_settings") as mock_settings,
-            patch("src.services.hint_generator.anthropic.AsyncAnthropic") as mock_anthropic,
+            patch("anthropic.AsyncAnthropic") as mock_anthropic,
         ):
             mock_settings.return_value.anthropic_api_key = "sk-test"
             mock_anthropic.return_value.messages.create = AsyncMock(return_value=mock_resp)
@@ -249,7 +249,7 @@ class TestHintGeneratorFlow:
 
         with (
             patch("src.services.hint_generator.get_settings") as mock_settings,
-            patch("src.services.hint_generator.anthropic.AsyncAnthropic") as mock_anthropic,
+            patch("anthropic.AsyncAnthropic") as mock_anthropic,
         ):
             mock_settings.return_value.anthropic_api_key = "sk-test"
             mock_anthropic.return_value.messages.create = AsyncMock(return_value=mock_resp)
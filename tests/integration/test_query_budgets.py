@@ -0,0 +1,326 @@
+"""Query-count budgets for webhook commands and REST routes.
+
+Each test drives one command or route against the in-memory database and
+fails if it executes more SQL statements than its budget (see the
+count_queries fixture in tests/conftest.py). Budgets are the current counts:
+when a change removes queries, lower the budget in the same PR; raising one
+needs a reason in the PR description.
+"""
+
+from collections.abc import AsyncGenerator, Callable, Generator
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.student import invalidate_student
+from src.config import get_settings
+from src.database import get_session
+from src.main import app
+from src.models.problem import Problem
+from src.models.student import Student
+from src.routes import practice
+from src.routes.webhook import (
+    _active_sessions,
+    _handle_message,
+    _pending_continue,
+    _pending_grade_choice,
+    _pending_language_choice,
+    _pending_onboarding,
+    _pending_practice_grade,
+    _pending_topic_choice,
+    _pending_wrong_answer,
+    _session_grade_override,
+)
+from src.schemas.telegram import TelegramMessage
+from src.services.outbox import enqueue_message
+from tests.conftest import QueryCounter
+
+TELEGRAM_ID = 777666555
+
+# Statements per Telegram update, including the student lookup that
+# _handle_message runs before routing and the outbox INSERT for the reply.
+WEBHOOK_BUDGETS: dict[str, int] = {
+    "/practice": 10,
+    "practice grade choice": 10,
+    "topic choice": 11,
+    "answer (correct)": 22,
+    "answer (wrong)": 20,
+    "answer (completes session)": 25,
+    "/hint": 23,
+    "/streak": 16,
+    "/language": 9,
+    "language choice": 10,
+    "/grade": 9,
+    "grade choice": 10,
+    "continue": 11,
+}
+
+# Statements per request, including the verify_student lookup (cold cache).
+REST_BUDGETS: dict[str, int] = {
+    "GET /practice": 8,
+    "POST /practice/{id}/answer": 18,
+    "POST /practice/{id}/hint": 17,
+    "GET /streak": 6,
+}
+
+
+def _message(text: str) -> TelegramMessage:
+    return TelegramMessage.model_validate(
+        {
+            "message_id": 1,
+            "date": int(datetime.now(UTC).timestamp()),
+            "chat": {"id": TELEGRAM_ID, "type": "private"},
+            "from": {"id": TELEGRAM_ID, "is_bot": False, "first_name": "Budget"},
+            "text": text,
+        }
+    )
+
+
+async def _seed(db: AsyncSession) -> list[str]:
+    """Create the student and five grade-7 problems in one topic.
+
+    Returns:
+        Correct answers in the order a practice session asks the problems.
+    """
+    db.add(Student(telegram_id=TELEGRAM_ID, name="Budget", grade=7, language="en"))
+    problems = [
+        Problem(
+            grade=7,
+            topic="fractions",
+            question_en=f"What is {i} + {i}?",
+            question_bn=f"{i} + {i} কত?",
+            answer=str(2 * i),
+            hints=[
+                {"hint_number": n, "text_en": f"Hint {n}", "text_bn": f"Hint {n}"}
+                for n in (1, 2, 3)
+            ],
+            difficulty=1 + i % 3,
+            estimated_time_minutes=2,
+        )
+        for i in range(1, 6)
+    ]
+    db.add_all(problems)
+    await db.flush()
+    answers = [p.answer for p in sorted(problems, key=lambda p: (p.difficulty, p.problem_id))]
+    await db.commit()
+    return answers
+
+
+@pytest.fixture(autouse=True)
+def _reset_state() -> Generator[None, None, None]:
+    """Clear per-student webhook state and the auth cache around each test."""
+    pending: list[dict[int, Any]] = [
+        _active_sessions,
+        _pending_continue,
+        _pending_grade_choice,
+        _pending_language_choice,
+        _pending_onboarding,
+        _pending_practice_grade,
+        _pending_topic_choice,
+        _pending_wrong_answer,
+        _session_grade_override,
+    ]
+    for state in pending:
+        state.pop(TELEGRAM_ID, None)
+    invalidate_student(TELEGRAM_ID)
+    yield
+    for state in pending:
+        state.pop(TELEGRAM_ID, None)
+    invalidate_student(TELEGRAM_ID)
+
+
+@pytest.fixture(autouse=True)
+def _production_session(db_session, monkeypatch) -> None:
+    """Match get_session_factory() and never call Claude (pre-written hints)."""
+    monkeypatch.setattr(db_session.sync_session, "expire_on_commit", False)
+    monkeypatch.setattr(get_settings(), "anthropic_api_key", "")
+    # Budgets count database lookups; a bundle mapped by an earlier test
+    # would serve problems from memory instead
+    monkeypatch.setattr("src.services.content_bundle._bundle", None)
+
+
+@pytest.fixture
+def replies() -> Generator[list[str], None, None]:
+    """Collect reply texts as they are queued in the outbox."""
+    sent: list[str] = []
+
+    async def _enqueue(db: AsyncSession, chat_id: int, text: str, **kwargs: Any) -> None:
+        sent.append(text)
+        await enqueue_message(db, chat_id, text, **kwargs)
+
+    with patch("src.routes.webhook.enqueue_message", side_effect=_enqueue):
+        yield sent
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("replies")
+class TestWebhookQueryBudgets:
+    """Statements per update for each webhook command."""
+
+    async def _send(self, db: AsyncSession, text: str) -> None:
+        await _handle_message(_message(text), db)
+
+    async def _measure(
+        self,
+        db: AsyncSession,
+        count_queries: Callable[[], QueryCounter],
+        text: str,
+        label: str,
+    ) -> None:
+        with count_queries() as queries:
+            await self._send(db, text)
+        queries.assert_within(WEBHOOK_BUDGETS[label], label)
+
+    async def _start_session(self, db: AsyncSession) -> list[str]:
+        answers = await _seed(db)
+        await self._send(db, "/practice")
+        await self._send(db, "7")
+        await self._send(db, "1")
+        return answers
+
+    async def test_practice(self, db_session, count_queries) -> None:
+        await _seed(db_session)
+        await self._measure(db_session, count_queries, "/practice", "/practice")
+        assert _pending_practice_grade.get(TELEGRAM_ID)
+
+    async def test_practice_grade_choice(self, db_session, count_queries) -> None:
+        await _seed(db_session)
+        await self._send(db_session, "/practice")
+        await self._measure(db_session, count_queries, "7", "practice grade choice")
+        assert _pending_topic_choice[TELEGRAM_ID] == ["fractions"]
+
+    async def test_topic_choice(self, db_session, count_queries) -> None:
+        await _seed(db_session)
+        await self._send(db_session, "/practice")
+        await self._send(db_session, "7")
+        await self._measure(db_session, count_queries, "1", "topic choice")
+        assert TELEGRAM_ID in _active_sessions
+
+    async def test_answer_correct(self, db_session, count_queries, replies) -> None:
+        answers = await self._start_session(db_session)
+        await self._measure(db_session, count_queries, answers[0], "answer (correct)")
+        assert replies[-1].startswith("Correct!")
+
+    async def test_answer_wrong(self, db_session, count_queries) -> None:
+        await self._start_session(db_session)
+        await self._measure(db_session, count_queries, "999", "answer (wrong)")
+        assert _pending_wrong_answer.get(TELEGRAM_ID)
+
+    async def test_answer_completes_session(self, db_session, count_queries) -> None:
+        answers = await self._start_session(db_session)
+        for answer in answers[:-1]:
+            await self._send(db_session, answer)
+        await self._measure(db_session, count_queries, answers[-1], "answer (completes session)")
+        assert TELEGRAM_ID in _pending_continue
+
+    async def test_hint(self, db_session, count_queries, replies) -> None:
+        await self._start_session(db_session)
+        await self._measure(db_session, count_queries, "/hint", "/hint")
+        assert "Hint 1" in replies[-1]
+
+    async def test_streak(self, db_session, count_queries) -> None:
+        answers = await self._start_session(db_session)
+        for answer in answers:
+            await self._send(db_session, answer)
+        await self._measure(db_session, count_queries, "/streak", "/streak")
+
+    async def test_language(self, db_session, count_queries) -> None:
+        await _seed(db_session)
+        await self._measure(db_session, count_queries, "/language", "/language")
+        await self._measure(db_session, count_queries, "2", "language choice")
+        assert TELEGRAM_ID not in _pending_language_choice
+
+    async def test_grade(self, db_session, count_queries) -> None:
+        await _seed(db_session)
+        await self._measure(db_session, count_queries, "/grade", "/grade")
+        await self._measure(db_session, count_queries, "8", "grade choice")
+        assert TELEGRAM_ID not in _pending_grade_choice
+
+    async def test_continue(self, db_session, count_queries) -> None:
+        answers = await self._start_session(db_session)
+        for answer in answers:
+            await self._send(db_session, answer)
+        await self._measure(db_session, count_queries, "1", "continue")
+        assert _pending_practice_grade.get(TELEGRAM_ID)
+
+
+@pytest.mark.integration
+class TestRestQueryBudgets:
+    """Statements per request for the student REST routes.
+
+    Requests go through httpx.ASGITransport on the test's event loop, since
+    the in-memory aiosqlite engine cannot be shared with TestClient's thread.
+    """
+
+    @pytest.fixture
+    async def client(self, db_session, monkeypatch) -> AsyncGenerator[httpx.AsyncClient, None]:
+        async def _override() -> Any:
+            yield db_session
+
+        monkeypatch.setattr(practice.limiter, "enabled", False)
+        app.dependency_overrides[get_session] = _override
+        try:
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                base_url="http://test",
+                headers={"X-Student-ID": str(TELEGRAM_ID)},
+            ) as client:
+                yield client
+        finally:
+            app.dependency_overrides.pop(get_session, None)
+
+    async def _measure(
+        self,
+        client: httpx.AsyncClient,
+        count_queries: Callable[[], QueryCounter],
+        method: str,
+        url: str,
+        label: str,
+        **kwargs: Any,
+    ) -> Any:
+        invalidate_student(TELEGRAM_ID)
+        with count_queries() as queries:
+            response = await client.request(method, url, **kwargs)
+        assert response.status_code == 200, response.text
+        queries.assert_within(REST_BUDGETS[label], label)
+        return response.json()
+
+    async def _start(self, db: AsyncSession, client: httpx.AsyncClient) -> tuple[int, int]:
+        await _seed(db)
+        body = (await client.get("/practice")).json()
+        return body["session_id"], body["problems"][0]["problem_id"]
+
+    async def test_get_practice(self, db_session, client, count_queries) -> None:
+        await _seed(db_session)
+        body = await self._measure(client, count_queries, "GET", "/practice", "GET /practice")
+        assert body["problems"]
+
+    async def test_submit_answer(self, db_session, client, count_queries) -> None:
+        session_id, problem_id = await self._start(db_session, client)
+        await self._measure(
+            client,
+            count_queries,
+            "POST",
+            f"/practice/{problem_id}/answer",
+            "POST /practice/{id}/answer",
+            json={"session_id": session_id, "student_answer": "2"},
+        )
+
+    async def test_request_hint(self, db_session, client, count_queries) -> None:
+        session_id, problem_id = await self._start(db_session, client)
+        await self._measure(
+            client,
+            count_queries,
+            "POST",
+            f"/practice/{problem_id}/hint",
+            "POST /practice/{id}/hint",
+            json={"session_id": session_id, "hint_number": 1},
+        )
+
+    async def test_get_streak(self, db_session, client, count_queries) -> None:
+        await _seed(db_session)
+        await self._measure(client, count_queries, "GET", "/streak", "GET /streak")
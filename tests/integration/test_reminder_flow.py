@@ -6,26 +6,47 @@ Uses in-memory SQLite (db_session fixture) with src.scheduler.get_session_factor
 patched to yield the test session, so send_daily_reminders() queries the same
 in-memory DB that the test populates.
 
-TelegramClient.send_message is patched to avoid real HTTP calls.
+Reminders are queued in the outbox table (nothing is sent over HTTP); the
+tests assert on the queued rows. Students are created with their reminder
+slot already due unless a test says otherwise.
 """
 
 from __future__ import annotations
 
-from datetime import date, timedelta
+from collections.abc import Generator
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
+from zoneinfo import ZoneInfo
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.models.outbox_message import OutboxMessage, OutboxStatus
+from src.models.sent_message import SentMessage
 from src.models.streak import Streak
 from src.models.student import Student
 from src.scheduler import send_daily_reminders
+from src.services.outbox import enqueue_message
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
+def _ist_today() -> date:
+    """Reminders use the student's local date; students default to IST."""
+    return datetime.now(ZoneInfo("Asia/Kolkata")).date()
+
+
+@pytest.fixture(autouse=True)
+def _production_session(db_session: AsyncSession) -> Generator[None, None, None]:
+    """Match get_session_factory(): the job commits per student."""
+    with patch.object(db_session.sync_session, "expire_on_commit", False):
+        yield
+
+
 def _make_factory(db: AsyncSession) -> MagicMock:
     """Return a mock session factory whose async context manager yields db."""
     cm = AsyncMock()
@@ -35,16 +56,28 @@ def _make_factory(db: AsyncSession) -> MagicMock:
     return factory
 
 
+async def _queued(db: AsyncSession) -> list[OutboxMessage]:
+    result = await db.execute(select(OutboxMessage).order_by(OutboxMessage.id))
+    return list(result.scalars().all())
+
+
+async def _run_job(db: AsyncSession) -> None:
+    with patch("src.scheduler.get_session_factory", return_value=_make_factory(db)):
+        await send_daily_reminders()
+
+
 async def _create_student(
     db: AsyncSession,
     telegram_id: int = 100,
     language: str = "en",
+    next_reminder_at: datetime | None = None,
 ) -> Student:
     student = Student(
         telegram_id=telegram_id,
         name="Test Student",
         grade=7,
         language=language,
+        next_reminder_at=next_reminder_at or datetime.now(UTC) - timedelta(minutes=1),
     )
     db.add(student)
     await db.flush()
@@ -61,7 +94,7 @@ async def _create_streak(
         student_id=student_id,
         current_streak=current,
         longest_streak=max(current, 5),
-        last_practice_date=last_date or (date.today() - timedelta(days=1)),
+        last_practice_date=last_date or (_ist_today() - timedelta(days=1)),
         milestones_achieved=[],
     )
     db.add(streak)
@@ -79,29 +112,22 @@ class TestReminderFlow:
     async def test_reminder_sent_to_student_who_has_not_practiced_today(
         self, db_session: AsyncSession
     ) -> None:
-        """Students with last_practice_date=yesterday receive one reminder."""
+        """Students with last_practice_date=yesterday get one reminder queued."""
         student = await _create_student(db_session, telegram_id=101)
         student_id = student.student_id
         await _create_streak(
             db_session,
             student_id=student_id,
             current=3,
-            last_date=date.today() - timedelta(days=1),
+            last_date=_ist_today() - timedelta(days=1),
         )
 
-        factory = _make_factory(db_session)
-        mock_send = AsyncMock(return_value=True)
-
-        with (
-            patch("src.scheduler.get_session_factory", return_value=factory),
-            patch("src.scheduler.TelegramClient") as mock_telegram_cls,
-        ):
-            mock_telegram_cls.return_value.send_message = mock_send
-            await send_daily_reminders()
+        await _run_job(db_session)
 
-        mock_send.assert_called_once()
-        called_chat_id = mock_send.call_args.args[0]
-        assert called_chat_id == 101
+        (queued,) = await _queued(db_session)
+        assert queued.chat_id == 101
+        assert queued.status == OutboxStatus.PENDING
+        assert queued.idempotency_key == f"reminder:{student_id}:{_ist_today().isoformat()}"
 
     @pytest.mark.asyncio
     async def test_no_reminder_to_student_who_practiced_today(
@@ -114,20 +140,12 @@ class TestReminderFlow:
             db_session,
             student_id=student_id,
             current=5,
-            last_date=date.today(),
+            last_date=_ist_today(),
         )
 
-        factory = _make_factory(db_session)
-        mock_send = AsyncMock(return_value=True)
+        await _run_job(db_session)
 
-        with (
-            patch("src.scheduler.get_session_factory", return_value=factory),
-            patch("src.scheduler.TelegramClient") as mock_telegram_cls,
-        ):
-            mock_telegram_cls.return_value.send_message = mock_send
-            await send_daily_reminders()
-
-        mock_send.assert_not_called()
+        assert await _queued(db_session) == []
 
     @pytest.mark.asyncio
     async def test_zero_streak_gets_motivational_not_at_risk_message(
@@ -140,22 +158,13 @@ class TestReminderFlow:
             db_session,
             student_id=student_id,
             current=0,
-            last_date=date.today() - timedelta(days=1),
+            last_date=_ist_today() - timedelta(days=1),
         )
 
-        factory = _make_factory(db_session)
-        mock_send = AsyncMock(return_value=True)
-
-        with (
-            patch("src.scheduler.get_session_factory", return_value=factory),
-            patch("src.scheduler.TelegramClient") as mock_telegram_cls,
-        ):
-            mock_telegram_cls.return_value.send_message = mock_send
-            await send_daily_reminders()
+        await _run_job(db_session)
 
-        mock_send.assert_called_once()
-        _chat_id, msg = mock_send.call_args.args
-        assert "at risk" not in msg
+        (queued,) = await _queued(db_session)
+        assert "at risk" not in queued.text
 
     @pytest.mark.asyncio
     async def test_reminder_message_matches_student_language_bengali(
@@ -168,55 +177,183 @@ class TestReminderFlow:
             db_session,
             student_id=student_id,
             current=4,
-            last_date=date.today() - timedelta(days=1),
+            last_date=_ist_today() - timedelta(days=1),
         )
 
-        factory = _make_factory(db_session)
-        mock_send = AsyncMock(return_value=True)
+        await _run_job(db_session)
+
+        (queued,) = await _queued(db_session)
+        assert any(ord(c) > 0x0980 for c in queued.text), "Expected Bengali Unicode in message"
+
+    @pytest.mark.asyncio
+    async def test_rerun_does_not_queue_twice(self, db_session: AsyncSession) -> None:
+        """A second run on the same day (e.g. after a restart) queues nothing new."""
+        student = await _create_student(db_session, telegram_id=107)
+        await _create_streak(db_session, student_id=student.student_id)
 
-        with (
-            patch("src.scheduler.get_session_factory", return_value=factory),
-            patch("src.scheduler.TelegramClient") as mock_telegram_cls,
-        ):
-            mock_telegram_cls.return_value.send_message = mock_send
-            await send_daily_reminders()
+        await _run_job(db_session)
+        await _run_job(db_session)
 
-        mock_send.assert_called_once()
-        _chat_id, msg = mock_send.call_args.args
-        assert any(ord(c) > 0x0980 for c in msg), "Expected Bengali Unicode in message"
+        assert len(await _queued(db_session)) == 1
+        assert len((await db_session.execute(select(SentMessage))).scalars().all()) == 1
 
     @pytest.mark.asyncio
-    async def test_telegram_failure_does_not_crash_scheduler(
-        self, db_session: AsyncSession
-    ) -> None:
-        """A send failure on one student is logged and processing continues for others."""
+    async def test_queue_failure_does_not_crash_scheduler(self, db_session: AsyncSession) -> None:
+        """A failure on one student is logged and processing continues for others."""
         student_a = await _create_student(db_session, telegram_id=105)
         student_b = await _create_student(db_session, telegram_id=106)
-        yesterday = date.today() - timedelta(days=1)
+        yesterday = _ist_today() - timedelta(days=1)
         await _create_streak(db_session, student_id=student_a.student_id, last_date=yesterday)
         await _create_streak(db_session, student_id=student_b.student_id, last_date=yesterday)
 
-        factory = _make_factory(db_session)
-        # First call raises, second succeeds
-        mock_send = AsyncMock(side_effect=[Exception("Telegram down"), True])
+        calls = 0
 
-        with (
-            patch("src.scheduler.get_session_factory", return_value=factory),
-            patch("src.scheduler.TelegramClient") as mock_telegram_cls,
-        ):
-            mock_telegram_cls.return_value.send_message = mock_send
+        async def _flaky(*args: Any, **kwargs: Any) -> None:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ConnectionError("db blip")
+            await enqueue_message(*args, **kwargs)
+
+        with patch("src.scheduler.enqueue_message", side_effect=_flaky):
             # Must not raise
-            await send_daily_reminders()
+            await _run_job(db_session)
 
-        # Both students were attempted
-        assert mock_send.call_count == 2
+        # Both students were attempted; only the second reminder is queued and
+        # recorded (the failed one left no SentMessage row to block a retry)
+        assert calls == 2
+        assert len(await _queued(db_session)) == 1
+        rows = (await db_session.execute(select(SentMessage))).scalars().all()
+        assert len(rows) == 1
 
-        # Only the successful student's reminder is recorded (failed send must not write row)
-        from sqlalchemy import select
 
-        from src.models.sent_message import SentMessage
+class TestReminderScheduling:
+    """Per-student reminder slots read in per-minute buckets."""
 
-        rows = (await db_session.execute(select(SentMessage))).scalars().all()
-        assert (
-            len(rows) == 1
-        ), f"Expected exactly 1 SentMessage row (successful student only), got {len(rows)}"
+    @pytest.mark.asyncio
+    async def test_student_not_yet_due_is_not_reminded(self, db_session: AsyncSession) -> None:
+        later = datetime.now(UTC) + timedelta(hours=1)
+        student = await _create_student(db_session, telegram_id=201, next_reminder_at=later)
+        await _create_streak(db_session, student_id=student.student_id)
+
+        await _run_job(db_session)
+
+        assert await _queued(db_session) == []
+
+    @pytest.mark.asyncio
+    async def test_reminded_student_moves_to_next_slot(self, db_session: AsyncSession) -> None:
+        student = await _create_student(db_session, telegram_id=202)
+        await _create_streak(db_session, student_id=student.student_id)
+
+        await _run_job(db_session)
+
+        await db_session.refresh(student)
+        next_at = student.next_reminder_at
+        assert next_at is not None
+        assert next_at.replace(tzinfo=UTC) > datetime.now(UTC)
+        assert len(await _queued(db_session)) == 1
+
+    @pytest.mark.asyncio
+    async def test_new_student_is_scheduled_not_reminded(self, db_session: AsyncSession) -> None:
+        """Students without a slot get one; they are not reminded straight away."""
+        student = Student(telegram_id=203, name="New", grade=7, language="en")
+        db_session.add(student)
+        await db_session.flush()
+        await _create_streak(db_session, student_id=student.student_id)
+
+        await _run_job(db_session)
+
+        await db_session.refresh(student)
+        assert student.next_reminder_at is not None
+        assert await _queued(db_session) == []
+
+    @pytest.mark.asyncio
+    async def test_long_missed_slot_is_skipped(self, db_session: AsyncSession) -> None:
+        """After an outage, slots hours in the past are not sent late."""
+        stale = datetime.now(UTC) - timedelta(hours=5)
+        student = await _create_student(db_session, telegram_id=204, next_reminder_at=stale)
+        await _create_streak(db_session, student_id=student.student_id)
+
+        await _run_job(db_session)
+
+        await db_session.refresh(student)
+        assert await _queued(db_session) == []
+        assert student.next_reminder_at is not None
+        assert student.next_reminder_at.replace(tzinfo=UTC) > datetime.now(UTC)
+
+    @pytest.mark.asyncio
+    async def test_run_reads_buckets_until_none_due(
+        self, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The bucket size bounds one query, not the reminders sent per run."""
+        from src.config import get_settings
+
+        monkeypatch.setattr(get_settings(), "reminder_bucket_size", 2)
+        for i in range(5):
+            student = await _create_student(db_session, telegram_id=210 + i)
+            await _create_streak(db_session, student_id=student.student_id)
+
+        await _run_job(db_session)
+
+        assert len(await _queued(db_session)) == 5
+
+    @pytest.mark.asyncio
+    async def test_time_budget_leaves_rest_for_next_run(self, db_session: AsyncSession) -> None:
+        student = await _create_student(db_session, telegram_id=220)
+        await _create_streak(db_session, student_id=student.student_id)
+
+        with patch("src.scheduler._REMINDER_MAX_RUN_SECONDS", 0):
+            await _run_job(db_session)
+        assert await _queued(db_session) == []
+
+        await _run_job(db_session)
+        assert len(await _queued(db_session)) == 1
+
+    @pytest.mark.asyncio
+    async def test_inactive_students_are_rescheduled_without_reminder(
+        self, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from src.config import get_settings
+
+        monkeypatch.setattr(get_settings(), "reminder_bucket_size", 2)
+        dormant = []
+        for i in range(3):
+            student = await _create_student(db_session, telegram_id=230 + i)
+            await _create_streak(
+                db_session,
+                student_id=student.student_id,
+                last_date=_ist_today() - timedelta(days=45),
+            )
+            dormant.append(student)
+        never = await _create_student(db_session, telegram_id=233)  # No streak row at all
+        active = await _create_student(db_session, telegram_id=234)
+        await _create_streak(db_session, student_id=active.student_id)
+
+        await _run_job(db_session)
+
+        (queued,) = await _queued(db_session)
+        assert queued.chat_id == 234
+        for student in [*dormant, never]:
+            await db_session.refresh(student)
+            assert student.next_reminder_at is not None
+            assert student.next_reminder_at.replace(tzinfo=UTC) > datetime.now(UTC)
+        (record,) = (await db_session.execute(select(SentMessage))).scalars().all()
+        assert record.student_id == active.student_id
+
+    @pytest.mark.asyncio
+    async def test_reminder_is_keyed_on_students_local_date(self, db_session: AsyncSession) -> None:
+        """A UTC+14 student's day starts before the UTC day does."""
+        zone = ZoneInfo("Pacific/Kiritimati")
+        local_today = datetime.now(zone).date()
+        student = await _create_student(db_session, telegram_id=240)
+        student.timezone = "Pacific/Kiritimati"
+        await _create_streak(
+            db_session, student_id=student.student_id, last_date=local_today - timedelta(days=1)
+        )
+
+        await _run_job(db_session)
+
+        (queued,) = await _queued(db_session)
+        assert queued.idempotency_key == f"reminder:{student.student_id}:{local_today}"
+        (record,) = (await db_session.execute(select(SentMessage))).scalars().all()
+        assert record.message_key == f"reminder_{local_today}"
@@ -19,12 +19,19 @@ from src.models.streak import Streak
 from src.models.student import Student
 from src.routes.webhook import _format_streak_message
 from src.services.encouragement import EncouragementService
+from src.services.recent_variants import get_recent_variants
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _fresh_tracker() -> None:
+    """Start each test with an empty process-wide recent-variant tracker."""
+    get_recent_variants().clear()
+
+
 def _make_streak(current: int = 5, longest: int = 10) -> Streak:
     """Build an unsaved Streak ORM object (no DB needed for formatter tests)."""
     streak = Streak()
@@ -148,6 +155,7 @@ class TestEncouragementNonRepeat:
             assert isinstance(msg, str) and len(msg) > 0
 
         # Inspect SentMessage keys written
+        await get_recent_variants().flush(db_session)
         rows = (
             (
                 await db_session.execute(
@@ -182,6 +190,7 @@ class TestEncouragementNonRepeat:
                 hints_used=i,
                 language="en",
             )
+            await get_recent_variants().flush(db_session)
             rows = (
                 (
                     await db_session.execute(
@@ -210,6 +219,7 @@ class TestEncouragementNonRepeat:
                 streak=0,
                 language="en",
             )
+            await get_recent_variants().flush(db_session)
             rows = (
                 (
                     await db_session.execute(
@@ -4,8 +4,6 @@ These tests verify the full end-to-end user flows work correctly,
 including database persistence and API interactions.
 """
 
-from unittest.mock import AsyncMock, patch
-
 import pytest
 from sqlalchemy import select
 
@@ -40,20 +38,16 @@ class TestStudentOnboardingFlow:
         telegram_id = 987654321
         _pending_onboarding.pop(telegram_id, None)  # clean state
 
-        with patch("src.services.telegram_client.TelegramClient.send_message", new=AsyncMock()):
-
-            # Step 1: /start → begins onboarding, student NOT yet created
-            await _handle_message(_make_message(telegram_id, "/start", "TestUser"), db_session)
-            result = await db_session.execute(
-                select(Student).where(Student.telegram_id == telegram_id)
-            )
-            assert result.scalar_one_or_none() is None  # not yet
+        # Step 1: /start → begins onboarding, student NOT yet created
+        await _handle_message(_make_message(telegram_id, "/start", "TestUser"), db_session)
+        result = await db_session.execute(select(Student).where(Student.telegram_id == telegram_id))
+        assert result.scalar_one_or_none() is None  # not yet
 
-            # Step 2: choose grade
-            await _handle_message(_make_message(telegram_id, "7"), db_session)
+        # Step 2: choose grade
+        await _handle_message(_make_message(telegram_id, "7"), db_session)
 
-            # Step 3: choose language → student created
-            await _handle_message(_make_message(telegram_id, "1"), db_session)
+        # Step 3: choose language → student created
+        await _handle_message(_make_message(telegram_id, "1"), db_session)
 
         result = await db_session.execute(select(Student).where(Student.telegram_id == telegram_id))
         student = result.scalar_one_or_none()
@@ -7,11 +7,11 @@ PHASE3-B-4
 """
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from sqlalchemy import select
 
+from src.models.outbox_message import OutboxMessage
 from src.models.problem import Problem
 from src.models.session import Session, SessionStatus
 from src.models.student import Student
@@ -353,19 +353,12 @@ class TestWebhookMessageRouting:
 
         message = _make_message("/practice")
 
-        with patch("src.routes.webhook.TelegramClient") as mock_tg_class:
-            mock_tg = MagicMock()
-            mock_tg.send_message = AsyncMock()
-            mock_tg_class.return_value = mock_tg
+        await _handle_message(message, db_session)
 
-            await _handle_message(message, db_session)
-
-            # send_message should have been called
-            mock_tg.send_message.assert_called_once()
-            call_args = mock_tg.send_message.call_args
-            sent_text = call_args[0][1] if call_args[0] else call_args[1].get("text", "")
-            # Should contain a question
-            assert len(sent_text) > 0
+        # Exactly one reply is queued in the outbox
+        (queued,) = (await db_session.execute(select(OutboxMessage))).scalars().all()
+        assert queued.chat_id == message.chat.id
+        assert len(queued.text) > 0
 
     async def test_hint_command_via_handle_message(self, db_session) -> None:
         """_handle_message routes /hint to hint handler."""
@@ -393,11 +386,6 @@ class TestWebhookMessageRouting:
 
         message = _make_message("/hint")
 
-        with patch("src.routes.webhook.TelegramClient") as mock_tg_class:
-            mock_tg = MagicMock()
-            mock_tg.send_message = AsyncMock()
-            mock_tg_class.return_value = mock_tg
-
-            await _handle_message(message, db_session)
+        await _handle_message(message, db_session)
 
-            mock_tg.send_message.assert_called_once()
+        assert len((await db_session.execute(select(OutboxMessage))).scalars().all()) == 1
@@ -101,6 +101,34 @@ class TestNumericEvaluation:
         assert result2.is_correct is False
 
 
+@pytest.mark.unit
+class TestBundledAnswers:
+    """Correct answers come pre-normalized from the content bundle."""
+
+    def test_uses_bundled_normalized_answer(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        bundle = MagicMock()
+        bundle.answer_normalized.return_value = "1200"
+        monkeypatch.setattr("src.services.content_bundle._bundle", bundle)
+        problem = _make_problem(answer="unused")
+        problem.content_key, problem.content_hash = "key", "hash"
+
+        result = AnswerEvaluator().evaluate(problem, "1200", hints_used=0)
+
+        assert result.is_correct is True
+        bundle.answer_normalized.assert_called_once_with("key", "hash")
+
+    def test_changed_problem_normalizes_its_own_answer(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A row edited since the bundle was built is not in it (hash mismatch)."""
+        bundle = MagicMock()
+        bundle.answer_normalized.return_value = None
+        monkeypatch.setattr("src.services.content_bundle._bundle", bundle)
+        problem = _make_problem(answer="₹1,500")
+
+        assert AnswerEvaluator().evaluate(problem, "1500", hints_used=0).is_correct is True
+
+
 @pytest.mark.unit
 class TestMultipleChoiceEvaluation:
     """Tests for multiple-choice answer evaluation."""
@@ -0,0 +1,122 @@
+"""Unit tests for admin broadcast fan-out (src/services/broadcasts.py)."""
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.broadcast import Broadcast, BroadcastStatus
+from src.models.outbox_message import OutboxMessage, OutboxStatus
+from src.models.student import Student
+from src.services.broadcasts import advance_broadcasts, create_broadcast, fan_out
+
+
+async def _students(db: AsyncSession, count: int, grade: int = 7, language: str = "en") -> None:
+    start = (await db.scalar(select(Student.telegram_id).order_by(Student.telegram_id.desc()))) or 0
+    for i in range(1, count + 1):
+        db.add(Student(telegram_id=start + i, name="S", grade=grade, language=language))
+    await db.flush()
+
+
+async def _queued(db: AsyncSession) -> list[OutboxMessage]:
+    result = await db.execute(select(OutboxMessage).order_by(OutboxMessage.id))
+    return list(result.scalars().all())
+
+
+@pytest.mark.unit
+class TestCreateBroadcast:
+    async def test_counts_matching_students(self, db_session: AsyncSession) -> None:
+        await _students(db_session, 3, grade=7)
+        await _students(db_session, 2, grade=8)
+        await _students(db_session, 1, grade=7, language="bn")
+
+        broadcast = await create_broadcast(db_session, "Hi", created_by=1, grade=7, language="en")
+
+        assert broadcast.status == BroadcastStatus.SENDING
+        assert broadcast.total_recipients == 3
+        assert await _queued(db_session) == []  # Nothing is fanned out by the API
+
+    async def test_no_recipients_completes_immediately(self, db_session: AsyncSession) -> None:
+        broadcast = await create_broadcast(db_session, "Hi", created_by=1, grade=6)
+
+        assert broadcast.status == BroadcastStatus.COMPLETED
+        assert (broadcast.sent, broadcast.failed) == (0, 0)
+
+
+@pytest.mark.unit
+class TestFanOut:
+    async def test_queues_each_recipient_once_across_pages(self, db_session: AsyncSession) -> None:
+        await _students(db_session, 5)
+        broadcast = await create_broadcast(db_session, "Hi", created_by=1)
+
+        assert await fan_out(db_session, broadcast, limit=2) == 2
+        assert await fan_out(db_session, broadcast, limit=10) == 3
+        assert await fan_out(db_session, broadcast, limit=10) == 0
+
+        rows = await _queued(db_session)
+        assert len({row.chat_id for row in rows}) == 5
+        assert {row.broadcast_id for row in rows} == {broadcast.id}
+        assert broadcast.queued == 5
+
+    async def test_resumes_from_committed_cursor(
+        self, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A fan-out that crashed before commit is redone without duplicates."""
+        monkeypatch.setattr(db_session.sync_session, "expire_on_commit", False)
+        await _students(db_session, 4)
+        broadcast = await create_broadcast(db_session, "Hi", created_by=1)
+        await fan_out(db_session, broadcast, limit=2)
+        await db_session.commit()
+        broadcast_id = broadcast.id
+
+        await fan_out(db_session, broadcast, limit=2)
+        await db_session.rollback()  # Crash before commit
+
+        resumed = await db_session.get(Broadcast, broadcast_id, populate_existing=True)
+        assert resumed is not None
+        assert await fan_out(db_session, resumed, limit=10) == 2
+        await db_session.commit()
+        assert len(await _queued(db_session)) == 4
+
+    async def test_students_created_later_are_not_recipients(
+        self, db_session: AsyncSession
+    ) -> None:
+        await _students(db_session, 2)
+        broadcast = await create_broadcast(db_session, "Hi", created_by=1)
+        await _students(db_session, 2)
+
+        assert await fan_out(db_session, broadcast, limit=10) == 2
+
+
+@pytest.mark.unit
+class TestAdvanceBroadcasts:
+    async def test_in_flight_cap_limits_queueing(self, db_session: AsyncSession) -> None:
+        """Undelivered broadcast rows cap further fan-out, keeping replies ahead."""
+        await _students(db_session, 10)
+        await create_broadcast(db_session, "Hi", created_by=1)
+
+        assert await advance_broadcasts(db_session, budget=100, max_in_flight=4) == 4
+        assert await advance_broadcasts(db_session, budget=100, max_in_flight=4) == 0
+
+        await db_session.execute(update(OutboxMessage).values(status=OutboxStatus.SENT))
+        assert await advance_broadcasts(db_session, budget=3, max_in_flight=4) == 3
+
+    async def test_completes_when_every_message_settled(self, db_session: AsyncSession) -> None:
+        await _students(db_session, 3)
+        broadcast = await create_broadcast(db_session, "Hi", created_by=1)
+        await advance_broadcasts(db_session, budget=10, max_in_flight=10)
+
+        await advance_broadcasts(db_session, budget=10, max_in_flight=10)
+        assert broadcast.status == BroadcastStatus.SENDING  # Messages still pending
+
+        first_id = (await _queued(db_session))[0].id
+        await db_session.execute(update(OutboxMessage).values(status=OutboxStatus.SENT))
+        await db_session.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id == first_id)
+            .values(status=OutboxStatus.FAILED)
+        )
+        await advance_broadcasts(db_session, budget=10, max_in_flight=10)
+
+        assert broadcast.status == BroadcastStatus.COMPLETED
+        assert (broadcast.sent, broadcast.failed) == (2, 1)
+        assert broadcast.completed_at is not None
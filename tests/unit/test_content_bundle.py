@@ -0,0 +1,137 @@
+"""Unit tests for the compiled content bundle (src/services/content_bundle.py)."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+
+from src.services.content_bundle import (
+    ContentBundle,
+    ContentBundleError,
+    compile_bundle,
+    get_content_bundle,
+    load_content_bundle,
+)
+from src.services.problem_content import content_source_path, find_problem_files
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _problem(question: str, answer: str = "₹1,200", topic: str = "percentages") -> dict[str, Any]:
+    return {
+        "grade": 7,
+        "topic": topic,
+        "question_en": question,
+        "question_bn": f"{question} (bn)",
+        "answer": answer,
+        "hints": [{"en": "Hint one.", "bn": "ইঙ্গিত।"}],
+    }
+
+
+def _write_yaml(path: Path, problems: list[dict[str, Any]]) -> str:
+    path.write_text(yaml.safe_dump(problems, allow_unicode=True), encoding="utf-8")
+    return str(path)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestCompileAndLoad:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Compiled records decode back with hashes, normalized answers and indexes."""
+        a = _write_yaml(tmp_path / "a.yaml", [_problem("Q1"), _problem("Q2", topic="algebra")])
+        b = _write_yaml(tmp_path / "b.yaml", [_problem("Q3")])
+        output = tmp_path / "bundle.jsonl"
+
+        header = compile_bundle([a, b], output, workers=1)
+        bundle = ContentBundle(output)
+
+        assert header["problem_count"] == len(bundle) == 3
+        assert [p["question_en"] for p in bundle] == ["Q1", "Q2", "Q3"]
+        first = bundle.problem(0)
+        assert first["answer"] == "₹1,200"
+        assert first["answer_normalized"] == "1200"
+        assert first["hints"][0]["hint_number"] == 1
+        assert len(first["content_key"]) == len(first["content_hash"]) == 64
+        assert [p["question_en"] for p in bundle.problems_for_topic(7, "percentages")] == [
+            "Q1",
+            "Q3",
+        ]
+        assert [p["question_en"] for p in bundle.problems_for_source(content_source_path(b))] == [
+            "Q3"
+        ]
+
+    def test_lookup_by_content_key(self, tmp_path: Path) -> None:
+        """Records and normalized answers are found by content_key; edited rows are not."""
+        a = _write_yaml(tmp_path / "a.yaml", [_problem("Q1"), _problem("Q2", answer="15%")])
+        output = tmp_path / "bundle.jsonl"
+        compile_bundle([a], output, workers=1)
+        bundle = ContentBundle(output)
+        second = bundle.problem(1)
+
+        assert bundle.problem_by_key(second["content_key"]) == second
+        assert bundle.problem_by_key("0" * 64) is None
+        assert bundle.answer_normalized(second["content_key"], second["content_hash"]) == "15"
+        assert bundle.answer_normalized(second["content_key"], "changed") is None
+
+    def test_invalid_content_fails_without_touching_bundle(self, tmp_path: Path) -> None:
+        """Any invalid or duplicate problem aborts the build; the old bundle stays."""
+        good = _write_yaml(tmp_path / "good.yaml", [_problem("Q1")])
+        output = tmp_path / "bundle.jsonl"
+        compile_bundle([good], output, workers=1)
+        before = output.read_bytes()
+
+        bad_problem = _problem("Q2")
+        del bad_problem["answer"]
+        bad = _write_yaml(tmp_path / "bad.yaml", [bad_problem, _problem("Q1")])
+
+        with pytest.raises(ContentBundleError, match="2 content error"):
+            compile_bundle([good, bad], output, workers=1)
+        assert output.read_bytes() == before
+
+    def test_stale_sources(self, tmp_path: Path) -> None:
+        """Edited sources are reported as stale without parsing anything."""
+        a = _write_yaml(tmp_path / "a.yaml", [_problem("Q1")])
+        b = _write_yaml(tmp_path / "b.yaml", [_problem("Q2")])
+        output = tmp_path / "bundle.jsonl"
+        compile_bundle([a, b], output, workers=1)
+        bundle = ContentBundle(output)
+        assert bundle.stale_sources([a, b]) == []
+
+        _write_yaml(tmp_path / "b.yaml", [_problem("Q2", answer="7")])
+        assert bundle.stale_sources([a, b]) == [content_source_path(b)]
+
+    def test_not_a_bundle(self, tmp_path: Path) -> None:
+        """Missing, empty or foreign files raise ContentBundleError."""
+        empty = tmp_path / "empty.jsonl"
+        empty.write_bytes(b"")
+        other = tmp_path / "other.jsonl"
+        other.write_text('{"hello": 1}\n')
+
+        for path in (tmp_path / "missing.jsonl", empty, other):
+            with pytest.raises(ContentBundleError):
+                ContentBundle(path)
+
+    def test_repo_content_compiles(self, tmp_path: Path) -> None:
+        """The shipped YAML catalog passes validation."""
+        files = find_problem_files()
+        header = compile_bundle(files, tmp_path / "bundle.jsonl")
+        assert header["problem_count"] >= 100
+        assert len(header["sources"]) == len(files)
+
+
+class TestLoadContentBundle:
+    def test_load_replaces_process_bundle(self, tmp_path: Path) -> None:
+        """load_content_bundle() swaps the process-wide bundle."""
+        a = _write_yaml(tmp_path / "a.yaml", [_problem("Q1")])
+        output = tmp_path / "bundle.jsonl"
+        compile_bundle([a], output, workers=1)
+
+        bundle = load_content_bundle(output)
+        assert get_content_bundle() is bundle
+        assert len(bundle) == 1
@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from fastapi.testclient import TestClient
 
-from src.auth.student import verify_student
+from src.auth.student import AuthenticatedStudent, verify_student
 from src.database import get_session
 from src.main import app
 
@@ -42,7 +42,9 @@ def get_mock_verify_student(student_id: int = 123):
     """Return a function that mocks student verification."""
 
     async def _verify_student():
-        return student_id
+        return AuthenticatedStudent(
+            student_id=1, telegram_id=student_id, grade=7, language="en", difficulty_level=1
+        )
 
     return _verify_student
 
@@ -141,8 +143,11 @@ class TestWebhookEndpoint:
         # Override database dependency
         app.dependency_overrides[get_session] = get_mock_db(mock_db)
 
-        # Mock TelegramClient and StudentService to avoid actual API calls
-        with patch("src.routes.webhook.TelegramClient"), patch("src.routes.webhook.StudentService"):
+        # Mock the outbox and StudentService; the database is a mock
+        with (
+            patch("src.routes.webhook.enqueue_message"),
+            patch("src.routes.webhook.StudentService"),
+        ):
             try:
                 response = client.post(
                     "/webhook",
@@ -179,8 +184,11 @@ class TestWebhookEndpoint:
         # Override database dependency
         app.dependency_overrides[get_session] = get_mock_db(mock_db)
 
-        # Mock TelegramClient and StudentService to avoid actual API calls
-        with patch("src.routes.webhook.TelegramClient"), patch("src.routes.webhook.StudentService"):
+        # Mock the outbox and StudentService; the database is a mock
+        with (
+            patch("src.routes.webhook.enqueue_message"),
+            patch("src.routes.webhook.StudentService"),
+        ):
             try:
                 response = client.post(
                     "/webhook",
@@ -218,8 +226,11 @@ class TestWebhookEndpoint:
         # Override database dependency
         app.dependency_overrides[get_session] = get_mock_db(mock_db)
 
-        # Mock TelegramClient and StudentService to avoid actual API calls
-        with patch("src.routes.webhook.TelegramClient"), patch("src.routes.webhook.StudentService"):
+        # Mock the outbox and StudentService; the database is a mock
+        with (
+            patch("src.routes.webhook.enqueue_message"),
+            patch("src.routes.webhook.StudentService"),
+        ):
             try:
                 response = client.post(
                     "/webhook",
@@ -251,12 +262,6 @@ class TestPracticeEndpoints:
         app.dependency_overrides[get_session] = get_mock_db(mock_db)
         app.dependency_overrides[verify_student] = get_mock_verify_student(123)
 
-        # Build mock student
-        mock_student = MagicMock()
-        mock_student.student_id = 1
-        mock_student.grade = 7
-        mock_student.language = "en"
-
         # Build mock problem (used by _problem_to_schema)
         mock_problem = MagicMock()
         mock_problem.problem_id = 1
@@ -274,10 +279,6 @@ class TestPracticeEndpoints:
         mock_session.expires_at = datetime.now(UTC) + timedelta(hours=24)
 
         with (
-            patch(
-                "src.routes.practice._get_student_by_telegram_id",
-                new=AsyncMock(return_value=mock_student),
-            ),
             patch("src.routes.practice.SessionRepository") as MockSessionRepo,
             patch("src.routes.practice.ProblemRepository"),
             patch("src.routes.practice.ResponseRepository"),
@@ -332,11 +333,6 @@ class TestPracticeEndpoints:
         app.dependency_overrides[get_session] = get_mock_db(mock_db)
         app.dependency_overrides[verify_student] = get_mock_verify_student(123)
 
-        mock_student = MagicMock()
-        mock_student.student_id = 1
-        mock_student.grade = 7
-        mock_student.language = "en"
-
         mock_problem = MagicMock()
         mock_problem.problem_id = 1
         mock_problem.answer = "75"
@@ -358,10 +354,6 @@ class TestPracticeEndpoints:
         )
 
         with (
-            patch(
-                "src.routes.practice._get_student_by_telegram_id",
-                new=AsyncMock(return_value=mock_student),
-            ),
             patch("src.routes.practice.SessionRepository") as MockSessionRepo,
             patch("src.routes.practice.ProblemRepository") as MockProblemRepo,
             patch("src.routes.practice.ResponseRepository") as MockResponseRepo,
@@ -467,9 +459,6 @@ class TestStreakEndpoint:
 
         from src.models.streak import Streak
 
-        mock_student = MagicMock()
-        mock_student.student_id = 1
-
         mock_streak = MagicMock(spec=Streak)
         mock_streak.current_streak = 5
         mock_streak.longest_streak = 10
@@ -479,13 +468,7 @@ class TestStreakEndpoint:
         app.dependency_overrides[get_session] = get_mock_db(mock_db)
         app.dependency_overrides[verify_student] = get_mock_verify_student(123)
 
-        with (
-            patch(
-                "src.routes.streak._get_student_by_telegram_id",
-                new=AsyncMock(return_value=mock_student),
-            ),
-            patch("src.routes.streak.StreakRepository") as MockStreakRepo,
-        ):
+        with patch("src.routes.streak.StreakRepository") as MockStreakRepo:
             mock_streak_repo = MockStreakRepo.return_value
             mock_streak_repo.get_or_create = AsyncMock(return_value=mock_streak)
 
@@ -516,6 +499,9 @@ class TestStudentEndpoints:
         s.name = "Test Student"
         s.grade = 7
         s.language = "en"
+        s.timezone = "Asia/Kolkata"
+        s.reminder_hour = 18
+        s.next_reminder_at = None
         s.created_at = datetime.now(UTC)
         s.updated_at = datetime.now(UTC)
         return s
@@ -579,6 +565,24 @@ class TestStudentEndpoints:
         )
         assert response.status_code == 200
 
+    def test_update_profile_accepts_reminder_time(self) -> None:
+        """Profile update should accept a timezone and reminder hour."""
+        response = client.patch(
+            "/student/profile",
+            headers={"X-Student-ID": "123"},
+            json={"timezone": "Asia/Dhaka", "reminder_hour": 19},
+        )
+        assert response.status_code == 200
+
+    def test_update_profile_rejects_unknown_timezone(self) -> None:
+        """Profile update should reject a timezone name the system does not know."""
+        response = client.patch(
+            "/student/profile",
+            headers={"X-Student-ID": "123"},
+            json={"timezone": "Mars/Olympus_Mons"},
+        )
+        assert response.status_code == 422
+
 
 @pytest.mark.unit
 class TestAdminEndpoints:
@@ -0,0 +1,154 @@
+"""Unit tests for the background health monitor and /health/live, /health/ready."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.config import get_settings
+from src.main import app
+from src.services.health_monitor import HealthMonitor
+
+client = TestClient(app)
+
+
+def _pool(size: int | None, checked_out: int | None) -> dict[str, int | None]:
+    return {"size": size, "checked_out": checked_out, "overflow": 0, "timeouts": 0}
+
+
+@pytest.fixture
+def healthy():
+    """Scheduler running, no pool, empty queues."""
+    with (
+        patch("src.services.health_monitor.scheduler", MagicMock(running=True)),
+        patch("src.services.health_monitor.pool_stats.snapshot", return_value=_pool(None, None)),
+    ):
+        yield
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("healthy")
+class TestHealthMonitor:
+    """HealthMonitor caches the DB check and combines in-memory signals."""
+
+    async def _monitor(self, db_ok: bool = True) -> HealthMonitor:
+        monitor = HealthMonitor(interval=10)
+        with patch("src.database.check_connection", AsyncMock(return_value=db_ok)):
+            await monitor.refresh()
+        return monitor
+
+    def test_not_ready_before_first_check(self) -> None:
+        report = HealthMonitor(interval=10).readiness()
+
+        assert report["status"] == "error"
+        assert report["checks"]["db"]["status"] == "unknown"
+
+    async def test_ready_after_successful_check(self) -> None:
+        monitor = await self._monitor()
+
+        report = monitor.readiness()
+
+        assert report["status"] == "ok"
+        assert report["checks"]["db"]["status"] == "ok"
+        assert report["checks"]["db"]["age_seconds"] >= 0
+
+    async def test_failed_check_not_ready(self) -> None:
+        monitor = await self._monitor(db_ok=False)
+
+        assert monitor.readiness()["status"] == "error"
+        assert monitor.db_status == "error"
+
+    async def test_timeout_recorded(self, monkeypatch) -> None:
+        async def _hang() -> bool:
+            await asyncio.sleep(1)
+            return True
+
+        monkeypatch.setattr("src.services.health_monitor.DB_CHECK_TIMEOUT", 0.01)
+        monitor = HealthMonitor(interval=10)
+        with patch("src.database.check_connection", _hang):
+            assert await monitor.refresh() == "timeout"
+
+    async def test_stale_result_not_ready(self) -> None:
+        monitor = await self._monitor()
+        monitor._db_checked_at -= 31  # Three missed intervals
+
+        db = monitor.readiness()["checks"]["db"]
+
+        assert db["ok"] is False
+        assert db["status"] == "stale"
+
+    async def test_pool_saturation_not_ready(self, monkeypatch) -> None:
+        monkeypatch.setattr(get_settings(), "db_max_overflow", 5)
+        monitor = await self._monitor()
+        with (
+            patch("src.services.health_monitor.database._engine", MagicMock()),
+            patch(
+                "src.services.health_monitor.pool_stats.snapshot",
+                return_value=_pool(size=5, checked_out=9),
+            ),
+        ):
+            pool = monitor.readiness()["checks"]["pool"]
+
+        assert pool["ok"] is False
+        assert pool["saturation"] == 0.9
+        assert pool["capacity"] == 10
+
+    async def test_stopped_scheduler_not_ready(self) -> None:
+        monitor = await self._monitor()
+        with patch("src.services.health_monitor.scheduler", MagicMock(running=False)):
+            assert monitor.readiness()["checks"]["scheduler"]["ok"] is False
+
+    async def test_queue_backlog_not_ready(self, monkeypatch) -> None:
+        monkeypatch.setattr(get_settings(), "health_queue_depth_limit", 10)
+        monitor = await self._monitor()
+        with patch("src.services.health_monitor.log_queue_depth", return_value=10):
+            queues = monitor.readiness()["checks"]["queues"]
+
+        assert queues["ok"] is False
+        assert queues["depths"]["log_records"] == 10
+
+    async def test_background_loop_refreshes(self) -> None:
+        monitor = HealthMonitor(interval=0.01)
+        check = AsyncMock(return_value=True)
+        with patch("src.database.check_connection", check):
+            monitor.start()
+            await asyncio.sleep(0.05)
+            await monitor.stop()
+
+        assert check.await_count >= 2
+        assert not monitor.running
+
+
+@pytest.mark.unit
+class TestHealthEndpoints:
+    """Probe endpoints are served from memory."""
+
+    def test_liveness(self) -> None:
+        response = client.get("/health/live")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ok"
+        assert response.json()["uptime_seconds"] >= 0
+
+    @pytest.mark.parametrize(("ready", "code"), [("ok", 200), ("error", 503)])
+    def test_readiness_status_code(self, ready: str, code: int) -> None:
+        monitor = MagicMock()
+        monitor.readiness.return_value = {"status": ready, "checks": {}, "timestamp": "t"}
+        with patch("src.routes.health.get_health_monitor", return_value=monitor):
+            response = client.get("/health/ready")
+
+        assert response.status_code == code
+        assert response.json()["status"] == ready
+
+    def test_health_uses_cached_db_status(self) -> None:
+        monitor = MagicMock(has_result=True, db_status="ok")
+        check = AsyncMock(return_value=True)
+        with (
+            patch("src.routes.health.get_health_monitor", return_value=monitor),
+            patch("src.database.check_connection", check),
+        ):
+            response = client.get("/health")
+
+        assert response.json()["db"] == "ok"
+        check.assert_not_awaited()
@@ -90,7 +90,7 @@ class TestHintGeneratorCacheHit:
         db = AsyncMock()
         problem = _make_problem()
 
-        with patch("src.services.hint_generator.anthropic.AsyncAnthropic") as mock_client:
+        with patch("anthropic.AsyncAnthropic") as mock_client:
             await gen.get_hint(
                 db=db,
                 problem=problem,
@@ -191,7 +191,7 @@ class TestHintGeneratorRateLimit:
             patch.object(
                 gen, "_ai_hints_today", new=AsyncMock(return_value=_MAX_AI_HINTS_PER_DAY - 1)
             ),
-            patch("src.services.hint_generator.anthropic.AsyncAnthropic") as mock_anthropic,
+            patch("anthropic.AsyncAnthropic") as mock_anthropic,
         ):
             mock_settings.return_value.anthropic_api_key = "sk-test"
             mock_anthropic.return_value.messages.create = AsyncMock(return_value=mock_resp)
@@ -226,7 +226,7 @@ class TestHintGeneratorApiSuccess:
         with (
             patch("src.services.hint_generator.get_settings") as mock_settings,
             patch.object(gen, "_ai_hints_today", new=AsyncMock(return_value=0)),
-            patch("src.services.hint_generator.anthropic.AsyncAnthropic") as mock_anthropic,
+            patch("anthropic.AsyncAnthropic") as mock_anthropic,
         ):
             mock_settings.return_value.anthropic_api_key = "sk-test"
             mock_anthropic.return_value.messages.create = AsyncMock(return_value=mock_resp)
@@ -255,7 +255,7 @@ class TestHintGeneratorApiSuccess:
         with (
             patch("src.services.hint_generator.get_settings") as mock_settings,
             patch.object(gen, "_ai_hints_today", new=AsyncMock(return_value=0)),
-            patch("src.services.hint_generator.anthropic.AsyncAnthropic") as mock_anthropic,
+            patch("anthropic.AsyncAnthropic") as mock_anthropic,
         ):
             mock_settings.return_value.anthropic_api_key = "sk-test"
             mock_anthropic.return_value.messages.create = AsyncMock(return_value=mock_resp)
@@ -281,7 +281,7 @@ class TestHintGeneratorApiSuccess:
         with (
             patch("src.services.hint_generator.get_settings") as mock_settings,
             patch.object(gen, "_ai_hints_today", new=AsyncMock(return_value=0)),
-            patch("src.services.hint_generator.anthropic.AsyncAnthropic") as mock_anthropic,
+            patch("anthropic.AsyncAnthropic") as mock_anthropic,
         ):
             mock_settings.return_value.anthropic_api_key = "sk-test"
             mock_anthropic.return_value.messages.create = capture_create
@@ -317,7 +317,7 @@ class TestHintGeneratorApiFallback:
         with (
             patch("src.services.hint_generator.get_settings") as mock_settings,
             patch.object(gen, "_ai_hints_today", new=AsyncMock(return_value=0)),
-            patch("src.services.hint_generator.anthropic.AsyncAnthropic") as mock_anthropic,
+            patch("anthropic.AsyncAnthropic") as mock_anthropic,
             patch("src.services.hint_generator.asyncio.sleep", new=AsyncMock()),
         ):
             mock_settings.return_value.anthropic_api_key = "sk-test"
@@ -357,7 +357,7 @@ class TestHintGeneratorApiFallback:
         with (
             patch("src.services.hint_generator.get_settings") as mock_settings,
             patch.object(gen, "_ai_hints_today", new=AsyncMock(return_value=0)),
-            patch("src.services.hint_generator.anthropic.AsyncAnthropic") as mock_anthropic,
+            patch("anthropic.AsyncAnthropic") as mock_anthropic,
         ):
             mock_settings.return_value.anthropic_api_key = "sk-bad"
             mock_anthropic.return_value.messages.create = raise_auth
@@ -0,0 +1,152 @@
+"""Unit tests for lease-based leader election (src/services/leader_election.py)."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.scheduler_lease import SchedulerLease
+from src.services.leader_election import LeaderLease
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_800_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _pair(clock: _Clock) -> tuple[LeaderLease, LeaderLease]:
+    return (
+        LeaderLease("scheduler", lease_seconds=30, holder="web-1:10:a", clock=clock),
+        LeaderLease("scheduler", lease_seconds=30, holder="web-2:10:b", clock=clock),
+    )
+
+
+class TestLeaderLease:
+    async def test_only_one_holder(self, db_session: AsyncSession) -> None:
+        """The first process takes the lease; the second stands by."""
+        clock = _Clock()
+        first, second = _pair(clock)
+
+        assert await first.renew(db_session) is True
+        assert await second.renew(db_session) is False
+        assert first.is_leader
+        assert not second.is_leader
+
+    async def test_renewal_keeps_lease_and_acquired_at(self, db_session: AsyncSession) -> None:
+        """Heartbeats extend the lease without resetting acquired_at."""
+        clock = _Clock()
+        first, second = _pair(clock)
+        await first.renew(db_session)
+        acquired_at = (await db_session.execute(select(SchedulerLease.acquired_at))).scalar_one()
+
+        for _ in range(5):
+            clock.now += 20  # Less than the lease each time
+            assert await first.renew(db_session) is True
+            assert await second.renew(db_session) is False
+
+        lease = (await db_session.execute(select(SchedulerLease))).scalar_one()
+        await db_session.refresh(lease)
+        assert lease.holder == "web-1:10:a"
+        assert lease.acquired_at == acquired_at
+
+    async def test_failover_after_expiry(self, db_session: AsyncSession) -> None:
+        """A leader that stops renewing loses the lease once it expires."""
+        clock = _Clock()
+        first, second = _pair(clock)
+        await first.renew(db_session)
+
+        clock.now += 31
+        assert not first.is_leader  # Local expiry, before anyone takes over
+        assert await second.renew(db_session) is True
+        assert await first.renew(db_session) is False
+        assert second.is_leader
+
+    async def test_release_hands_over_immediately(self, db_session: AsyncSession) -> None:
+        """release() lets another process take the lease without waiting."""
+        clock = _Clock()
+        first, second = _pair(clock)
+        await first.renew(db_session)
+
+        await first.release(db_session)
+
+        assert not first.is_leader
+        assert await second.renew(db_session) is True
+
+    async def test_release_by_follower_is_harmless(self, db_session: AsyncSession) -> None:
+        """A follower's release() does not touch the leader's lease."""
+        clock = _Clock()
+        first, second = _pair(clock)
+        await first.renew(db_session)
+
+        await second.release(db_session)
+
+        assert await second.renew(db_session) is False
+        assert await first.renew(db_session) is True
+
+
+class TestSchedulerLeadership:
+    def _factory(self, session: object) -> MagicMock:
+        cm = AsyncMock()
+        cm.__aenter__ = AsyncMock(return_value=session)
+        cm.__aexit__ = AsyncMock(return_value=None)
+        return MagicMock(return_value=cm)
+
+    async def test_leader_only_skips_on_follower(self, monkeypatch) -> None:
+        """Leader-only jobs do nothing in processes without the lease."""
+        from src.config import get_settings
+        from src.scheduler import leader_only
+
+        monkeypatch.setattr(get_settings(), "scheduler_leader_election", True)
+        job = AsyncMock(__name__="job")
+        lease = MagicMock(is_leader=False)
+        with patch("src.scheduler.get_leader_lease", return_value=lease):
+            await leader_only(job)()
+            job.assert_not_awaited()
+
+            lease.is_leader = True
+            await leader_only(job)()
+            job.assert_awaited_once()
+
+    async def test_leader_only_runs_everywhere_when_disabled(self, monkeypatch) -> None:
+        """SCHEDULER_LEADER_ELECTION=false restores run-in-every-process."""
+        from src.config import get_settings
+        from src.scheduler import leader_only
+
+        monkeypatch.setattr(get_settings(), "scheduler_leader_election", False)
+        job = AsyncMock(__name__="job")
+        with patch("src.scheduler.get_leader_lease", return_value=MagicMock(is_leader=False)):
+            await leader_only(job)()
+
+        job.assert_awaited_once()
+
+    async def test_renew_failure_keeps_current_lease(self) -> None:
+        """A database error during the heartbeat does not drop a live lease."""
+        from src.scheduler import renew_leadership
+
+        lease = MagicMock(is_leader=True, holder="web-1")
+        lease.renew = AsyncMock(side_effect=ConnectionError("db down"))
+        with (
+            patch("src.scheduler.get_leader_lease", return_value=lease),
+            patch("src.scheduler.get_session_factory", return_value=self._factory(AsyncMock())),
+        ):
+            assert await renew_leadership() is True
+
+    async def test_release_only_when_leader(self) -> None:
+        """Shutdown releases the lease only if this process holds it."""
+        from src.scheduler import release_leadership
+
+        lease = MagicMock(is_leader=False)
+        lease.release = AsyncMock()
+        with patch("src.scheduler.get_leader_lease", return_value=lease):
+            await release_leadership()
+            lease.release.assert_not_awaited()
+
+            lease.is_leader = True
+            with patch(
+                "src.scheduler.get_session_factory", return_value=self._factory(AsyncMock())
+            ):
+                await release_leadership()
+            lease.release.assert_awaited_once()
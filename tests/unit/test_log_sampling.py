@@ -0,0 +1,107 @@
+"""Unit tests for per-event log sampling (src/logging/sampling.py)."""
+
+import logging
+from collections.abc import Iterator
+
+import pytest
+
+from src.logging.config import StructuredLogger
+from src.logging.sampling import (
+    LogSampler,
+    SamplingRule,
+    get_log_sampler,
+    parse_sampling_rules,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLogSampler:
+    def test_sample_every(self) -> None:
+        """1 in N records is kept; the rest are counted as suppressed."""
+        sampler = LogSampler({"tick": SamplingRule(sample_every=10)}, clock=_Clock())
+
+        kept = [sampler.allow("tick") for _ in range(100)]
+
+        assert kept.count(10) == 10
+        assert kept.count(None) == 90
+        assert sampler.take_summary(force=True) == {"tick": 90}
+        assert sampler.take_summary(force=True) is None
+
+    def test_rate_limit_window(self) -> None:
+        """At most max_per_window records are kept per window."""
+        clock = _Clock()
+        sampler = LogSampler(
+            {"tick": SamplingRule(max_per_window=3, window_seconds=10)}, clock=clock
+        )
+
+        assert [sampler.allow("tick") for _ in range(5)] == [1, 1, 1, None, None]
+        clock.now = 10
+        assert sampler.allow("tick") == 1
+
+    def test_unknown_events_always_kept(self) -> None:
+        """Events without a rule are never suppressed or counted."""
+        sampler = LogSampler({"tick": SamplingRule(sample_every=2)})
+
+        assert all(sampler.allow("other") == 1 for _ in range(5))
+        assert sampler.take_summary(force=True) is None
+
+    def test_summary_interval(self) -> None:
+        """Summaries are only due once per summary_interval unless forced."""
+        clock = _Clock()
+        sampler = LogSampler(
+            {"tick": SamplingRule(sample_every=2)}, summary_interval=60, clock=clock
+        )
+        sampler.allow("tick")
+        sampler.allow("tick")
+
+        assert sampler.take_summary() is None
+        clock.now = 60
+        assert sampler.take_summary() == {"tick": 1}
+
+
+class TestParseSamplingRules:
+    def test_parse(self) -> None:
+        """Both rule forms parse; event names may contain spaces."""
+        rules = parse_sampling_rules("Received Telegram update=1/50; hint_cache_hit=100/60s;")
+
+        assert rules == {
+            "Received Telegram update": SamplingRule(sample_every=50),
+            "hint_cache_hit": SamplingRule(max_per_window=100, window_seconds=60.0),
+        }
+
+    @pytest.mark.parametrize("spec", ["tick", "tick=10", "tick=3/10", "tick=1/0", "=1/2"])
+    def test_invalid(self, spec: str) -> None:
+        """Malformed entries raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_sampling_rules(spec)
+
+
+class TestStructuredLoggerSampling:
+    @pytest.fixture(autouse=True)
+    def _sampling(self) -> Iterator[None]:
+        get_log_sampler().configure(
+            {"tick": SamplingRule(sample_every=5), "Auth failed": SamplingRule(sample_every=5)}
+        )
+        yield
+        get_log_sampler().configure({})
+
+    def test_info_sampled_warning_never(self, caplog: pytest.LogCaptureFixture) -> None:
+        """INFO records of a sampled event are thinned; WARNING records are not."""
+        logger = StructuredLogger("src.test.sampling")
+        with caplog.at_level(logging.INFO, logger="src.test.sampling"):
+            for _ in range(10):
+                logger.info("tick", n=1)
+                logger.warning("Auth failed")
+
+        ticks = [r for r in caplog.records if r.getMessage() == "tick"]
+        warnings = [r for r in caplog.records if r.getMessage() == "Auth failed"]
+        assert len(ticks) == 2
+        assert ticks[0].extra == {"n": 1, "sample_every": 5}  # type: ignore[attr-defined]
+        assert len(warnings) == 10
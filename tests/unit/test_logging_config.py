@@ -0,0 +1,116 @@
+"""Unit tests for JSON log formatting and the queue pipeline (src/logging/config.py)."""
+
+import io
+import json
+import logging
+import queue
+from logging.handlers import QueueListener
+
+from src.logging.config import (
+    MASKED,
+    DeferredQueueHandler,
+    JSONFormatter,
+    StructuredLogger,
+    sanitize_log_data,
+)
+
+
+def _record(message: str, *args: object, **extra: object) -> logging.LogRecord:
+    record = logging.LogRecord("src.test", logging.INFO, __file__, 1, message, args, None)
+    if extra:
+        record.extra = extra
+    return record
+
+
+class TestSanitizeLogData:
+    def test_masks_sensitive_keys_and_pairs(self) -> None:
+        """Sensitive dict keys and key=value strings are masked at any depth (SEC-006)."""
+        data = {
+            "API_KEY": "abc",
+            "nested": [{"token": "t"}, "Authorization: Bearer x", "grade=7"],
+            "count": 3,
+        }
+
+        assert sanitize_log_data(data) == {
+            "API_KEY": MASKED,
+            "nested": [{"token": MASKED}, MASKED, "grade=7"],
+            "count": 3,
+        }
+
+    def test_key_without_separator_is_kept(self) -> None:
+        """Mentioning a sensitive word without = or : is not a credential."""
+        assert sanitize_log_data("token refreshed") == "token refreshed"
+
+
+class TestJSONFormatter:
+    def test_format(self) -> None:
+        """Records become one JSON object with sanitized message and extra."""
+        record = _record("hint %s for %s", 2, "password=hunter2", student="abc", secret="s")
+
+        payload = json.loads(JSONFormatter().format(record))
+
+        assert payload["level"] == "INFO"
+        assert payload["logger"] == "src.test"
+        assert payload["message"] == MASKED
+        assert payload["extra"] == {"student": "abc", "secret": MASKED}
+
+    def test_stdlib_extra_is_output(self) -> None:
+        """Keys passed through logging's extra={...} are not dropped."""
+        record = logging.makeLogRecord(
+            {
+                "name": "src.db",
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": "slow_query",
+                "request_id": "r1",
+                "fingerprint": "SELECT ?",
+                "duration_ms": 120.5,
+            }
+        )
+
+        payload = json.loads(JSONFormatter().format(record))
+
+        assert payload["request_id"] == "r1"
+        assert payload["extra"] == {"fingerprint": "SELECT ?", "duration_ms": 120.5}
+
+
+class TestQueuePipeline:
+    def test_records_are_formatted_on_listener(self) -> None:
+        """Log calls enqueue; the listener writes JSON lines with tracebacks."""
+        stream = io.StringIO()
+        target = logging.StreamHandler(stream)
+        target.setFormatter(JSONFormatter())
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        listener = QueueListener(log_queue, target)
+        logger = StructuredLogger("src.test.pipeline")
+        logger.logger.addHandler(DeferredQueueHandler(log_queue))
+        logger.logger.propagate = False
+        logger.logger.setLevel(logging.INFO)
+        listener.start()
+        try:
+            logger.info("update received", update_id=7)
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.logger.exception("failed")
+        finally:
+            listener.stop()
+            logger.logger.handlers.clear()
+            logger.logger.propagate = True
+            logger.logger.setLevel(logging.NOTSET)
+
+        first, second = (json.loads(line) for line in stream.getvalue().splitlines())
+        assert first["message"] == "update received"
+        assert first["extra"] == {"update_id": 7}
+        assert second["message"] == "failed"
+        assert "exception" in second
+
+    def test_prepare_resolves_arguments(self) -> None:
+        """Arguments are bound at log time, so later mutation does not leak in."""
+        items = ["a"]
+        record = _record("items=%s", items)
+
+        prepared = DeferredQueueHandler(queue.SimpleQueue()).prepare(record)
+        items.append("b")
+
+        assert prepared.getMessage() == "items=['a']"
@@ -0,0 +1,130 @@
+"""Unit tests for the message catalog (src/services/messages.py)."""
+
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.message_template import MessageCategory, MessageTemplate
+from src.services.messages import (
+    MESSAGES,
+    CompiledTemplate,
+    MessageKey,
+    get_message,
+    get_message_catalog,
+    refresh_message_catalog,
+    reset_message_catalog,
+)
+
+
+@pytest.fixture(autouse=True)
+def _default_catalog() -> Iterator[None]:
+    """Every test starts and ends with the code-default catalog."""
+    reset_message_catalog()
+    yield
+    reset_message_catalog()
+
+
+def _template(key: str, en: str, bn: str) -> MessageTemplate:
+    return MessageTemplate(
+        message_key=key, category=MessageCategory.UI, message_en=en, message_bn=bn, variables=[]
+    )
+
+
+class TestCompiledTemplate:
+    def test_fields_extracted(self) -> None:
+        """Placeholder names are parsed once, including attribute/index access."""
+        template = CompiledTemplate.parse("Hi {name}, {stats.days} days, {items[0]}")
+        assert template.fields == frozenset({"name", "stats", "items"})
+
+    def test_missing_placeholder_renders_none(self) -> None:
+        """render() returns None instead of raising when a kwarg is missing."""
+        assert CompiledTemplate.parse("Hi {name}").render({}) is None
+        assert CompiledTemplate.parse("Hi {name}").render({"name": "Ria"}) == "Hi Ria"
+
+    def test_unbalanced_braces_rejected(self) -> None:
+        """Malformed templates fail at parse time, not when a student is waiting."""
+        with pytest.raises(ValueError):
+            CompiledTemplate.parse("Hi {name")
+
+
+class TestGetMessage:
+    def test_code_defaults(self) -> None:
+        """Without overrides, messages come straight from MESSAGES."""
+        assert get_message_catalog().version == 0
+        assert get_message(MessageKey.WELCOME, "en", name="Ria") == MESSAGES[MessageKey.WELCOME][
+            "en"
+        ].format(name="Ria")
+
+    def test_unknown_language_falls_back_to_english(self) -> None:
+        """Unsupported languages get the English text."""
+        assert get_message(MessageKey.HELP, "fr") == MESSAGES[MessageKey.HELP]["en"]
+
+    def test_missing_kwarg_returns_template(self) -> None:
+        """A missing placeholder kwarg returns the raw template instead of raising."""
+        assert (
+            get_message(MessageKey.WELCOME, "en", other="x") == MESSAGES[MessageKey.WELCOME]["en"]
+        )
+
+
+class TestRefreshMessageCatalog:
+    async def test_override_applies_without_restart(self, db_session: AsyncSession) -> None:
+        """A message_templates row replaces the code default after a refresh."""
+        db_session.add(_template("welcome", "Hello {name}!", "নমস্কার {name}!"))
+        await db_session.flush()
+
+        catalog = await refresh_message_catalog(db_session)
+
+        assert catalog.version == 1
+        assert catalog.overrides == ("welcome",)
+        assert get_message(MessageKey.WELCOME, "en", name="Ria") == "Hello Ria!"
+        assert get_message(MessageKey.WELCOME, "bn", name="Ria") == "নমস্কার Ria!"
+
+    async def test_unchanged_rows_keep_version(self, db_session: AsyncSession) -> None:
+        """Polling an unchanged table does not rebuild the catalog."""
+        db_session.add(_template("welcome", "Hello {name}!", "নমস্কার {name}!"))
+        await db_session.flush()
+
+        first = await refresh_message_catalog(db_session)
+        second = await refresh_message_catalog(db_session)
+        forced = await refresh_message_catalog(db_session, force=True)
+
+        assert second is first
+        assert forced.version == first.version + 1
+
+    async def test_edit_bumps_version(self, db_session: AsyncSession) -> None:
+        """Editing a row yields a new catalog version with the new wording."""
+        row = _template("welcome", "Hello {name}!", "নমস্কার {name}!")
+        db_session.add(row)
+        await db_session.flush()
+        await refresh_message_catalog(db_session)
+
+        row.message_en = "Hey {name}!"
+        await db_session.flush()
+        catalog = await refresh_message_catalog(db_session)
+
+        assert catalog.version == 2
+        assert get_message(MessageKey.WELCOME, "en", name="Ria") == "Hey Ria!"
+
+    async def test_invalid_rows_are_rejected(self, db_session: AsyncSession) -> None:
+        """Rows with bad braces or unknown placeholders keep the code default."""
+        db_session.add(_template("welcome", "Hello {student}!", "নমস্কার {student}!"))
+        db_session.add(_template("help", "Broken {", "ভাঙা {"))
+        await db_session.flush()
+
+        catalog = await refresh_message_catalog(db_session)
+
+        assert sorted(catalog.rejected) == ["help", "welcome"]
+        assert get_message(MessageKey.HELP, "en") == MESSAGES[MessageKey.HELP]["en"]
+
+    async def test_db_only_keys_and_partial_rows(self, db_session: AsyncSession) -> None:
+        """New keys are served by name; an empty language keeps the default text."""
+        db_session.add(_template("feedback_correct", "Correct! 🎉", "সঠিক! 🎉"))
+        db_session.add(_template("help", "Custom help", ""))
+        await db_session.flush()
+
+        await refresh_message_catalog(db_session)
+
+        assert get_message("feedback_correct", "bn") == "সঠিক! 🎉"
+        assert get_message(MessageKey.HELP, "en") == "Custom help"
+        assert get_message(MessageKey.HELP, "bn") == MESSAGES[MessageKey.HELP]["bn"]
@@ -0,0 +1,98 @@
+"""Unit tests for the metrics registry (src/metrics.py) and GET /metrics."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.metrics import WEBHOOK_COMMAND_SECONDS, MetricsRegistry
+
+client = TestClient(app)
+
+
+class TestMetricsRegistry:
+    def test_counter_render(self) -> None:
+        """Counters render one sample per label set with escaped values."""
+        registry = MetricsRegistry()
+        counter = registry.counter("dars_test_total", "Test counter.", ("outcome",))
+        counter.inc("ok")
+        counter.inc("ok", amount=2)
+        counter.inc('say "hi"')
+
+        text = registry.render()
+
+        assert "# TYPE dars_test_total counter" in text
+        assert 'dars_test_total{outcome="ok"} 3' in text
+        assert 'dars_test_total{outcome="say \\"hi\\""} 1' in text
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        """Each observation lands in one bucket; rendering accumulates them."""
+        registry = MetricsRegistry()
+        hist = registry.histogram("dars_test_seconds", "Test.", ("route",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            hist.observe(value, "/x")
+
+        lines = registry.render().splitlines()
+
+        assert 'dars_test_seconds_bucket{route="/x",le="0.1"} 2' in lines
+        assert 'dars_test_seconds_bucket{route="/x",le="1"} 3' in lines
+        assert 'dars_test_seconds_bucket{route="/x",le="+Inf"} 4' in lines
+        assert 'dars_test_seconds_sum{route="/x"} 3.65' in lines
+        assert 'dars_test_seconds_count{route="/x"} 4' in lines
+        assert hist.count("/x") == 4
+
+    def test_callback_read_at_render(self) -> None:
+        """Callback metrics are evaluated on every render."""
+        registry = MetricsRegistry()
+        depth = {"n": 1}
+        registry.callback("dars_test_depth", "gauge", "Depth.", lambda: {(): depth["n"]})
+        depth["n"] = 7
+
+        assert "dars_test_depth 7" in registry.render()
+
+    def test_duplicate_name_rejected(self) -> None:
+        """Registering the same counter name twice is an error."""
+        registry = MetricsRegistry()
+        registry.counter("dars_dup_total", "Dup.")
+        with pytest.raises(ValueError):
+            registry.counter("dars_dup_total", "Dup.")
+
+    def test_observe_overhead(self) -> None:
+        """Observing a labelled histogram stays in the low microseconds."""
+        registry = MetricsRegistry()
+        hist = registry.histogram("dars_overhead_seconds", "Overhead.", ("command",))
+        n = 20_000
+
+        start = time.perf_counter()
+        for _ in range(n):
+            hist.observe(0.003, "practice")
+        per_call_us = (time.perf_counter() - start) / n * 1e6
+
+        assert per_call_us < 10, f"observe() took {per_call_us:.2f}us"
+
+
+class TestMetricsEndpoint:
+    def test_scrape(self) -> None:
+        """GET /metrics serves the text format including hot-path metrics."""
+        WEBHOOK_COMMAND_SECONDS.observe(0.01, "practice")
+        client.get("/metrics")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'dars_webhook_command_duration_seconds_count{command="practice"}' in response.text
+        assert 'route="/metrics"' in response.text
+        assert "dars_hint_cache_requests_total" in response.text
+        assert 'dars_queue_depth{queue="sent_messages"}' in response.text
+
+    def test_token_required_when_configured(self) -> None:
+        """With METRICS_TOKEN set, scrapes need the matching bearer token."""
+        with patch("src.routes.metrics.get_settings") as mock_settings:
+            mock_settings.return_value.metrics_token = "s3cret"
+            assert client.get("/metrics").status_code == 401
+            ok = client.get("/metrics", headers={"Authorization": "Bearer s3cret"})
+
+        assert ok.status_code == 200
@@ -0,0 +1,174 @@
+"""
+Unit tests for scripts/migrate.py (skip-if-current migration entry point).
+
+PostgreSQL advisory locking is exercised against a fake connection; the
+version comparison runs against real SQLite files.
+"""
+
+import importlib.util
+import socket
+import sqlite3
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.utils import database_url as _migrate_url
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+_MIGRATE_SCRIPT = _PROJECT_ROOT / "scripts" / "migrate.py"
+_spec = importlib.util.spec_from_file_location("migrate", str(_MIGRATE_SCRIPT))
+assert _spec is not None and _spec.loader is not None
+_migrate = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_migrate)  # type: ignore[union-attr]
+
+
+@pytest.fixture
+def config():
+    return _migrate.Config(str(_PROJECT_ROOT / "alembic.ini"))
+
+
+@pytest.fixture
+def head(config) -> str:
+    (revision,) = _migrate.script_heads(config)
+    return revision
+
+
+def _sqlite_db(tmp_path: Path, version: str | None) -> str:
+    path = tmp_path / "dars.db"
+    conn = sqlite3.connect(path)
+    if version is not None:
+        conn.execute("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)")
+        conn.execute("INSERT INTO alembic_version VALUES (?)", (version,))
+        conn.commit()
+    conn.close()
+    return f"sqlite:///{path}"
+
+
+@pytest.mark.unit
+class TestMigrationDatabaseUrl:
+    """migration_database_url() swaps async drivers for sync ones."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("postgres://u:p@db:5432/dars", "postgresql+psycopg2://u:p@db:5432/dars"),
+            ("postgresql://u:p@db/dars", "postgresql+psycopg2://u:p@db/dars"),
+            ("postgresql+asyncpg://u:p@db/dars", "postgresql+psycopg2://u:p@db/dars"),
+            ("sqlite+aiosqlite:///./test.db", "sqlite:///./test.db"),
+        ],
+    )
+    def test_converts(self, raw: str, expected: str) -> None:
+        assert _migrate.migration_database_url(raw) == expected
+
+    def test_railway_internal_host_resolves_to_ipv4(self) -> None:
+        """The version check connects the same way alembic/env.py does."""
+        addrinfo = [(2, 1, 6, "", ("10.0.0.7", 0))]
+        with patch("socket.getaddrinfo", return_value=addrinfo) as getaddrinfo:
+            url = _migrate.migration_database_url("postgresql://u:p@db.railway.internal:5432/d")
+
+        assert url == "postgresql+psycopg2://u:p@10.0.0.7:5432/d"
+        assert getaddrinfo.call_args.kwargs["family"] == socket.AF_INET
+
+    def test_postgres_connections_time_out(self) -> None:
+        args = _migrate.migration_connect_args("postgresql+psycopg2://u:p@db/dars")
+
+        assert args == {"connect_timeout": _migrate_url.MIGRATION_CONNECT_TIMEOUT_SECONDS}
+        assert _migrate.migration_connect_args("sqlite:///dars.db") == {}
+
+
+@pytest.mark.unit
+class TestMigrateIfNeeded:
+    """Migrations run only when alembic_version differs from the head."""
+
+    def test_current_schema_skips_upgrade(self, tmp_path, config, head) -> None:
+        url = _sqlite_db(tmp_path, head)
+
+        with patch.object(_migrate.command, "upgrade") as upgrade:
+            outcome = _migrate.migrate_if_needed(url, config, lock_timeout=1)
+
+        assert outcome == "current"
+        upgrade.assert_not_called()
+
+    def test_behind_schema_upgrades(self, tmp_path, config) -> None:
+        url = _sqlite_db(tmp_path, "47eebe03a353")
+
+        with patch.object(_migrate.command, "upgrade") as upgrade:
+            outcome = _migrate.migrate_if_needed(url, config, lock_timeout=1)
+
+        assert outcome == "migrated"
+        upgrade.assert_called_once_with(config, "head")
+
+    def test_missing_version_table_upgrades(self, tmp_path, config) -> None:
+        url = _sqlite_db(tmp_path, None)
+
+        with patch.object(_migrate.command, "upgrade") as upgrade:
+            outcome = _migrate.migrate_if_needed(url, config, lock_timeout=1)
+
+        assert outcome == "migrated"
+        upgrade.assert_called_once()
+
+    def test_check_reports_pending_without_upgrading(self, tmp_path, config) -> None:
+        url = _sqlite_db(tmp_path, "47eebe03a353")
+
+        with patch.object(_migrate.command, "upgrade") as upgrade:
+            outcome = _migrate.migrate_if_needed(url, config, lock_timeout=1, check=True)
+
+        assert outcome == "pending"
+        upgrade.assert_not_called()
+
+    def test_failed_upgrade_raises_migration_error(self, tmp_path, config) -> None:
+        url = _sqlite_db(tmp_path, None)
+
+        with (
+            patch.object(_migrate.command, "upgrade", side_effect=RuntimeError("boom")),
+            pytest.raises(_migrate.MigrationError, match="boom"),
+        ):
+            _migrate.migrate_if_needed(url, config, lock_timeout=1)
+
+
+@pytest.mark.unit
+class TestAdvisoryLock:
+    """advisory_lock() polls pg_try_advisory_lock and always unlocks."""
+
+    def _conn(self, lock_results: list[bool]) -> MagicMock:
+        conn = MagicMock()
+        results = iter(lock_results)
+
+        def _execute(statement, params):
+            result = MagicMock()
+            result.scalar.return_value = next(results, True)
+            return result
+
+        conn.execute.side_effect = _execute
+        return conn
+
+    def test_waits_then_acquires_and_releases(self, monkeypatch) -> None:
+        monkeypatch.setattr(_migrate, "_LOCK_POLL_SECONDS", 0)
+        conn = self._conn([False, False, True])
+
+        with _migrate.advisory_lock(conn, timeout=5):
+            pass
+
+        statements = [str(call.args[0]) for call in conn.execute.call_args_list]
+        assert statements.count("SELECT pg_try_advisory_lock(:key)") == 3
+        assert statements[-1] == "SELECT pg_advisory_unlock(:key)"
+
+    def test_times_out(self, monkeypatch) -> None:
+        monkeypatch.setattr(_migrate, "_LOCK_POLL_SECONDS", 0)
+        conn = self._conn([False] * 1000)
+
+        with (
+            pytest.raises(_migrate.MigrationLockTimeout),
+            _migrate.advisory_lock(conn, timeout=0),
+        ):
+            pass
+
+    def test_released_when_body_raises(self) -> None:
+        conn = self._conn([True])
+
+        with pytest.raises(ValueError), _migrate.advisory_lock(conn, timeout=5):
+            raise ValueError("migration failed")
+
+        assert str(conn.execute.call_args_list[-1].args[0]) == "SELECT pg_advisory_unlock(:key)"
@@ -0,0 +1,280 @@
+"""Unit tests for the transactional outbox (src/services/outbox.py)."""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.outbox_message import OutboxMessage, OutboxStatus
+from src.services.outbox import OutboxDispatcher, enqueue_message, purge_outbox
+from src.services.telegram_client import TelegramRetryAfter
+
+
+def _dispatcher(sender: object, **overrides: float) -> OutboxDispatcher:
+    options = {
+        "batch_size": 10,
+        "poll_seconds": 1.0,
+        "rate_per_second": 0,
+        "max_attempts": 3,
+        "claim_seconds": 60,
+    }
+    options.update(overrides)
+    return OutboxDispatcher(sender=sender, **options)  # type: ignore[arg-type]
+
+
+async def _rows(db: AsyncSession) -> list[OutboxMessage]:
+    result = await db.execute(select(OutboxMessage).order_by(OutboxMessage.id))
+    return list(result.scalars().all())
+
+
+async def _make_due(db: AsyncSession) -> None:
+    await db.execute(
+        update(OutboxMessage).values(next_attempt_at=datetime.now(UTC) - timedelta(seconds=1))
+    )
+    await db.commit()
+
+
+@pytest.mark.unit
+class TestEnqueue:
+    async def test_enqueue_adds_pending_row(self, db_session: AsyncSession) -> None:
+        await enqueue_message(db_session, 42, "Hello", key="reply:42:1")
+        await db_session.commit()
+
+        (row,) = await _rows(db_session)
+        assert (row.chat_id, row.text, row.status, row.attempts) == (
+            42,
+            "Hello",
+            OutboxStatus.PENDING,
+            0,
+        )
+
+    async def test_duplicate_key_is_ignored(self, db_session: AsyncSession) -> None:
+        """A redelivered update cannot queue its reply twice."""
+        await enqueue_message(db_session, 42, "First", key="reply:42:1")
+        await enqueue_message(db_session, 42, "Second", key="reply:42:1")
+        await db_session.commit()
+
+        (row,) = await _rows(db_session)
+        assert row.text == "First"
+
+    async def test_nothing_queued_without_commit(self, db_session: AsyncSession) -> None:
+        await enqueue_message(db_session, 42, "Hello")
+        await db_session.rollback()
+
+        assert await _rows(db_session) == []
+
+    async def test_commit_wakes_dispatcher(self, db_session: AsyncSession) -> None:
+        dispatcher = _dispatcher(AsyncMock())
+        with patch("src.services.outbox._dispatcher", dispatcher):
+            await enqueue_message(db_session, 42, "Hello")
+            assert not dispatcher._wake.is_set()  # Not before commit
+            await db_session.commit()
+
+        assert dispatcher._wake.is_set()
+
+
+@pytest.mark.unit
+class TestDispatch:
+    async def test_sends_and_marks_sent(self, db_session: AsyncSession) -> None:
+        sender = MagicMock(send_message=AsyncMock(return_value=True))
+        for i in range(3):
+            await enqueue_message(db_session, 100 + i, f"msg {i}")
+        await db_session.commit()
+
+        claimed, sent = await _dispatcher(sender).dispatch(db_session)
+
+        assert (claimed, sent) == (3, 3)
+        assert [call.args for call in sender.send_message.await_args_list] == [
+            (100, "msg 0"),
+            (101, "msg 1"),
+            (102, "msg 2"),
+        ]
+        rows = await _rows(db_session)
+        assert {row.status for row in rows} == {OutboxStatus.SENT}
+        assert all(row.sent_at is not None for row in rows)
+
+    async def test_claimed_rows_are_not_claimed_again(self, db_session: AsyncSession) -> None:
+        """While a claim is live, no other dispatcher picks the row up."""
+        await enqueue_message(db_session, 42, "Hello")
+        await db_session.commit()
+        dispatcher = _dispatcher(AsyncMock())
+
+        assert len(await dispatcher._claim(db_session)) == 1
+        assert await dispatcher._claim(db_session) == []
+
+    async def test_failed_send_is_retried_later(self, db_session: AsyncSession) -> None:
+        sender = MagicMock(send_message=AsyncMock(return_value=False))
+        await enqueue_message(db_session, 42, "Hello")
+        await db_session.commit()
+        dispatcher = _dispatcher(sender)
+
+        assert await dispatcher.dispatch(db_session) == (1, 0)
+
+        (row,) = await _rows(db_session)
+        assert row.status == OutboxStatus.PENDING
+        assert row.attempts == 1
+        assert row.last_error == "send_failed"
+        # Backed off: not due again straight away
+        assert await dispatcher.dispatch(db_session) == (0, 0)
+
+    async def test_gives_up_after_max_attempts(self, db_session: AsyncSession) -> None:
+        sender = MagicMock(send_message=AsyncMock(side_effect=ConnectionError("down")))
+        await enqueue_message(db_session, 42, "Hello")
+        await db_session.commit()
+        dispatcher = _dispatcher(sender, max_attempts=2)
+
+        await dispatcher.dispatch(db_session)
+        await _make_due(db_session)
+        await dispatcher.dispatch(db_session)
+
+        (row,) = await _rows(db_session)
+        assert row.status == OutboxStatus.FAILED
+        assert row.attempts == 2
+        assert row.last_error == "ConnectionError"
+        await _make_due(db_session)
+        assert await dispatcher.dispatch(db_session) == (0, 0)
+
+    async def test_rate_limit_spaces_sends(self, db_session: AsyncSession) -> None:
+        sender = MagicMock(send_message=AsyncMock(return_value=True))
+        for i in range(3):
+            await enqueue_message(db_session, 42, f"msg {i}")
+        await db_session.commit()
+
+        started = time.monotonic()
+        await _dispatcher(sender, rate_per_second=50).dispatch(db_session)
+
+        assert time.monotonic() - started >= 2 / 50
+
+    async def test_processes_share_one_send_budget(self, db_session: AsyncSession) -> None:
+        """Reservations from every process together never exceed the rate."""
+        window = int(time.time()) + 60  # A whole second ahead: nothing capped by time left
+        worker_a = _dispatcher(AsyncMock(), rate_per_second=5)
+        worker_b = _dispatcher(AsyncMock(), rate_per_second=5)
+
+        assert await worker_a._reserve(db_session, window, remaining=3) == 3
+        assert await worker_b._reserve(db_session, window, remaining=10) == 2
+        assert await worker_a._reserve(db_session, window, remaining=10) == 0
+        assert await worker_b._reserve(db_session, window + 1, remaining=10) == 5
+
+    async def test_throttled_rows_are_retried_without_an_attempt(
+        self, db_session: AsyncSession
+    ) -> None:
+        """A 429 hands the rest of the batch back, due after Telegram's retry_after."""
+        sender = MagicMock(send_message=AsyncMock(side_effect=[True, TelegramRetryAfter(30), True]))
+        for i in range(3):
+            await enqueue_message(db_session, 42, f"msg {i}")
+        await db_session.commit()
+        before = datetime.now(UTC)
+
+        assert await _dispatcher(sender).dispatch(db_session) == (3, 1)
+
+        assert sender.send_message.await_count == 2
+        rows = await _rows(db_session)
+        for row in rows:
+            await db_session.refresh(row)
+        assert [(row.status, row.attempts) for row in rows] == [
+            (OutboxStatus.SENT, 1),
+            (OutboxStatus.PENDING, 0),
+            (OutboxStatus.PENDING, 0),
+        ]
+        for row in rows[1:]:
+            due = row.next_attempt_at.replace(tzinfo=UTC)
+            assert due >= before + timedelta(seconds=30)
+
+    async def test_claim_is_capped_by_rate(self, db_session: AsyncSession) -> None:
+        """A round never claims more than half the claim window can send."""
+        for i in range(10):
+            await enqueue_message(db_session, 42, f"msg {i}")
+        await db_session.commit()
+        dispatcher = _dispatcher(AsyncMock(), rate_per_second=1, claim_seconds=8)
+
+        assert len(await dispatcher._claim(db_session)) == 4
+
+    async def test_stale_outcome_does_not_overwrite_reclaimed_row(
+        self, db_session: AsyncSession
+    ) -> None:
+        """A lapsed claim's outcome is dropped once another process re-claimed the row."""
+        await enqueue_message(db_session, 42, "Hello")
+        await db_session.commit()
+        slow = _dispatcher(AsyncMock())
+        ((row_id, _, _, stale_attempts),) = await slow._claim(db_session)
+        await _make_due(db_session)  # The claim lapses
+        other = _dispatcher(MagicMock(send_message=AsyncMock(return_value=True)))
+        await other.dispatch(db_session)
+
+        await slow._settle(db_session, [], [(row_id, stale_attempts, "send_failed")], [])
+
+        (row,) = await _rows(db_session)
+        await db_session.refresh(row)
+        assert (row.status, row.attempts, row.last_error) == (OutboxStatus.SENT, 2, None)
+
+    async def test_rows_are_handed_back_before_claim_lapses(self, db_session: AsyncSession) -> None:
+        async def slow_send(chat_id: int, text: str) -> bool:
+            await asyncio.sleep(0.15)
+            return True
+
+        sender = MagicMock(send_message=AsyncMock(side_effect=slow_send))
+        for i in range(3):
+            await enqueue_message(db_session, 42, f"msg {i}")
+        await db_session.commit()
+
+        # Sending stops 0.1 s before the 0.2 s claim lapses
+        assert await _dispatcher(sender, claim_seconds=0.2).dispatch(db_session) == (3, 1)
+
+        rows = await _rows(db_session)
+        for row in rows:
+            await db_session.refresh(row)
+        assert [(row.status, row.attempts) for row in rows] == [
+            (OutboxStatus.SENT, 1),
+            (OutboxStatus.PENDING, 0),
+            (OutboxStatus.PENDING, 0),
+        ]
+
+    async def test_drain_runs_until_short_batch(self, db_session: AsyncSession) -> None:
+        sender = MagicMock(send_message=AsyncMock(return_value=True))
+        for i in range(5):
+            await enqueue_message(db_session, 42, f"msg {i}")
+        await db_session.commit()
+        session_cm = AsyncMock()
+        session_cm.__aenter__ = AsyncMock(return_value=db_session)
+        session_cm.__aexit__ = AsyncMock(return_value=None)
+
+        with patch(
+            "src.services.outbox.get_session_factory",
+            return_value=MagicMock(return_value=session_cm),
+        ):
+            sent = await _dispatcher(sender, batch_size=2).drain()
+
+        assert sent == 5
+        assert sender.send_message.await_count == 5
+
+
+@pytest.mark.unit
+class TestPurge:
+    async def test_purges_only_old_settled_rows(self, db_session: AsyncSession) -> None:
+        for key in ("old-sent", "old-pending", "new-sent"):
+            await enqueue_message(db_session, 42, key, key=key)
+        await db_session.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.idempotency_key.in_(("old-sent", "new-sent")))
+            .values(status=OutboxStatus.SENT)
+        )
+        await db_session.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.idempotency_key.in_(("old-sent", "old-pending")))
+            .values(created_at=datetime.now(UTC) - timedelta(days=8))
+        )
+        await db_session.commit()
+
+        deleted = await purge_outbox(db_session, timedelta(days=7))
+        await db_session.commit()
+
+        assert deleted == 1
+        assert {row.idempotency_key for row in await _rows(db_session)} == {
+            "old-pending",
+            "new-sent",
+        }
@@ -6,9 +6,11 @@ Coverage target: ≥80% of src/repositories/problem_repository.py.
 """
 
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from typing import Any
 
 import pytest
+import yaml
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
@@ -18,6 +20,7 @@ from src.models.response import Response
 from src.models.session import Session, SessionStatus
 from src.models.student import Student
 from src.repositories.problem_repository import ProblemRepository
+from src.services.content_bundle import ContentBundle, compile_bundle
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -82,6 +85,41 @@ def _make_problem(
     )
 
 
+@pytest.fixture
+def bundle(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ContentBundle:
+    """Load a three-problem grade 7 bundle as the process-wide bundle."""
+    problems = [
+        {"topic": "percentages", "question_en": "P1", "answer": "20", "difficulty": 1},
+        {"topic": "percentages", "question_en": "P2", "answer": "₹1,200", "difficulty": 2},
+        {"topic": "algebra", "question_en": "A1", "answer": "7", "difficulty": 1},
+    ]
+    source = tmp_path / "grade_7.yaml"
+    source.write_text(
+        yaml.safe_dump(
+            [
+                {"grade": 7, "question_bn": "প্রশ্ন", "hints": [{"en": "H", "bn": "ই"}], **p}
+                for p in problems
+            ],
+            allow_unicode=True,
+        ),
+        encoding="utf-8",
+    )
+    compile_bundle([str(source)], tmp_path / "bundle.jsonl", workers=1)
+    loaded = ContentBundle(tmp_path / "bundle.jsonl")
+    monkeypatch.setattr("src.services.content_bundle._bundle", loaded)
+    monkeypatch.setattr("src.repositories.problem_repository._catalog", None)
+    return loaded
+
+
+async def _seed_from_bundle(db: AsyncSession, bundle: ContentBundle) -> list[Problem]:
+    """Insert a problems row per bundle record, as scripts/seed_problems.py does."""
+    columns = {c.key for c in Problem.__table__.columns}
+    problems = [Problem(**{k: v for k, v in record.items() if k in columns}) for record in bundle]
+    db.add_all(problems)
+    await db.flush()
+    return problems
+
+
 async def _persist(db: AsyncSession, obj: Any) -> Any:
     """Add obj to session, flush, and return it."""
     db.add(obj)
@@ -316,3 +354,66 @@ class TestGetProblemCountByGrade:
         repo = ProblemRepository()
         count = await repo.get_problem_count_by_grade(db, grade=8)
         assert count == 0
+
+
+class TestBundleLookups:
+    """Problem lookups served from the loaded content bundle."""
+
+    @pytest.mark.asyncio
+    async def test_lookups_read_the_bundle(self, db: AsyncSession, bundle: ContentBundle) -> None:
+        """Seeded rows matching the bundle are decoded from it, not read from the table."""
+        repo = ProblemRepository()
+        p1, _, a1 = await _seed_from_bundle(db, bundle)
+        await repo.get_problem_by_id(db, p1.problem_id)  # Builds the id map
+        # Rewrite a row behind the bundle's back (content_hash unchanged)
+        p1.question_en = "edited in the table"
+        await db.flush()
+
+        by_id = await repo.get_problem_by_id(db, p1.problem_id)
+        by_ids = await repo.get_problems_by_ids(db, [a1.problem_id, p1.problem_id])
+        by_grade = await repo.get_problems_by_grade(db, 7)
+
+        assert by_id is not None
+        assert by_id.question_en == "P1"
+        assert by_id.problem_id == p1.problem_id
+        assert by_id not in db  # Transient, never flushed back
+        assert [(p.problem_id, p.question_en) for p in by_ids] == [
+            (a1.problem_id, "A1"),
+            (p1.problem_id, "P1"),
+        ]
+        assert [p.question_en for p in by_grade] == ["P1", "P2", "A1"]
+
+    @pytest.mark.asyncio
+    async def test_filters_apply_to_bundled_grade(
+        self, db: AsyncSession, bundle: ContentBundle
+    ) -> None:
+        repo = ProblemRepository()
+        p1, p2, _ = await _seed_from_bundle(db, bundle)
+
+        by_topic = await repo.get_problems_by_grade(db, 7, topic="percentages")
+        by_difficulty = await repo.get_problems_by_grade(db, 7, difficulty=2)
+        excluding = await repo.get_problems_by_grade(
+            db, 7, topic="percentages", exclude_ids=[p1.problem_id]
+        )
+
+        assert [p.question_en for p in by_topic] == ["P1", "P2"]
+        assert [p.question_en for p in by_difficulty] == ["P2"]
+        assert [p.problem_id for p in excluding] == [p2.problem_id]
+
+    @pytest.mark.asyncio
+    async def test_rows_not_matching_bundle_come_from_database(
+        self, db: AsyncSession, bundle: ContentBundle
+    ) -> None:
+        """Changed or non-YAML problems are read from the table, and so is their grade."""
+        repo = ProblemRepository()
+        p1, _, _ = await _seed_from_bundle(db, bundle)
+        p1.question_en = "P1 v2"
+        p1.content_hash = "changed"
+        extra = await _persist(db, _make_problem(question_en="Admin-added"))
+
+        by_id = await repo.get_problem_by_id(db, p1.problem_id)
+        assert by_id is not None
+        assert by_id.question_en == "P1 v2"
+        by_grade = await repo.get_problems_by_grade(db, 7)
+        assert {p.question_en for p in by_grade} == {"P1 v2", "P2", "A1", "Admin-added"}
+        assert extra in by_grade
@@ -0,0 +1,150 @@
+"""Unit tests for the batched SQL rate-limit storage (src/services/rate_limits.py)."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.rate_limit_counter import RateLimitCounter
+from src.services.rate_limits import BatchedCounterStore, BatchedSQLStorage, get_rate_limit_store
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_800_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestBatchedCounterStore:
+    def test_fixed_window(self) -> None:
+        """Hits accumulate within a window and restart once it ends."""
+        clock = _Clock()
+        store = BatchedCounterStore(clock=clock)
+
+        assert store.incr("k", 60) == 1
+        assert store.incr("k", 60, amount=2) == 3
+        assert store.get_expiry("k") == clock.now + 60
+        clock.now += 60
+        assert store.get("k") == 0
+        assert store.incr("k", 60) == 1
+
+    async def test_workers_share_counts(self, db_session: AsyncSession) -> None:
+        """After a flush, each worker's count includes the other's hits."""
+        clock = _Clock()
+        worker_a = BatchedCounterStore(clock=clock)
+        worker_b = BatchedCounterStore(clock=clock)
+        for _ in range(3):
+            worker_a.incr("hint", 86400)
+        worker_b.incr("hint", 86400)
+
+        assert await worker_a.flush(db_session) == 1
+        assert await worker_b.flush(db_session) == 1
+        await worker_a.flush(db_session)  # picks up worker_b's hit without writing
+
+        assert worker_a.get("hint") == worker_b.get("hint") == 4
+        assert worker_a.pending == worker_b.pending == 0
+
+    async def test_restart_restores_open_windows(self, db_session: AsyncSession) -> None:
+        """load() restores counters whose window is still open."""
+        clock = _Clock()
+        before = BatchedCounterStore(clock=clock)
+        before.incr("day", 86400, amount=5)
+        before.incr("minute", 60)
+        await before.flush(db_session)
+
+        clock.now += 120
+        after = BatchedCounterStore(clock=clock)
+        assert await after.load(db_session) == 1
+        assert after.get("day") == 5
+        assert after.get("minute") == 0
+
+    async def test_expired_row_restarts_window(self, db_session: AsyncSession) -> None:
+        """A flush into an expired row replaces its count instead of adding to it."""
+        clock = _Clock()
+        store = BatchedCounterStore(clock=clock)
+        store.incr("k", 60, amount=7)
+        await store.flush(db_session)
+
+        clock.now += 61
+        store.incr("k", 60)
+        await store.flush(db_session)
+
+        row = (await db_session.execute(select(RateLimitCounter))).scalar_one()
+        assert row.count == 1
+        assert store.get("k") == 1
+
+    async def test_clear_deletes_row(self, db_session: AsyncSession) -> None:
+        """clear() resets the key locally and removes its row on the next flush."""
+        store = BatchedCounterStore(clock=_Clock())
+        store.incr("k", 60)
+        await store.flush(db_session)
+
+        store.clear("k")
+        await store.flush(db_session)
+
+        assert (await db_session.execute(select(RateLimitCounter))).first() is None
+
+    async def test_in_flight_hits_still_count(self, db_session: AsyncSession) -> None:
+        """Hits being written by a flush count towards the limit until it finishes."""
+        store = BatchedCounterStore(clock=_Clock())
+        store.incr("hint", 86400, amount=9)
+        upsert = store._upsert
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def held_upsert(*args: object) -> dict[str, tuple[int, float]]:
+            started.set()
+            await release.wait()
+            return await upsert(*args)  # type: ignore[arg-type]
+
+        store._upsert = held_upsert  # type: ignore[method-assign]
+        flush = asyncio.create_task(store.flush(db_session))
+        await started.wait()
+
+        assert store.get("hint") == 9
+        assert store.incr("hint", 86400) == 10
+        release.set()
+        await flush
+        assert store.get("hint") == 10
+        assert store.pending == 1
+
+    async def test_failed_commit_keeps_hits(self, db_session: AsyncSession) -> None:
+        """Hits whose commit failed stay counted and are written by the next flush."""
+        store = BatchedCounterStore(clock=_Clock())
+        store.incr("hint", 86400, amount=3)
+        commit = db_session.commit
+        db_session.commit = AsyncMock(side_effect=OSError("connection lost"))  # type: ignore[method-assign]
+
+        with pytest.raises(OSError):
+            await store.flush(db_session)
+        await db_session.rollback()
+        assert store.get("hint") == 3
+        assert store.pending == 1
+
+        db_session.commit = commit  # type: ignore[method-assign]
+        assert await store.flush(db_session) == 1
+        row = (await db_session.execute(select(RateLimitCounter))).scalar_one()
+        assert row.count == store.get("hint") == 3
+
+
+class TestBatchedSQLStorage:
+    def test_registered_with_limits(self) -> None:
+        """The dars-sql:// URI resolves to the shared store and enforces fixed windows."""
+        storage = storage_from_string("dars-sql://")
+        limiter = FixedWindowRateLimiter(storage)
+        limit = parse("2/day")
+
+        try:
+            assert isinstance(storage, BatchedSQLStorage)
+            assert limiter.hit(limit, "student:1")
+            assert limiter.hit(limit, "student:1")
+            assert not limiter.hit(limit, "student:1")
+            assert get_rate_limit_store().get(limit.key_for("student:1")) == 3
+        finally:
+            get_rate_limit_store().reset()
@@ -0,0 +1,70 @@
+"""Unit tests for per-student reminder slots (src/services/reminder_schedule.py)."""
+
+from datetime import UTC, datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src.services.reminder_schedule import (
+    get_zone,
+    is_valid_timezone,
+    next_reminder_at,
+)
+
+
+@pytest.mark.unit
+class TestNextReminderAt:
+    def test_ist_evening_slot_in_utc(self) -> None:
+        """18:00 IST is 12:30 UTC; student_id spreads the slot over the hour."""
+        after = datetime(2026, 3, 2, 6, 0, tzinfo=UTC)
+
+        slot = next_reminder_at(17, "Asia/Kolkata", 18, after, spread_minutes=60)
+
+        assert slot == datetime(2026, 3, 2, 12, 47, tzinfo=UTC)
+
+    def test_passed_slot_rolls_to_next_day(self) -> None:
+        after = datetime(2026, 3, 2, 12, 30, tzinfo=UTC)  # Exactly today's slot
+
+        slot = next_reminder_at(60, "Asia/Kolkata", 18, after, spread_minutes=60)
+
+        assert slot == datetime(2026, 3, 3, 12, 30, tzinfo=UTC)
+
+    def test_students_are_spread_over_the_window(self) -> None:
+        after = datetime(2026, 3, 2, 0, 0, tzinfo=UTC)
+
+        slots = {next_reminder_at(i, "Asia/Kolkata", 18, after, 60) for i in range(120)}
+
+        assert len(slots) == 60
+
+    def test_zero_spread_is_on_the_hour(self) -> None:
+        after = datetime(2026, 3, 2, 0, 0, tzinfo=UTC)
+
+        slot = next_reminder_at(17, "Asia/Kolkata", 18, after, spread_minutes=0)
+
+        assert slot == datetime(2026, 3, 2, 12, 30, tzinfo=UTC)
+
+    def test_other_timezone_uses_its_local_hour(self) -> None:
+        after = datetime(2026, 7, 1, 0, 0, tzinfo=UTC)
+
+        slot = next_reminder_at(0, "Europe/London", 18, after, spread_minutes=60)
+
+        assert slot.astimezone(ZoneInfo("Europe/London")).hour == 18
+        assert slot == datetime(2026, 7, 1, 17, 0, tzinfo=UTC)  # BST
+
+    def test_unknown_timezone_falls_back_to_ist(self) -> None:
+        after = datetime(2026, 3, 2, 0, 0, tzinfo=UTC)
+
+        assert next_reminder_at(0, "Nowhere/Town", 18, after, 60) == next_reminder_at(
+            0, "Asia/Kolkata", 18, after, 60
+        )
+
+
+@pytest.mark.unit
+class TestTimezones:
+    def test_is_valid_timezone(self) -> None:
+        assert is_valid_timezone("Asia/Kolkata")
+        assert not is_valid_timezone("Nowhere/Town")
+        assert not is_valid_timezone("../etc/passwd")
+
+    def test_get_zone_falls_back(self) -> None:
+        assert get_zone("Nowhere/Town") == get_zone("Asia/Kolkata")
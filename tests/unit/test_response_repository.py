@@ -211,6 +211,40 @@ class TestCreateResponse:
         )
         assert response.confidence_level == ConfidenceLevel.HIGH
 
+    @pytest.mark.asyncio
+    async def test_student_id_resolved_from_session_when_omitted(self, db: AsyncSession) -> None:
+        """student_id should be filled from the owning session if not passed."""
+        repo = ResponseRepository()
+        student = await _make_student(db, telegram_id=2012)
+        problem = await _make_problem(db, question_en="Denormalized student?")
+        session = await _make_session(db, student.student_id, [problem.problem_id])
+
+        response = await repo.create_response(
+            db, session.session_id, problem.problem_id, "20", True, 0, 30
+        )
+        await db.refresh(response)
+        assert response.student_id == student.student_id
+
+    @pytest.mark.asyncio
+    async def test_explicit_student_id_is_stored(self, db: AsyncSession) -> None:
+        """An explicitly passed student_id should be stored as-is."""
+        repo = ResponseRepository()
+        student = await _make_student(db, telegram_id=2013)
+        problem = await _make_problem(db, question_en="Explicit student?")
+        session = await _make_session(db, student.student_id, [problem.problem_id])
+
+        response = await repo.create_response(
+            db,
+            session_id=session.session_id,
+            problem_id=problem.problem_id,
+            student_answer="20",
+            is_correct=True,
+            hints_used=0,
+            time_spent_seconds=30,
+            student_id=student.student_id,
+        )
+        assert response.student_id == student.student_id
+
 
 # ---------------------------------------------------------------------------
 # Tests: get_response_for_problem
@@ -321,6 +355,28 @@ class TestGetTopicAccuracyForStudent:
         # Should return neutral baseline since no responses exist.
         assert result == 0.5
 
+    @pytest.mark.asyncio
+    async def test_ignores_other_students_responses(self, db: AsyncSession) -> None:
+        """Responses from another student must not affect accuracy."""
+        repo = ResponseRepository()
+        alice = await _make_student(db, telegram_id=2014)
+        bob = await _make_student(db, telegram_id=2015)
+        problem = await _make_problem(db, topic="geometry", question_en="Angle sum?")
+        alice_session = await _make_session(db, alice.student_id, [problem.problem_id])
+        bob_session = await _make_session(db, bob.student_id, [problem.problem_id])
+
+        await repo.create_response(
+            db, alice_session.session_id, problem.problem_id, "180", True, 0, 30
+        )
+        await repo.create_response(
+            db, bob_session.session_id, problem.problem_id, "90", False, 0, 30
+        )
+
+        accuracy = await repo.get_topic_accuracy_for_student(
+            db, student_id=alice.student_id, topic="geometry"
+        )
+        assert accuracy == pytest.approx(1.0)
+
 
 # ---------------------------------------------------------------------------
 # Tests: get_all_topic_accuracies
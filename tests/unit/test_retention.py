@@ -0,0 +1,215 @@
+"""Unit tests for RetentionService (archival of cost_records / sent_messages).
+
+Tests use in-memory SQLite via the shared db_session fixture from conftest.py.
+SQLite is unpartitioned, so partition maintenance is a no-op there; the
+archive/delete path is the same on both dialects.
+"""
+
+import gzip
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import Settings
+from src.models.cost_record import ApiProvider, CostRecord, OperationType
+from src.models.sent_message import SentMessage
+from src.models.student import Student
+from src.services.retention import (
+    RetentionPolicy,
+    RetentionService,
+    get_retention_policies,
+    partition_name,
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+async def _make_student(db: AsyncSession, telegram_id: int = 100) -> Student:
+    """Insert a minimal Student row and return it."""
+    student = Student(telegram_id=telegram_id, name="Test Student", grade=7, language="en")
+    db.add(student)
+    await db.flush()
+    return student
+
+
+def _read_archives(directory: Path) -> list[dict]:
+    rows: list[dict] = []
+    for path in sorted(directory.glob("*.ndjson.gz")):
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            rows.extend(json.loads(line) for line in fh)
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestRetentionPolicies:
+    def test_policies_follow_settings(self) -> None:
+        """Retention windows come from Settings."""
+        settings = Settings(cost_records_retention_days=90, sent_messages_retention_days=14)
+        policies = {p.table: p for p in get_retention_policies(settings)}
+
+        assert policies["cost_records"].retention_days == 90
+        assert policies["cost_records"].timestamp_column == "recorded_at"
+        assert policies["sent_messages"].retention_days == 14
+        assert policies["sent_messages"].timestamp_column == "sent_at"
+
+    def test_partition_name(self) -> None:
+        """Monthly partitions are named <table>_yYYYYmMM."""
+        assert partition_name("cost_records", datetime(2026, 3, 1).date()) == (
+            "cost_records_y2026m03"
+        )
+
+
+class TestArchiveExpired:
+    @pytest.mark.asyncio
+    async def test_archives_and_deletes_only_expired_rows(
+        self, db_session: AsyncSession, tmp_path: Path
+    ) -> None:
+        """Rows past the window go to NDJSON and are deleted; recent rows stay."""
+        student = await _make_student(db_session)
+        student_id = student.student_id  # capture before commit expires attributes
+        now = datetime.now(UTC)
+        db_session.add_all(
+            [
+                SentMessage(
+                    student_id=student_id,
+                    message_key="old_0",
+                    sent_at=now - timedelta(days=40),
+                ),
+                SentMessage(
+                    student_id=student_id,
+                    message_key="recent_0",
+                    sent_at=now - timedelta(days=2),
+                ),
+            ]
+        )
+        await db_session.commit()
+
+        service = RetentionService(tmp_path)
+        policy = RetentionPolicy(SentMessage, "sent_at", retention_days=30)
+        archived = await service.archive_expired(db_session, policy, now=now)
+
+        assert archived == 1
+        remaining = (await db_session.execute(select(SentMessage.message_key))).scalars().all()
+        assert remaining == ["recent_0"]
+
+        rows = _read_archives(tmp_path / "sent_messages")
+        assert [r["message_key"] for r in rows] == ["old_0"]
+        assert rows[0]["student_id"] == student_id
+
+    @pytest.mark.asyncio
+    async def test_archives_in_batches(self, db_session: AsyncSession, tmp_path: Path) -> None:
+        """Each batch of batch_size rows is written to its own archive file."""
+        student = await _make_student(db_session, telegram_id=101)
+        old = datetime.now(UTC) - timedelta(days=400)
+        db_session.add_all(
+            [
+                CostRecord(
+                    student_id=student.student_id,
+                    operation=OperationType.HINT_GENERATION,
+                    api_provider=ApiProvider.CLAUDE,
+                    cost_usd=0.001,
+                    recorded_at=old,
+                )
+                for _ in range(5)
+            ]
+        )
+        await db_session.commit()
+
+        service = RetentionService(tmp_path, batch_size=2)
+        policy = RetentionPolicy(CostRecord, "recorded_at", retention_days=180)
+        archived = await service.archive_expired(db_session, policy)
+
+        assert archived == 5
+        assert len(list((tmp_path / "cost_records").glob("*.ndjson.gz"))) == 3
+        assert len(_read_archives(tmp_path / "cost_records")) == 5
+        assert await db_session.scalar(select(func.count(CostRecord.cost_id))) == 0
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_archive_writes_no_files(
+        self, db_session: AsyncSession, tmp_path: Path
+    ) -> None:
+        """No expired rows means no archive directory is created."""
+        service = RetentionService(tmp_path)
+        policy = RetentionPolicy(SentMessage, "sent_at", retention_days=30)
+
+        assert await service.archive_expired(db_session, policy) == 0
+        assert not (tmp_path / "sent_messages").exists()
+
+    @pytest.mark.asyncio
+    async def test_without_archive_dir_rows_are_kept(self, db_session: AsyncSession) -> None:
+        """Rows are only deleted once they are archived somewhere."""
+        student = await _make_student(db_session)
+        db_session.add(
+            SentMessage(
+                student_id=student.student_id,
+                message_key="old_0",
+                sent_at=datetime.now(UTC) - timedelta(days=40),
+            )
+        )
+        await db_session.commit()
+
+        service = RetentionService(None)
+        policy = RetentionPolicy(SentMessage, "sent_at", retention_days=30)
+
+        assert await service.archive_expired(db_session, policy) == 0
+        assert await db_session.scalar(select(func.count()).select_from(SentMessage)) == 1
+
+
+class TestRunRetention:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("archive_dir", ["", "archive"])
+    async def test_unset_or_relative_archive_dir_disables_purge(
+        self, archive_dir: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A relative ARCHIVE_DIR is app-local and lost on redeploy."""
+        from src.config import get_settings
+        from src.scheduler import run_retention
+
+        monkeypatch.setattr(get_settings(), "archive_dir", archive_dir)
+        with (
+            patch("src.scheduler.get_session_factory", return_value=MagicMock()),
+            patch("src.scheduler.RetentionService") as mock_service_cls,
+        ):
+            await run_retention()
+
+        mock_service_cls.assert_called_once_with(None)
+
+    @pytest.mark.asyncio
+    async def test_absolute_archive_dir_is_used(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from src.config import get_settings
+        from src.scheduler import run_retention
+
+        monkeypatch.setattr(get_settings(), "archive_dir", str(tmp_path))
+        with (
+            patch("src.scheduler.get_session_factory", return_value=MagicMock()),
+            patch("src.scheduler.RetentionService") as mock_service_cls,
+        ):
+            await run_retention()
+
+        mock_service_cls.assert_called_once_with(tmp_path)
+
+
+class TestPartitionMaintenance:
+    @pytest.mark.asyncio
+    async def test_partition_helpers_noop_on_sqlite(
+        self, db_session: AsyncSession, tmp_path: Path
+    ) -> None:
+        """SQLite tables are unpartitioned, so partition maintenance does nothing."""
+        service = RetentionService(tmp_path)
+        policy = RetentionPolicy(CostRecord, "recorded_at", retention_days=180)
+
+        assert await service.ensure_partitions(db_session, policy) == []
+        assert await service.drop_expired_partitions(db_session, policy) == []
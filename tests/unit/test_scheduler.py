@@ -3,36 +3,212 @@
 PHASE6-C-3 (REQ-011)
 
 Tests verify:
-- Scheduler registers the daily_reminders job at 12:30 UTC
+- Scheduler registers the daily_reminders job to run every minute
 - send_daily_reminders skips students who already practiced today
 - send_daily_reminders sends reminders to students who missed
+- sweep_stale_sessions runs in bounded batches
 """
 
 import asyncio
-from datetime import date, timedelta
+from datetime import UTC, date, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
+from zoneinfo import ZoneInfo
+
+
+def _ist_today() -> date:
+    """Reminders use the student's local date; test students are in IST."""
+    return datetime.now(ZoneInfo("Asia/Kolkata")).date()
 
 
 class TestSchedulerJobRegistration:
     async def test_scheduler_registers_daily_reminders_job(self) -> None:
-        """start_scheduler() should register 'daily_reminders' cron job at 12:30 UTC."""
-        from src.scheduler import scheduler, start_scheduler, stop_scheduler
+        """start_scheduler() should poll for due reminder slots every minute."""
+        from src.scheduler import (
+            _REMINDER_INTERVAL_SECONDS,
+            scheduler,
+            start_scheduler,
+            stop_scheduler,
+        )
 
         start_scheduler()
         try:
             job = scheduler.get_job("daily_reminders")
             assert job is not None, "daily_reminders job not found"
+            assert job.trigger.interval == timedelta(seconds=_REMINDER_INTERVAL_SECONDS)
+            assert job.max_instances == 1
+        finally:
+            stop_scheduler()
+
+    async def test_scheduler_registers_stale_session_sweeper(self) -> None:
+        """start_scheduler() should register the 'stale_session_sweeper' interval job."""
+        from src.scheduler import (
+            _SWEEP_INTERVAL_MINUTES,
+            scheduler,
+            start_scheduler,
+            stop_scheduler,
+        )
+
+        start_scheduler()
+        try:
+            job = scheduler.get_job("stale_session_sweeper")
+            assert job is not None, "stale_session_sweeper job not found"
+            assert job.trigger.interval == timedelta(minutes=_SWEEP_INTERVAL_MINUTES)
+            assert job.max_instances == 1
+        finally:
+            stop_scheduler()
+
+    async def test_scheduler_registers_retention_job(self) -> None:
+        """start_scheduler() should register the nightly 'retention' job at 03:00 UTC."""
+        from src.scheduler import scheduler, start_scheduler, stop_scheduler
+
+        start_scheduler()
+        try:
+            job = scheduler.get_job("retention")
+            assert job is not None, "retention job not found"
+            fields_by_name = {f.name: f for f in job.trigger.fields}
+            assert str(fields_by_name["hour"]) == "3"
+            assert str(fields_by_name["minute"]) == "0"
+        finally:
+            stop_scheduler()
+
+    async def test_scheduler_registers_outbox_purge(self) -> None:
+        """start_scheduler() should register the hourly 'outbox_purge' job."""
+        from src.scheduler import (
+            _OUTBOX_PURGE_INTERVAL_MINUTES,
+            scheduler,
+            start_scheduler,
+            stop_scheduler,
+        )
+
+        start_scheduler()
+        try:
+            job = scheduler.get_job("outbox_purge")
+            assert job is not None, "outbox_purge job not found"
+            assert job.trigger.interval == timedelta(minutes=_OUTBOX_PURGE_INTERVAL_MINUTES)
+        finally:
+            stop_scheduler()
+
+    async def test_scheduler_registers_broadcast_fan_out(self) -> None:
+        """start_scheduler() should register the 'broadcast_fan_out' interval job."""
+        from src.scheduler import (
+            _BROADCAST_INTERVAL_SECONDS,
+            scheduler,
+            start_scheduler,
+            stop_scheduler,
+        )
+
+        start_scheduler()
+        try:
+            job = scheduler.get_job("broadcast_fan_out")
+            assert job is not None, "broadcast_fan_out job not found"
+            assert job.trigger.interval == timedelta(seconds=_BROADCAST_INTERVAL_SECONDS)
+        finally:
+            stop_scheduler()
+
+    async def test_scheduler_registers_message_catalog_reload(self) -> None:
+        """start_scheduler() should poll message_templates on the configured interval."""
+        from src.config import get_settings
+        from src.scheduler import scheduler, start_scheduler, stop_scheduler
+
+        start_scheduler()
+        try:
+            job = scheduler.get_job("message_catalog_reload")
+            assert job is not None, "message_catalog_reload job not found"
+            assert job.trigger.interval == timedelta(
+                seconds=get_settings().message_catalog_refresh_seconds
+            )
+        finally:
+            stop_scheduler()
+
+    async def test_scheduler_registers_sent_message_flush(self) -> None:
+        """start_scheduler() should register the write-behind 'sent_message_flush' job."""
+        from src.scheduler import (
+            _SENT_MESSAGE_FLUSH_SECONDS,
+            scheduler,
+            start_scheduler,
+            stop_scheduler,
+        )
+
+        start_scheduler()
+        try:
+            job = scheduler.get_job("sent_message_flush")
+            assert job is not None, "sent_message_flush job not found"
+            assert job.trigger.interval == timedelta(seconds=_SENT_MESSAGE_FLUSH_SECONDS)
+        finally:
+            stop_scheduler()
 
-            # Verify cron trigger fields: hour=12, minute=30
-            trigger = job.trigger
-            fields_by_name = {f.name: f for f in trigger.fields}
-            hour_expr = str(fields_by_name["hour"])
-            minute_expr = str(fields_by_name["minute"])
-            assert hour_expr == "12", f"Expected hour=12, got {hour_expr}"
-            assert minute_expr == "30", f"Expected minute=30, got {minute_expr}"
+    async def test_scheduler_registers_rate_limit_flush(self) -> None:
+        """start_scheduler() should sync rate-limit counters on the configured interval."""
+        from src.config import get_settings
+        from src.scheduler import scheduler, start_scheduler, stop_scheduler
+
+        start_scheduler()
+        try:
+            job = scheduler.get_job("rate_limit_flush")
+            assert job is not None, "rate_limit_flush job not found"
+            assert job.trigger.interval == timedelta(
+                seconds=get_settings().rate_limit_flush_seconds
+            )
         finally:
             stop_scheduler()
 
+    async def test_scheduler_registers_leader_heartbeat(self) -> None:
+        """start_scheduler() should heartbeat the leader lease right away, then periodically."""
+        from src.config import get_settings
+        from src.scheduler import scheduler, start_scheduler, stop_scheduler
+
+        start_scheduler()
+        try:
+            job = scheduler.get_job("leader_heartbeat")
+            assert job is not None, "leader_heartbeat job not found"
+            assert job.trigger.interval == timedelta(
+                seconds=get_settings().scheduler_heartbeat_seconds
+            )
+            assert job.max_instances == 1
+        finally:
+            stop_scheduler()
+
+
+class TestSweepStaleSessions:
+    def _make_session_factory(self) -> MagicMock:
+        cm = AsyncMock()
+        cm.__aenter__ = AsyncMock(return_value=AsyncMock())
+        cm.__aexit__ = AsyncMock(return_value=None)
+        return MagicMock(return_value=cm)
+
+    def test_stops_after_short_batch(self) -> None:
+        """A batch smaller than the batch size ends the run."""
+        from src.scheduler import _SWEEP_BATCH_SIZE, sweep_stale_sessions
+
+        factory = self._make_session_factory()
+        with (
+            patch("src.scheduler.get_session_factory", return_value=factory),
+            patch("src.scheduler.SessionRepository") as mock_repo_cls,
+        ):
+            mock_repo_cls.return_value.expire_stale_sessions = AsyncMock(
+                side_effect=[_SWEEP_BATCH_SIZE, 3]
+            )
+            total = asyncio.run(sweep_stale_sessions())
+
+        assert total == _SWEEP_BATCH_SIZE + 3
+        assert mock_repo_cls.return_value.expire_stale_sessions.await_count == 2
+
+    def test_caps_batches_per_run(self) -> None:
+        """A run never exceeds _SWEEP_MAX_BATCHES batches."""
+        from src.scheduler import _SWEEP_BATCH_SIZE, _SWEEP_MAX_BATCHES, sweep_stale_sessions
+
+        factory = self._make_session_factory()
+        with (
+            patch("src.scheduler.get_session_factory", return_value=factory),
+            patch("src.scheduler.SessionRepository") as mock_repo_cls,
+        ):
+            mock_repo_cls.return_value.expire_stale_sessions = AsyncMock(
+                return_value=_SWEEP_BATCH_SIZE
+            )
+            asyncio.run(sweep_stale_sessions())
+
+        assert mock_repo_cls.return_value.expire_stale_sessions.await_count == _SWEEP_MAX_BATCHES
+
 
 class TestSendDailyReminders:
     def _make_student(
@@ -42,31 +218,17 @@ class TestSendDailyReminders:
         s.student_id = student_id
         s.telegram_id = telegram_id
         s.language = language
+        s.timezone = "Asia/Kolkata"
+        s.reminder_hour = 18
+        s.next_reminder_at = datetime.now(UTC) - timedelta(minutes=1)  # Due now
         return s
 
     def _make_streak(self, current: int = 3, last_date: date | None = None) -> MagicMock:
         sk = MagicMock()
         sk.current_streak = current
-        sk.last_practice_date = last_date or (date.today() - timedelta(days=1))
+        sk.last_practice_date = last_date or (_ist_today() - timedelta(days=1))
         return sk
 
-    def _make_db_session(self, students: list[MagicMock]) -> MagicMock:
-        """Build a mock async DB session whose execute() returns the given student list.
-
-        .scalars().all() returns the student list (used by the initial Student query).
-        .scalar_one_or_none() returns None (used by the double-fire SentMessage guard,
-        meaning no reminder has been sent today yet).
-        """
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = students
-        mock_result = MagicMock()
-        mock_result.scalars.return_value = mock_scalars
-        mock_result.scalar_one_or_none.return_value = None  # no reminder sent yet today
-
-        mock_db = AsyncMock()
-        mock_db.execute = AsyncMock(return_value=mock_result)
-        return mock_db
-
     def _make_session_factory(self, mock_db: MagicMock) -> MagicMock:
         """Wrap mock_db in a factory whose async context manager yields it."""
         cm = AsyncMock()
@@ -75,150 +237,158 @@ class TestSendDailyReminders:
         factory = MagicMock(return_value=cm)
         return factory
 
-    def test_skips_student_who_practiced_today(self) -> None:
-        """Students with last_practice_date == today receive no reminder."""
-        student = self._make_student()
-        streak = self._make_streak(current=5, last_date=date.today())
-        mock_db = self._make_db_session([student])
-        factory = self._make_session_factory(mock_db)
+    def _run(
+        self,
+        student: MagicMock,
+        streak: MagicMock,
+        enqueue: AsyncMock,
+        reminded: bool = False,
+    ) -> None:
+        """Run send_daily_reminders() with one due active student.
+
+        The bucket queries are patched: the first bucket holds the student,
+        the second is empty. reminded=True means today's SentMessage row
+        already exists (the double-fire guard).
+        """
+        mock_db = AsyncMock()
+        mock_db.add = MagicMock()
+        mock_db.begin_nested = MagicMock(return_value=AsyncMock())  # per-student savepoint
+        reminded_ids = {student.student_id} if reminded else set()
 
         with (
-            patch("src.scheduler.get_session_factory", return_value=factory),
-            patch("src.scheduler.StreakRepository") as mock_repo_cls,
-            patch("src.scheduler.TelegramClient") as mock_telegram_cls,
+            patch(
+                "src.scheduler.get_session_factory",
+                return_value=self._make_session_factory(mock_db),
+            ),
+            patch("src.scheduler.schedule_new_students", new_callable=AsyncMock, return_value=0),
+            patch("src.scheduler._reschedule_dormant", new_callable=AsyncMock, return_value=0),
+            patch(
+                "src.scheduler._due_students",
+                new_callable=AsyncMock,
+                side_effect=[[(student, streak)], []],
+            ),
+            patch(
+                "src.scheduler._reminded_today", new_callable=AsyncMock, return_value=reminded_ids
+            ),
+            patch("src.scheduler.enqueue_message", enqueue),
         ):
-            mock_repo_cls.return_value.get_for_student = AsyncMock(return_value=streak)
-            mock_telegram = AsyncMock()
-            mock_telegram_cls.return_value = mock_telegram
-
             from src.scheduler import send_daily_reminders
 
             asyncio.run(send_daily_reminders())
 
-            mock_telegram.send_message.assert_not_called()
+    def test_skips_student_who_practiced_today(self) -> None:
+        """Students with last_practice_date == today receive no reminder."""
+        student = self._make_student()
+        streak = self._make_streak(current=5, last_date=_ist_today())
+        mock_enqueue = AsyncMock()
+
+        self._run(student, streak, mock_enqueue)
+
+        mock_enqueue.assert_not_called()
 
     def test_sends_reminder_to_student_who_missed(self) -> None:
         """Students with last_practice_date < today receive a reminder."""
         student = self._make_student(telegram_id=42)
-        yesterday = date.today() - timedelta(days=1)
+        yesterday = _ist_today() - timedelta(days=1)
         streak = self._make_streak(current=3, last_date=yesterday)
-        mock_db = self._make_db_session([student])
-        factory = self._make_session_factory(mock_db)
+        mock_send = AsyncMock()
 
-        with (
-            patch("src.scheduler.get_session_factory", return_value=factory),
-            patch("src.scheduler.StreakRepository") as mock_repo_cls,
-            patch("src.scheduler.TelegramClient") as mock_telegram_cls,
-        ):
-            mock_repo_cls.return_value.get_for_student = AsyncMock(return_value=streak)
-            mock_send = AsyncMock(return_value=True)
-            mock_telegram_cls.return_value.send_message = mock_send
+        self._run(student, streak, mock_send)
 
-            from src.scheduler import send_daily_reminders
-
-            asyncio.run(send_daily_reminders())
-
-            mock_send.assert_called_once()
-            _chat_id, msg = mock_send.call_args.args
-            assert _chat_id == 42
-            assert "at risk" in msg
+        mock_send.assert_called_once()
+        _db, _chat_id, msg = mock_send.call_args.args
+        assert _chat_id == 42
+        assert "at risk" in msg
 
     def test_zero_streak_sends_motivational_not_at_risk(self) -> None:
         """Students with current_streak=0 get motivational message without 'at risk'."""
         student = self._make_student(telegram_id=99)
-        yesterday = date.today() - timedelta(days=1)
+        yesterday = _ist_today() - timedelta(days=1)
         streak = self._make_streak(current=0, last_date=yesterday)
-        mock_db = self._make_db_session([student])
-        factory = self._make_session_factory(mock_db)
-
-        with (
-            patch("src.scheduler.get_session_factory", return_value=factory),
-            patch("src.scheduler.StreakRepository") as mock_repo_cls,
-            patch("src.scheduler.TelegramClient") as mock_telegram_cls,
-        ):
-            mock_repo_cls.return_value.get_for_student = AsyncMock(return_value=streak)
-            mock_send = AsyncMock(return_value=True)
-            mock_telegram_cls.return_value.send_message = mock_send
-
-            from src.scheduler import send_daily_reminders
+        mock_send = AsyncMock()
 
-            asyncio.run(send_daily_reminders())
+        self._run(student, streak, mock_send)
 
-            mock_send.assert_called_once()
-            _chat_id, msg = mock_send.call_args.args
-            assert "at risk" not in msg
-            assert "streak" in msg.lower() or "ধারা" in msg
+        mock_send.assert_called_once()
+        _db, _chat_id, msg = mock_send.call_args.args
+        assert "at risk" not in msg
+        assert "streak" in msg.lower() or "ধারা" in msg
 
     def test_bengali_message_for_bn_student(self) -> None:
         """Bengali students receive reminders in Bengali."""
         student = self._make_student(telegram_id=77, language="bn")
-        yesterday = date.today() - timedelta(days=1)
+        yesterday = _ist_today() - timedelta(days=1)
         streak = self._make_streak(current=5, last_date=yesterday)
-        mock_db = self._make_db_session([student])
-        factory = self._make_session_factory(mock_db)
+        mock_send = AsyncMock()
 
-        with (
-            patch("src.scheduler.get_session_factory", return_value=factory),
-            patch("src.scheduler.StreakRepository") as mock_repo_cls,
-            patch("src.scheduler.TelegramClient") as mock_telegram_cls,
-        ):
-            mock_repo_cls.return_value.get_for_student = AsyncMock(return_value=streak)
-            mock_send = AsyncMock(return_value=True)
-            mock_telegram_cls.return_value.send_message = mock_send
+        self._run(student, streak, mock_send)
 
-            from src.scheduler import send_daily_reminders
-
-            asyncio.run(send_daily_reminders())
-
-            _chat_id, msg = mock_send.call_args.args
-            # Bengali message must contain Bengali Unicode characters
-            assert any(ord(c) > 0x0980 for c in msg), "Expected Bengali Unicode in message"
+        _db, _chat_id, msg = mock_send.call_args.args
+        # Bengali message must contain Bengali Unicode characters
+        assert any(ord(c) > 0x0980 for c in msg), "Expected Bengali Unicode in message"
 
     def test_send_failure_does_not_crash_job(self) -> None:
-        """A Telegram send failure is logged but does not crash the scheduler job."""
+        """A failure to queue a reminder is logged but does not crash the scheduler job."""
         student = self._make_student(telegram_id=55)
-        yesterday = date.today() - timedelta(days=1)
+        yesterday = _ist_today() - timedelta(days=1)
         streak = self._make_streak(current=2, last_date=yesterday)
-        mock_db = self._make_db_session([student])
-        factory = self._make_session_factory(mock_db)
-
-        with (
-            patch("src.scheduler.get_session_factory", return_value=factory),
-            patch("src.scheduler.StreakRepository") as mock_repo_cls,
-            patch("src.scheduler.TelegramClient") as mock_telegram_cls,
-        ):
-            mock_repo_cls.return_value.get_for_student = AsyncMock(return_value=streak)
-            mock_telegram_cls.return_value.send_message = AsyncMock(
-                side_effect=Exception("Network error")
-            )
 
-            from src.scheduler import send_daily_reminders
-
-            # Must not raise
-            asyncio.run(send_daily_reminders())
+        # Must not raise
+        self._run(student, streak, AsyncMock(side_effect=Exception("Database error")))
 
     def test_double_fire_guard_skips_already_reminded_student(self) -> None:
         """Student with a SentMessage reminder row for today is skipped (double-fire guard)."""
         student = self._make_student(telegram_id=66)
-        yesterday = date.today() - timedelta(days=1)
+        yesterday = _ist_today() - timedelta(days=1)
         streak = self._make_streak(current=3, last_date=yesterday)
-        mock_db = self._make_db_session([student])
-        # Override: scalar_one_or_none returns a truthy mock — reminder already sent today
-        mock_db.execute.return_value.scalar_one_or_none.return_value = MagicMock()
-        factory = self._make_session_factory(mock_db)
+        mock_send = AsyncMock()
 
-        with (
-            patch("src.scheduler.get_session_factory", return_value=factory),
-            patch("src.scheduler.StreakRepository") as mock_repo_cls,
-            patch("src.scheduler.TelegramClient") as mock_telegram_cls,
-        ):
-            mock_repo_cls.return_value.get_for_student = AsyncMock(return_value=streak)
-            mock_send = AsyncMock()
-            mock_telegram_cls.return_value.send_message = mock_send
+        self._run(student, streak, mock_send, reminded=True)
 
-            from src.scheduler import send_daily_reminders
+        # Guard fired — nothing may be queued
+        mock_send.assert_not_called()
 
-            asyncio.run(send_daily_reminders())
+    def test_handled_student_moves_to_next_slot(self) -> None:
+        """After a reminder is queued the student moves on to their next slot."""
+        student = self._make_student(student_id=7, telegram_id=70)
+        streak = self._make_streak(current=1)
 
-        # Guard fired — send_message must NOT have been called
-        mock_send.assert_not_called()
+        self._run(student, streak, AsyncMock())
+
+        assert isinstance(student.next_reminder_at, datetime)
+        assert student.next_reminder_at > datetime.now(UTC)
+        assert student.next_reminder_at.minute == 30 + 7  # 18:00 IST + student_id offset
+
+
+class TestReminderSkipReason:
+    def _student(self, tz: str, due_at: datetime) -> MagicMock:
+        return MagicMock(timezone=tz, next_reminder_at=due_at)
+
+    def test_practiced_today_uses_local_date(self) -> None:
+        """18:00 in Los Angeles is already tomorrow in UTC."""
+        from src.scheduler import _reminder_skip_reason
+
+        now = datetime(2026, 3, 3, 2, 0, tzinfo=UTC)  # 2026-03-02 18:00 PST
+        student = self._student("America/Los_Angeles", now)
+        streak = MagicMock(last_practice_date=date(2026, 3, 2))
+
+        assert _reminder_skip_reason(student, streak, now, False) == "practiced_today"
+
+    def test_yesterday_in_local_date_gets_reminder(self) -> None:
+        """In UTC+14 it is already the next day, so the practice was yesterday."""
+        from src.scheduler import _reminder_skip_reason
+
+        now = datetime(2026, 3, 2, 12, 0, tzinfo=UTC)  # 2026-03-03 02:00 local
+        student = self._student("Pacific/Kiritimati", now)
+        streak = MagicMock(last_practice_date=date(2026, 3, 2))
+
+        assert _reminder_skip_reason(student, streak, now, False) is None
+
+    def test_already_reminded_is_skipped(self) -> None:
+        from src.scheduler import _reminder_skip_reason
+
+        now = datetime(2026, 3, 2, 12, 30, tzinfo=UTC)
+        student = self._student("Asia/Kolkata", now)
+        streak = MagicMock(last_practice_date=date(2026, 3, 1))
+
+        assert _reminder_skip_reason(student, streak, now, True) == "already_reminded_today"
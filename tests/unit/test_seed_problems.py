@@ -10,6 +10,8 @@ Tests:
 - test_idempotent_no_duplicates: running twice -> 0 inserts second time
 - test_missing_answer_field_raises: YAML without 'answer' raises ValueError
 - test_bilingual_hints_preserved: text_en and text_bn both populated
+- test_changed_problem_updated_in_place: edited YAML content updates the existing row
+- test_unchanged_files_skipped_via_manifest: second seed_content run parses nothing
 """
 
 import sys
@@ -37,6 +39,11 @@ from sqlalchemy.pool import StaticPool  # noqa: E402
 
 from src.models.base import Base  # noqa: E402
 from src.models.problem import Problem  # noqa: E402
+from src.services.problem_content import (  # noqa: E402
+    convert_hints,
+    parse_problem_files,
+    validate_and_transform_problem,
+)
 
 _SEED_SCRIPT = _PROJECT_ROOT / "scripts" / "seed_problems.py"
 _spec = importlib.util.spec_from_file_location("seed_problems", str(_SEED_SCRIPT))
@@ -44,10 +51,9 @@ assert _spec is not None and _spec.loader is not None
 _seed_module = importlib.util.module_from_spec(_spec)
 _spec.loader.exec_module(_seed_module)  # type: ignore[union-attr]
 
-convert_hints = _seed_module.convert_hints
-validate_and_transform_problem = _seed_module.validate_and_transform_problem
 load_yaml_files = _seed_module.load_yaml_files
 seed_problems = _seed_module.seed_problems
+seed_content = _seed_module.seed_content
 
 
 # ---------------------------------------------------------------------------
@@ -286,7 +292,7 @@ class TestSeedProblems:
         """Seeding valid problems must insert them into the database."""
         engine, factory = await _make_test_session()
         async with factory() as session, session.begin():
-            inserted, skipped = await seed_problems(
+            inserted, _updated, skipped = await seed_problems(
                 session, "test.yaml", sample_raw_problems, dry_run=False
             )
         assert inserted == 2
@@ -302,7 +308,7 @@ class TestSeedProblems:
 
         # First run: inserts 2.
         async with factory() as session, session.begin():
-            inserted1, skipped1 = await seed_problems(
+            inserted1, _updated1, skipped1 = await seed_problems(
                 session, "test.yaml", sample_raw_problems, dry_run=False
             )
         assert inserted1 == 2
@@ -310,10 +316,11 @@ class TestSeedProblems:
 
         # Second run: skips both.
         async with factory() as session, session.begin():
-            inserted2, skipped2 = await seed_problems(
+            inserted2, updated2, skipped2 = await seed_problems(
                 session, "test.yaml", sample_raw_problems, dry_run=False
             )
         assert inserted2 == 0
+        assert updated2 == 0
         assert skipped2 == 2
         await engine.dispose()
 
@@ -324,7 +331,7 @@ class TestSeedProblems:
 
         engine, factory = await _make_test_session()
         async with factory() as session, session.begin():
-            inserted, skipped = await seed_problems(
+            inserted, _updated, skipped = await seed_problems(
                 session, "test.yaml", sample_raw_problems, dry_run=True
             )
         assert inserted == 2
@@ -346,10 +353,96 @@ class TestSeedProblems:
 
         engine, factory = await _make_test_session()
         async with factory() as session, session.begin():
-            inserted, skipped = await seed_problems(
+            inserted, _updated, skipped = await seed_problems(
                 session, "test.yaml", raw_problems, dry_run=False
             )
         # bad_problem is skipped due to ValueError; good_problem is inserted.
         assert inserted == 1
         assert skipped == 1
         await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_changed_problem_updated_in_place(
+        self, sample_raw_problems: list[dict[str, Any]]
+    ) -> None:
+        """Editing a problem's content updates the existing row instead of skipping it."""
+        from sqlalchemy import select
+
+        engine, factory = await _make_test_session()
+        async with factory() as session, session.begin():
+            await seed_problems(session, "test.yaml", sample_raw_problems)
+
+        edited = [dict(p) for p in sample_raw_problems]
+        edited[0]["answer"] = "20.0"
+        async with factory() as session, session.begin():
+            inserted, updated, skipped = await seed_problems(session, "test.yaml", edited)
+        assert (inserted, updated, skipped) == (0, 1, 1)
+
+        async with factory() as session:
+            rows = (await session.execute(select(Problem))).scalars().all()
+        assert len(rows) == 2
+        assert {r.answer for r in rows} == {"20.0", "100"}
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_skipped_via_manifest(self) -> None:
+        """A second seed_content run over unchanged files does not re-seed them."""
+        files = sorted(str(p) for p in (_PROJECT_ROOT / "content" / "problems").glob("*/*.yaml"))
+        files = [f for f in files if "grade_7" in f][:2]
+
+        engine, factory = await _make_test_session()
+        async with factory() as session, session.begin():
+            first = await seed_content(session, files, workers=1)
+        assert first["files_seeded"] == 2
+        assert first["inserted"] > 0
+
+        async with factory() as session, session.begin():
+            second = await seed_content(session, files, workers=1)
+        assert second["files_seeded"] == 0
+        assert second["files_unchanged"] == 2
+        assert second["inserted"] == second["updated"] == 0
+
+        async with factory() as session, session.begin():
+            forced = await seed_content(session, files, force=True, workers=1)
+        assert forced["files_seeded"] == 2
+        assert forced["inserted"] == forced["updated"] == 0
+        await engine.dispose()
+
+
+class TestParseProblemFiles:
+    """Tests for parse_problem_files()."""
+
+    def test_parallel_matches_serial(self) -> None:
+        """Parsing across worker processes yields the same result as serial parsing."""
+        files = sorted(str(p) for p in (_PROJECT_ROOT / "content" / "problems").glob("*/*.yaml"))
+        serial = parse_problem_files(files, workers=1)
+        parallel = parse_problem_files(files, workers=2)
+        assert parallel == serial
+        assert len(serial) == len(files)
+
+
+class TestSeedFromBundle:
+    """seed_content() prefers the compiled bundle for sources it was built from."""
+
+    @pytest.mark.asyncio
+    async def test_current_sources_come_from_bundle(self, tmp_path: Path) -> None:
+        """Sources whose hash matches the bundle are seeded without parsing YAML."""
+        from src.services.content_bundle import ContentBundle, compile_bundle
+
+        files = _seed_module.find_problem_files(7)[:2]
+        bundle_path = tmp_path / "bundle.jsonl"
+        compile_bundle(files[:1], bundle_path, workers=1)
+        bundle = ContentBundle(bundle_path)
+
+        engine, factory = await _make_test_session()
+        async with factory() as session, session.begin():
+            totals = await seed_content(session, files, workers=1, bundle=bundle)
+        assert totals["files_seeded"] == 2
+        assert totals["files_from_bundle"] == 1
+        assert totals["inserted"] == sum(len(p) for _, p in parse_problem_files(files, workers=1))
+
+        # Same content either way, so a forced YAML re-seed changes nothing.
+        async with factory() as session, session.begin():
+            forced = await seed_content(session, files, force=True, workers=1)
+        assert forced["inserted"] == forced["updated"] == 0
+        await engine.dispose()
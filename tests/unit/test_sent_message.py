@@ -7,6 +7,7 @@ All async methods flush but do not commit — we verify state within the session
 """
 
 from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from sqlalchemy import select
@@ -15,12 +16,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.sent_message import SentMessage
 from src.models.student import Student
 from src.services.encouragement import EncouragementService
+from src.services.recent_variants import RecentVariantTracker, get_recent_variants
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _fresh_tracker() -> None:
+    """Start each test with an empty process-wide recent-variant tracker."""
+    get_recent_variants().clear()
+
+
 async def _make_student(db: AsyncSession, telegram_id: int = 100) -> Student:
     """Insert a minimal Student row and return it."""
     student = Student(
@@ -80,6 +88,7 @@ class TestGetUniqueCorrectMessage:
         assert isinstance(msg, str)
         assert len(msg) > 0
         # Verify a new SentMessage row was written for variant 2
+        await get_recent_variants().flush(db_session)
         rows = (
             (
                 await db_session.execute(
@@ -129,6 +138,7 @@ class TestGetUniqueCorrectMessage:
             language="en",
         )
 
+        await get_recent_variants().flush(db_session)
         rows = (
             (
                 await db_session.execute(
@@ -242,6 +252,7 @@ class TestGetUniqueIncorrectMessage:
         # Should land on variant 2
         assert isinstance(msg, str)
         assert len(msg) > 0
+        await get_recent_variants().flush(db_session)
         rows = (
             (
                 await db_session.execute(
@@ -268,6 +279,7 @@ class TestGetUniqueIncorrectMessage:
             language="en",
         )
 
+        await get_recent_variants().flush(db_session)
         rows = (
             (
                 await db_session.execute(
@@ -294,3 +306,87 @@ class TestGetUniqueIncorrectMessage:
 
         assert isinstance(msg, str)
         assert len(msg) > 0
+
+
+# ---------------------------------------------------------------------------
+# Tests: RecentVariantTracker (in-memory ring buffer, write-behind)
+# ---------------------------------------------------------------------------
+
+
+class TestRecentVariantTracker:
+    @pytest.mark.asyncio
+    async def test_hydrates_once_then_selects_in_memory(self, db_session: AsyncSession) -> None:
+        """Only the first selection for a student reads sent_messages."""
+        student = await _make_student(db_session, telegram_id=300)
+        tracker = RecentVariantTracker()
+        svc = EncouragementService(tracker=tracker)
+
+        for _ in range(3):
+            await svc.get_unique_correct_message(
+                db=db_session, student_id=student.student_id, streak=0, language="en"
+            )
+
+        assert tracker.stats["hydrations"] == 1
+        assert tracker.pending == 3
+        recent = await tracker.recent_keys(db_session, student.student_id, "correct_streak_low")
+        assert recent == {f"correct_streak_low_{i}" for i in range(3)}
+
+    @pytest.mark.asyncio
+    async def test_flushed_history_survives_restart(self, db_session: AsyncSession) -> None:
+        """A new tracker (fresh process) hydrates the flushed sends from the DB."""
+        student = await _make_student(db_session, telegram_id=301)
+        before = RecentVariantTracker()
+        for _ in range(2):
+            await EncouragementService(tracker=before).get_unique_incorrect_message(
+                db=db_session, student_id=student.student_id, hints_used=0, language="en"
+            )
+        assert await before.flush(db_session) == 2
+        assert before.pending == 0
+
+        after = RecentVariantTracker()
+        await EncouragementService(tracker=after).get_unique_incorrect_message(
+            db=db_session, student_id=student.student_id, hints_used=0, language="en"
+        )
+        await after.flush(db_session)
+
+        keys = (
+            (
+                await db_session.execute(
+                    select(SentMessage.message_key).where(
+                        SentMessage.student_id == student.student_id
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+        assert sorted(keys) == ["incorrect_0", "incorrect_1", "incorrect_2"]
+
+    @pytest.mark.asyncio
+    async def test_evicted_student_keeps_unflushed_sends(self, db_session: AsyncSession) -> None:
+        """Re-hydrating an evicted student merges sends still waiting for flush()."""
+        first = await _make_student(db_session, telegram_id=302)
+        second = await _make_student(db_session, telegram_id=303)
+        tracker = RecentVariantTracker(max_students=1)
+
+        await tracker.recent_keys(db_session, first.student_id, "incorrect")
+        tracker.record(first.student_id, "incorrect_0")
+        await tracker.recent_keys(db_session, second.student_id, "incorrect")
+
+        assert await tracker.recent_keys(db_session, first.student_id, "incorrect") == {
+            "incorrect_0"
+        }
+        assert tracker.stats["hydrations"] == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_requeues(self) -> None:
+        """Rows stay queued if the batch insert fails for a transient reason."""
+        tracker = RecentVariantTracker()
+        tracker.record(1, "incorrect_0")
+        db = MagicMock()
+        db.flush = AsyncMock(side_effect=OSError("connection lost"))
+
+        with pytest.raises(OSError):
+            await tracker.flush(db)
+
+        assert tracker.pending == 1
@@ -1,11 +1,11 @@
 """Unit tests for service layer."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.services.student_service import StudentService
-from src.services.telegram_client import TelegramClient
+from src.services.telegram_client import TelegramClient, TelegramRetryAfter
 
 
 @pytest.mark.unit
@@ -49,6 +49,17 @@ class TestStudentService:
         assert student1.student_id == student2.student_id
         assert student2.name == "TestStudent"  # Original name preserved
 
+    async def test_get_or_create_inside_request_transaction(self, db_session) -> None:
+        """Creating a student works inside get_session's session.begin() block."""
+        service = StudentService()
+
+        async with db_session.begin():
+            student = await service.get_or_create(
+                db=db_session, telegram_id=654321, name="Onboarded", grade=8, language="bn"
+            )
+            assert student.student_id is not None
+            assert student.grade == 8
+
 
 @pytest.mark.unit
 class TestTelegramClient:
@@ -88,3 +99,21 @@ class TestTelegramClient:
             result = await client.send_message(chat_id=123, text="Hello")
 
             assert result is False
+
+    async def test_send_message_rate_limited(self) -> None:
+        """HTTP 429 raises TelegramRetryAfter with Telegram's retry_after."""
+        mock_response = MagicMock()
+        mock_response.status_code = 429
+        mock_response.json.return_value = {"ok": False, "parameters": {"retry_after": 7}}
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=mock_response)
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=False)
+
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            client = TelegramClient()
+            with pytest.raises(TelegramRetryAfter) as exc_info:
+                await client.send_message(chat_id=123, text="Hello")
+
+        assert exc_info.value.retry_after == 7.0
@@ -25,20 +25,23 @@ from src.auth.session import (
     verify_problem_in_session,
     verify_session_owner,
 )
+from src.auth.student import AuthenticatedStudent
 from src.models.session import Session, SessionStatus
-from src.models.student import Student
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _make_student(student_id: int = 1, telegram_id: int = 111111) -> Student:
-    """Build a mock Student with the minimum fields required."""
-    student = MagicMock(spec=Student)
-    student.student_id = student_id
-    student.telegram_id = telegram_id
-    return student
+def _make_student(student_id: int = 1, telegram_id: int = 111111) -> AuthenticatedStudent:
+    """Build the authenticated-student record verify_student would return."""
+    return AuthenticatedStudent(
+        student_id=student_id,
+        telegram_id=telegram_id,
+        grade=7,
+        language="en",
+        difficulty_level=1,
+    )
 
 
 def _make_session(
@@ -58,19 +61,16 @@ def _make_session(
     return session
 
 
-def _make_db_with_session(session_obj: Session | None, student_obj: Student | None) -> Any:
-    """Build a mock AsyncSession that returns the given session and student."""
-    db = AsyncMock()
+def _make_db_with_session(session_obj: Session | None) -> Any:
+    """Build a mock AsyncSession whose only query returns the given session.
 
-    # First execute call → session query result
-    # Second execute call → student query result
+    The student comes from verify_student, so verify_session_owner must not
+    query for it again; a second execute() call would raise StopAsyncIteration.
+    """
+    db = AsyncMock()
     session_result = MagicMock()
     session_result.scalar_one_or_none.return_value = session_obj
-
-    student_result = MagicMock()
-    student_result.scalar_one_or_none.return_value = student_obj
-
-    db.execute = AsyncMock(side_effect=[session_result, student_result])
+    db.execute = AsyncMock(side_effect=[session_result])
     return db
 
 
@@ -88,11 +88,11 @@ class TestVerifySessionOwner:
         """Happy path: authenticated student accesses their own session."""
         student = _make_student(student_id=1, telegram_id=111111)
         session = _make_session(session_id=10, student_id=1, status=SessionStatus.IN_PROGRESS)
-        db = _make_db_with_session(session, student)
+        db = _make_db_with_session(session)
 
         result = await verify_session_owner(
             session_id=10,
-            telegram_id=111111,
+            student=student,
             db=db,
         )
 
@@ -110,12 +110,12 @@ class TestVerifySessionOwner:
             student_id=1,  # session belongs to student 1
             status=SessionStatus.IN_PROGRESS,
         )
-        db = _make_db_with_session(session, victim_student)
+        db = _make_db_with_session(session)
 
         with pytest.raises(HTTPException) as exc_info:
             await verify_session_owner(
                 session_id=10,
-                telegram_id=222222,  # student 2 tries to access student 1's session
+                student=victim_student,  # student 2 tries to access student 1's session
                 db=db,
             )
 
@@ -133,12 +133,12 @@ class TestVerifySessionOwner:
             status=SessionStatus.IN_PROGRESS,
             is_expired=True,  # expired
         )
-        db = _make_db_with_session(session, student)
+        db = _make_db_with_session(session)
 
         with pytest.raises(HTTPException) as exc_info:
             await verify_session_owner(
                 session_id=10,
-                telegram_id=111111,
+                student=student,
                 db=db,
             )
 
@@ -150,12 +150,12 @@ class TestVerifySessionOwner:
         from fastapi import HTTPException
 
         student = _make_student(student_id=1, telegram_id=111111)
-        db = _make_db_with_session(session_obj=None, student_obj=student)
+        db = _make_db_with_session(None)
 
         with pytest.raises(HTTPException) as exc_info:
             await verify_session_owner(
                 session_id=99999,
-                telegram_id=111111,
+                student=student,
                 db=db,
             )
 
@@ -173,12 +173,12 @@ class TestVerifySessionOwner:
             status=SessionStatus.COMPLETED,
             is_expired=False,
         )
-        db = _make_db_with_session(session, student)
+        db = _make_db_with_session(session)
 
         with pytest.raises(HTTPException) as exc_info:
             await verify_session_owner(
                 session_id=10,
-                telegram_id=111111,
+                student=student,
                 db=db,
             )
 
@@ -197,12 +197,12 @@ class TestVerifySessionOwner:
             status=SessionStatus.ABANDONED,
             is_expired=True,
         )
-        db = _make_db_with_session(session, student)
+        db = _make_db_with_session(session)
 
         with pytest.raises(HTTPException) as exc_info:
             await verify_session_owner(
                 session_id=10,
-                telegram_id=111111,
+                student=student,
                 db=db,
             )
 
@@ -281,7 +281,7 @@ class TestIDORLogging:
             status=SessionStatus.IN_PROGRESS,
             is_expired=False,
         )
-        db = _make_db_with_session(session, attacker_student)
+        db = _make_db_with_session(session)
 
         with (
             caplog.at_level(logging.WARNING, logger="src.auth.session"),
@@ -289,7 +289,7 @@ class TestIDORLogging:
         ):
             await verify_session_owner(
                 session_id=10,
-                telegram_id=222222,
+                student=attacker_student,
                 db=db,
             )
 
@@ -316,7 +316,7 @@ class TestIDORLogging:
             status=SessionStatus.IN_PROGRESS,
             is_expired=False,
         )
-        db = _make_db_with_session(session, attacker_student)
+        db = _make_db_with_session(session)
 
         with (
             caplog.at_level(logging.WARNING, logger="src.auth.session"),
@@ -324,7 +324,7 @@ class TestIDORLogging:
         ):
             await verify_session_owner(
                 session_id=10,
-                telegram_id=attacker_telegram_id,
+                student=attacker_student,
                 db=db,
             )
 
@@ -346,7 +346,7 @@ class TestIDORLogging:
             status=SessionStatus.IN_PROGRESS,
             is_expired=False,
         )
-        db = _make_db_with_session(session, attacker_student)
+        db = _make_db_with_session(session)
 
         with (
             caplog.at_level(logging.WARNING, logger="src.auth.session"),
@@ -354,7 +354,7 @@ class TestIDORLogging:
         ):
             await verify_session_owner(
                 session_id=20,
-                telegram_id=333333,
+                student=attacker_student,
                 db=db,
             )
 
@@ -166,6 +166,20 @@ class TestGetActiveSessionForToday:
         assert result is not None
         assert result.status == SessionStatus.COMPLETED
 
+    @pytest.mark.asyncio
+    async def test_expired_in_progress_session_treated_as_absent(self, db: AsyncSession) -> None:
+        """An in_progress session past expires_at is lazily treated as expired."""
+        repo = SessionRepository()
+        student = await _make_student(db, telegram_id=1005)
+        session = await repo.create_session(db, student_id=student.student_id, problem_ids=[1])
+        session.expires_at = datetime.now(UTC) - timedelta(minutes=1)
+        await db.flush()
+
+        result = await repo.get_active_session_for_today(db, student_id=student.student_id)
+        assert result is None
+        # Lazy expiry must not write: the row stays in_progress until the sweeper runs.
+        assert session.status == SessionStatus.IN_PROGRESS
+
 
 class TestGetSessionById:
     """Tests for SessionRepository.get_session_by_id()."""
@@ -298,6 +312,30 @@ class TestExpireStaleSessions:
         assert refreshed is not None
         assert refreshed.status == SessionStatus.IN_PROGRESS
 
+    @pytest.mark.asyncio
+    async def test_limit_bounds_batch_size(self, db: AsyncSession) -> None:
+        """With a limit, only that many stale sessions are abandoned per call."""
+        repo = SessionRepository()
+        student = await _make_student(db, telegram_id=1012)
+        now = datetime.now(UTC)
+        for i in range(3):
+            db.add(
+                Session(
+                    student_id=student.student_id,
+                    date=now - timedelta(hours=2),
+                    status=SessionStatus.IN_PROGRESS,
+                    problem_ids=[1],
+                    expires_at=now - timedelta(minutes=10 + i),
+                    total_time_seconds=0,
+                    problems_correct=0,
+                )
+            )
+        await db.flush()
+
+        assert await repo.expire_stale_sessions(db, limit=2) == 2
+        assert await repo.expire_stale_sessions(db, limit=2) == 1
+        assert await repo.expire_stale_sessions(db, limit=2) == 0
+
 
 class TestGetCompletedSessionsForStudent:
     """Tests for SessionRepository.get_completed_sessions_for_student()."""
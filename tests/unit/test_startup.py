@@ -0,0 +1,156 @@
+"""
+Unit tests for cold-start work: deferred imports, pool warm-up and the
+concurrent startup phases in src/main.py, plus the import-time parser in
+scripts/profile_imports.py.
+"""
+
+import asyncio
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.config import get_settings
+from src.database import warm_pool
+from src.main import _start_database
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+_PROFILE_SCRIPT = _PROJECT_ROOT / "scripts" / "profile_imports.py"
+_spec = importlib.util.spec_from_file_location("profile_imports", str(_PROFILE_SCRIPT))
+assert _spec is not None and _spec.loader is not None
+_profile_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_profile_module)  # type: ignore[union-attr]
+
+parse_importtime = _profile_module.parse_importtime
+
+
+@pytest.mark.unit
+class TestDeferredImports:
+    """Heavy SDKs stay out of the app's import graph."""
+
+    def test_app_import_does_not_load_anthropic(self) -> None:
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, src.main; print('anthropic' in sys.modules)",
+            ],
+            cwd=_PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip().splitlines()[-1] == "False"
+
+
+@pytest.mark.unit
+class TestParseImporttime:
+    """parse_importtime() reads -X importtime output."""
+
+    def test_parses_rows_and_depth(self) -> None:
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |     _io\n"
+            "import time:       300 |        420 |   fastapi.routing\n"
+            "import time:      2000 |       2420 | src.main\n"
+            "something else on stderr\n"
+        )
+
+        timings = parse_importtime(output)
+
+        assert [t.module for t in timings] == ["_io", "fastapi.routing", "src.main"]
+        assert [t.depth for t in timings] == [2, 1, 0]
+        assert timings[2].self_us == 2000
+        assert timings[2].cumulative_us == 2420
+
+
+@pytest.mark.unit
+class TestWarmPool:
+    """warm_pool() opens connections concurrently."""
+
+    async def test_opens_requested_connections(self, monkeypatch) -> None:
+        monkeypatch.setattr(get_settings(), "db_pool_size", 5)
+        connect = AsyncMock()
+        engine = MagicMock()
+        engine.connect.return_value.__aenter__.return_value = connect
+
+        with patch("src.database.get_engine", return_value=engine):
+            opened = await warm_pool(3)
+
+        assert opened == 3
+        assert connect.execute.await_count == 3
+
+    async def test_capped_at_pool_size(self, monkeypatch) -> None:
+        monkeypatch.setattr(get_settings(), "db_pool_size", 2)
+        engine = MagicMock()
+
+        with patch("src.database.get_engine", return_value=engine):
+            opened = await warm_pool(10)
+
+        assert opened == 2
+
+    async def test_failed_connections_not_counted(self, monkeypatch) -> None:
+        monkeypatch.setattr(get_settings(), "db_pool_size", 5)
+        engine = MagicMock()
+        engine.connect.side_effect = OSError("refused")
+
+        with patch("src.database.get_engine", return_value=engine):
+            opened = await warm_pool(2)
+
+        assert opened == 0
+
+    async def test_zero_skips_warmup(self) -> None:
+        with patch("src.database.get_engine") as get_engine:
+            assert await warm_pool(0) == 0
+        get_engine.assert_not_called()
+
+
+@pytest.mark.unit
+class TestStartDatabase:
+    """_start_database() gates DB-backed startup on the connection check."""
+
+    async def test_loads_state_concurrently_when_connected(self) -> None:
+        running = 0
+        peak = 0
+
+        async def _phase(*_args: object) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        timings: dict[str, float] = {}
+        with (
+            patch("src.main.check_connection", AsyncMock(return_value=True)),
+            patch("src.main.warm_pool", side_effect=_phase),
+            patch("src.main.reload_messages", side_effect=_phase),
+            patch("src.main.load_rate_limits", side_effect=_phase),
+        ):
+            connected = await _start_database(get_settings(), timings)
+
+        assert connected is True
+        assert peak == 3
+        assert set(timings) == {
+            "db_connect_ms",
+            "db_pool_warmup_ms",
+            "message_catalog_ms",
+            "rate_limits_ms",
+        }
+
+    async def test_skips_db_state_when_unreachable(self) -> None:
+        reload_messages = AsyncMock()
+        timings: dict[str, float] = {}
+        with (
+            patch("src.main.check_connection", AsyncMock(return_value=False)),
+            patch("src.main.reload_messages", reload_messages),
+        ):
+            connected = await _start_database(get_settings(), timings)
+
+        assert connected is False
+        reload_messages.assert_not_called()
+        assert set(timings) == {"db_connect_ms"}
@@ -15,7 +15,7 @@ from sqlalchemy.pool import StaticPool
 
 from src.models.base import Base
 from src.models.session import Session, SessionStatus
-from src.models.streak import Streak
+from src.models.streak import PRACTICE_HISTORY_DAYS, Streak
 from src.models.student import Student
 from src.repositories.streak_repository import StreakRepository
 from src.repositories.student_repository import StudentRepository
@@ -363,7 +363,7 @@ class TestGetForStudent:
 
 
 # ---------------------------------------------------------------------------
-# StreakRepository.get_last_7_days
+# StreakRepository.get_last_7_days / practice calendar
 # ---------------------------------------------------------------------------
 
 
@@ -371,7 +371,7 @@ class TestGetLast7Days:
     """Tests for get_last_7_days — calendar view for /streak endpoint."""
 
     async def test_returns_empty_for_new_student(self, db: AsyncSession) -> None:
-        """Should return empty list when no sessions exist."""
+        """Should return empty list when the student never practiced."""
         student = await _make_student(db)
         repo = StreakRepository()
 
@@ -379,42 +379,118 @@ class TestGetLast7Days:
 
         assert result == []
 
-    async def test_returns_dates_of_completed_sessions(self, db: AsyncSession) -> None:
-        """Should return calendar dates where student has completed sessions."""
+    async def test_returns_recorded_practice_days(self, db: AsyncSession) -> None:
+        """Should return calendar dates recorded via record_practice."""
         student = await _make_student(db)
         repo = StreakRepository()
-        today_dt = datetime.now(UTC).replace(hour=10, minute=0, second=0, microsecond=0)
-        await _make_completed_session(db, student.student_id, today_dt)
+        today = datetime.now(UTC).date()
+        await repo.record_practice(db, student.student_id, today - timedelta(days=2))
+        await repo.record_practice(db, student.student_id, today)
 
         result = await repo.get_last_7_days(db, student.student_id)
 
-        assert len(result) == 1
-        assert result[0] == today_dt.date()
+        assert result == [today - timedelta(days=2), today]
 
-    async def test_deduplicates_multiple_sessions_same_day(self, db: AsyncSession) -> None:
-        """Multiple completed sessions on same day should count as one date."""
+    async def test_same_day_recorded_once(self, db: AsyncSession) -> None:
+        """Practicing twice on one day yields a single date."""
         student = await _make_student(db)
         repo = StreakRepository()
-        today_dt = datetime.now(UTC).replace(hour=9, minute=0, second=0, microsecond=0)
-        today_dt2 = today_dt.replace(hour=15)
-        await _make_completed_session(db, student.student_id, today_dt)
-        await _make_completed_session(db, student.student_id, today_dt2)
+        today = datetime.now(UTC).date()
+        await repo.record_practice(db, student.student_id, today)
+        await repo.record_practice(db, student.student_id, today)
 
         result = await repo.get_last_7_days(db, student.student_id)
 
-        assert len(result) == 1
+        assert result == [today]
 
-    async def test_excludes_sessions_older_than_7_days(self, db: AsyncSession) -> None:
-        """Sessions from 8+ days ago should not appear in the 7-day window."""
+    async def test_excludes_days_older_than_7_days(self, db: AsyncSession) -> None:
+        """Practice from 8+ days ago should not appear in the 7-day window."""
         student = await _make_student(db)
         repo = StreakRepository()
-        old_dt = datetime.now(UTC) - timedelta(days=8)
-        await _make_completed_session(db, student.student_id, old_dt)
+        await repo.record_practice(
+            db, student.student_id, datetime.now(UTC).date() - timedelta(days=8)
+        )
 
         result = await repo.get_last_7_days(db, student.student_id)
 
         assert result == []
 
+    async def test_does_not_query_sessions(self, db: AsyncSession) -> None:
+        """Completed sessions alone do not feed the calendar; the bitmap does."""
+        student = await _make_student(db)
+        repo = StreakRepository()
+        await _make_completed_session(db, student.student_id, datetime.now(UTC))
+
+        result = await repo.get_last_7_days(db, student.student_id)
+
+        assert result == []
+
+
+class TestPracticeHistory:
+    """Tests for the practice_history bitmap, N-day windows and monthly heatmaps."""
+
+    async def test_any_window_length(self, db: AsyncSession) -> None:
+        """Windows of any length up to PRACTICE_HISTORY_DAYS are served from the bitmap."""
+        student = await _make_student(db)
+        repo = StreakRepository()
+        end = date(2026, 3, 31)
+        practiced = [end - timedelta(days=n) for n in (400, 60, 3, 0)]
+        for day in practiced:
+            await repo.record_practice(db, student.student_id, day)
+
+        assert await repo.get_practice_days(db, student.student_id, 4, end) == practiced[2:]
+        assert await repo.get_practice_days(db, student.student_id, 61, end) == practiced[1:]
+        assert (
+            await repo.get_practice_days(db, student.student_id, PRACTICE_HISTORY_DAYS, end)
+            == practiced
+        )
+
+    async def test_invalid_window_raises(self, db: AsyncSession) -> None:
+        """Windows outside 1..PRACTICE_HISTORY_DAYS are rejected."""
+        student = await _make_student(db)
+        repo = StreakRepository()
+
+        with pytest.raises(ValueError):
+            await repo.get_practice_days(db, student.student_id, PRACTICE_HISTORY_DAYS + 1)
+
+    async def test_month_heatmap(self, db: AsyncSession) -> None:
+        """get_month_heatmap returns one flag per day of the month."""
+        student = await _make_student(db)
+        repo = StreakRepository()
+        for day in (1, 2, 28):
+            await repo.record_practice(db, student.student_id, date(2026, 2, day))
+        await repo.record_practice(db, student.student_id, date(2026, 3, 1))
+
+        heatmap = await repo.get_month_heatmap(db, student.student_id, 2026, 2)
+
+        assert len(heatmap) == 28
+        assert [i + 1 for i, practiced in enumerate(heatmap) if practiced] == [1, 2, 28]
+
+    def test_bitmap_rolls_off_old_days(self) -> None:
+        """Days beyond PRACTICE_HISTORY_DAYS fall out and the bitmap stays bounded."""
+        streak = Streak(student_id=1)
+        start = date(2024, 1, 1)
+        streak.mark_practiced(start)
+        streak.mark_practiced(start + timedelta(days=PRACTICE_HISTORY_DAYS))
+
+        assert streak.practiced_days(start, start + timedelta(days=PRACTICE_HISTORY_DAYS)) == [
+            start + timedelta(days=PRACTICE_HISTORY_DAYS)
+        ]
+        assert streak.practice_history is not None
+        assert len(streak.practice_history) <= (PRACTICE_HISTORY_DAYS + 7) // 8
+
+    def test_out_of_order_day_is_recorded(self) -> None:
+        """An earlier day inside the window sets its bit without moving the end."""
+        streak = Streak(student_id=1)
+        streak.mark_practiced(date(2026, 3, 10))
+        streak.mark_practiced(date(2026, 3, 7))
+
+        assert streak.practice_history_end == date(2026, 3, 10)
+        assert streak.practiced_days(date(2026, 3, 1), date(2026, 3, 31)) == [
+            date(2026, 3, 7),
+            date(2026, 3, 10),
+        ]
+
 
 # ---------------------------------------------------------------------------
 # StudentRepository — difficulty level (REQ-004)
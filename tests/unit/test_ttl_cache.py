@@ -0,0 +1,68 @@
+"""Unit tests for the bounded TTL+LRU cache (src/utils/ttl_cache.py)."""
+
+import pytest
+
+from src.utils.ttl_cache import TTLCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    def test_get_set(self) -> None:
+        """Stored values are returned until they expire."""
+        clock = _Clock()
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        clock.now = 10
+        assert cache.get("a") is None
+        assert "a" not in cache
+
+    def test_lru_eviction(self) -> None:
+        """The least recently used entry is evicted when full."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl_seconds=10, clock=_Clock())
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats["evictions"] == 1
+        assert len(cache) == 2
+
+    def test_set_resets_ttl(self) -> None:
+        """Re-setting a key restarts its lifetime."""
+        clock = _Clock()
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 8
+        cache.set("a", 2)
+        clock.now = 15
+
+        assert cache.get("a") == 2
+
+    def test_pop_and_clear(self) -> None:
+        """pop() removes one key; clear() removes all and resets stats."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl_seconds=10, clock=_Clock())
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.pop("a")
+        cache.pop("missing")
+        assert cache.get("a") is None
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats == {"hits": 0, "misses": 0, "evictions": 0, "entries": 0}
+
+    def test_invalid_maxsize(self) -> None:
+        """maxsize must be positive."""
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=0, ttl_seconds=1)